@@ -0,0 +1,152 @@
+"""Measure import time and memory of gybe and every generated k8s module against budgets.
+
+Each import runs in a fresh interpreter: `-X importtime` gives the cumulative import time and a
+second run with `tracemalloc` gives the peak memory allocated while importing. Exits with status 1
+when a module goes over its budget.
+
+Run from the repository root:
+
+    python -m benchmarks.importtime [--repeat 3] [--only PATTERN]
+"""
+
+import argparse
+import fnmatch
+import os
+import subprocess
+import sys
+import tempfile
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Collection
+
+K8S_DIR = Path(__file__).parent.parent / 'gybe/k8s'
+# bytecode caches of the measured imports are written here instead of next to the sources
+PYCACHE_PREFIX = os.path.join(tempfile.gettempdir(), 'gybe-importtime-pycache')
+FACADE_MODULES = ['gybe', 'gybe.k8s']
+
+# (milliseconds, MiB) per module pattern, the first matching pattern applies. API group modules
+# import their dependencies, typically core/v1 and meta/v1, so they share one budget
+BUDGETS = {
+    'gybe': (60, 2),
+    'gybe.k8s': (60, 2),
+    'gybe.k8s.v1_*.*.*': (500, 8),
+    'gybe.k8s.v1_*': (60, 2),
+}
+
+
+@dataclass
+class ImportResult:
+    """Cost of importing a module in a fresh interpreter."""
+
+    module: str
+    seconds: float
+    peak_bytes: int
+
+    def over_budget(self) -> bool:
+        """Whether the import took longer or used more memory than its budget allows."""
+        ms, mib = budget_for(self.module)
+        return self.seconds * 1000 > ms or self.peak_bytes / 2**20 > mib
+
+
+def budget_for(module: str) -> tuple[int, int]:
+    """Look up the (milliseconds, MiB) budget of a module."""
+    for pattern, budget in BUDGETS.items():
+        if fnmatch.fnmatchcase(module, pattern):
+            return budget
+    raise KeyError(f'No import budget for {module}')
+
+
+def k8s_modules() -> list[str]:
+    """Every generated version package and API group module, like `gybe.k8s.v1_32.core.v1`."""
+    modules = []
+    for version_dir in sorted(K8S_DIR.glob('v1_*')):
+        modules.append(f'gybe.k8s.{version_dir.name}')
+        for path in sorted(version_dir.glob('*/*.py')):
+            modules.append(f'gybe.k8s.{version_dir.name}.{path.parent.name}.{path.stem}')
+    return modules
+
+
+def parse_importtime(stderr: str, ignore: Collection[str] = ()) -> float:
+    """Sum the cumulative seconds of top level imports in `-X importtime` output.
+
+    Modules in `ignore`, like the ones imported on interpreter startup, aren't counted.
+    """
+    total_us = 0
+    for line in stderr.splitlines():
+        if not line.startswith('import time:'):
+            continue
+        _, cumulative, name = line[len('import time:') :].split('|')
+        # nested imports are indented below the import that triggered them
+        if not name.startswith('  ') and cumulative.strip().isdigit() and name.strip() not in ignore:
+            total_us += int(cumulative)
+    return total_us / 1e6
+
+
+def _run(code: str, importtime: bool = False) -> subprocess.CompletedProcess:
+    args = [sys.executable, *(['-X', 'importtime'] if importtime else []), '-c', code]
+    # imports are measured from bytecode caches, like an installed package
+    env = {k: v for k, v in os.environ.items() if k != 'PYTHONDONTWRITEBYTECODE'}
+    env['PYTHONPYCACHEPREFIX'] = PYCACHE_PREFIX
+    return subprocess.run(args, capture_output=True, text=True, check=True, env=env)  # noqa: S603
+
+
+def startup_modules() -> set[str]:
+    """Modules imported by the interpreter before running any code."""
+    stderr = _run('pass', importtime=True).stderr
+    return {line.split('|')[-1].strip() for line in stderr.splitlines() if line.startswith('import time:')}
+
+
+def imported_modules(module: str) -> set[str]:
+    """Modules imported by importing `module` in a fresh interpreter, `module` included."""
+    code = f'import sys; before = set(sys.modules); import {module}; print(*set(sys.modules) - before)'
+    return set(_run(code).stdout.split())
+
+
+def peak_memory(module: str) -> int:
+    """Peak bytes allocated while importing `module` in a fresh interpreter, traced by `tracemalloc`.
+
+    Unlike import time, this doesn't depend on the machine.
+    """
+    code = (
+        f'import tracemalloc; tracemalloc.start(); import {module}; print(tracemalloc.get_traced_memory()[1])'
+    )
+    return int(_run(code).stdout)
+
+
+def measure(module: str, repeat: int = 3, ignore: Collection[str] = ()) -> ImportResult:
+    """Import `module` in fresh interpreters, keeping the fastest of `repeat` runs."""
+    _run(f'import {module}')  # writes the bytecode caches
+    seconds = min(
+        parse_importtime(_run(f'import {module}', importtime=True).stderr, ignore) for _ in range(repeat)
+    )
+    return ImportResult(module, seconds, peak_memory(module))
+
+
+def main():
+    """Print the import cost of each module and fail if any is over budget."""
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--repeat', type=int, default=3)
+    parser.add_argument('--only', default='*', help='Only measure modules matching this pattern.')
+    args = parser.parse_args()
+
+    ignore = startup_modules()
+    modules = [m for m in FACADE_MODULES + k8s_modules() if fnmatch.fnmatchcase(m, args.only)]
+    failed = []
+    for module in modules:
+        result = measure(module, args.repeat, ignore)
+        ms, mib = budget_for(module)
+        status = 'OVER BUDGET' if result.over_budget() else 'ok'
+        print(
+            f'{module:<55} {result.seconds * 1000:7.1f} ms / {ms:>4} ms'
+            f' {result.peak_bytes / 2**20:7.2f} MiB / {mib:>3} MiB  {status}'
+        )
+        if result.over_budget():
+            failed.append(module)
+
+    if failed:
+        print(f'{len(failed)} modules over budget: {", ".join(failed)}')
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,71 @@
+"""Compare memory used by generated models in the dict, slots and sparse codegen modes.
+
+Run from the repository root:
+
+    python -m benchmarks.model_memory [--count 20000] [--spec-dir PATH]
+"""
+
+import argparse
+import importlib
+import tracemalloc
+from pathlib import Path
+from tempfile import TemporaryDirectory
+
+import gybe.k8s
+from gybe.codegen.k8s_modules import CodegenOptions, write_module
+
+DEFAULT_SPEC_DIR = Path('tests/data/k8s-api-specs/v1.32.1/api/openapi-spec/v3')
+MODES = {
+    'v1_97': ('dict', CodegenOptions()),
+    'v1_98': ('slots', CodegenOptions(slots=True)),
+    'v1_99': ('sparse', CodegenOptions(sparse=True)),
+}
+
+
+def build_containers(core_v1, count: int) -> list:
+    """Build `count` containers with a couple of env vars and volume mounts each."""
+    return [
+        core_v1.Container(
+            name=f'container-{i}',
+            image='python:3',
+            env=[core_v1.EnvVar(name='A', value='1'), core_v1.EnvVar(name='B', value='2')],
+            volumeMounts=[core_v1.VolumeMount(name='data', mountPath='/data')],
+        )
+        for i in range(count)
+    ]
+
+
+def measure(core_v1, count: int) -> int:
+    """Peak bytes allocated while building `count` containers."""
+    tracemalloc.start()
+    containers = build_containers(core_v1, count)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del containers
+    return peak
+
+
+def main():
+    """Print peak memory for each generation mode."""
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--count', type=int, default=20_000)
+    parser.add_argument('--spec-dir', type=Path, default=DEFAULT_SPEC_DIR)
+    args = parser.parse_args()
+
+    with TemporaryDirectory() as tdir:
+        k8s_module_dir = Path(tdir) / 'gybe/k8s'
+        k8s_module_dir.mkdir(parents=True)
+        gybe.k8s.__path__.append(str(k8s_module_dir))
+        results = {}
+        for version_module, (mode, options) in MODES.items():
+            write_module(version_module, k8s_module_dir, args.spec_dir, options=options)
+            core_v1 = importlib.import_module(f'gybe.k8s.{version_module}.core.v1')
+            results[mode] = measure(core_v1, args.count)
+
+    print(f'{args.count} containers, 2 env vars and 1 volume mount each')
+    for mode, peak in results.items():
+        print(f'{mode:>6}: {peak / 2**20:8.2f} MiB ({peak / results["dict"]:.0%})')
+
+
+if __name__ == '__main__':
+    main()
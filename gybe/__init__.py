@@ -2,8 +2,41 @@
 
 __version__ = '0.7.0'
 
+from typing import TYPE_CHECKING
 
-from gybe import k8s
-from gybe.decorators import Manifest, transpiler
+from gybe.lazy import lazy_attributes
 
-__all__ = ['k8s', 'Manifest', 'transpiler']
+if TYPE_CHECKING:
+    from gybe import files, k8s
+    from gybe.decorators import AsyncManifestIterator, Manifest, ManifestIterator, transpiler
+    from gybe.memoize import cached
+    from gybe.rendering import render, render_dicts, render_yaml
+
+__all__ = [
+    'k8s',
+    'Manifest',
+    'ManifestIterator',
+    'AsyncManifestIterator',
+    'transpiler',
+    'cached',
+    'files',
+    'render',
+    'render_dicts',
+    'render_yaml',
+]
+
+__getattr__, __dir__ = lazy_attributes(
+    __name__,
+    {
+        'k8s': 'gybe.k8s',
+        'Manifest': 'gybe.decorators',
+        'ManifestIterator': 'gybe.decorators',
+        'AsyncManifestIterator': 'gybe.decorators',
+        'transpiler': 'gybe.decorators',
+        'cached': 'gybe.memoize',
+        'files': 'gybe.files',
+        'render': 'gybe.rendering',
+        'render_dicts': 'gybe.rendering',
+        'render_yaml': 'gybe.rendering',
+    },
+)
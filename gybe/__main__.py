@@ -0,0 +1,6 @@
+"""Run the `gybe` command."""
+
+from gybe.cli import main
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,91 @@
+"""Render a transpiler once for each of many values files, like one manifest for every tenant.
+
+Values files are rendered in parallel by a pool of worker processes. Each worker imports the chart
+and prepares its transpiler once, then renders its share of the values files.
+"""
+
+import os
+import traceback
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+from typing import Iterable, Sequence
+
+from gybe.charts import chart_ref, find_transpiler
+from gybe.exceptions import RenderError
+from gybe.rendering import Transpiler, prepare, transpile
+from gybe.values import load_values
+from gybe.yaml import yaml_dump_manifest
+
+# the transpiler of a worker process, imported once when the worker starts
+_transpiler: Transpiler | None = None
+
+
+def output_paths(paths: Iterable[str], output_dir: str) -> list[str]:
+    """Where the manifest of each values file is written, `output_dir` and the values file's name."""
+    outputs: dict[str, str] = {}
+    for path in paths:
+        output = os.path.join(output_dir, os.path.basename(path))
+        if output in outputs:
+            raise ValueError(f'{outputs[output]} and {path} would both be rendered to {output}')
+        outputs[output] = path
+    return list(outputs)
+
+
+def _init_worker(chart: str) -> None:
+    global _transpiler
+    _transpiler = find_transpiler(chart)
+    prepare(_transpiler)
+
+
+def _render_file(
+    func: Transpiler | None,
+    base_paths: Sequence[str],
+    overrides: Sequence[str],
+    typed_overrides: Sequence[str],
+    path: str,
+    output: str,
+) -> str | None:
+    """Render one values file to `output`, returning the error message instead of raising it."""
+    transpiler = func if func is not None else _transpiler
+    try:
+        values = load_values([*base_paths, path])
+        manifest = transpile(transpiler, values, overrides, typed_overrides)  # type: ignore[arg-type]
+        with open(output, 'w') as f:
+            yaml_dump_manifest(manifest, f)
+    except Exception as exc:
+        # generators fail while they're written, don't leave half a manifest behind
+        if os.path.exists(output):
+            os.remove(output)
+        if isinstance(exc, (RenderError, OSError)):
+            return str(exc)
+        return ''.join(traceback.format_exception_only(exc)).strip()
+    return None
+
+
+def render_many(
+    func: Transpiler,
+    paths: Sequence[str],
+    output_dir: str,
+    base_paths: Sequence[str] = (),
+    overrides: Sequence[str] = (),
+    typed_overrides: Sequence[str] = (),
+    jobs: int | None = None,
+) -> dict[str, str]:
+    """Render a transpiler once for each values file, writing each manifest to `output_dir`.
+
+    Every values file is merged over `base_paths`, and the overrides are set on each. Files that
+    fail don't stop the others, their error messages are returned by values file. `jobs` worker
+    processes render the files, one for each CPU by default, and a single job renders in-process.
+    """
+    outputs = output_paths(paths, output_dir)
+    os.makedirs(output_dir, exist_ok=True)
+    jobs = min(jobs or os.cpu_count() or 1, len(paths))
+    if jobs <= 1:
+        render = partial(_render_file, func, base_paths, overrides, typed_overrides)
+        errors = list(map(render, paths, outputs))
+    else:
+        render = partial(_render_file, None, base_paths, overrides, typed_overrides)
+        with ProcessPoolExecutor(jobs, initializer=_init_worker, initargs=(chart_ref(func),)) as pool:
+            # a few chunks for each worker, so they're sent in few messages and still share the work evenly
+            errors = list(pool.map(render, paths, outputs, chunksize=max(1, len(paths) // (jobs * 4))))
+    return {path: error for path, error in zip(paths, errors) if error is not None}
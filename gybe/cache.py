@@ -0,0 +1,116 @@
+"""Cache rendered manifests on disk, so renders that didn't change are read back instead.
+
+Manifests are stored by a key hashing the gybe version, the chart's path, source and transpiler
+name, the raw bytes of the values files and the overrides. Each entry also records the local modules
+the chart imported, from the chart's directory, with a hash of their source, and is only used
+while they're unchanged too. Reading an entry back doesn't import the chart or the k8s models.
+
+The least recently used entries are removed once the cache grows over its size limit.
+"""
+
+import hashlib
+import json
+import os
+import tempfile
+from contextlib import suppress
+from typing import Iterable
+
+from gybe import __version__
+from gybe.charts import local_modules, split_chart_ref
+from gybe.exceptions import ChartError
+
+CACHE_DIR_ENV = 'GYBE_CACHE_DIR'
+DEFAULT_MAX_BYTES = 256 * 2**20
+
+# first line of an entry, followed by the local modules it depends on as JSON
+_HEADER = '# gybe cache '
+
+
+def default_cache_dir() -> str:
+    """`$GYBE_CACHE_DIR`, or `gybe` in the user's cache directory."""
+    directory = os.environ.get(CACHE_DIR_ENV)
+    if directory:
+        return directory
+    cache_home = os.environ.get('XDG_CACHE_HOME') or os.path.join(os.path.expanduser('~'), '.cache')
+    return os.path.join(cache_home, 'gybe')
+
+
+def _digest(path: str) -> str:
+    with open(path, 'rb') as f:
+        return hashlib.sha256(f.read()).hexdigest()
+
+
+class RenderCache:
+    """Rendered manifests in a directory, with the least recently used removed over `max_bytes`."""
+
+    def __init__(self, directory: str | None = None, max_bytes: int = DEFAULT_MAX_BYTES):
+        """Use `directory`, `default_cache_dir()` by default, it's created on the first write."""
+        self.directory = directory if directory is not None else default_cache_dir()
+        self.max_bytes = max_bytes
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.directory, f'{key}.yaml')
+
+    def key(
+        self,
+        chart: str,
+        values_paths: Iterable[str] = (),
+        overrides: Iterable[str] = (),
+        typed_overrides: Iterable[str] = (),
+    ) -> str:
+        """Key of rendering a chart, like `chart.py:name`, with values files and overrides."""
+        path, name = split_chart_ref(chart)
+        try:
+            digests = [_digest(path)]
+        except OSError as exc:
+            raise ChartError(f"Can't read chart {path}: {exc.strerror}") from exc
+        digests.extend(_digest(p) for p in values_paths)
+        # charts with the same source in different directories can import different local modules
+        key = [__version__, os.path.abspath(path), name, digests, list(overrides), list(typed_overrides)]
+        return hashlib.sha256(json.dumps(key).encode()).hexdigest()
+
+    def get(self, key: str) -> str | None:
+        """Read back a manifest, None when it isn't cached or a local module it depends on changed."""
+        path = self._path(key)
+        try:
+            with open(path) as f:
+                header = f.readline()
+                modules = json.loads(header[len(_HEADER) :])
+                if any(_digest(module) != digest for module, digest in modules.items()):
+                    return None
+                manifest = f.read()
+            # entries are evicted by modification time, so reading one keeps it
+            os.utime(path)
+        except (OSError, ValueError):
+            return None
+        return manifest
+
+    def put(self, key: str, manifest: str, chart: str) -> None:
+        """Store a manifest rendered from `chart`, once rendered so every local module it imports is known."""
+        modules = {module: _digest(module) for module in local_modules(split_chart_ref(chart)[0])}
+        os.makedirs(self.directory, exist_ok=True)
+        # written to a temporary file first, so concurrent renders never read half an entry
+        fd, tmp = tempfile.mkstemp(dir=self.directory, suffix='.tmp')
+        with os.fdopen(fd, 'w') as f:
+            f.write(f'{_HEADER}{json.dumps(modules)}\n{manifest}')
+        os.replace(tmp, self._path(key))
+        self.evict()
+
+    def evict(self) -> None:
+        """Remove the least recently used entries until the cache is within `max_bytes`."""
+        entries = []
+        total = 0
+        with os.scandir(self.directory) as it:
+            for entry in it:
+                if entry.name.endswith('.yaml'):
+                    stat = entry.stat()
+                    entries.append((stat.st_mtime_ns, stat.st_size, entry.path))
+                    total += stat.st_size
+        # least recently used last
+        entries.sort(reverse=True)
+        while total > self.max_bytes:
+            _, size, path = entries.pop()
+            # another render may have removed it already
+            with suppress(FileNotFoundError):
+                os.remove(path)
+            total -= size
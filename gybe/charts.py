@@ -0,0 +1,156 @@
+"""Load transpilers from chart files, like `chart.py` or `chart.py:two_pods`.
+
+Modules a chart imports from its own directory, like a `helpers.py` next to it, are tracked with
+the chart. They're taken out of `sys.modules` before another chart is loaded, so charts in
+different directories each import their own, and the chart is imported again when one changes.
+"""
+
+import hashlib
+import importlib.util
+import os
+import sys
+from dataclasses import dataclass
+from types import ModuleType
+from typing import TYPE_CHECKING, Iterable
+
+from gybe.exceptions import ChartError
+
+if TYPE_CHECKING:
+    from gybe.rendering import Transpiler
+
+
+@dataclass
+class _Chart:
+    module: ModuleType
+    # modules the chart imported from its directory by name
+    local_modules: dict[str, ModuleType]
+    # modification times of the chart and its local modules when they were imported
+    mtimes: dict[str, int]
+
+    def changed(self) -> bool:
+        try:
+            return any(os.stat(path).st_mtime_ns != mtime for path, mtime in self.mtimes.items())
+        except OSError:
+            return True
+
+
+# loaded charts by path
+_charts: dict[str, _Chart] = {}
+
+
+def split_chart_ref(chart: str) -> tuple[str, str | None]:
+    """Split `path/to/chart.py:name` into the path and transpiler name, None if there's no name."""
+    path, sep, name = chart.rpartition(':')
+    if sep and name.isidentifier():
+        return path, name
+    return chart, None
+
+
+def local_modules(chart_path: str, modules: Iterable[ModuleType] | None = None) -> list[str]:
+    """Source files of the modules imported from the chart's directory, other than the chart itself.
+
+    `modules` are the modules in `sys.modules` by default. Installed packages in a virtualenv below
+    the chart's directory don't count.
+    """
+    chart_path = os.path.abspath(chart_path)
+    root = os.path.dirname(chart_path) + os.sep
+    paths = set()
+    for module in list(sys.modules.values()) if modules is None else modules:
+        path = getattr(module, '__file__', None)
+        if not path or not path.endswith('.py'):
+            continue
+        path = os.path.abspath(path)
+        if path.startswith(root) and path != chart_path and f'{os.sep}site-packages{os.sep}' not in path:
+            paths.add(path)
+    return sorted(paths)
+
+
+def _unload_local_modules(keep: _Chart | None = None) -> None:
+    """Take the local modules of every loaded chart but `keep` out of `sys.modules`."""
+    for chart in _charts.values():
+        if chart is not keep:
+            for name, module in chart.local_modules.items():
+                if sys.modules.get(name) is module:
+                    del sys.modules[name]
+
+
+def load_chart(path: str) -> ModuleType:
+    """Import a chart file, or return the module imported before if neither it nor its local modules changed.
+
+    Charts are imported under a name of their own, so `if __name__ == '__main__'` blocks don't
+    run, with the chart's directory on `sys.path` like when running `python chart.py`.
+    """
+    path = os.path.abspath(path)
+    try:
+        mtime = os.stat(path).st_mtime_ns
+    except OSError as exc:
+        raise ChartError(f"Can't read chart {path}: {exc.strerror}") from exc
+    loaded = _charts.get(path)
+    if loaded is not None and not loaded.changed():
+        _unload_local_modules(keep=loaded)
+        sys.modules.update(loaded.local_modules)
+        return loaded.module
+
+    # the chart imports its local modules again, even ones another chart imported under the same name
+    _unload_local_modules()
+    before = set(sys.modules)
+    module_name = '_gybe_chart_' + hashlib.sha1(path.encode(), usedforsecurity=False).hexdigest()[:12]
+    spec = importlib.util.spec_from_file_location(module_name, path)
+    if spec is None or spec.loader is None:
+        raise ChartError(f"Can't import chart {path}, it should be a Python file")
+    module = importlib.util.module_from_spec(spec)
+    # dataclasses look up their module while they're created
+    sys.modules[module_name] = module
+    sys.path.insert(0, os.path.dirname(path))
+    try:
+        spec.loader.exec_module(module)
+    except BaseException:
+        del sys.modules[module_name]
+        raise
+    finally:
+        sys.path.pop(0)
+    imported = {name: m for name, m in sys.modules.items() if name not in before and name != module_name}
+    files = set(local_modules(path, imported.values()))
+    local = {name: m for name, m in imported.items() if os.path.abspath(getattr(m, '__file__', '')) in files}
+    mtimes = {path: mtime, **{f: os.stat(f).st_mtime_ns for f in files}}
+    _charts[path] = _Chart(module, local, mtimes)
+    return module
+
+
+def _is_transpiler(obj: object) -> bool:
+    # commands made by `gybe.transpiler` keep the decorated function as their callback's `__wrapped__`
+    return hasattr(getattr(obj, 'callback', None), '__wrapped__')
+
+
+def transpiler_function(func: 'Transpiler') -> 'Transpiler':
+    """Find the function a command made by `gybe.transpiler` was made from, or return `func` itself."""
+    callback = getattr(func, 'callback', None)
+    return getattr(callback, '__wrapped__', func)
+
+
+def chart_ref(func: 'Transpiler') -> str:
+    """Find the `path/to/chart.py:name` of a transpiler, so other processes can import it themselves."""
+    f = transpiler_function(func)
+    module = sys.modules.get(f.__module__)
+    path = getattr(module, '__file__', None)
+    command = getattr(module, f.__name__, None)
+    if path is None or command is None or transpiler_function(command) is not f:
+        raise ChartError(f'{f.__qualname__} should be defined at the top level of a chart file')
+    return f'{os.path.abspath(path)}:{f.__name__}'
+
+
+def find_transpiler(chart: str) -> 'Transpiler':
+    """Load the transpiler of a chart, the one named after `:` or the only one the chart defines."""
+    path, name = split_chart_ref(chart)
+    module = load_chart(path)
+    if name is not None:
+        try:
+            return getattr(module, name)
+        except AttributeError:
+            raise ChartError(f'{path} has no transpiler named {name}') from None
+
+    transpilers = {k: v for k, v in vars(module).items() if _is_transpiler(v)}
+    if len(transpilers) != 1:
+        found = ', '.join(transpilers) or 'none'
+        raise ChartError(f'{path} should define one transpiler, or pick one with {path}:name (found {found})')
+    return next(iter(transpilers.values()))
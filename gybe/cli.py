@@ -0,0 +1,108 @@
+"""The `gybe` command, which renders charts and runs the render daemon."""
+
+import io
+from typing import IO
+
+import click
+
+from gybe import __version__, daemon
+from gybe.cache import RenderCache
+from gybe.exceptions import RenderError
+from gybe.options import VALUES_FILE, VALUES_HELP, exit_on_render_error
+
+_socket_option = click.option(
+    '--socket',
+    'socket_path',
+    default=daemon.default_socket_path,
+    show_default='$GYBE_SOCKET or a socket in $XDG_RUNTIME_DIR',
+    help='Unix socket of the render daemon.',
+)
+
+
+@click.group()
+@click.version_option(__version__)
+def main():
+    """Render Kubernetes manifests from gybe charts."""
+
+
+def _render_in_process(
+    chart: str,
+    paths: list[str],
+    overrides: tuple[str, ...],
+    typed_overrides: tuple[str, ...],
+    output: IO[str],
+) -> None:
+    # imported when rendering in-process, so cached and daemon renders start quickly
+    from gybe.charts import find_transpiler
+    from gybe.rendering import transpile
+    from gybe.values import load_values
+    from gybe.yaml import yaml_dump_manifest
+
+    resources = transpile(find_transpiler(chart), load_values(paths), overrides, typed_overrides)
+    yaml_dump_manifest(resources, output)
+
+
+@main.command()
+@click.argument('chart')
+@click.argument('values', required=False, type=VALUES_FILE)
+@click.option('-f', '--values', 'values_files', type=VALUES_FILE, multiple=True, help=VALUES_HELP)
+@click.option(
+    '--set', 'overrides', type=str, multiple=True, help='Override an input value, path.to.arg=value.'
+)
+@click.option(
+    '--set-typed', 'typed_overrides', type=str, multiple=True, help='Like --set, with a YAML value.'
+)
+@click.option('-o', '--output', type=click.File('w'), default='-', help='Write the manifest to a file.')
+@click.option(
+    '--daemon', 'use_daemon', is_flag=True, help="Render with `gybe serve`, in-process when it isn't running."
+)
+@_socket_option
+@click.option(
+    '--cache', 'use_cache', is_flag=True, help='Reuse manifests rendered before, see $GYBE_CACHE_DIR.'
+)
+def render(
+    chart: str,
+    values: str | None,
+    values_files: tuple[str, ...],
+    overrides: tuple[str, ...],
+    typed_overrides: tuple[str, ...],
+    output: IO[str],
+    use_daemon: bool,
+    socket_path: str,
+    use_cache: bool,
+):
+    """Render CHART, a chart file like `chart.py` or `chart.py:two_pods`, with VALUES files."""
+    paths = ([values] if values is not None else []) + list(values_files)
+    if use_cache and '-' in paths:
+        raise click.UsageError("Option --cache can't cache values read from stdin.")
+    try:
+        with exit_on_render_error():
+            cache = RenderCache() if use_cache else None
+            key = cache.key(chart, paths, overrides, typed_overrides) if cache is not None else ''
+            manifest = cache.get(key) if cache is not None else None
+            if manifest is None and use_daemon:
+                # not cached, the local modules the chart imported in the daemon aren't known here
+                manifest = daemon.request_render(socket_path, chart, paths, overrides, typed_overrides)
+            if manifest is not None:
+                output.write(manifest)
+            elif cache is None:
+                _render_in_process(chart, paths, overrides, typed_overrides, output)
+            else:
+                stream = io.StringIO()
+                _render_in_process(chart, paths, overrides, typed_overrides, stream)
+                cache.put(key, stream.getvalue(), chart)
+                output.write(stream.getvalue())
+    except RenderError as exc:
+        raise click.ClickException(str(exc)) from exc
+
+
+@main.command()
+@click.option('--preload', multiple=True, help='Import a chart when starting, can be given more than once.')
+@_socket_option
+def serve(preload: tuple[str, ...], socket_path: str):
+    """Render charts for `gybe render --daemon` until interrupted."""
+    click.echo(f'Listening on {socket_path}', err=True)
+    try:
+        daemon.serve(socket_path, preload)
+    except (OSError, RenderError) as exc:
+        raise click.ClickException(str(exc)) from exc
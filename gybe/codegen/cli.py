@@ -1,13 +1,47 @@
 """gybe.k8s codegen cli"""
 
 import argparse
+from pathlib import Path
 
-from gybe.codegen.k8s_modules import write_module
+from gybe.codegen.k8s_modules import CodegenOptions, write_modules
 
 
 def main():
     """Run gybe.k8s code generator cli"""
     parser = argparse.ArgumentParser()
-    parser.add_argument('k8s_version_module')
+    parser.add_argument(
+        'k8s_version_modules',
+        nargs='+',
+        metavar='k8s_version_module[=openapi_dir]',
+        help='version modules from oldest to newest, models identical to an older version are shared',
+    )
+    parser.add_argument('--slots', action='store_true', help='generate dataclasses with slots=True')
+    parser.add_argument('--kw-only', action='store_true', help='generate dataclasses with kw_only=True')
+    parser.add_argument('--sparse', action='store_true', help='generate models that only store set fields')
+    parser.add_argument(
+        '--slim-docs',
+        action='store_true',
+        help='write model docstrings to a docs.json index instead of the modules',
+    )
+    parser.add_argument(
+        '--split', action='store_true', help='split large modules into lazily imported submodules'
+    )
+    parser.add_argument(
+        '--to-dict',
+        action='store_true',
+        help='generate to_dict() methods, faster for render_dicts() than compiled unstructure functions',
+    )
     args = parser.parse_args()
-    write_module(args.k8s_version_module)
+    options = CodegenOptions(
+        slots=args.slots,
+        kw_only=args.kw_only,
+        sparse=args.sparse,
+        slim_docs=args.slim_docs,
+        split=args.split,
+        to_dict=args.to_dict,
+    )
+    k8s_openapi_dirs = dict()
+    for arg in args.k8s_version_modules:
+        version_module, _, openapi_dir = arg.partition('=')
+        k8s_openapi_dirs[version_module] = Path(openapi_dir or 'kubernetes/api/openapi-spec/v3')
+    write_modules(k8s_openapi_dirs, options=options)
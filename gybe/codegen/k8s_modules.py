@@ -3,11 +3,16 @@
 from __future__ import annotations
 
 import ast
+import copy
 import json
+import re
+import shutil
 import textwrap
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Optional, TypeAlias, TypedDict, Union
+from typing import Iterable, Iterator, Mapping, Optional, TypeAlias, TypedDict, Union
+
+from gybe.k8s.docs import INDEX_FILE
 
 # a json-serializable dict
 JSONObj: TypeAlias = Union[dict[str, 'JSONObj'], list['JSONObj'], str, int, float, bool, None]
@@ -19,6 +24,9 @@ schema_type_map = dict(
     number='float',
     object='JSONDict',
 )
+# modules with fewer models than this aren't split into submodules
+SPLIT_MIN_MODELS = 20
+
 # ignored models fallback to `JSONObj`
 ignore_models = {
     # includes hyphenated fields
@@ -66,10 +74,43 @@ class K8sResourceRef:
             return self.version
 
 
+@dataclass
+class CodegenOptions:
+    """Options controlling how generated model classes are written."""
+
+    slots: bool = False
+    kw_only: bool = False
+    sparse: bool = False
+    slim_docs: bool = False
+    split: bool = False
+    to_dict: bool = False
+
+    def __post_init__(self):
+        """Reject options that can't be combined."""
+        if self.sparse and (self.slots or self.kw_only):
+            raise ValueError(
+                'sparse models define their own slots and __init__, so slots and kw_only do not apply'
+            )
+        if self.sparse and self.to_dict:
+            raise ValueError('sparse models are unstructured by only visiting the fields that were set')
+
+    @property
+    def dataclass_decorator(self) -> str:
+        """Decorator applied to every generated model class."""
+        args = [f'{k}=True' for k in ('slots', 'kw_only') if getattr(self, k)]
+        return '@dataclass' + (f'({", ".join(args)})' if args else '')
+
+
 class K8sModule:
     """An abstract representation of a kubernetes module in gybe."""
 
-    def __init__(self, version_module: str, module_name: str, module_dir: Path):
+    def __init__(
+        self,
+        version_module: str,
+        module_name: str,
+        module_dir: Path,
+        options: CodegenOptions | None = None,
+    ):
         """Initialize a K8sModule.
 
         Attributes
@@ -77,8 +118,10 @@ class K8sModule:
         version_module: Python version submodule under the k8s module (ex: 'v1_30')
         module_name: Python non-relative import path (ex: 'gybe.k8s.v1_30.apps.v1').
         module_dir: Path to gybe.k8s module directory.
+        options: Options for the generated model classes.
 
         """
+        self._options = options or CodegenOptions()
         self._version_module = version_module
         self._module_name = module_name
         root_gybe_dir = module_dir.parent.parent
@@ -86,12 +129,72 @@ class K8sModule:
         self._module_path.parent.mkdir(exist_ok=True)
         self._module_imports: set[str] = set()
         self._class_defs: list[ast.ClassDef] = []
+        self._reexports: dict[str, str] = dict()
         self._line_length = 110
+        self.docs: dict[str, str] = dict()
+
+    @property
+    def module_name(self) -> str:
+        """Python non-relative import path of the module."""
+        return self._module_name
+
+    @property
+    def class_defs(self) -> list[ast.ClassDef]:
+        """Model classes defined by the module."""
+        return self._class_defs
+
+    def reexport(self, name: str, module_name: str) -> None:
+        """Replace the model `name` with the identical model defined by `module_name`."""
+        self._class_defs = [c for c in self._class_defs if c.name != name]
+        self.docs.pop(name, None)
+        self._reexports[name] = module_name
 
     def write_module(self):
-        """Write abstract module to python file."""
-        with open(self._module_path, 'w') as f:
-            f.write(self._unparse())
+        """Write abstract module to python file, or to a package of submodules when it's split."""
+        package_dir = self._module_path.with_suffix('')
+        if self._options.split and len(self._class_defs) >= SPLIT_MIN_MODELS:
+            self._module_path.unlink(missing_ok=True)
+            self._write_package(package_dir)
+        else:
+            # a package left by a split run would shadow the module
+            shutil.rmtree(package_dir, ignore_errors=True)
+            imports = self._module_imports
+            if self._reexports:
+                # re-exported models are referenced through this module, which imports them lazily
+                qualify = _QualifyNames(set(self._reexports), self._module_name)
+                for c in self._class_defs:
+                    qualify.visit(c)
+                imports = imports | {f'import {self._module_name}'}
+            with open(self._module_path, 'w') as f:
+                f.write(self._unparse(self._class_defs, imports, reexports=self._reexports))
+
+    def _write_package(self, package_dir: Path) -> None:
+        package_dir.mkdir(exist_ok=True)
+        exports: dict[str, str] = dict()
+        for submodule, class_defs in _split_models(self._class_defs).items():
+            submodule_name = f'{self._module_name}.{submodule}'
+            # models of sibling submodules are referenced through the package, which imports them lazily
+            siblings = {c.name for c in self._class_defs} - {c.name for c in class_defs} | set(
+                self._reexports
+            )
+            qualify = _QualifyNames(siblings, self._module_name)
+            for c in class_defs:
+                qualify.visit(c)
+                exports[c.name] = submodule_name
+            imports = {f'import {m}' for c in class_defs for m in _referenced_modules(c)}
+            with open(package_dir / f'{submodule}.py', 'w') as f:
+                f.write(self._unparse(class_defs, imports, docs_module='__package__'))
+        exports.update(self._reexports)
+
+        names = ''.join(f'    {n!r},\n' for n in exports)
+        attributes = ''.join(f'        {n!r}: {m!r},\n' for n, m in exports.items())
+        with open(package_dir / '__init__.py', 'w') as f:
+            f.write(
+                '"""Models generated from Kubernetes OpenAPI Spec."""\n\n'
+                'from gybe.lazy import lazy_attributes\n\n'
+                f'__all__ = [\n{names}]\n\n'
+                f'__getattr__, __dir__ = lazy_attributes(\n    __name__,\n    {{\n{attributes}    }},\n)\n'
+            )
 
     def add_model(
         self,
@@ -118,20 +221,43 @@ class K8sModule:
         )
         self._class_defs.append(model_def)
 
-    def _unparse(self):
+    def _unparse(
+        self,
+        class_defs: list[ast.ClassDef],
+        module_imports: set[str],
+        docs_module: str = '__name__',
+        reexports: Mapping[str, str] | None = None,
+    ) -> str:
         if self._module_name.endswith('api.resource'):
             return '"""Models generated from Kubernetes OpenAPI Spec."""\nQuantity = str | int | float'
 
         imports = [
             '"""Models generated from Kubernetes OpenAPI Spec."""',
             'from __future__ import annotations',
-            'from typing import List, Optional, Literal',
+            'from typing import Any, List, Optional, Literal',
             'from dataclasses import dataclass',
             'from gybe.k8s.types import JSONObj, JSONDict, K8sSpec, K8sResource',
-        ] + sorted(list(self._module_imports))
+        ]
+        if self._options.to_dict:
+            imports.append('from gybe.k8s.types import SCALAR_TYPES, unstructure_value')
+        if self._options.sparse:
+            imports.append('from gybe.k8s.sparse import SparseK8sSpec, SparseK8sResource')
+        if self._options.slim_docs:
+            imports.append('from gybe.k8s.docs import IndexedDoc')
+        if reexports:
+            imports.append('from gybe.lazy import lazy_attributes')
+        imports += sorted(list(module_imports))
+        if self._options.slim_docs:
+            imports.append(f'_docs = IndexedDoc({docs_module})')
         mod = ast.parse('\n'.join(imports))
-        for c in self._class_defs:
+        for c in class_defs:
             mod.body.append(c)
+        if self._options.slim_docs:
+            mod.body.append(ast.parse('_docs.imported = True').body[0])
+        if reexports:
+            mod.body.append(
+                ast.parse(f'__getattr__, __dir__ = lazy_attributes(__name__, {dict(reexports)!r})').body[0]
+            )
         return ast.unparse(mod)
 
     def _model_def(
@@ -143,7 +269,10 @@ class K8sModule:
         resource_properties: dict[str, str],
     ) -> ast.ClassDef:
         base_cls = 'K8sSpec' if len(resource_properties) == 0 else 'K8sResource'
-        cdef = ast.parse('@dataclass\nclass ' + name + f'({base_cls}):\n    pass').body[0]
+        if self._options.sparse:
+            base_cls = 'Sparse' + base_cls
+        decorator = self._options.dataclass_decorator
+        cdef = ast.parse(f'{decorator}\nclass {name}({base_cls}):\n    pass').body[0]
         if not isinstance(cdef, ast.ClassDef):
             raise ValueError(f'{cdef} is not expected ast.ClassDef')
 
@@ -153,29 +282,77 @@ class K8sModule:
             self._prop_desc(properties),
             '',
         ]
-        docstring = '\n'.join(sections).replace('"', "'").replace('\\', '')
-        docstring = textwrap.indent(docstring, '    ')
-        cdef.body = [ast.parse(f'"""\n{docstring}\n"""').body[0]]
+        if self._options.slim_docs:
+            # the docstring goes to the documentation index of the version package
+            self.docs[name] = '\n'.join(sections)
+            cdef.body = [ast.parse('__doc__ = _docs').body[0]]
+        else:
+            docstring = '\n'.join(sections).replace('"', "'").replace('\\', '')
+            docstring = textwrap.indent(docstring, '    ')
+            cdef.body = [ast.parse(f'"""\n{docstring}\n"""').body[0]]
+        if self._options.sparse:
+            cdef.body.append(ast.parse('__slots__ = ()').body[0])
 
         literal_props = resource_properties or dict()
-        fields: list[tuple[str, int]] = []
+        fields: list[tuple[str, int, str]] = []
         for k, v in properties.items():
             if k in literal_props:
                 literal_value = literal_props[k]
-                fields.append((f"{k}: Literal['{literal_value}'] = '{literal_value}'", 200))
+                fields.append((f"{k}: Literal['{literal_value}'] = '{literal_value}'", 200, k))
             elif k in required:
                 field_type = self._type_hint_for(properties[k])
                 field = f'{k}: {field_type}'
-                fields.append((field, required.index(k)))
+                fields.append((field, required.index(k), k))
             else:
                 field_type = self._type_hint_for(v)
                 field = f'{k}: Optional[{field_type}] = None'
-                fields.append((field, 300))
+                fields.append((field, 300, k))
 
-        for field, _ in sorted(fields, key=lambda f: f[1]):
+        sorted_fields = sorted(fields, key=lambda f: f[1])
+        for field, _, _ in sorted_fields:
             cdef.body.append(ast.parse(field).body[0])
+        if self._options.to_dict:
+            cdef.body.append(self._to_dict_def([(k, properties[k]) for _, _, k in sorted_fields]))
         return cdef
 
+    def _to_dict_def(self, properties: list[tuple[str, JSONSchemaProperties]]) -> ast.stmt:
+        lines = [
+            'def to_dict(self) -> JSONDict:',
+            '    """Convert to a JSON dict, omitting None values."""',
+            '    d: dict[str, Any] = {}',
+        ]
+        for k, v in properties:
+            lines += [
+                f'    if self.{k} is not None:',
+                f"        d['{k}'] = {self._to_dict_expr(v, f'self.{k}')}",
+            ]
+        lines.append('    return d')
+        return ast.parse('\n'.join(lines)).body[0]
+
+    def _to_dict_expr(self, v: JSONSchemaProperties, var: str, depth: int = 0) -> str:
+        # checks value types like `gybe.converter.make_unstructure_fn`, so both give the same dict
+        scalar = f'{var} if {var}.__class__ in SCALAR_TYPES else unstructure_value({var})'
+        json_type = v.get('type')
+        if json_type == 'array':
+            item = f'v{depth}'
+            item_expr = self._to_dict_expr(v['items'], item, depth + 1)
+            return (
+                f'[{item_expr} for {item} in {var}] if {var}.__class__ is list else unstructure_value({var})'
+            )
+        elif json_type == 'object':
+            return f'unstructure_value({var})'
+        elif json_type is not None:
+            return scalar
+
+        ref = self._ref_for(v)
+        if any(m in ref for m in ignore_models):
+            return f'unstructure_value({var})'
+        elif ref.endswith('IntOrString') or 'Time' in ref:
+            return scalar
+        elif _ref_to_module_name(ref, version_module=self._version_module).endswith('api.resource'):
+            return scalar
+        return f'{var}.to_dict() if isinstance({var}, K8sSpec) else unstructure_value({var})'
+
     def _prop_desc(self, properties: dict[str, JSONSchemaProperties]) -> str:
         descriptions = []
         for k, v in properties.items():
@@ -191,6 +368,14 @@ class K8sModule:
         fd = '\n'.join(descriptions)
         return textwrap.indent(fd, '    ')
 
+    def _ref_for(self, v: JSONSchemaProperties) -> str:
+        ref = v.get('$ref')
+        if ref is None:
+            allof = v.get('allOf')
+            if allof is not None:
+                ref = allof[0]['$ref']  # type: ignore
+        return str(ref)
+
     def _type_hint_for(self, v: JSONSchemaProperties) -> str:
         json_type = v.get('type')
         if json_type == 'array':
@@ -199,13 +384,7 @@ class K8sModule:
         elif json_type is not None:
             return schema_type_map[json_type]
 
-        ref = v.get('$ref')
-        if ref is None:
-            allof = v.get('allOf')
-            if allof is not None:
-                ref = allof[0]['$ref']  # type: ignore
-
-        ref = str(ref)
+        ref = self._ref_for(v)
         import_ = _ref_to_module_name(ref, version_module=self._version_module)
         for m in ignore_models:
             if m in ref:
@@ -221,7 +400,93 @@ class K8sModule:
             return ref.split('.')[-1]
 
 
-def _write_k8s_models(k8s_openapi_dir: Path, k8s_module_dir: Path, k8s_version_module: str) -> None:
+def _snake_case(name: str) -> str:
+    name = re.sub(r'([A-Z]+)([A-Z][a-z])', r'\1_\2', name)
+    return re.sub(r'([a-z0-9])([A-Z])', r'\1_\2', name).lower()
+
+
+def _annotations(cdef: ast.ClassDef) -> Iterator[ast.expr]:
+    for stmt in cdef.body:
+        if isinstance(stmt, ast.AnnAssign):
+            yield stmt.annotation
+
+
+def _referenced_names(cdef: ast.ClassDef) -> set[str]:
+    return {n.id for a in _annotations(cdef) for n in ast.walk(a) if isinstance(n, ast.Name)}
+
+
+def _referenced_modules(cdef: ast.ClassDef) -> set[str]:
+    paths = (ast.unparse(n) for a in _annotations(cdef) for n in ast.walk(a) if isinstance(n, ast.Attribute))
+    # only the full model paths, like `gybe.k8s.v1_32.meta.v1.ObjectMeta`, not their prefixes
+    return {p.rsplit('.', 1)[0] for p in paths if p.startswith('gybe.') and p.count('.') >= 5}
+
+
+class _QualifyNames(ast.NodeTransformer):
+    """Rewrite references to models in other submodules to their path through the split package."""
+
+    def __init__(self, names: set[str], module_name: str):
+        self._names = names
+        self._module_name = module_name
+
+    def visit_ClassDef(self, node: ast.ClassDef) -> ast.ClassDef:  # noqa: N802
+        for stmt in node.body:
+            if isinstance(stmt, ast.AnnAssign):
+                stmt.annotation = self.visit(stmt.annotation)
+        return node
+
+    def visit_Name(self, node: ast.Name) -> ast.expr:  # noqa: N802
+        if node.id in self._names:
+            return ast.parse(f'{self._module_name}.{node.id}', mode='eval').body
+        return node
+
+
+def _split_models(class_defs: list[ast.ClassDef]) -> dict[str, list[ast.ClassDef]]:
+    """Group the models of a module into submodules by their dependency closures.
+
+    Each resource kind, or model that no other model in the module references, is a root. Models
+    are grouped by the set of roots they're reachable from, so a kind and its private spec types
+    share a submodule and types used by several kinds get a submodule of their own. Submodules
+    are named after the top model of their group, like `_pod` or `_pod_spec`.
+    """
+    names = {c.name: c for c in class_defs}
+    refs = {c.name: (_referenced_names(c) & names.keys()) - {c.name} for c in class_defs}
+    referenced = set().union(*refs.values())
+    owners: dict[str, set[str]] = {name: set() for name in names}
+
+    def visit(root: str) -> None:
+        stack = [root]
+        while stack:
+            name = stack.pop()
+            if root not in owners[name]:
+                owners[name].add(root)
+                stack.extend(refs[name])
+
+    for c in class_defs:
+        base = c.bases[0]
+        if (isinstance(base, ast.Name) and base.id.endswith('K8sResource')) or c.name not in referenced:
+            visit(c.name)
+    for c in class_defs:
+        # models only reachable through a reference cycle
+        if not owners[c.name]:
+            visit(c.name)
+
+    groups: dict[frozenset[str], list[str]] = dict()
+    for c in class_defs:
+        groups.setdefault(frozenset(owners[c.name]), []).append(c.name)
+    submodules = dict()
+    for group in groups.values():
+        members = set(group)
+        tops = [n for n in group if not any(n in refs[m] for m in members - {n})]
+        submodules['_' + _snake_case(min(tops or group))] = [names[n] for n in group]
+    return submodules
+
+
+def _build_k8s_models(
+    k8s_openapi_dir: Path,
+    k8s_module_dir: Path,
+    k8s_version_module: str,
+    options: CodegenOptions,
+) -> dict[str, K8sModule]:
     model_schemas = dict()
     for p in k8s_openapi_dir.iterdir():
         with p.open() as f:
@@ -240,6 +505,7 @@ def _write_k8s_models(k8s_openapi_dir: Path, k8s_module_dir: Path, k8s_version_m
                 module_dir=k8s_module_dir,
                 module_name=module_name,
                 version_module=k8s_version_module,
+                options=options,
             )
 
     for name, schema in model_schemas.items():
@@ -255,15 +521,109 @@ def _write_k8s_models(k8s_openapi_dir: Path, k8s_module_dir: Path, k8s_version_m
         if properties:
             k8s_module = k8s_modules[_ref_to_module_name(name, k8s_version_module)]
             k8s_module.add_model(name, properties, description, required, resource_ref)
-
+    return k8s_modules
+
+
+def _model_refs(cdef: ast.ClassDef, module_name: str, version_module: str) -> list[str]:
+    """Names referenced by a model's type hints, as paths without the version like `core.v1.PodSpec`."""
+    prefix = f'gybe.k8s.{version_module}.'
+    local = module_name[len(prefix) :]
+    refs = []
+    for a in _annotations(cdef):
+        for n in ast.walk(a):
+            if isinstance(n, ast.Name):
+                refs.append(f'{local}.{n.id}')
+            elif isinstance(n, ast.Attribute) and (path := ast.unparse(n)).startswith(prefix):
+                refs.append(path[len(prefix) :])
+    return refs
+
+
+def _dedupe_models(versions: Mapping[str, Mapping[str, K8sModule]]) -> None:
+    """Re-export models that are identical to a model of an earlier version instead of redefining them.
+
+    Models are identical when their fields are, apart from the version in type hints and their
+    docstrings, and the models they reference are identical too. Starting from the fields alone,
+    models are split into groups until every model of a group references the same groups.
+    """
+    sources: dict[tuple[str, str], str] = dict()
+    refs: dict[tuple[str, str], list[str]] = dict()
+    for version_module, modules in versions.items():
+        prefix = f'gybe.k8s.{version_module}.'
+        for module_name, module in modules.items():
+            for c in module.class_defs:
+                node = (version_module, f'{module_name[len(prefix) :]}.{c.name}')
+                fields = copy.copy(c)
+                fields.body = [
+                    s for s in c.body if not (isinstance(s, ast.Expr) and isinstance(s.value, ast.Constant))
+                ]
+                source = ast.unparse(fields)
+                sources[node] = node[1] + '\n' + source.replace(prefix, 'gybe.k8s.')
+                refs[node] = _model_refs(c, module_name, version_module)
+
+    ids: dict[object, int] = dict()
+    groups = {node: ids.setdefault(source, len(ids)) for node, source in sources.items()}
+    while True:
+        keys = {
+            node: (group, tuple(groups.get((node[0], r)) for r in refs[node]))
+            for node, group in groups.items()
+        }
+        ids = dict()
+        refined = {node: ids.setdefault(key, len(ids)) for node, key in keys.items()}
+        if len(ids) == len(set(groups.values())):
+            break
+        groups = refined
+
+    defined_by: dict[int, str] = dict()
+    for version_module, modules in versions.items():
+        prefix = f'gybe.k8s.{version_module}.'
+        for module_name, module in modules.items():
+            for c in list(module.class_defs):
+                group = groups[(version_module, f'{module_name[len(prefix) :]}.{c.name}')]
+                home = defined_by.setdefault(group, module_name)
+                if home != module_name:
+                    module.reexport(c.name, home)
+
+
+def _write_k8s_models(
+    k8s_module_dir: Path,
+    k8s_version_module: str,
+    k8s_modules: dict[str, K8sModule],
+    options: CodegenOptions,
+) -> None:
     for k8s_module in k8s_modules.values():
         k8s_module.write_module()
+    _write_module_init(k8s_module_dir / k8s_version_module, k8s_modules)
+    if options.slim_docs:
+        _write_docs_index(k8s_module_dir / k8s_version_module, k8s_modules)
+
 
+def _write_docs_index(module_path: Path, modules: dict[str, K8sModule]) -> None:
+    index = {
+        module_name.split('.', 3)[3]: module.docs
+        for module_name, module in sorted(modules.items())
+        if module.docs
+    }
+    with open(module_path / INDEX_FILE, 'w') as f:
+        json.dump(index, f, separators=(',', ':'))
 
-def _write_module_init(module_path: Path) -> None:
+
+def _write_module_init(module_path: Path, modules: Iterable[str] = ()) -> None:
     module_path.mkdir(exist_ok=True)
+    # API groups are namespace packages, importing a group imports each of its version modules
+    groups: dict[str, list[str]] = dict()
+    for module_name in sorted(modules):
+        groups.setdefault(module_name.split('.')[3], []).append(module_name)
+    names = ''.join(f'    {g!r},\n' for g in groups)
+    attributes = ''
+    for group, group_modules in groups.items():
+        attributes += f'        {group!r}: ({", ".join(map(repr, group_modules))},),\n'
     with open(module_path / '__init__.py', 'w') as f:
-        f.write('"""k8s dataclass models generated by gybe"""')
+        f.write(
+            '"""k8s dataclass models generated by gybe"""\n\n'
+            'from gybe.lazy import lazy_attributes\n\n'
+            f'__all__ = [\n{names}]\n\n'
+            f'__getattr__, __dir__ = lazy_attributes(\n    __name__,\n    {{\n{attributes}    }},\n)\n'
+        )
 
 
 def _ref_to_model_path(ref: str, version_module: str) -> str:
@@ -278,12 +638,35 @@ def write_module(
     k8s_version_module: str,
     k8s_module_dir: Path = Path('gybe/k8s/'),
     k8s_openapi_dir: Path = Path('kubernetes/api/openapi-spec/v3'),
+    options: CodegenOptions | None = None,
 ) -> None:
     """Write generated k8s module based on kubernetes JSON schema."""
-    _write_module_init(k8s_module_dir / k8s_version_module)
+    write_modules({k8s_version_module: k8s_openapi_dir}, k8s_module_dir=k8s_module_dir, options=options)
+
+
+def write_modules(
+    k8s_openapi_dirs: Mapping[str, Path],
+    k8s_module_dir: Path = Path('gybe/k8s/'),
+    options: CodegenOptions | None = None,
+) -> None:
+    """Write generated k8s modules of several versions in one pass, sharing identical models.
+
+    `k8s_openapi_dirs` maps each version module to its kubernetes JSON schema directory, from the
+    oldest version to the newest. A model that's identical to one of an earlier version is only
+    defined by the earlier version's module and lazily re-exported by the later ones, so the
+    versions share classes and unstructure functions.
+    """
+    options = options or CodegenOptions()
     k8s_module_dir.mkdir(parents=True, exist_ok=True)
-    _write_k8s_models(
-        k8s_openapi_dir=k8s_openapi_dir,
-        k8s_module_dir=k8s_module_dir,
-        k8s_version_module=k8s_version_module,
-    )
+    versions = dict()
+    for k8s_version_module, k8s_openapi_dir in k8s_openapi_dirs.items():
+        _write_module_init(k8s_module_dir / k8s_version_module)
+        versions[k8s_version_module] = _build_k8s_models(
+            k8s_openapi_dir=k8s_openapi_dir,
+            k8s_module_dir=k8s_module_dir,
+            k8s_version_module=k8s_version_module,
+            options=options,
+        )
+    _dedupe_models(versions)
+    for k8s_version_module, k8s_modules in versions.items():
+        _write_k8s_models(k8s_module_dir, k8s_version_module, k8s_modules, options)
@@ -0,0 +1,163 @@
+"""Convert between JSON objects and gybe models."""
+
+import linecache
+import types
+import typing
+from dataclasses import fields
+from functools import partial
+from typing import Any, Callable, Literal, Union, get_args, get_origin
+
+from cattrs import Converter
+
+from gybe.k8s.sparse import SparseK8sSpec, sparse_layout
+from gybe.k8s.types import SCALAR_TYPES, JSONDict, K8sSpec
+
+UnstructureFn: typing.TypeAlias = Callable[..., JSONDict]
+Memo: typing.TypeAlias = dict[int, tuple[K8sSpec, JSONDict]]
+
+_scalar_types = SCALAR_TYPES
+_unstructure_fns: dict[type, UnstructureFn] = {}
+
+
+def _field_kind(hint: Any) -> Any:
+    """Classify a resolved type hint as 'scalar', 'spec', ('list', kind) or 'any'."""
+    origin = get_origin(hint)
+    if origin is Literal:
+        return 'scalar'
+    if origin is Union or origin is types.UnionType:
+        kinds = {_field_kind(a) for a in get_args(hint) if a is not type(None)}
+        return kinds.pop() if len(kinds) == 1 else 'any'
+    if origin is list:
+        args = get_args(hint)
+        return ('list', _field_kind(args[0]) if args else 'any')
+    if hint in _scalar_types:
+        return 'scalar'
+    if isinstance(hint, type) and issubclass(hint, K8sSpec):
+        return 'spec'
+    return 'any'
+
+
+def _value_expr(kind: Any, var: str) -> str:
+    if kind == 'scalar':
+        return f'{var} if {var}.__class__ in _scalar_types else _u({var})'
+    if kind == 'spec':
+        return f'_unstructure_value({var}, memo)'
+    if isinstance(kind, tuple):
+        item = '_i' + var
+        return f'[{_value_expr(kind[1], item)} for {item} in {var}] if {var}.__class__ is list else _u({var})'
+    return f'_u({var})'
+
+
+def make_unstructure_fn(cls: type[K8sSpec]) -> UnstructureFn:
+    """Compile a function that unstructures instances of `cls` into a dict without None values.
+
+    Type hints are resolved once so each field gets a specialized conversion instead of going
+    through the generic cattrs dispatch on every call. `SparseK8sSpec` models only visit the
+    fields stored on the instance. The compiled function takes an optional memo, see
+    `unstructure_model`.
+    """
+    try:
+        hints = typing.get_type_hints(cls)
+    except Exception:
+        hints = {}
+    exprs = {f.name: _value_expr(_field_kind(hints.get(f.name)), 'v') for f in fields(cls)}
+
+    if issubclass(cls, SparseK8sSpec):
+        # only visit the fields stored on the instance
+        lines = ['_converters = {']
+        lines += [f'    {name!r}: lambda v, memo: {expr},' for name, expr in exprs.items()]
+        lines += [
+            '}',
+            'def unstructure(obj, memo=None):',
+            '    d = {}',
+            '    m = obj._mask',
+            '    names = _layouts.get(m)',
+            '    if names is None:',
+            '        names = _layout(m)',
+            '    for k, v in zip(names, obj._values):',
+            '        d[k] = v if v.__class__ in _scalar_types else _converters[k](v, memo)',
+            '    return d',
+        ]
+    else:
+        lines = ['def unstructure(obj, memo=None):', '    d = {}']
+        for name, expr in exprs.items():
+            lines += [
+                f'    v = obj.{name}',
+                '    if v is not None:',
+                f'        d[{name!r}] = {expr}',
+            ]
+        lines.append('    return d')
+
+    source = '\n'.join(lines) + '\n'
+    filename = f'<gybe unstructure {cls.__module__}.{cls.__qualname__}>'
+    namespace: dict[str, Any] = {
+        '_scalar_types': _scalar_types,
+        '_u': converter.unstructure,
+        '_unstructure_value': _unstructure_value,
+    }
+    if issubclass(cls, SparseK8sSpec):
+        namespace['_layouts'] = cls._sparse_layouts
+        namespace['_layout'] = partial(sparse_layout, cls)
+    exec(compile(source, filename, 'exec'), namespace)  # noqa: S102
+    linecache.cache[filename] = (len(source), None, source.splitlines(True), filename)
+    return namespace['unstructure']
+
+
+def _to_dict_fn(cls: type[K8sSpec]) -> UnstructureFn:
+    to_dict = cls.to_dict
+    compiled = make_unstructure_fn(cls)
+
+    def unstructure(obj: K8sSpec, memo: Memo | None = None) -> JSONDict:
+        if memo is None:
+            # generated to_dict() checks value types like the compiled function, so both give the same dict
+            return to_dict(obj)
+        # to_dict() calls nested to_dict() methods directly, so only the compiled function can
+        # look up shared subtrees in the memo
+        return compiled(obj, memo)
+
+    return unstructure
+
+
+def get_unstructure_fn(cls: type[K8sSpec]) -> UnstructureFn:
+    """Get the cached unstructure function for a model class, compiling it on first use.
+
+    Classes that define their own `to_dict()`, like models generated by `gybe.codegen`, are
+    unstructured with it directly.
+    """
+    fn = _unstructure_fns.get(cls)
+    if fn is None:
+        fn = _to_dict_fn(cls) if 'to_dict' in cls.__dict__ else make_unstructure_fn(cls)
+        _unstructure_fns[cls] = fn
+    return fn
+
+
+def unstructure_model(obj: K8sSpec, memo: Memo | None = None) -> JSONDict:
+    """Unstructure a model into a dict, omitting None values.
+
+    With a `memo`, a model instance that appears several times, like a `PodSpec` shared by many
+    resources, is unstructured once and its dict is reused for every later occurrence. Keep one
+    memo per render, it holds a reference to every model it has seen.
+    """
+    if memo is not None:
+        return _unstructure_value(obj, memo)
+    return get_unstructure_fn(obj.__class__)(obj)
+
+
+def _unstructure_value(v: Any, memo: Memo | None) -> Any:
+    fn = _unstructure_fns.get(v.__class__)
+    if fn is None:
+        if not isinstance(v, K8sSpec):
+            return converter.unstructure(v)
+        fn = get_unstructure_fn(v.__class__)
+    if memo is None:
+        return fn(v)
+    key = id(v)
+    hit = memo.get(key)
+    if hit is None:
+        # keep a reference to the model so its id can't be reused during the render
+        hit = memo[key] = (v, fn(v, memo))
+    return hit[1]
+
+
+converter = Converter()
+converter.register_unstructure_hook(K8sSpec, unstructure_model)
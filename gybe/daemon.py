@@ -0,0 +1,219 @@
+"""Render charts in a long-running process over a Unix socket.
+
+`gybe serve` imports the k8s models and charts once and keeps them, and the converter hooks they
+compile, warm between renders. Each connection sends one JSON request line:
+
+    {"chart": "/abs/path/chart.py[:name]", "values": ["/abs/path/values.yaml", {"yaml": "<stdin>"}],
+     "overrides": ["path=value"], "typed_overrides": ["path=3"], "cwd": "/abs/path"}
+
+and reads back one JSON response, `{"yaml": "<manifest>"}` or `{"error": {"type": ..., ...}}`.
+Values files are merged in order, each is parsed once for as long as it's unchanged. Requests
+are rendered one at a time in the client's working directory, so charts never run concurrently
+and read relative paths like they do in-process.
+
+Clients only connect to sockets owned by their own user, and the daemon only binds sockets in
+directories other users can't add files to, so no other user can receive values or send back
+manifests.
+"""
+
+import json
+import os
+import signal
+import socket
+import socketserver
+import stat
+import sys
+import tempfile
+import traceback
+from typing import Any, Iterable
+
+from gybe.charts import find_transpiler, split_chart_ref
+from gybe.exceptions import (
+    ChartError,
+    DaemonError,
+    InputValidationError,
+    InvalidOutputError,
+    InvalidOverrideError,
+    RenderError,
+)
+
+SOCKET_ENV = 'GYBE_SOCKET'
+
+
+def default_socket_path() -> str:
+    """`$GYBE_SOCKET`, or a socket per user in the runtime directory or a private temp directory."""
+    if os.environ.get(SOCKET_ENV):
+        return os.environ[SOCKET_ENV]
+    runtime_dir = os.environ.get('XDG_RUNTIME_DIR')
+    if runtime_dir:
+        return os.path.join(runtime_dir, f'gybe-{os.getuid()}.sock')
+    # the temp directory is shared with every user, the daemon creates one only its user can use
+    return os.path.join(tempfile.gettempdir(), f'gybe-{os.getuid()}', 'gybe.sock')
+
+
+def _check_directory(directory: str) -> None:
+    """Raise OSError for a directory where other users could replace the daemon's socket."""
+    st = os.stat(directory)
+    # like /tmp, anyone can add files to sticky directories but only remove their own
+    writable = st.st_mode & 0o022 and not st.st_mode & stat.S_ISVTX
+    if st.st_uid not in (os.getuid(), 0) or writable:
+        raise OSError(f"Other users can write to {directory}, the daemon's socket needs a private directory")
+
+
+def _error_json(exc: RenderError) -> dict[str, Any]:
+    error: dict[str, Any] = {'type': type(exc).__name__, 'message': str(exc)}
+    if isinstance(exc, InputValidationError):
+        error['errors'] = exc.errors
+    elif isinstance(exc, InvalidOverrideError):
+        error['errors'] = exc.errors
+    return error
+
+
+def _raise_error(error: dict[str, Any]) -> None:
+    kind = error['type']
+    if kind == 'InputValidationError':
+        raise InputValidationError(error['errors'])
+    if kind == 'InvalidOverrideError':
+        errors = [(override, message) for override, message in error['errors']]
+        raise InvalidOverrideError(errors[0][0], errors[0][1], errors)
+    if kind == 'InvalidOutputError':
+        raise InvalidOutputError()
+    if kind == 'ChartError':
+        raise ChartError(error['message'])
+    raise DaemonError(error['message'])
+
+
+def handle_request(request: dict[str, Any]) -> dict[str, Any]:
+    """Render a request, returning the manifest or the error as a JSON response."""
+    # imported by the daemon on first use, clients of `gybe render --daemon` never need them
+    from gybe.rendering import render_yaml
+    from gybe.values import merge_values, parse_values, read_values
+
+    cwd = os.getcwd()
+    try:
+        os.chdir(request.get('cwd', cwd))
+        func = find_transpiler(request['chart'])
+        layers = request.get('values', [])
+        values = merge_values(
+            read_values(v) if isinstance(v, str) else parse_values(v['yaml']) for v in layers
+        )
+        overrides = request.get('overrides', ())
+        return {'yaml': render_yaml(func, values, overrides, request.get('typed_overrides', ()))}
+    except RenderError as exc:
+        return {'error': _error_json(exc)}
+    except Exception:
+        # errors in charts are sent back instead of stopping the daemon
+        return {'error': {'type': 'Exception', 'message': traceback.format_exc()}}
+    finally:
+        os.chdir(cwd)
+
+
+class _RequestHandler(socketserver.StreamRequestHandler):
+    def handle(self) -> None:
+        line = self.rfile.readline()
+        if not line:
+            # a client checking whether a daemon is listening
+            return
+        try:
+            request = json.loads(line)
+        except ValueError as exc:
+            response: dict[str, Any] = {'error': {'type': 'Exception', 'message': f'Invalid request: {exc}'}}
+        else:
+            response = handle_request(request)
+        self.wfile.write(json.dumps(response).encode() + b'\n')
+
+
+def _connect(socket_path: str) -> socket.socket | None:
+    if not hasattr(socket, 'AF_UNIX'):
+        return None
+    try:
+        if os.stat(socket_path).st_uid != os.getuid():
+            # another user could be listening, it would receive the values and send the manifest
+            return None
+    except OSError:
+        return None
+    sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    try:
+        sock.connect(socket_path)
+    except OSError:
+        sock.close()
+        return None
+    return sock
+
+
+def preload(charts: Iterable[str] = ()) -> None:
+    """Import the default k8s models and `charts` and compile their input hooks ahead of rendering."""
+    import gybe.k8s
+    from gybe.rendering import prepare
+
+    for name in gybe.k8s.__all__:
+        getattr(gybe.k8s, name)
+    for chart in charts:
+        prepare(find_transpiler(chart))
+
+
+def make_server(socket_path: str) -> socketserver.UnixStreamServer:
+    """Bind the daemon's socket, replacing a stale socket file left behind by a stopped daemon.
+
+    Its directory is created only for the current user when missing, and must not be writable by
+    other users.
+    """
+    directory = os.path.dirname(os.path.abspath(socket_path))
+    os.makedirs(directory, mode=0o700, exist_ok=True)
+    _check_directory(directory)
+    sock = _connect(socket_path)
+    if sock is not None:
+        sock.close()
+        raise OSError(f'A daemon is already listening on {socket_path}')
+    if os.path.exists(socket_path):
+        os.unlink(socket_path)
+    return socketserver.UnixStreamServer(socket_path, _RequestHandler)
+
+
+def serve(socket_path: str, charts: Iterable[str] = ()) -> None:
+    """Preload the k8s models and `charts`, then render requests until interrupted or terminated."""
+    preload(charts)
+    with make_server(socket_path) as server:
+        # remove the socket when stopped with SIGTERM too
+        signal.signal(signal.SIGTERM, lambda *_: sys.exit(0))
+        try:
+            server.serve_forever()
+        except KeyboardInterrupt:
+            pass
+        finally:
+            os.unlink(socket_path)
+
+
+def request_render(
+    socket_path: str,
+    chart: str,
+    values: Iterable[str] = (),
+    overrides: Iterable[str] = (),
+    typed_overrides: Iterable[str] = (),
+) -> str | None:
+    """Render a chart with the daemon listening on `socket_path`, None when no daemon is running.
+
+    Daemons listening on a socket owned by another user are treated as not running.
+
+    `values` are paths of values files, `-` for stdin. Errors are raised like `gybe.render` raises
+    them.
+    """
+    sock = _connect(socket_path)
+    if sock is None:
+        return None
+    path, name = split_chart_ref(chart)
+    # the daemon's working directory isn't the client's
+    request = {
+        'chart': os.path.abspath(path) + (f':{name}' if name else ''),
+        'values': [{'yaml': sys.stdin.read()} if v == '-' else os.path.abspath(v) for v in values],
+        'overrides': list(overrides),
+        'typed_overrides': list(typed_overrides),
+        'cwd': os.getcwd(),
+    }
+    with sock, sock.makefile('rwb') as stream:
+        stream.write(json.dumps(request).encode() + b'\n')
+        stream.flush()
+        response = json.loads(stream.readline())
+    if 'error' in response:
+        _raise_error(response['error'])
+    return response['yaml']
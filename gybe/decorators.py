@@ -1,116 +1,161 @@
 """Decorators for building CLI commands."""
 
-import inspect
+import glob
 import sys
-from dataclasses import fields
-from typing import IO, Any, Callable
+from typing import IO, Iterable
 
 import click
-from cattrs import Converter, transform_error
-
-from gybe.exceptions import InvalidOutputError
-from gybe.k8s.types import JSONDict, JSONObj, K8sResource, K8sSpec, Manifest
-from gybe.modeling import create_input_model
-from gybe.yaml import yaml_dumps, yaml_loads
-
-
-def _omit_none_values(obj: K8sSpec) -> dict[str, Any]:
-    u = {}
-    for f in fields(obj):
-        v = getattr(obj, f.name)
-        if v is not None:
-            if inspect.isclass(f.type) and issubclass(f.type, K8sSpec):
-                u[f.name] = _c.unstructure(v, f.type)
-            else:
-                u[f.name] = _c.unstructure(v)
-    return u
-
-
-_c = Converter()
-_c.register_unstructure_hook(K8sSpec, _omit_none_values)
-
-
-def set_nested_arg(path: str, value: str, data: JSONObj) -> None:
-    """Set value in nested JSON object using a basic "." path."""
-    keys = path.split('.')
-    for key in keys[:-1]:
-        if isinstance(data, dict):
-            data = data[key]
-        elif isinstance(data, list):
-            try:
-                data = data[int(key)]
-            except ValueError:
-                raise KeyError(f'Expected integer but recieved "{key}"')
-
-    last_key: str | int
-    if isinstance(data, dict):
-        last_key = keys[-1]
-    elif isinstance(data, list):
-        last_key = int(keys[-1])
-    else:
-        raise KeyError('Path leads to unindexable location')
-
-    if isinstance(data, list) and isinstance(last_key, int):
-        data[last_key] = value
-    elif isinstance(data, dict) and isinstance(last_key, str):
-        data[last_key] = value
-    else:
-        raise ValueError('Path leads to unexpected data type')
+
+from gybe.batch import render_many
+from gybe.cache import RenderCache
+from gybe.charts import chart_ref
+from gybe.exceptions import ChartError, RenderError
+from gybe.k8s.types import AsyncManifestIterator as AsyncManifestIterator
+from gybe.k8s.types import Manifest as Manifest
+from gybe.k8s.types import ManifestIterator as ManifestIterator
+from gybe.options import VALUES_FILE, VALUES_HELP, exit_on_render_error, values_paths
+from gybe.overrides import set_nested_arg as set_nested_arg
+from gybe.rendering import Transpiler, render_yaml, transpile
+from gybe.values import load_values
+from gybe.watch import Watcher
+from gybe.yaml import yaml_dump_manifest
+
+
+def expand_patterns(patterns: Iterable[str]) -> list[str]:
+    """Values files matching glob patterns, in order and without duplicates.
+
+    Patterns that match nothing are kept as they are, so they're reported as missing files.
+    """
+    return list(
+        dict.fromkeys(path for pattern in patterns for path in sorted(glob.glob(pattern)) or [pattern])
+    )
+
+
+def _render_many(
+    f: Transpiler,
+    patterns: Iterable[str],
+    output_dir: str | None,
+    base_paths: list[str],
+    overrides: list[str],
+    typed_overrides: list[str],
+    jobs: int | None,
+) -> None:
+    if output_dir is None:
+        raise click.UsageError('Option --render-many needs --output-dir.')
+    paths = expand_patterns(patterns)
+    if '-' in base_paths or '-' in paths:
+        # every file is rendered with its own read of the values, stdin can only be read once
+        raise click.UsageError("Option --render-many can't read values from stdin.")
+    try:
+        errors = render_many(f, paths, output_dir, base_paths, overrides, typed_overrides, jobs)
+    except (ValueError, RenderError) as exc:
+        raise click.UsageError(str(exc)) from exc
+    for path, message in errors.items():
+        print(f'\nERROR: {path}\n{message}')
+    click.echo(f'Rendered {len(paths) - len(errors)} of {len(paths)} values files to {output_dir}', err=True)
+    if errors:
+        sys.exit(-1)
+
+
+def _watch(
+    f: Transpiler, paths: list[str], overrides: list[str], typed_overrides: list[str], output: IO[str]
+):
+    if '-' in paths:
+        raise click.UsageError("Option --watch can't watch values read from stdin.")
+    try:
+        Watcher(f, paths, overrides, typed_overrides, output).run()
+    except KeyboardInterrupt:
+        pass
+
+
+def _render_cached(
+    f: Transpiler, paths: list[str], overrides: list[str], typed_overrides: list[str], output: IO[str]
+) -> None:
+    if '-' in paths:
+        raise click.UsageError("Option --cache can't cache values read from stdin.")
+    try:
+        chart = chart_ref(f)
+    except ChartError as exc:
+        raise click.UsageError(str(exc)) from exc
+    cache = RenderCache()
+    key = cache.key(chart, paths, overrides, typed_overrides)
+    manifest = cache.get(key)
+    if manifest is None:
+        with exit_on_render_error():
+            manifest = render_yaml(f, load_values(paths), overrides, typed_overrides)
+        cache.put(key, manifest, chart)
+    output.write(manifest)
 
 
 def _bind_function(f):
-    @click.argument('file', required=True, type=click.File('r'))
+    @click.argument('file', required=False, type=VALUES_FILE)
+    @click.option('-f', '--values', 'values_files', type=VALUES_FILE, multiple=True, help=VALUES_HELP)
     @click.option('--set', 'set_nested_args', type=str, multiple=True)
-    def func(file: IO[str], set_nested_args: list[str]):
-        inputs: JSONDict = yaml_loads(file.read()) or dict()
-
-        input_model = create_input_model(f)
-        try:
-            input_obj: Any = _c.structure(inputs, input_model)
-        except Exception as exc:
-            print('validation errors:')
-            for m in transform_error(exc):
-                print('-', m)
-            sys.exit(-1)
-
-        if len(set_nested_args):
-            patched_inputs = _c.unstructure(input_obj)
-            for arg in set_nested_args:
-                try:
-                    path, value = arg.split('=')
-                except (ValueError, IndexError):
-                    print('\nERROR: --set expects this format: path.to.arg=value')
-                    sys.exit(-1)
-
-                try:
-                    set_nested_arg(path, value, patched_inputs)
-                except KeyError:
-                    print(f'\nERROR: path "{path}" does not exist in the input data')
-                    sys.exit(-1)
-
-            input_obj = _c.structure(patched_inputs, input_model)
-
-        input_fields = [f.name for f in fields(input_model)]
-        _kwargs = {kwarg: getattr(input_obj, kwarg) for kwarg in input_fields}
-
-        manifest = f(**_kwargs)
-
-        # Validate outputs
-        if not isinstance(manifest, list):
-            raise InvalidOutputError()
-
-        for resource in manifest:
-            if not isinstance(resource, K8sResource):
-                raise InvalidOutputError()
-
-        # Print manifest
-        print('---\n'.join([yaml_dumps(_c.unstructure(r)) for r in manifest]))
+    @click.option('--set-typed', 'typed_args', type=str, multiple=True, help='Like --set, with a YAML value.')
+    @click.option('-o', '--output', type=click.File('w'), default='-', help='Write the manifest to a file.')
+    @click.option(
+        '--render-many',
+        'patterns',
+        metavar='PATTERN',
+        multiple=True,
+        help='Render a manifest for each values file matching a glob, merged over FILE and -f files.',
+    )
+    @click.option(
+        '--output-dir',
+        type=click.Path(file_okay=False),
+        help='Directory to write --render-many manifests to, named after their values files.',
+    )
+    @click.option(
+        '-j',
+        '--jobs',
+        type=click.IntRange(min=1),
+        help='Processes rendering --render-many values files.  [default: one for each CPU]',
+    )
+    @click.option('--watch', is_flag=True, help='Render again whenever the chart or values files change.')
+    @click.option('--cache', is_flag=True, help='Reuse manifests rendered before, see $GYBE_CACHE_DIR.')
+    def func(
+        file: str | None,
+        values_files: list[str],
+        set_nested_args: list[str],
+        typed_args: list[str],
+        output: IO[str],
+        patterns: list[str],
+        output_dir: str | None,
+        jobs: int | None,
+        watch: bool,
+        cache: bool,
+    ):
+        if patterns:
+            base_paths = ([file] if file is not None else []) + list(values_files)
+            return _render_many(f, patterns, output_dir, base_paths, set_nested_args, typed_args, jobs)
+        paths = values_paths(file, values_files)
+        if watch:
+            return _watch(f, paths, set_nested_args, typed_args, output)
+        if cache:
+            return _render_cached(f, paths, set_nested_args, typed_args, output)
+        with exit_on_render_error():
+            manifest = transpile(f, load_values(paths), set_nested_args, typed_args)
+
+        yaml_dump_manifest(manifest, output)
 
     func.__name__ = f.__name__
+    func.__wrapped__ = f  # type: ignore[attr-defined]
     return func
 
 
-def transpiler(f: Callable[..., Manifest]):
-    """Command that takes in a YAML file and outputs a Kubernetes manifest YAML file."""
+def transpiler(f: Transpiler):
+    """Command that takes in YAML values files and outputs a Kubernetes manifest YAML file.
+
+    Values files given with `-f` are merged over the FILE argument and each other, later files win.
+
+    The function can return a list of resources or be a generator that yields them, which writes
+    each resource as soon as it's yielded. It can also be an `async def` function, which is run on
+    an event loop, to read files or other inputs concurrently, see `gybe.files`.
+
+    `--watch` keeps the process running and writes the documents that changed whenever the chart
+    or values files change, see `gybe.watch.Watcher`. `--render-many` renders a manifest for each
+    of many values files in parallel, see `gybe.batch.render_many`. `--cache` reads back manifests
+    rendered before from the same chart, values and overrides, see `gybe.cache.RenderCache`.
+    """
     func = _bind_function(f)
     return click.command()(func)
@@ -1,9 +1,48 @@
 """Gybe transpiler validation errors."""
 
 
-class InvalidOutputError(Exception):
+class RenderError(Exception):
+    """Base class for errors raised while rendering a transpiler."""
+
+
+class InputValidationError(RenderError):
+    """Raised when input values don't match the arguments of a transpiler."""
+
+    def __init__(self, errors: list[str]):
+        """Keep each validation error message, like `count must be an int @ $.count`."""
+        self.errors = errors
+        return super().__init__('validation errors:\n' + '\n'.join(f'- {e}' for e in errors))
+
+
+class InvalidOverrideError(RenderError):
+    """Raised when `path.to.arg=value` overrides are malformed or their paths don't exist."""
+
+    def __init__(self, override: str, message: str, errors: list[tuple[str, str]] | None = None):
+        """Keep the override that failed, or each (override, message) in `errors` when several did."""
+        self.override = override
+        self.errors = errors or [(override, message)]
+        return super().__init__('\n'.join(m for _, m in self.errors))
+
+
+class InvalidOutputError(RenderError):
     """Raised when a transpiler returns an invalid type."""
 
     def __init__(self):
         """Raise generic validation error message."""
-        return super().__init__('Must be a list of gybe.types.K8sResource')
+        return super().__init__('Must be a list or generator of gybe.types.K8sResource')
+
+
+class ChartError(RenderError):
+    """Raised when a chart file can't be loaded or its transpiler can't be found."""
+
+
+class DaemonError(RenderError):
+    """Raised when a chart fails in the render daemon, with the daemon's traceback as message."""
+
+
+class YAMLBackendMismatchError(Exception):
+    """Raised in cross-check mode when a faster YAML backend doesn't match pure-Python PyYAML."""
+
+    def __init__(self, backend: str):
+        """Name the backend that produced different results."""
+        return super().__init__(f'{backend} output differs from pure-Python PyYAML')
@@ -0,0 +1,70 @@
+"""Read files concurrently from async transpilers.
+
+Charts that build resources like `Secret` and `ConfigMap` from many local files, like certificates,
+config templates or SQL migrations, can read them all at once, so a render waits for the slowest
+read instead of all of them one after another:
+
+    @gybe.transpiler
+    async def certificates(paths: list[str]) -> gybe.Manifest:
+        files = await gybe.files.read_many_text(paths)
+        return [gybe.k8s.Secret(stringData={os.path.basename(p): text for p, text in files.items()})]
+
+Files are read in a pool of threads kept for the life of the process.
+"""
+
+import asyncio
+import os
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Iterable, TypeVar
+
+# reads mostly wait on the disk or network, not the CPU, so there are more threads than CPUs
+IO_THREADS = 32
+
+StrPath = str | os.PathLike[str]
+T = TypeVar('T')
+
+_executor: ThreadPoolExecutor | None = None
+
+
+def _read_text(path: StrPath, encoding: str) -> str:
+    with open(path, encoding=encoding) as f:
+        return f.read()
+
+
+def _read_bytes(path: StrPath) -> bytes:
+    with open(path, 'rb') as f:
+        return f.read()
+
+
+async def _in_thread(func: Callable[..., T], *args: object) -> T:
+    global _executor
+    if _executor is None:
+        _executor = ThreadPoolExecutor(max_workers=IO_THREADS, thread_name_prefix='gybe-files')
+    return await asyncio.get_running_loop().run_in_executor(_executor, func, *args)
+
+
+async def read_text(path: StrPath, encoding: str = 'utf-8') -> str:
+    """Read a text file without blocking the event loop."""
+    return await _in_thread(_read_text, path, encoding)
+
+
+async def read_bytes(path: StrPath) -> bytes:
+    """Read a binary file without blocking the event loop."""
+    return await _in_thread(_read_bytes, path)
+
+
+async def read_many_text(paths: Iterable[StrPath], encoding: str = 'utf-8') -> dict[str, str]:
+    """Read text files concurrently, by path in the order they're given.
+
+    Raises the error of the first file that fails, like `FileNotFoundError`.
+    """
+    names = [os.fspath(path) for path in paths]
+    texts = await asyncio.gather(*(read_text(name, encoding) for name in names))
+    return dict(zip(names, texts))
+
+
+async def read_many_bytes(paths: Iterable[StrPath]) -> dict[str, bytes]:
+    """Read binary files concurrently, by path in the order they're given, see `read_many_text`."""
+    names = [os.fspath(path) for path in paths]
+    contents = await asyncio.gather(*(read_bytes(name) for name in names))
+    return dict(zip(names, contents))
@@ -1,57 +1,62 @@
 """Kubernetes models as dataclasses copied from k8s' OpenAPI V3 Spec."""
 
-from gybe.k8s.types import K8sResource, K8sSpec
-from gybe.k8s.v1_32.apps.v1 import (
-    DaemonSet,
-    DaemonSetSpec,
-    Deployment,
-    DeploymentSpec,
-    DeploymentStrategy,
-    StatefulSet,
-    StatefulSetSpec,
-)
-from gybe.k8s.v1_32.batch.v1 import Job, JobSpec
-from gybe.k8s.v1_32.core.v1 import (
-    Affinity,
-    Container,
-    ContainerPort,
-    EnvFromSource,
-    EnvVar,
-    EnvVarSource,
-    HTTPGetAction,
-    ObjectFieldSelector,
-    PersistentVolume,
-    PersistentVolumeClaim,
-    PersistentVolumeClaimSpec,
-    PersistentVolumeSpec,
-    Pod,
-    PodAffinityTerm,
-    PodAntiAffinity,
-    PodSpec,
-    PodTemplateSpec,
-    Probe,
-    ResourceRequirements,
-    Secret,
-    SecretEnvSource,
-    SecretKeySelector,
-    SecretVolumeSource,
-    SecurityContext,
-    Service,
-    ServicePort,
-    ServiceSpec,
-    Volume,
-    VolumeMount,
-    VolumeResourceRequirements,
-    WeightedPodAffinityTerm,
-)
-from gybe.k8s.v1_32.meta.v1 import LabelSelector, LabelSelectorRequirement, ObjectMeta
-from gybe.k8s.v1_32.networking.v1 import (
-    Ingress,
-    IngressBackend,
-    IngressServiceBackend,
-    IngressSpec,
-    ServiceBackendPort,
-)
+from typing import TYPE_CHECKING
+
+from gybe.lazy import lazy_attributes
+
+if TYPE_CHECKING:
+    from gybe.k8s.types import K8sResource, K8sSpec
+    from gybe.k8s.v1_32.apps.v1 import (
+        DaemonSet,
+        DaemonSetSpec,
+        Deployment,
+        DeploymentSpec,
+        DeploymentStrategy,
+        StatefulSet,
+        StatefulSetSpec,
+    )
+    from gybe.k8s.v1_32.batch.v1 import Job, JobSpec
+    from gybe.k8s.v1_32.core.v1 import (
+        Affinity,
+        Container,
+        ContainerPort,
+        EnvFromSource,
+        EnvVar,
+        EnvVarSource,
+        HTTPGetAction,
+        ObjectFieldSelector,
+        PersistentVolume,
+        PersistentVolumeClaim,
+        PersistentVolumeClaimSpec,
+        PersistentVolumeSpec,
+        Pod,
+        PodAffinityTerm,
+        PodAntiAffinity,
+        PodSpec,
+        PodTemplateSpec,
+        Probe,
+        ResourceRequirements,
+        Secret,
+        SecretEnvSource,
+        SecretKeySelector,
+        SecretVolumeSource,
+        SecurityContext,
+        Service,
+        ServicePort,
+        ServiceSpec,
+        Volume,
+        VolumeMount,
+        VolumeResourceRequirements,
+        WeightedPodAffinityTerm,
+    )
+    from gybe.k8s.v1_32.meta.v1 import LabelSelector, LabelSelectorRequirement, ObjectMeta
+    from gybe.k8s.v1_32.networking.v1 import (
+        Ingress,
+        IngressBackend,
+        IngressServiceBackend,
+        IngressSpec,
+        ServiceBackendPort,
+    )
 
 __all__ = [
     'Affinity',
@@ -69,7 +74,6 @@ __all__ = [
     'Ingress',
     'IngressBackend',
     'IngressServiceBackend',
-    'IngressServiceBackendPort',
     'IngressSpec',
     'Job',
     'JobSpec',
@@ -82,7 +86,6 @@ __all__ = [
     'PersistentVolume',
     'PersistentVolumeClaim',
     'PersistentVolumeClaimSpec',
-    'PersistentVolumeClaimSpec',
     'PersistentVolumeSpec',
     'Pod',
     'PodAffinityTerm',
@@ -107,3 +110,59 @@ __all__ = [
     'VolumeResourceRequirements',
     'WeightedPodAffinityTerm',
 ]
+
+_attributes = {
+    'Affinity': 'gybe.k8s.v1_32.core.v1',
+    'Container': 'gybe.k8s.v1_32.core.v1',
+    'ContainerPort': 'gybe.k8s.v1_32.core.v1',
+    'DaemonSet': 'gybe.k8s.v1_32.apps.v1',
+    'DaemonSetSpec': 'gybe.k8s.v1_32.apps.v1',
+    'Deployment': 'gybe.k8s.v1_32.apps.v1',
+    'DeploymentSpec': 'gybe.k8s.v1_32.apps.v1',
+    'DeploymentStrategy': 'gybe.k8s.v1_32.apps.v1',
+    'EnvFromSource': 'gybe.k8s.v1_32.core.v1',
+    'EnvVar': 'gybe.k8s.v1_32.core.v1',
+    'EnvVarSource': 'gybe.k8s.v1_32.core.v1',
+    'HTTPGetAction': 'gybe.k8s.v1_32.core.v1',
+    'Ingress': 'gybe.k8s.v1_32.networking.v1',
+    'IngressBackend': 'gybe.k8s.v1_32.networking.v1',
+    'IngressServiceBackend': 'gybe.k8s.v1_32.networking.v1',
+    'IngressSpec': 'gybe.k8s.v1_32.networking.v1',
+    'Job': 'gybe.k8s.v1_32.batch.v1',
+    'JobSpec': 'gybe.k8s.v1_32.batch.v1',
+    'K8sResource': 'gybe.k8s.types',
+    'K8sSpec': 'gybe.k8s.types',
+    'LabelSelector': 'gybe.k8s.v1_32.meta.v1',
+    'LabelSelectorRequirement': 'gybe.k8s.v1_32.meta.v1',
+    'ObjectFieldSelector': 'gybe.k8s.v1_32.core.v1',
+    'ObjectMeta': 'gybe.k8s.v1_32.meta.v1',
+    'PersistentVolume': 'gybe.k8s.v1_32.core.v1',
+    'PersistentVolumeClaim': 'gybe.k8s.v1_32.core.v1',
+    'PersistentVolumeClaimSpec': 'gybe.k8s.v1_32.core.v1',
+    'PersistentVolumeSpec': 'gybe.k8s.v1_32.core.v1',
+    'Pod': 'gybe.k8s.v1_32.core.v1',
+    'PodAffinityTerm': 'gybe.k8s.v1_32.core.v1',
+    'PodAntiAffinity': 'gybe.k8s.v1_32.core.v1',
+    'PodSpec': 'gybe.k8s.v1_32.core.v1',
+    'PodTemplateSpec': 'gybe.k8s.v1_32.core.v1',
+    'Probe': 'gybe.k8s.v1_32.core.v1',
+    'ResourceRequirements': 'gybe.k8s.v1_32.core.v1',
+    'Secret': 'gybe.k8s.v1_32.core.v1',
+    'SecretEnvSource': 'gybe.k8s.v1_32.core.v1',
+    'SecretKeySelector': 'gybe.k8s.v1_32.core.v1',
+    'SecretVolumeSource': 'gybe.k8s.v1_32.core.v1',
+    'SecurityContext': 'gybe.k8s.v1_32.core.v1',
+    'Service': 'gybe.k8s.v1_32.core.v1',
+    'ServiceBackendPort': 'gybe.k8s.v1_32.networking.v1',
+    'ServicePort': 'gybe.k8s.v1_32.core.v1',
+    'ServiceSpec': 'gybe.k8s.v1_32.core.v1',
+    'StatefulSet': 'gybe.k8s.v1_32.apps.v1',
+    'StatefulSetSpec': 'gybe.k8s.v1_32.apps.v1',
+    'Volume': 'gybe.k8s.v1_32.core.v1',
+    'VolumeMount': 'gybe.k8s.v1_32.core.v1',
+    'VolumeResourceRequirements': 'gybe.k8s.v1_32.core.v1',
+    'WeightedPodAffinityTerm': 'gybe.k8s.v1_32.core.v1',
+}
+
+# version packages like `gybe.k8s.v1_31` are imported as submodules on first use
+__getattr__, __dir__ = lazy_attributes(__name__, _attributes, submodules=True)
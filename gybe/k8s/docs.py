@@ -0,0 +1,46 @@
+"""Docstrings of generated models read from a documentation index instead of the module source.
+
+Modules generated with `--slim-docs` leave the long docstrings of their models out and write them
+to a `docs.json` index in the version package, keyed by module and class name. The index is only
+read when a docstring is looked up, for example by `help()`.
+"""
+
+from functools import cache
+from typing import Any
+
+INDEX_FILE = 'docs.json'
+
+
+@cache
+def read_index(package: str) -> dict[str, dict[str, str]]:
+    """Read the documentation index of a version package like `gybe.k8s.v1_32`."""
+    # imported here, generated modules import this module and shouldn't pay for reading docs
+    import json
+    from importlib import resources
+
+    return json.loads(resources.files(package).joinpath(INDEX_FILE).read_text())
+
+
+class IndexedDoc:
+    """Descriptor serving the `__doc__` of the models in a generated module from the index.
+
+    Generated classes set `__doc__ = _docs` and the module sets `_docs.imported = True` once all
+    of its models are defined.
+    """
+
+    __slots__ = ('package', 'module', 'imported')
+
+    def __init__(self, module_name: str):
+        """Look up docs of models in `module_name`, like `gybe.k8s.v1_32.core.v1`."""
+        parts = module_name.split('.')
+        self.package = '.'.join(parts[:3])
+        self.module = '.'.join(parts[3:])
+        self.imported = False
+
+    def __get__(self, obj: Any, cls: type) -> str | None:
+        """Return the docstring of `cls` from the index."""
+        if not self.imported:
+            # dataclass() generates a docstring for classes without one, any text will do until
+            # the module is imported
+            return cls.__name__
+        return read_index(self.package).get(self.module, {}).get(cls.__name__)
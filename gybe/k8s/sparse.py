@@ -0,0 +1,133 @@
+"""Sparse base models that only store the fields that were set.
+
+A sparse model keeps a bitmask of the fields that hold a value and a tuple of just those values,
+in field order. Kubernetes objects typically set a handful of their optional fields, so this is
+much smaller than a slot per field, and unstructuring only visits the fields that were set.
+"""
+
+import linecache
+from dataclasses import Field, dataclass
+from typing import Any, ClassVar, Iterator, get_origin
+
+from gybe.k8s.types import K8sResource, K8sSpec
+
+_MISSING = object()
+
+
+class _SparseField:
+    """Data descriptor reading and writing one field of a sparse model."""
+
+    __slots__ = ('name', 'bit', 'lower', 'default')
+
+    def __init__(self, name: str, index: int, default: Any):
+        self.name = name
+        self.bit = 1 << index
+        self.lower = self.bit - 1
+        self.default = default
+
+    def __get__(self, obj: Any, cls: Any = None) -> Any:
+        if obj is None:
+            # dataclass reads field defaults from the class
+            if self.default is _MISSING:
+                raise AttributeError(self.name)
+            return self.default
+        mask = obj._mask
+        if mask & self.bit:
+            return obj._values[(mask & self.lower).bit_count()]
+        return None
+
+    def __set__(self, obj: Any, value: Any) -> None:
+        mask = obj._mask
+        values = obj._values
+        i = (mask & self.lower).bit_count()
+        if mask & self.bit:
+            if value is None:
+                obj._values = values[:i] + values[i + 1 :]
+                obj._mask = mask & ~self.bit
+            else:
+                obj._values = values[:i] + (value,) + values[i + 1 :]
+        elif value is not None:
+            obj._values = values[:i] + (value,) + values[i:]
+            obj._mask = mask | self.bit
+
+
+def _make_init(cls: type, fields: list[tuple[str, Any]]) -> Any:
+    args = ['self']
+    namespace: dict[str, Any] = {}
+    body = ['    m = 0', '    v = []']
+    for i, (name, default) in enumerate(fields):
+        if default is _MISSING:
+            args.append(name)
+        else:
+            namespace[f'_d_{name}'] = default
+            args.append(f'{name}=_d_{name}')
+        body += [f'    if {name} is not None:', f'        m |= {1 << i}', f'        v.append({name})']
+    body += ['    self._mask = m', '    self._values = tuple(v)']
+
+    source = f'def __init__({", ".join(args)}):\n' + '\n'.join(body) + '\n'
+    filename = f'<gybe sparse init {cls.__module__}.{cls.__qualname__}>'
+    exec(compile(source, filename, 'exec'), namespace)  # noqa: S102
+    linecache.cache[filename] = (len(source), None, source.splitlines(True), filename)
+    init = namespace['__init__']
+    init.__qualname__ = f'{cls.__qualname__}.__init__'
+    return init
+
+
+@dataclass
+class SparseK8sSpec(K8sSpec):
+    """Base model class that only stores the fields that were set to a value.
+
+    Subclasses must be dataclasses with plain default values and should declare `__slots__ = ()`.
+    """
+
+    __slots__ = ('_mask', '_values')
+
+    _sparse_fields: ClassVar[tuple[tuple[str, Any], ...]] = ()
+    _sparse_layouts: ClassVar[dict[int, tuple[str, ...]]] = {}
+
+    def __init_subclass__(cls, **kwargs):
+        """Replace annotated fields with sparse descriptors and compile a matching `__init__`."""
+        super().__init_subclass__(**kwargs)
+        fields = list(cls._sparse_fields)
+        for name, annotation in cls.__dict__.get('__annotations__', {}).items():
+            if get_origin(annotation) is ClassVar or str(annotation).startswith(
+                ('ClassVar', 'typing.ClassVar')
+            ):
+                continue
+            default = cls.__dict__.get(name, _MISSING)
+            if isinstance(default, Field):
+                raise TypeError(f'{cls.__name__}.{name}: sparse models only support plain default values')
+            names = [f[0] for f in fields]
+            if name in names:
+                # like dataclasses, a redefined field keeps its original position
+                fields[names.index(name)] = (name, default)
+            else:
+                fields.append((name, default))
+
+        for i, (name, default) in enumerate(fields):
+            setattr(cls, name, _SparseField(name, i, default))
+        cls._sparse_fields = tuple(fields)
+        cls._sparse_layouts = {}
+        cls.__init__ = _make_init(cls, fields)  # type: ignore[method-assign]
+
+
+@dataclass
+class SparseK8sResource(SparseK8sSpec, K8sResource):
+    """Sparse base model for kubernetes resources."""
+
+    __slots__ = ()
+
+
+def sparse_layout(cls: type[SparseK8sSpec], mask: int) -> tuple[str, ...]:
+    """Names of the fields set on instances of `cls` with the given bitmask, in field order."""
+    names = cls._sparse_layouts.get(mask)
+    if names is None:
+        names = tuple(name for i, (name, _) in enumerate(cls._sparse_fields) if mask & (1 << i))
+        cls._sparse_layouts[mask] = names
+    return names
+
+
+def sparse_items(obj: SparseK8sSpec) -> Iterator[tuple[str, Any]]:
+    """Iterate over the names and values of the fields that are set on a sparse model."""
+    state: Any = obj
+    return zip(sparse_layout(obj.__class__, state._mask), state._values)
@@ -1,22 +1,40 @@
 """Type aliases for JSON serializable objects."""
 
 from dataclasses import dataclass
-from typing import Mapping, TypeAlias, Union
+from typing import Any, AsyncIterator, Iterator, Mapping, TypeAlias, Union
 
 JSONObj: TypeAlias = Union[Mapping[str, 'JSONObj'], list['JSONObj'], str, int, float, bool, None]
 JSONDict: TypeAlias = Mapping[str, Union['JSONObj', 'JSONDict']]
 
+# values of exactly these types are unstructured as they are, subclasses like enums go through cattrs
+SCALAR_TYPES = frozenset({str, int, float, bool})
 
-# decorating the base classes with @dataclass has no runtime effect but tells `mypy` to
-# expect subclasses to each be a dataclass
-@dataclass
+
+def unstructure_value(v: Any) -> Any:
+    """Unstructure a value with cattrs, for generated `to_dict()` methods and values of unexpected types."""
+    from gybe.converter import converter
+
+    return converter.unstructure(v)
+
+
+# decorating the base classes with @dataclass tells `mypy` to expect subclasses to each be a
+# dataclass, and `slots=True` keeps `__dict__` off of models generated with `--slots`
+@dataclass(slots=True)
 class K8sSpec:
     """Base model class for all kubernetes dataclasses."""
 
+    def to_dict(self) -> 'JSONDict':
+        """Convert to a JSON dict, omitting None values."""
+        from gybe.converter import unstructure_model
+
+        return unstructure_model(self)
+
 
-@dataclass
+@dataclass(slots=True)
 class K8sResource(K8sSpec):
     """Base model for kubernetes resources, like Deployment, Service and StatefulSet"""
 
 
 Manifest: TypeAlias = list[K8sResource]
+ManifestIterator: TypeAlias = Iterator[K8sResource]
+AsyncManifestIterator: TypeAlias = AsyncIterator[K8sResource]
@@ -9,7 +9,7 @@ import gybe.k8s.v1_31.meta.v1
 from gybe.k8s.types import K8sResource, K8sSpec
 
 
-@dataclass
+@dataclass(slots=True)
 class AuditAnnotation(K8sSpec):
     """AuditAnnotation describes how to produce an audit annotation for an API request.
 
@@ -38,7 +38,7 @@ class AuditAnnotation(K8sSpec):
     valueExpression: str
 
 
-@dataclass
+@dataclass(slots=True)
 class ExpressionWarning(K8sSpec):
     """ExpressionWarning is a warning information that targets a specific expression.
 
@@ -55,7 +55,7 @@ class ExpressionWarning(K8sSpec):
     warning: str
 
 
-@dataclass
+@dataclass(slots=True)
 class MatchCondition(K8sSpec):
     """MatchCondition represents a condition which must by fulfilled for a request to be sent to a webhook.
 
@@ -83,7 +83,7 @@ class MatchCondition(K8sSpec):
     expression: str
 
 
-@dataclass
+@dataclass(slots=True)
 class MatchResources(K8sSpec):
     """MatchResources decides whether to run the admission control policy on an object based on whether it
     meets the match criteria. The exclude rules take precedence over include rules (if a resource matches
@@ -136,7 +136,7 @@ class MatchResources(K8sSpec):
     resourceRules: Optional[List[NamedRuleWithOperations]] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class MutatingWebhook(K8sSpec):
     """MutatingWebhook describes an admission webhook and the resources and operations it applies to.
 
@@ -233,7 +233,7 @@ class MutatingWebhook(K8sSpec):
     timeoutSeconds: Optional[int] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class MutatingWebhookConfiguration(K8sResource):
     """MutatingWebhookConfiguration describes the configuration of and admission webhook that accept or
     reject and may change the object.
@@ -255,7 +255,7 @@ class MutatingWebhookConfiguration(K8sResource):
     webhooks: Optional[List[MutatingWebhook]] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class NamedRuleWithOperations(K8sSpec):
     """NamedRuleWithOperations is a tuple of Operations and Resources with ResourceNames.
 
@@ -291,7 +291,7 @@ class NamedRuleWithOperations(K8sSpec):
     scope: Optional[str] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class ParamKind(K8sSpec):
     """ParamKind is a tuple of Group Kind and Version.
 
@@ -306,7 +306,7 @@ class ParamKind(K8sSpec):
     kind: Optional[str] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class ParamRef(K8sSpec):
     """ParamRef describes how to locate the params to be used as input to expressions of rules applied by a
     policy binding.
@@ -343,7 +343,7 @@ class ParamRef(K8sSpec):
     selector: Optional[gybe.k8s.v1_31.meta.v1.LabelSelector] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class RuleWithOperations(K8sSpec):
     """RuleWithOperations is a tuple of Operations and Resources. It is recommended to make sure that all the
     tuple expansions are valid.
@@ -377,7 +377,7 @@ class RuleWithOperations(K8sSpec):
     scope: Optional[str] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class ServiceReference(K8sSpec):
     """ServiceReference holds a reference to Service.legacy.k8s.io
     Attributes:
@@ -395,7 +395,7 @@ class ServiceReference(K8sSpec):
     port: Optional[int] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class TypeChecking(K8sSpec):
     """TypeChecking contains results of type checking the expressions in the ValidatingAdmissionPolicy
     Attributes:
@@ -406,7 +406,7 @@ class TypeChecking(K8sSpec):
     expressionWarnings: Optional[List[ExpressionWarning]] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class ValidatingAdmissionPolicy(K8sResource):
     """ValidatingAdmissionPolicy describes the definition of an admission validation policy that accepts or
     rejects an object without changing it.
@@ -431,7 +431,7 @@ class ValidatingAdmissionPolicy(K8sResource):
     status: Optional[ValidatingAdmissionPolicyStatus] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class ValidatingAdmissionPolicyBinding(K8sResource):
     """ValidatingAdmissionPolicyBinding binds the ValidatingAdmissionPolicy with paramerized resources.
     ValidatingAdmissionPolicyBinding and parameter CRDs together define how cluster administrators
@@ -459,7 +459,7 @@ class ValidatingAdmissionPolicyBinding(K8sResource):
     spec: Optional[ValidatingAdmissionPolicyBindingSpec] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class ValidatingAdmissionPolicyBindingSpec(K8sSpec):
     """ValidatingAdmissionPolicyBindingSpec is the specification of the ValidatingAdmissionPolicyBinding.
 
@@ -512,7 +512,7 @@ class ValidatingAdmissionPolicyBindingSpec(K8sSpec):
     validationActions: Optional[List[str]] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class ValidatingAdmissionPolicySpec(K8sSpec):
     """ValidatingAdmissionPolicySpec is the specification of the desired behavior of the AdmissionPolicy.
 
@@ -567,7 +567,7 @@ class ValidatingAdmissionPolicySpec(K8sSpec):
     variables: Optional[List[Variable]] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class ValidatingAdmissionPolicyStatus(K8sSpec):
     """ValidatingAdmissionPolicyStatus represents the status of an admission validation policy.
 
@@ -584,7 +584,7 @@ class ValidatingAdmissionPolicyStatus(K8sSpec):
     typeChecking: Optional[TypeChecking] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class ValidatingWebhook(K8sSpec):
     """ValidatingWebhook describes an admission webhook and the resources and operations it applies to.
 
@@ -669,7 +669,7 @@ class ValidatingWebhook(K8sSpec):
     timeoutSeconds: Optional[int] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class ValidatingWebhookConfiguration(K8sResource):
     """ValidatingWebhookConfiguration describes the configuration of and admission webhook that accept or
     reject and object without changing it.
@@ -691,7 +691,7 @@ class ValidatingWebhookConfiguration(K8sResource):
     webhooks: Optional[List[ValidatingWebhook]] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class Validation(K8sSpec):
     """Validation specifies the CEL expression which is used to apply the validation.
 
@@ -759,7 +759,7 @@ class Validation(K8sSpec):
     reason: Optional[str] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class Variable(K8sSpec):
     """Variable is the definition of a variable that is used for composition. A variable is defined as a
     named expression.
@@ -777,7 +777,7 @@ class Variable(K8sSpec):
     expression: str
 
 
-@dataclass
+@dataclass(slots=True)
 class WebhookClientConfig(K8sSpec):
     """WebhookClientConfig contains the information to make a TLS connection with the webhook
     Attributes:
@@ -9,7 +9,7 @@ import gybe.k8s.v1_31.meta.v1
 from gybe.k8s.types import K8sResource, K8sSpec
 
 
-@dataclass
+@dataclass(slots=True)
 class AuditAnnotation(K8sSpec):
     """AuditAnnotation describes how to produce an audit annotation for an API request.
 
@@ -38,7 +38,7 @@ class AuditAnnotation(K8sSpec):
     valueExpression: str
 
 
-@dataclass
+@dataclass(slots=True)
 class ExpressionWarning(K8sSpec):
     """ExpressionWarning is a warning information that targets a specific expression.
 
@@ -55,7 +55,7 @@ class ExpressionWarning(K8sSpec):
     warning: str
 
 
-@dataclass
+@dataclass(slots=True)
 class MatchCondition(K8sSpec):
     """Schema model io.k8s.api.admissionregistration.v1alpha1.MatchCondition.
 
@@ -83,7 +83,7 @@ class MatchCondition(K8sSpec):
     expression: str
 
 
-@dataclass
+@dataclass(slots=True)
 class MatchResources(K8sSpec):
     """MatchResources decides whether to run the admission control policy on an object based on whether it
     meets the match criteria. The exclude rules take precedence over include rules (if a resource matches
@@ -136,7 +136,7 @@ class MatchResources(K8sSpec):
     resourceRules: Optional[List[NamedRuleWithOperations]] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class NamedRuleWithOperations(K8sSpec):
     """NamedRuleWithOperations is a tuple of Operations and Resources with ResourceNames.
 
@@ -172,7 +172,7 @@ class NamedRuleWithOperations(K8sSpec):
     scope: Optional[str] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class ParamKind(K8sSpec):
     """ParamKind is a tuple of Group Kind and Version.
 
@@ -187,7 +187,7 @@ class ParamKind(K8sSpec):
     kind: Optional[str] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class ParamRef(K8sSpec):
     """ParamRef describes how to locate the params to be used as input to expressions of rules applied by a
     policy binding.
@@ -222,7 +222,7 @@ class ParamRef(K8sSpec):
     selector: Optional[gybe.k8s.v1_31.meta.v1.LabelSelector] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class TypeChecking(K8sSpec):
     """TypeChecking contains results of type checking the expressions in the ValidatingAdmissionPolicy
     Attributes:
@@ -233,7 +233,7 @@ class TypeChecking(K8sSpec):
     expressionWarnings: Optional[List[ExpressionWarning]] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class ValidatingAdmissionPolicy(K8sResource):
     """ValidatingAdmissionPolicy describes the definition of an admission validation policy that accepts or
     rejects an object without changing it.
@@ -258,7 +258,7 @@ class ValidatingAdmissionPolicy(K8sResource):
     status: Optional[ValidatingAdmissionPolicyStatus] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class ValidatingAdmissionPolicyBinding(K8sResource):
     """ValidatingAdmissionPolicyBinding binds the ValidatingAdmissionPolicy with paramerized resources.
     ValidatingAdmissionPolicyBinding and parameter CRDs together define how cluster administrators
@@ -286,7 +286,7 @@ class ValidatingAdmissionPolicyBinding(K8sResource):
     spec: Optional[ValidatingAdmissionPolicyBindingSpec] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class ValidatingAdmissionPolicyBindingSpec(K8sSpec):
     """ValidatingAdmissionPolicyBindingSpec is the specification of the ValidatingAdmissionPolicyBinding.
 
@@ -339,7 +339,7 @@ class ValidatingAdmissionPolicyBindingSpec(K8sSpec):
     validationActions: Optional[List[str]] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class ValidatingAdmissionPolicySpec(K8sSpec):
     """ValidatingAdmissionPolicySpec is the specification of the desired behavior of the AdmissionPolicy.
 
@@ -394,7 +394,7 @@ class ValidatingAdmissionPolicySpec(K8sSpec):
     variables: Optional[List[Variable]] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class ValidatingAdmissionPolicyStatus(K8sSpec):
     """ValidatingAdmissionPolicyStatus represents the status of a ValidatingAdmissionPolicy.
 
@@ -411,7 +411,7 @@ class ValidatingAdmissionPolicyStatus(K8sSpec):
     typeChecking: Optional[TypeChecking] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class Validation(K8sSpec):
     """Validation specifies the CEL expression which is used to apply the validation.
 
@@ -479,7 +479,7 @@ class Validation(K8sSpec):
     reason: Optional[str] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class Variable(K8sSpec):
     """Variable is the definition of a variable that is used for composition.
 
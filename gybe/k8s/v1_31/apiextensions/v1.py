@@ -9,7 +9,7 @@ import gybe.k8s.v1_31.meta.v1
 from gybe.k8s.types import JSONObj, K8sResource, K8sSpec
 
 
-@dataclass
+@dataclass(slots=True)
 class CustomResourceColumnDefinition(K8sSpec):
     """CustomResourceColumnDefinition specifies a column for server side printing.
 
@@ -37,7 +37,7 @@ class CustomResourceColumnDefinition(K8sSpec):
     priority: Optional[int] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class CustomResourceConversion(K8sSpec):
     """CustomResourceConversion describes how to convert different versions of a CR.
 
@@ -56,7 +56,7 @@ class CustomResourceConversion(K8sSpec):
     webhook: Optional[WebhookConversion] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class CustomResourceDefinition(K8sResource):
     """CustomResourceDefinition represents a resource that should be exposed on the API server.  Its name
     MUST be in the format <.spec.name>.<.spec.group>.
@@ -80,7 +80,7 @@ class CustomResourceDefinition(K8sResource):
     status: Optional[CustomResourceDefinitionStatus] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class CustomResourceDefinitionCondition(K8sSpec):
     """CustomResourceDefinitionCondition contains details for the current condition of this pod.
 
@@ -101,7 +101,7 @@ class CustomResourceDefinitionCondition(K8sSpec):
     reason: Optional[str] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class CustomResourceDefinitionNames(K8sSpec):
     """CustomResourceDefinitionNames indicates the names to serve this CustomResourceDefinition
     Attributes:
@@ -129,7 +129,7 @@ class CustomResourceDefinitionNames(K8sSpec):
     singular: Optional[str] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class CustomResourceDefinitionSpec(K8sSpec):
     """CustomResourceDefinitionSpec describes how a user wants their resource to appear
     Attributes:
@@ -165,7 +165,7 @@ class CustomResourceDefinitionSpec(K8sSpec):
     preserveUnknownFields: Optional[bool] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class CustomResourceDefinitionStatus(K8sSpec):
     """CustomResourceDefinitionStatus indicates the state of the CustomResourceDefinition
     Attributes:
@@ -185,7 +185,7 @@ class CustomResourceDefinitionStatus(K8sSpec):
     storedVersions: Optional[List[str]] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class CustomResourceDefinitionVersion(K8sSpec):
     """CustomResourceDefinitionVersion describes a version for CRD.
 
@@ -225,7 +225,7 @@ class CustomResourceDefinitionVersion(K8sSpec):
     subresources: Optional[CustomResourceSubresources] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class CustomResourceSubresourceScale(K8sSpec):
     """CustomResourceSubresourceScale defines how to serve the scale subresource for CustomResources.
 
@@ -251,7 +251,7 @@ class CustomResourceSubresourceScale(K8sSpec):
     labelSelectorPath: Optional[str] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class CustomResourceSubresources(K8sSpec):
     """CustomResourceSubresources defines the status and scale subresources for CustomResources.
 
@@ -269,7 +269,7 @@ class CustomResourceSubresources(K8sSpec):
     status: Optional[JSONObj] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class CustomResourceValidation(K8sSpec):
     """CustomResourceValidation is a list of validation methods for CustomResources.
 
@@ -281,7 +281,7 @@ class CustomResourceValidation(K8sSpec):
     openAPIV3Schema: Optional[JSONObj] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class ExternalDocumentation(K8sSpec):
     """ExternalDocumentation allows referencing an external resource for extended documentation.
 
@@ -295,7 +295,7 @@ class ExternalDocumentation(K8sSpec):
     url: Optional[str] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class SelectableField(K8sSpec):
     """SelectableField specifies the JSON path of a field that may be used with field selectors.
 
@@ -311,7 +311,7 @@ class SelectableField(K8sSpec):
     jsonPath: str
 
 
-@dataclass
+@dataclass(slots=True)
 class ServiceReference(K8sSpec):
     """ServiceReference holds a reference to Service.legacy.k8s.io
     Attributes:
@@ -329,7 +329,7 @@ class ServiceReference(K8sSpec):
     port: Optional[int] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class ValidationRule(K8sSpec):
     """ValidationRule describes a validation rule written in the CEL expression language.
 
@@ -428,7 +428,7 @@ class ValidationRule(K8sSpec):
     reason: Optional[str] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class WebhookClientConfig(K8sSpec):
     """WebhookClientConfig contains the information to make a TLS connection with the webhook.
 
@@ -457,7 +457,7 @@ class WebhookClientConfig(K8sSpec):
     url: Optional[str] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class WebhookConversion(K8sSpec):
     """WebhookConversion describes how to call a conversion webhook
     Attributes:
@@ -9,7 +9,7 @@ import gybe.k8s.v1_31.meta.v1
 from gybe.k8s.types import K8sResource, K8sSpec
 
 
-@dataclass
+@dataclass(slots=True)
 class APIService(K8sResource):
     """APIService represents a server for a particular GroupVersion. Name must be 'version.group'.
 
@@ -32,7 +32,7 @@ class APIService(K8sResource):
     status: Optional[APIServiceStatus] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class APIServiceCondition(K8sSpec):
     """APIServiceCondition describes the state of an APIService at a particular point
     Attributes:
@@ -51,7 +51,7 @@ class APIServiceCondition(K8sSpec):
     reason: Optional[str] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class APIServiceSpec(K8sSpec):
     """APIServiceSpec contains information for locating and communicating with a server. Only https is
     supported, though you are able to disable certificate verification.
@@ -95,7 +95,7 @@ class APIServiceSpec(K8sSpec):
     version: Optional[str] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class APIServiceStatus(K8sSpec):
     """APIServiceStatus contains derived information about an API server
     Attributes:
@@ -106,7 +106,7 @@ class APIServiceStatus(K8sSpec):
     conditions: Optional[List[APIServiceCondition]] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class ServiceReference(K8sSpec):
     """ServiceReference holds a reference to Service.legacy.k8s.io
     Attributes:
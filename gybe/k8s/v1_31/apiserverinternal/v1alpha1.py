@@ -9,7 +9,7 @@ import gybe.k8s.v1_31.meta.v1
 from gybe.k8s.types import JSONObj, K8sResource, K8sSpec
 
 
-@dataclass
+@dataclass(slots=True)
 class ServerStorageVersion(K8sSpec):
     """An API server instance reports the version it can decode and the version it encodes objects to when
     persisting objects in the backend.
@@ -31,7 +31,7 @@ class ServerStorageVersion(K8sSpec):
     servedVersions: Optional[List[str]] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class StorageVersion(K8sResource):
     """Storage version of a specific resource.
 
@@ -55,7 +55,7 @@ class StorageVersion(K8sResource):
     metadata: Optional[gybe.k8s.v1_31.meta.v1.ObjectMeta] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class StorageVersionCondition(K8sSpec):
     """Describes the state of the storageVersion at a certain point.
 
@@ -78,7 +78,7 @@ class StorageVersionCondition(K8sSpec):
     observedGeneration: Optional[int] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class StorageVersionStatus(K8sSpec):
     """API server instances report the versions they can decode and the version they encode objects to when
     persisting objects in the backend.
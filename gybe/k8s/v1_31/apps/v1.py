@@ -10,7 +10,7 @@ import gybe.k8s.v1_31.meta.v1
 from gybe.k8s.types import JSONObj, K8sResource, K8sSpec
 
 
-@dataclass
+@dataclass(slots=True)
 class ControllerRevision(K8sResource):
     """ControllerRevision implements an immutable snapshot of state data. Clients are responsible for
     serializing and deserializing the objects that contain their internal state. Once a ControllerRevision
@@ -39,7 +39,7 @@ class ControllerRevision(K8sResource):
     metadata: Optional[gybe.k8s.v1_31.meta.v1.ObjectMeta] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class DaemonSet(K8sResource):
     """DaemonSet represents the configuration of a daemon set.
 
@@ -63,7 +63,7 @@ class DaemonSet(K8sResource):
     status: Optional[DaemonSetStatus] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class DaemonSetCondition(K8sSpec):
     """DaemonSetCondition describes the state of a DaemonSet at a certain point.
 
@@ -83,7 +83,7 @@ class DaemonSetCondition(K8sSpec):
     reason: Optional[str] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class DaemonSetSpec(K8sSpec):
     """DaemonSetSpec is the specification of a daemon set.
 
@@ -109,7 +109,7 @@ class DaemonSetSpec(K8sSpec):
     updateStrategy: Optional[DaemonSetUpdateStrategy] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class DaemonSetStatus(K8sSpec):
     """DaemonSetStatus represents the current status of a daemon set.
 
@@ -147,7 +147,7 @@ class DaemonSetStatus(K8sSpec):
     updatedNumberScheduled: Optional[int] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class DaemonSetUpdateStrategy(K8sSpec):
     """DaemonSetUpdateStrategy is a struct used to control the update strategy for a DaemonSet.
 
@@ -161,7 +161,7 @@ class DaemonSetUpdateStrategy(K8sSpec):
     type: Optional[str] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class Deployment(K8sResource):
     """Deployment enables declarative updates for Pods and ReplicaSets.
 
@@ -184,7 +184,7 @@ class Deployment(K8sResource):
     status: Optional[DeploymentStatus] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class DeploymentCondition(K8sSpec):
     """DeploymentCondition describes the state of a deployment at a certain point.
 
@@ -206,7 +206,7 @@ class DeploymentCondition(K8sSpec):
     reason: Optional[str] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class DeploymentSpec(K8sSpec):
     """DeploymentSpec is the specification of the desired behavior of the Deployment.
 
@@ -241,7 +241,7 @@ class DeploymentSpec(K8sSpec):
     strategy: Optional[DeploymentStrategy] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class DeploymentStatus(K8sSpec):
     """DeploymentStatus is the most recently observed status of the Deployment.
 
@@ -274,7 +274,7 @@ class DeploymentStatus(K8sSpec):
     updatedReplicas: Optional[int] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class DeploymentStrategy(K8sSpec):
     """DeploymentStrategy describes how to replace existing pods with new ones.
 
@@ -288,7 +288,7 @@ class DeploymentStrategy(K8sSpec):
     type: Optional[str] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class ReplicaSet(K8sResource):
     """ReplicaSet ensures that a specified number of pod replicas are running at any given time.
 
@@ -313,7 +313,7 @@ class ReplicaSet(K8sResource):
     status: Optional[ReplicaSetStatus] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class ReplicaSetCondition(K8sSpec):
     """ReplicaSetCondition describes the state of a replica set at a certain point.
 
@@ -333,7 +333,7 @@ class ReplicaSetCondition(K8sSpec):
     reason: Optional[str] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class ReplicaSetSpec(K8sSpec):
     """ReplicaSetSpec is the specification of a ReplicaSet.
 
@@ -357,7 +357,7 @@ class ReplicaSetSpec(K8sSpec):
     template: Optional[gybe.k8s.v1_31.core.v1.PodTemplateSpec] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class ReplicaSetStatus(K8sSpec):
     """ReplicaSetStatus represents the current status of a ReplicaSet.
 
@@ -382,7 +382,7 @@ class ReplicaSetStatus(K8sSpec):
     readyReplicas: Optional[int] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class RollingUpdateDaemonSet(K8sSpec):
     """Spec to control the desired behavior of daemon set rolling update.
 
@@ -416,7 +416,7 @@ class RollingUpdateDaemonSet(K8sSpec):
     maxUnavailable: Optional[int | str] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class RollingUpdateDeployment(K8sSpec):
     """Spec to control the desired behavior of rolling update.
 
@@ -442,7 +442,7 @@ class RollingUpdateDeployment(K8sSpec):
     maxUnavailable: Optional[int | str] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class RollingUpdateStatefulSetStrategy(K8sSpec):
     """RollingUpdateStatefulSetStrategy is used to communicate parameter for
     RollingUpdateStatefulSetStrategyType.
@@ -465,7 +465,7 @@ class RollingUpdateStatefulSetStrategy(K8sSpec):
     partition: Optional[int] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class StatefulSet(K8sResource):
     """StatefulSet represents a set of pods with consistent identities. Identities are defined as:   -
     Network: A single stable DNS and hostname.   - Storage: As many VolumeClaims as requested.  The
@@ -491,7 +491,7 @@ class StatefulSet(K8sResource):
     status: Optional[StatefulSetStatus] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class StatefulSetCondition(K8sSpec):
     """StatefulSetCondition describes the state of a statefulset at a certain point.
 
@@ -511,7 +511,7 @@ class StatefulSetCondition(K8sSpec):
     reason: Optional[str] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class StatefulSetOrdinals(K8sSpec):
     """StatefulSetOrdinals describes the policy used for replica ordinal assignment in this StatefulSet.
 
@@ -527,7 +527,7 @@ class StatefulSetOrdinals(K8sSpec):
     start: Optional[int] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class StatefulSetPersistentVolumeClaimRetentionPolicy(K8sSpec):
     """StatefulSetPersistentVolumeClaimRetentionPolicy describes the policy used for PVCs created from the
     StatefulSet VolumeClaimTemplates.
@@ -547,7 +547,7 @@ class StatefulSetPersistentVolumeClaimRetentionPolicy(K8sSpec):
     whenScaled: Optional[str] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class StatefulSetSpec(K8sSpec):
     """A StatefulSetSpec is the specification of a StatefulSet.
 
@@ -610,7 +610,7 @@ class StatefulSetSpec(K8sSpec):
     volumeClaimTemplates: Optional[List[gybe.k8s.v1_31.core.v1.PersistentVolumeClaim]] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class StatefulSetStatus(K8sSpec):
     """StatefulSetStatus represents the current state of a StatefulSet.
 
@@ -649,7 +649,7 @@ class StatefulSetStatus(K8sSpec):
     updatedReplicas: Optional[int] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class StatefulSetUpdateStrategy(K8sSpec):
     """StatefulSetUpdateStrategy indicates the strategy that the StatefulSet controller will use to perform
     updates. It includes any additional parameters necessary to perform the update for the indicated
@@ -9,7 +9,7 @@ import gybe.k8s.v1_31.meta.v1
 from gybe.k8s.types import JSONDict, K8sResource, K8sSpec
 
 
-@dataclass
+@dataclass(slots=True)
 class UserInfo(K8sSpec):
     """UserInfo holds the information about the user needed to implement the user.Info interface.
 
@@ -28,7 +28,7 @@ class UserInfo(K8sSpec):
     username: Optional[str] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class BoundObjectReference(K8sSpec):
     """BoundObjectReference is a reference to an object that a token is bound to.
 
@@ -46,7 +46,7 @@ class BoundObjectReference(K8sSpec):
     uid: Optional[str] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class TokenRequest(K8sResource):
     """TokenRequest requests a token for a given service account.
 
@@ -69,7 +69,7 @@ class TokenRequest(K8sResource):
     status: Optional[TokenRequestStatus] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class TokenRequestSpec(K8sSpec):
     """TokenRequestSpec contains client provided parameters of a token request.
 
@@ -93,7 +93,7 @@ class TokenRequestSpec(K8sSpec):
     expirationSeconds: Optional[int] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class TokenRequestStatus(K8sSpec):
     """TokenRequestStatus is the result of a token request.
 
@@ -107,7 +107,7 @@ class TokenRequestStatus(K8sSpec):
     expirationTimestamp: str
 
 
-@dataclass
+@dataclass(slots=True)
 class SelfSubjectReview(K8sResource):
     """SelfSubjectReview contains the user information that the kube-apiserver has about the user making this
     request. When using impersonation, users will receive the user info of the user being impersonated.
@@ -131,7 +131,7 @@ class SelfSubjectReview(K8sResource):
     status: Optional[SelfSubjectReviewStatus] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class SelfSubjectReviewStatus(K8sSpec):
     """SelfSubjectReviewStatus is filled by the kube-apiserver and sent back to a user.
 
@@ -143,7 +143,7 @@ class SelfSubjectReviewStatus(K8sSpec):
     userInfo: Optional[UserInfo] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class TokenReview(K8sResource):
     """TokenReview attempts to authenticate a token to a known user. Note: TokenReview requests may be cached
     by the webhook token authenticator plugin in the kube-apiserver.
@@ -167,7 +167,7 @@ class TokenReview(K8sResource):
     status: Optional[TokenReviewStatus] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class TokenReviewSpec(K8sSpec):
     """TokenReviewSpec is a description of the token authentication request.
 
@@ -184,7 +184,7 @@ class TokenReviewSpec(K8sSpec):
     token: Optional[str] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class TokenReviewStatus(K8sSpec):
     """TokenReviewStatus is the result of the token authentication request.
 
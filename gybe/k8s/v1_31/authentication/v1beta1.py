@@ -10,7 +10,7 @@ import gybe.k8s.v1_31.meta.v1
 from gybe.k8s.types import K8sResource, K8sSpec
 
 
-@dataclass
+@dataclass(slots=True)
 class SelfSubjectReview(K8sResource):
     """SelfSubjectReview contains the user information that the kube-apiserver has about the user making this
     request. When using impersonation, users will receive the user info of the user being impersonated.
@@ -34,7 +34,7 @@ class SelfSubjectReview(K8sResource):
     status: Optional[SelfSubjectReviewStatus] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class SelfSubjectReviewStatus(K8sSpec):
     """SelfSubjectReviewStatus is filled by the kube-apiserver and sent back to a user.
 
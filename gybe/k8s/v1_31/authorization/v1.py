@@ -9,7 +9,7 @@ import gybe.k8s.v1_31.meta.v1
 from gybe.k8s.types import JSONDict, K8sResource, K8sSpec
 
 
-@dataclass
+@dataclass(slots=True)
 class FieldSelectorAttributes(K8sSpec):
     """FieldSelectorAttributes indicates a field limited access. Webhook authors are encouraged to * ensure
     rawSelector and requirements are not both set * consider the requirements field if set * not try to
@@ -37,7 +37,7 @@ class FieldSelectorAttributes(K8sSpec):
     requirements: Optional[List[gybe.k8s.v1_31.meta.v1.FieldSelectorRequirement]] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class LabelSelectorAttributes(K8sSpec):
     """LabelSelectorAttributes indicates a label limited access. Webhook authors are encouraged to * ensure
     rawSelector and requirements are not both set * consider the requirements field if set * not try to
@@ -65,7 +65,7 @@ class LabelSelectorAttributes(K8sSpec):
     requirements: Optional[List[gybe.k8s.v1_31.meta.v1.LabelSelectorRequirement]] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class LocalSubjectAccessReview(K8sResource):
     """LocalSubjectAccessReview checks whether or not a user or group can perform an action in a given
     namespace. Having a namespace scoped resource makes it much easier to grant namespace scoped policy
@@ -91,7 +91,7 @@ class LocalSubjectAccessReview(K8sResource):
     status: Optional[SubjectAccessReviewStatus] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class NonResourceAttributes(K8sSpec):
     """NonResourceAttributes includes the authorization attributes available for non-resource requests to the
     Authorizer interface
@@ -105,7 +105,7 @@ class NonResourceAttributes(K8sSpec):
     verb: Optional[str] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class NonResourceRule(K8sSpec):
     """NonResourceRule holds information that describes a rule for the non-resource
     Attributes:
@@ -120,7 +120,7 @@ class NonResourceRule(K8sSpec):
     nonResourceURLs: Optional[List[str]] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class ResourceAttributes(K8sSpec):
     """ResourceAttributes includes the authorization attributes available for resource requests to the
     Authorizer interface
@@ -157,7 +157,7 @@ class ResourceAttributes(K8sSpec):
     version: Optional[str] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class ResourceRule(K8sSpec):
     """ResourceRule is the list of actions the subject is allowed to perform on resources. The list ordering
     isn't significant, may contain duplicates, and possibly be incomplete.
@@ -181,7 +181,7 @@ class ResourceRule(K8sSpec):
     resources: Optional[List[str]] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class SelfSubjectAccessReview(K8sResource):
     """SelfSubjectAccessReview checks whether or the current user can perform an action.  Not filling in a
     spec.namespace means 'in all namespaces'.  Self is a special case, because users should always be able
@@ -205,7 +205,7 @@ class SelfSubjectAccessReview(K8sResource):
     status: Optional[SubjectAccessReviewStatus] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class SelfSubjectAccessReviewSpec(K8sSpec):
     """SelfSubjectAccessReviewSpec is a description of the access request.  Exactly one of
     ResourceAuthorizationAttributes and NonResourceAuthorizationAttributes must be set
@@ -220,7 +220,7 @@ class SelfSubjectAccessReviewSpec(K8sSpec):
     resourceAttributes: Optional[ResourceAttributes] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class SelfSubjectRulesReview(K8sResource):
     """SelfSubjectRulesReview enumerates the set of actions the current user can perform within a namespace.
     The returned list of actions may be incomplete depending on the server's authorization mode, and any
@@ -249,7 +249,7 @@ class SelfSubjectRulesReview(K8sResource):
     status: Optional[SubjectRulesReviewStatus] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class SelfSubjectRulesReviewSpec(K8sSpec):
     """SelfSubjectRulesReviewSpec defines the specification for SelfSubjectRulesReview.
 
@@ -261,7 +261,7 @@ class SelfSubjectRulesReviewSpec(K8sSpec):
     namespace: Optional[str] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class SubjectAccessReview(K8sResource):
     """SubjectAccessReview checks whether or not a user or group can perform an action.
 
@@ -284,7 +284,7 @@ class SubjectAccessReview(K8sResource):
     status: Optional[SubjectAccessReviewStatus] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class SubjectAccessReviewSpec(K8sSpec):
     """SubjectAccessReviewSpec is a description of the access request.  Exactly one of
     ResourceAuthorizationAttributes and NonResourceAuthorizationAttributes must be set
@@ -309,7 +309,7 @@ class SubjectAccessReviewSpec(K8sSpec):
     user: Optional[str] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class SubjectAccessReviewStatus(K8sSpec):
     """SubjectAccessReviewStatus
     Attributes:
@@ -331,7 +331,7 @@ class SubjectAccessReviewStatus(K8sSpec):
     reason: Optional[str] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class SubjectRulesReviewStatus(K8sSpec):
     """SubjectRulesReviewStatus contains the result of a rules check. This check can be incomplete depending
     on the set of authorizers the server is configured with and any errors experienced during evaluation.
@@ -9,7 +9,7 @@ import gybe.k8s.v1_31.meta.v1
 from gybe.k8s.types import K8sResource, K8sSpec
 
 
-@dataclass
+@dataclass(slots=True)
 class Scale(K8sResource):
     """Scale represents a scaling request for a resource.
 
@@ -32,7 +32,7 @@ class Scale(K8sResource):
     status: Optional[ScaleStatus] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class ScaleSpec(K8sSpec):
     """ScaleSpec describes the attributes of a scale subresource.
 
@@ -44,7 +44,7 @@ class ScaleSpec(K8sSpec):
     replicas: Optional[int] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class ScaleStatus(K8sSpec):
     """ScaleStatus represents the current status of a scale subresource.
 
@@ -61,7 +61,7 @@ class ScaleStatus(K8sSpec):
     selector: Optional[str] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class CrossVersionObjectReference(K8sSpec):
     """CrossVersionObjectReference contains enough information to let you identify the referred resource.
 
@@ -77,7 +77,7 @@ class CrossVersionObjectReference(K8sSpec):
     apiVersion: Optional[str] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class HorizontalPodAutoscaler(K8sResource):
     """configuration of a horizontal pod autoscaler.
 
@@ -100,7 +100,7 @@ class HorizontalPodAutoscaler(K8sResource):
     status: Optional[HorizontalPodAutoscalerStatus] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class HorizontalPodAutoscalerSpec(K8sSpec):
     """specification of a horizontal pod autoscaler.
 
@@ -125,7 +125,7 @@ class HorizontalPodAutoscalerSpec(K8sSpec):
     targetCPUUtilizationPercentage: Optional[int] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class HorizontalPodAutoscalerStatus(K8sSpec):
     """current status of a horizontal pod autoscaler
     Attributes:
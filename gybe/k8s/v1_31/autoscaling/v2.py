@@ -10,7 +10,7 @@ import gybe.k8s.v1_31.meta.v1
 from gybe.k8s.types import K8sResource, K8sSpec
 
 
-@dataclass
+@dataclass(slots=True)
 class ContainerResourceMetricSource(K8sSpec):
     """ContainerResourceMetricSource indicates how to scale on a resource metric known to Kubernetes, as
     specified in requests and limits, describing each pod in the current scale target (e.g. CPU or
@@ -30,7 +30,7 @@ class ContainerResourceMetricSource(K8sSpec):
     container: str
 
 
-@dataclass
+@dataclass(slots=True)
 class ContainerResourceMetricStatus(K8sSpec):
     """ContainerResourceMetricStatus indicates the current value of a resource metric known to Kubernetes, as
     specified in requests and limits, describing a single container in each pod in the current scale
@@ -49,7 +49,7 @@ class ContainerResourceMetricStatus(K8sSpec):
     container: str
 
 
-@dataclass
+@dataclass(slots=True)
 class CrossVersionObjectReference(K8sSpec):
     """CrossVersionObjectReference contains enough information to let you identify the referred resource.
 
@@ -65,7 +65,7 @@ class CrossVersionObjectReference(K8sSpec):
     apiVersion: Optional[str] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class ExternalMetricSource(K8sSpec):
     """ExternalMetricSource indicates how to scale on a metric not associated with any Kubernetes object (for
     example length of queue in cloud messaging service, or QPS from loadbalancer running outside of
@@ -81,7 +81,7 @@ class ExternalMetricSource(K8sSpec):
     target: MetricTarget
 
 
-@dataclass
+@dataclass(slots=True)
 class ExternalMetricStatus(K8sSpec):
     """ExternalMetricStatus indicates the current value of a global metric not associated with any Kubernetes
     object.
@@ -96,7 +96,7 @@ class ExternalMetricStatus(K8sSpec):
     current: MetricValueStatus
 
 
-@dataclass
+@dataclass(slots=True)
 class HPAScalingPolicy(K8sSpec):
     """HPAScalingPolicy is a single policy which must hold true for a specified past interval.
 
@@ -114,7 +114,7 @@ class HPAScalingPolicy(K8sSpec):
     periodSeconds: int
 
 
-@dataclass
+@dataclass(slots=True)
 class HPAScalingRules(K8sSpec):
     """HPAScalingRules configures the scaling behavior for one direction. These Rules are applied after
     calculating DesiredReplicas from metrics for the HPA. They can limit the scaling velocity by
@@ -140,7 +140,7 @@ class HPAScalingRules(K8sSpec):
     stabilizationWindowSeconds: Optional[int] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class HorizontalPodAutoscaler(K8sResource):
     """HorizontalPodAutoscaler is the configuration for a horizontal pod autoscaler, which automatically
     manages the replica count of any resource implementing the scale subresource based on the metrics
@@ -165,7 +165,7 @@ class HorizontalPodAutoscaler(K8sResource):
     status: Optional[HorizontalPodAutoscalerStatus] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class HorizontalPodAutoscalerBehavior(K8sSpec):
     """HorizontalPodAutoscalerBehavior configures the scaling behavior of the target in both Up and Down
     directions (scaleUp and scaleDown fields respectively).
@@ -184,7 +184,7 @@ class HorizontalPodAutoscalerBehavior(K8sSpec):
     scaleUp: Optional[HPAScalingRules] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class HorizontalPodAutoscalerCondition(K8sSpec):
     """HorizontalPodAutoscalerCondition describes the state of a HorizontalPodAutoscaler at a certain point.
 
@@ -205,7 +205,7 @@ class HorizontalPodAutoscalerCondition(K8sSpec):
     reason: Optional[str] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class HorizontalPodAutoscalerSpec(K8sSpec):
     """HorizontalPodAutoscalerSpec describes the desired functionality of the HorizontalPodAutoscaler.
 
@@ -237,7 +237,7 @@ class HorizontalPodAutoscalerSpec(K8sSpec):
     minReplicas: Optional[int] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class HorizontalPodAutoscalerStatus(K8sSpec):
     """HorizontalPodAutoscalerStatus describes the current status of a horizontal pod autoscaler.
 
@@ -263,7 +263,7 @@ class HorizontalPodAutoscalerStatus(K8sSpec):
     observedGeneration: Optional[int] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class MetricIdentifier(K8sSpec):
     """MetricIdentifier defines the name and optionally selector for a metric
     Attributes:
@@ -278,7 +278,7 @@ class MetricIdentifier(K8sSpec):
     selector: Optional[gybe.k8s.v1_31.meta.v1.LabelSelector] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class MetricSpec(K8sSpec):
     """MetricSpec specifies how to scale based on a single metric (only `type` and one other matching field
     should be set at once).
@@ -316,7 +316,7 @@ class MetricSpec(K8sSpec):
     resource: Optional[ResourceMetricSource] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class MetricStatus(K8sSpec):
     """MetricStatus describes the last-read state of a single metric.
 
@@ -352,7 +352,7 @@ class MetricStatus(K8sSpec):
     resource: Optional[ResourceMetricStatus] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class MetricTarget(K8sSpec):
     """MetricTarget defines the target value, average value, or average utilization of a specific metric
     Attributes:
@@ -372,7 +372,7 @@ class MetricTarget(K8sSpec):
     value: Optional[gybe.k8s.v1_31.api.resource.Quantity] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class MetricValueStatus(K8sSpec):
     """MetricValueStatus holds the current value for a metric
     Attributes:
@@ -390,7 +390,7 @@ class MetricValueStatus(K8sSpec):
     value: Optional[gybe.k8s.v1_31.api.resource.Quantity] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class ObjectMetricSource(K8sSpec):
     """ObjectMetricSource indicates how to scale on a metric describing a kubernetes object (for example,
     hits-per-second on an Ingress object).
@@ -407,7 +407,7 @@ class ObjectMetricSource(K8sSpec):
     metric: MetricIdentifier
 
 
-@dataclass
+@dataclass(slots=True)
 class ObjectMetricStatus(K8sSpec):
     """ObjectMetricStatus indicates the current value of a metric describing a kubernetes object (for
     example, hits-per-second on an Ingress object).
@@ -424,7 +424,7 @@ class ObjectMetricStatus(K8sSpec):
     describedObject: CrossVersionObjectReference
 
 
-@dataclass
+@dataclass(slots=True)
 class PodsMetricSource(K8sSpec):
     """PodsMetricSource indicates how to scale on a metric describing each pod in the current scale target
     (for example, transactions-processed-per-second). The values will be averaged together before being
@@ -440,7 +440,7 @@ class PodsMetricSource(K8sSpec):
     target: MetricTarget
 
 
-@dataclass
+@dataclass(slots=True)
 class PodsMetricStatus(K8sSpec):
     """PodsMetricStatus indicates the current value of a metric describing each pod in the current scale
     target (for example, transactions-processed-per-second).
@@ -455,7 +455,7 @@ class PodsMetricStatus(K8sSpec):
     current: MetricValueStatus
 
 
-@dataclass
+@dataclass(slots=True)
 class ResourceMetricSource(K8sSpec):
     """ResourceMetricSource indicates how to scale on a resource metric known to Kubernetes, as specified in
     requests and limits, describing each pod in the current scale target (e.g. CPU or memory).  The values
@@ -473,7 +473,7 @@ class ResourceMetricSource(K8sSpec):
     target: MetricTarget
 
 
-@dataclass
+@dataclass(slots=True)
 class ResourceMetricStatus(K8sSpec):
     """ResourceMetricStatus indicates the current value of a resource metric known to Kubernetes, as
     specified in requests and limits, describing each pod in the current scale target (e.g. CPU or
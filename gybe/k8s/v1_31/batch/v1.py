@@ -10,7 +10,7 @@ import gybe.k8s.v1_31.meta.v1
 from gybe.k8s.types import K8sResource, K8sSpec
 
 
-@dataclass
+@dataclass(slots=True)
 class CronJob(K8sResource):
     """CronJob represents the configuration of a single cron job.
 
@@ -33,7 +33,7 @@ class CronJob(K8sResource):
     status: Optional[CronJobStatus] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class CronJobSpec(K8sSpec):
     """CronJobSpec describes how the job execution will look like and when it will actually run.
 
@@ -75,7 +75,7 @@ class CronJobSpec(K8sSpec):
     timeZone: Optional[str] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class CronJobStatus(K8sSpec):
     """CronJobStatus represents the current state of a cron job.
 
@@ -91,7 +91,7 @@ class CronJobStatus(K8sSpec):
     lastSuccessfulTime: Optional[str] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class Job(K8sResource):
     """Job represents the configuration of a single job.
 
@@ -114,7 +114,7 @@ class Job(K8sResource):
     status: Optional[JobStatus] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class JobCondition(K8sSpec):
     """JobCondition describes current state of a job.
 
@@ -136,7 +136,7 @@ class JobCondition(K8sSpec):
     reason: Optional[str] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class JobSpec(K8sSpec):
     """JobSpec describes how the job execution will look like.
 
@@ -248,7 +248,7 @@ class JobSpec(K8sSpec):
     ttlSecondsAfterFinished: Optional[int] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class JobStatus(K8sSpec):
     """JobStatus represents the current state of a Job.
 
@@ -316,7 +316,7 @@ class JobStatus(K8sSpec):
     uncountedTerminatedPods: Optional[UncountedTerminatedPods] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class JobTemplateSpec(K8sSpec):
     """JobTemplateSpec describes the data a Job should have when created from a template
     Attributes:
@@ -329,7 +329,7 @@ class JobTemplateSpec(K8sSpec):
     spec: Optional[JobSpec] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class PodFailurePolicy(K8sSpec):
     """PodFailurePolicy describes how failed pods influence the backoffLimit.
 
@@ -344,7 +344,7 @@ class PodFailurePolicy(K8sSpec):
     rules: List[PodFailurePolicyRule]
 
 
-@dataclass
+@dataclass(slots=True)
 class PodFailurePolicyOnExitCodesRequirement(K8sSpec):
     """PodFailurePolicyOnExitCodesRequirement describes the requirement for handling a failed pod based on
     its container exit codes. In particular, it lookups the .state.terminated.exitCode for each app
@@ -376,7 +376,7 @@ class PodFailurePolicyOnExitCodesRequirement(K8sSpec):
     containerName: Optional[str] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class PodFailurePolicyOnPodConditionsPattern(K8sSpec):
     """PodFailurePolicyOnPodConditionsPattern describes a pattern for matching an actual pod condition type.
 
@@ -392,7 +392,7 @@ class PodFailurePolicyOnPodConditionsPattern(K8sSpec):
     status: str
 
 
-@dataclass
+@dataclass(slots=True)
 class PodFailurePolicyRule(K8sSpec):
     """PodFailurePolicyRule describes how a pod failure is handled when the requirements are met. One of
     onExitCodes and onPodConditions, but not both, can be used in each rule.
@@ -419,7 +419,7 @@ class PodFailurePolicyRule(K8sSpec):
     onPodConditions: Optional[List[PodFailurePolicyOnPodConditionsPattern]] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class SuccessPolicy(K8sSpec):
     """SuccessPolicy describes when a Job can be declared as succeeded based on the success of some indexes.
 
@@ -435,7 +435,7 @@ class SuccessPolicy(K8sSpec):
     rules: List[SuccessPolicyRule]
 
 
-@dataclass
+@dataclass(slots=True)
 class SuccessPolicyRule(K8sSpec):
     """SuccessPolicyRule describes rule for declaring a Job as succeeded. Each rule must have at least one of
     the 'succeededIndexes' or 'succeededCount' specified.
@@ -463,7 +463,7 @@ class SuccessPolicyRule(K8sSpec):
     succeededIndexes: Optional[str] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class UncountedTerminatedPods(K8sSpec):
     """UncountedTerminatedPods holds UIDs of Pods that have terminated but haven't been accounted in Job
     status counters.
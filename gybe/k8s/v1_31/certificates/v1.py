@@ -9,7 +9,7 @@ import gybe.k8s.v1_31.meta.v1
 from gybe.k8s.types import JSONDict, K8sResource, K8sSpec
 
 
-@dataclass
+@dataclass(slots=True)
 class CertificateSigningRequest(K8sResource):
     """CertificateSigningRequest objects provide a mechanism to obtain x509 certificates by submitting a
     certificate signing request, and having it asynchronously approved and issued.  Kubelets use this API
@@ -41,7 +41,7 @@ class CertificateSigningRequest(K8sResource):
     status: Optional[CertificateSigningRequestStatus] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class CertificateSigningRequestCondition(K8sSpec):
     """CertificateSigningRequestCondition describes a condition of a CertificateSigningRequest object
     Attributes:
@@ -71,7 +71,7 @@ class CertificateSigningRequestCondition(K8sSpec):
     reason: Optional[str] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class CertificateSigningRequestSpec(K8sSpec):
     """CertificateSigningRequestSpec contains the certificate request.
 
@@ -139,7 +139,7 @@ class CertificateSigningRequestSpec(K8sSpec):
     username: Optional[str] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class CertificateSigningRequestStatus(K8sSpec):
     """CertificateSigningRequestStatus contains conditions used to indicate approved/denied/failed status of
     the request, and the issued certificate.
@@ -9,7 +9,7 @@ import gybe.k8s.v1_31.meta.v1
 from gybe.k8s.types import K8sResource, K8sSpec
 
 
-@dataclass
+@dataclass(slots=True)
 class ClusterTrustBundle(K8sResource):
     """ClusterTrustBundle is a cluster-scoped container for X.509 trust anchors (root certificates).
     ClusterTrustBundle objects are considered to be readable by any authenticated user in the cluster,
@@ -38,7 +38,7 @@ class ClusterTrustBundle(K8sResource):
     metadata: Optional[gybe.k8s.v1_31.meta.v1.ObjectMeta] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class ClusterTrustBundleSpec(K8sSpec):
     """ClusterTrustBundleSpec contains the signer and trust anchors.
 
@@ -9,7 +9,7 @@ import gybe.k8s.v1_31.meta.v1
 from gybe.k8s.types import K8sResource, K8sSpec
 
 
-@dataclass
+@dataclass(slots=True)
 class Lease(K8sResource):
     """Lease defines a lease concept.
 
@@ -30,7 +30,7 @@ class Lease(K8sResource):
     spec: Optional[LeaseSpec] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class LeaseSpec(K8sSpec):
     """LeaseSpec is a specification of a Lease.
 
@@ -9,7 +9,7 @@ import gybe.k8s.v1_31.meta.v1
 from gybe.k8s.types import JSONObj, K8sSpec
 
 
-@dataclass
+@dataclass(slots=True)
 class LeaseCandidate(K8sSpec):
     """LeaseCandidate defines a candidate for a Lease object. Candidates are created such that coordinated
     leader election will pick the best leader from the list of candidates.
@@ -31,7 +31,7 @@ class LeaseCandidate(K8sSpec):
     spec: Optional[LeaseCandidateSpec] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class LeaseCandidateList(K8sSpec):
     """LeaseCandidateList is a list of Lease objects.
 
@@ -52,7 +52,7 @@ class LeaseCandidateList(K8sSpec):
     metadata: Optional[JSONObj] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class LeaseCandidateSpec(K8sSpec):
     """LeaseCandidateSpec is a specification of a Lease.
 
@@ -10,7 +10,7 @@ import gybe.k8s.v1_31.meta.v1
 from gybe.k8s.types import JSONDict, K8sResource, K8sSpec
 
 
-@dataclass
+@dataclass(slots=True)
 class EventSource(K8sSpec):
     """EventSource contains information for an event.
 
@@ -24,7 +24,7 @@ class EventSource(K8sSpec):
     host: Optional[str] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class ObjectReference(K8sSpec):
     """ObjectReference contains enough information to let you inspect or modify the referred object.
 
@@ -53,7 +53,7 @@ class ObjectReference(K8sSpec):
     uid: Optional[str] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class NodeSelector(K8sSpec):
     """A node selector represents the union of the results of one or more label queries over a set of nodes;
     that is, it represents the OR of the selectors represented by the node selector terms.
@@ -66,7 +66,7 @@ class NodeSelector(K8sSpec):
     nodeSelectorTerms: List[NodeSelectorTerm]
 
 
-@dataclass
+@dataclass(slots=True)
 class NodeSelectorRequirement(K8sSpec):
     """A node selector requirement is a selector that contains values, a key, and an operator that relates
     the key and values.
@@ -87,7 +87,7 @@ class NodeSelectorRequirement(K8sSpec):
     values: Optional[List[str]] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class NodeSelectorTerm(K8sSpec):
     """A null or empty node selector term matches no objects. The requirements of them are ANDed. The
     TopologySelectorTerm type implements a subset of the NodeSelectorTerm.
@@ -102,7 +102,7 @@ class NodeSelectorTerm(K8sSpec):
     matchFields: Optional[List[NodeSelectorRequirement]] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class AWSElasticBlockStoreVolumeSource(K8sSpec):
     """Represents a Persistent Disk resource in AWS.  An AWS EBS disk must exist before mounting to a
     container. The disk must also be in the same AWS zone as the kubelet. An AWS EBS disk can only be
@@ -126,7 +126,7 @@ class AWSElasticBlockStoreVolumeSource(K8sSpec):
     readOnly: Optional[bool] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class AzureDiskVolumeSource(K8sSpec):
     """AzureDisk represents an Azure Data Disk mount on the host and bind mount to the pod.
 
@@ -152,7 +152,7 @@ class AzureDiskVolumeSource(K8sSpec):
     readOnly: Optional[bool] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class AzureFilePersistentVolumeSource(K8sSpec):
     """AzureFile represents an Azure File Service mount on the host and bind mount to the pod.
 
@@ -172,7 +172,7 @@ class AzureFilePersistentVolumeSource(K8sSpec):
     secretNamespace: Optional[str] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class CSIPersistentVolumeSource(K8sSpec):
     """Represents storage that is managed by an external CSI volume driver (Beta feature)
 
@@ -219,7 +219,7 @@ class CSIPersistentVolumeSource(K8sSpec):
     volumeAttributes: Optional[JSONDict] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class CephFSPersistentVolumeSource(K8sSpec):
     """Represents a Ceph Filesystem mount that lasts the lifetime of a pod Cephfs volumes do not support
     ownership management or SELinux relabeling.
@@ -245,7 +245,7 @@ class CephFSPersistentVolumeSource(K8sSpec):
     user: Optional[str] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class CinderPersistentVolumeSource(K8sSpec):
     """Represents a cinder volume resource in Openstack. A Cinder volume must exist before mounting to a
     container. The volume must also be in the same region as the kubelet. Cinder volumes support ownership
@@ -268,7 +268,7 @@ class CinderPersistentVolumeSource(K8sSpec):
     secretRef: Optional[SecretReference] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class FCVolumeSource(K8sSpec):
     """Represents a Fibre Channel volume. Fibre Channel volumes can only be mounted as read/write once. Fibre
     Channel volumes support ownership management and SELinux relabeling.
@@ -292,7 +292,7 @@ class FCVolumeSource(K8sSpec):
     wwids: Optional[List[str]] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class FlexPersistentVolumeSource(K8sSpec):
     """FlexPersistentVolumeSource represents a generic persistent volume resource that is
     provisioned/attached using an exec based plugin.
@@ -317,7 +317,7 @@ class FlexPersistentVolumeSource(K8sSpec):
     secretRef: Optional[SecretReference] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class FlockerVolumeSource(K8sSpec):
     """Represents a Flocker volume mounted by the Flocker agent. One and only one of datasetName and
     datasetUUID should be set. Flocker volumes do not support ownership management or SELinux relabeling.
@@ -333,7 +333,7 @@ class FlockerVolumeSource(K8sSpec):
     datasetUUID: Optional[str] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class GCEPersistentDiskVolumeSource(K8sSpec):
     """Represents a Persistent Disk resource in Google Compute Engine.  A GCE PD must exist before mounting
     to a container. The disk must also be in the same GCE project and zone as the kubelet. A GCE PD can
@@ -358,7 +358,7 @@ class GCEPersistentDiskVolumeSource(K8sSpec):
     readOnly: Optional[bool] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class GlusterfsPersistentVolumeSource(K8sSpec):
     """Represents a Glusterfs mount that lasts the lifetime of a pod. Glusterfs volumes do not support
     ownership management or SELinux relabeling.
@@ -379,7 +379,7 @@ class GlusterfsPersistentVolumeSource(K8sSpec):
     readOnly: Optional[bool] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class HostPathVolumeSource(K8sSpec):
     """Represents a host path mapped into a pod. Host path volumes do not support ownership management or
     SELinux relabeling.
@@ -395,7 +395,7 @@ class HostPathVolumeSource(K8sSpec):
     type: Optional[str] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class ISCSIPersistentVolumeSource(K8sSpec):
     """ISCSIPersistentVolumeSource represents an ISCSI disk. ISCSI volumes can only be mounted as read/write
     once. ISCSI volumes support ownership management and SELinux relabeling.
@@ -435,7 +435,7 @@ class ISCSIPersistentVolumeSource(K8sSpec):
     secretRef: Optional[SecretReference] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class LocalVolumeSource(K8sSpec):
     """Local represents directly-attached storage with node affinity (Beta feature)
 
@@ -452,7 +452,7 @@ class LocalVolumeSource(K8sSpec):
     fsType: Optional[str] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class NFSVolumeSource(K8sSpec):
     """Represents an NFS mount that lasts the lifetime of a pod. NFS volumes do not support ownership
     management or SELinux relabeling.
@@ -470,7 +470,7 @@ class NFSVolumeSource(K8sSpec):
     readOnly: Optional[bool] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class PersistentVolumeSpec(K8sSpec):
     """PersistentVolumeSpec is the specification of a persistent volume.
 
@@ -569,7 +569,7 @@ class PersistentVolumeSpec(K8sSpec):
     vsphereVolume: Optional[VsphereVirtualDiskVolumeSource] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class PhotonPersistentDiskVolumeSource(K8sSpec):
     """Represents a Photon Controller persistent disk resource.
 
@@ -584,7 +584,7 @@ class PhotonPersistentDiskVolumeSource(K8sSpec):
     fsType: Optional[str] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class PortworxVolumeSource(K8sSpec):
     """PortworxVolumeSource represents a Portworx volume resource.
 
@@ -602,7 +602,7 @@ class PortworxVolumeSource(K8sSpec):
     readOnly: Optional[bool] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class QuobyteVolumeSource(K8sSpec):
     """Represents a Quobyte mount that lasts the lifetime of a pod. Quobyte volumes do not support ownership
     management or SELinux relabeling.
@@ -629,7 +629,7 @@ class QuobyteVolumeSource(K8sSpec):
     user: Optional[str] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class RBDPersistentVolumeSource(K8sSpec):
     """Represents a Rados Block Device mount that lasts the lifetime of a pod. RBD volumes support ownership
     management and SELinux relabeling.
@@ -659,7 +659,7 @@ class RBDPersistentVolumeSource(K8sSpec):
     user: Optional[str] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class ScaleIOPersistentVolumeSource(K8sSpec):
     """ScaleIOPersistentVolumeSource represents a persistent ScaleIO volume
     Attributes:
@@ -694,7 +694,7 @@ class ScaleIOPersistentVolumeSource(K8sSpec):
     volumeName: Optional[str] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class SecretReference(K8sSpec):
     """SecretReference represents a Secret Reference. It has enough information to retrieve secret in any
     namespace
@@ -708,7 +708,7 @@ class SecretReference(K8sSpec):
     namespace: Optional[str] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class StorageOSPersistentVolumeSource(K8sSpec):
     """Represents a StorageOS persistent volume resource.
 
@@ -736,7 +736,7 @@ class StorageOSPersistentVolumeSource(K8sSpec):
     volumeNamespace: Optional[str] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class TopologySelectorLabelRequirement(K8sSpec):
     """A topology selector requirement is a selector that matches given label. This is an alpha feature and
     may change in the future.
@@ -752,7 +752,7 @@ class TopologySelectorLabelRequirement(K8sSpec):
     values: List[str]
 
 
-@dataclass
+@dataclass(slots=True)
 class TopologySelectorTerm(K8sSpec):
     """A topology selector term represents the result of label queries. A null or empty topology selector
     term matches no objects. The requirements of them are ANDed. It provides a subset of functionality as
@@ -766,7 +766,7 @@ class TopologySelectorTerm(K8sSpec):
     matchLabelExpressions: Optional[List[TopologySelectorLabelRequirement]] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class VolumeNodeAffinity(K8sSpec):
     """VolumeNodeAffinity defines constraints that limit what nodes this volume can be accessed from.
 
@@ -778,7 +778,7 @@ class VolumeNodeAffinity(K8sSpec):
     required: Optional[NodeSelector] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class VsphereVirtualDiskVolumeSource(K8sSpec):
     """Represents a vSphere volume resource.
 
@@ -798,7 +798,7 @@ class VsphereVirtualDiskVolumeSource(K8sSpec):
     storagePolicyName: Optional[str] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class Toleration(K8sSpec):
     """The pod this Toleration is attached to tolerates any taint that matches the triple <key,value,effect>
     using the matching operator <operator>.
@@ -827,7 +827,7 @@ class Toleration(K8sSpec):
     value: Optional[str] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class Affinity(K8sSpec):
     """Affinity is a group of affinity scheduling rules.
 
@@ -845,7 +845,7 @@ class Affinity(K8sSpec):
     podAntiAffinity: Optional[PodAntiAffinity] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class AppArmorProfile(K8sSpec):
     """AppArmorProfile defines a pod or container's AppArmor settings.
 
@@ -863,7 +863,7 @@ class AppArmorProfile(K8sSpec):
     localhostProfile: Optional[str] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class AzureFileVolumeSource(K8sSpec):
     """AzureFile represents an Azure File Service mount on the host and bind mount to the pod.
 
@@ -880,7 +880,7 @@ class AzureFileVolumeSource(K8sSpec):
     readOnly: Optional[bool] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class CSIVolumeSource(K8sSpec):
     """Represents a source location of a volume to mount, managed by an external CSI driver
     Attributes:
@@ -905,7 +905,7 @@ class CSIVolumeSource(K8sSpec):
     volumeAttributes: Optional[JSONDict] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class Capabilities(K8sSpec):
     """Adds and removes POSIX capabilities from running containers.
 
@@ -919,7 +919,7 @@ class Capabilities(K8sSpec):
     drop: Optional[List[str]] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class CephFSVolumeSource(K8sSpec):
     """Represents a Ceph Filesystem mount that lasts the lifetime of a pod Cephfs volumes do not support
     ownership management or SELinux relabeling.
@@ -945,7 +945,7 @@ class CephFSVolumeSource(K8sSpec):
     user: Optional[str] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class CinderVolumeSource(K8sSpec):
     """Represents a cinder volume resource in Openstack. A Cinder volume must exist before mounting to a
     container. The volume must also be in the same region as the kubelet. Cinder volumes support ownership
@@ -969,7 +969,7 @@ class CinderVolumeSource(K8sSpec):
     secretRef: Optional[LocalObjectReference] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class ClusterTrustBundleProjection(K8sSpec):
     """ClusterTrustBundleProjection describes how to select a set of ClusterTrustBundle objects and project
     their contents into the pod filesystem.
@@ -996,7 +996,7 @@ class ClusterTrustBundleProjection(K8sSpec):
     signerName: Optional[str] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class ConfigMapEnvSource(K8sSpec):
     """ConfigMapEnvSource selects a ConfigMap to populate the environment variables with.  The contents of
     the target ConfigMap's Data field will represent the key-value pairs as environment variables.
@@ -1012,7 +1012,7 @@ class ConfigMapEnvSource(K8sSpec):
     optional: Optional[bool] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class ConfigMapKeySelector(K8sSpec):
     """Selects a key from a ConfigMap.
 
@@ -1029,7 +1029,7 @@ class ConfigMapKeySelector(K8sSpec):
     optional: Optional[bool] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class ConfigMapProjection(K8sSpec):
     """Adapts a ConfigMap into a projected volume.  The contents of the target ConfigMap's Data field will be
     presented in a projected volume as files using the keys in the Data field as the file names, unless
@@ -1053,7 +1053,7 @@ class ConfigMapProjection(K8sSpec):
     optional: Optional[bool] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class ConfigMapVolumeSource(K8sSpec):
     """Adapts a ConfigMap into a volume.  The contents of the target ConfigMap's Data field will be presented
     in a volume as files using the keys in the Data field as the file names, unless the items element is
@@ -1083,7 +1083,7 @@ class ConfigMapVolumeSource(K8sSpec):
     optional: Optional[bool] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class Container(K8sSpec):
     """A single application container that you want to run within a pod.
 
@@ -1196,7 +1196,7 @@ class Container(K8sSpec):
     workingDir: Optional[str] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class ContainerPort(K8sSpec):
     """ContainerPort represents a network port in a single container.
 
@@ -1220,7 +1220,7 @@ class ContainerPort(K8sSpec):
     protocol: Optional[str] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class ContainerResizePolicy(K8sSpec):
     """ContainerResizePolicy represents resource resize policy for the container.
 
@@ -1236,7 +1236,7 @@ class ContainerResizePolicy(K8sSpec):
     restartPolicy: str
 
 
-@dataclass
+@dataclass(slots=True)
 class DownwardAPIProjection(K8sSpec):
     """Represents downward API info for projecting into a projected volume. Note that this is identical to a
     downwardAPI volume source without the default mode.
@@ -1249,7 +1249,7 @@ class DownwardAPIProjection(K8sSpec):
     items: Optional[List[DownwardAPIVolumeFile]] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class DownwardAPIVolumeFile(K8sSpec):
     """DownwardAPIVolumeFile represents information to create the file containing the pod field
     Attributes:
@@ -1274,7 +1274,7 @@ class DownwardAPIVolumeFile(K8sSpec):
     resourceFieldRef: Optional[ResourceFieldSelector] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class DownwardAPIVolumeSource(K8sSpec):
     """DownwardAPIVolumeSource represents a volume containing downward API info. Downward API volumes support
     ownership management and SELinux relabeling.
@@ -1294,7 +1294,7 @@ class DownwardAPIVolumeSource(K8sSpec):
     items: Optional[List[DownwardAPIVolumeFile]] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class EmptyDirVolumeSource(K8sSpec):
     """Represents an empty directory for a pod. Empty directory volumes support ownership management and
     SELinux relabeling.
@@ -1313,7 +1313,7 @@ class EmptyDirVolumeSource(K8sSpec):
     sizeLimit: Optional[gybe.k8s.v1_31.api.resource.Quantity] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class EnvFromSource(K8sSpec):
     """EnvFromSource represents the source of a set of ConfigMaps
     Attributes:
@@ -1328,7 +1328,7 @@ class EnvFromSource(K8sSpec):
     secretRef: Optional[SecretEnvSource] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class EnvVar(K8sSpec):
     """EnvVar represents an environment variable present in a Container.
 
@@ -1349,7 +1349,7 @@ class EnvVar(K8sSpec):
     valueFrom: Optional[EnvVarSource] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class EnvVarSource(K8sSpec):
     """EnvVarSource represents a source for the value of an EnvVar.
 
@@ -1371,7 +1371,7 @@ class EnvVarSource(K8sSpec):
     secretKeyRef: Optional[SecretKeySelector] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class EphemeralContainer(K8sSpec):
     """An EphemeralContainer is a temporary container that you may add to an existing Pod for user-initiated
     activities such as debugging. Ephemeral containers have no resource or scheduling guarantees, and they
@@ -1479,7 +1479,7 @@ class EphemeralContainer(K8sSpec):
     workingDir: Optional[str] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class EphemeralVolumeSource(K8sSpec):
     """Represents an ephemeral volume that is handled by a normal storage driver.
 
@@ -1501,7 +1501,7 @@ class EphemeralVolumeSource(K8sSpec):
     volumeClaimTemplate: Optional[PersistentVolumeClaimTemplate] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class ExecAction(K8sSpec):
     """ExecAction describes a 'run in container' action.
 
@@ -1517,7 +1517,7 @@ class ExecAction(K8sSpec):
     command: Optional[List[str]] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class FlexVolumeSource(K8sSpec):
     """FlexVolume represents a generic volume resource that is provisioned/attached using an exec based
     plugin.
@@ -1542,7 +1542,7 @@ class FlexVolumeSource(K8sSpec):
     secretRef: Optional[LocalObjectReference] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class GRPCAction(K8sSpec):
     """Schema model io.k8s.api.core.v1.GRPCAction.
 
@@ -1558,7 +1558,7 @@ class GRPCAction(K8sSpec):
     service: Optional[str] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class GitRepoVolumeSource(K8sSpec):
     """Represents a volume that is populated with the contents of a git repository. Git repo volumes do not
     support ownership management. Git repo volumes support SELinux relabeling.  DEPRECATED: GitRepo is
@@ -1579,7 +1579,7 @@ class GitRepoVolumeSource(K8sSpec):
     revision: Optional[str] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class GlusterfsVolumeSource(K8sSpec):
     """Represents a Glusterfs mount that lasts the lifetime of a pod. Glusterfs volumes do not support
     ownership management or SELinux relabeling.
@@ -1597,7 +1597,7 @@ class GlusterfsVolumeSource(K8sSpec):
     readOnly: Optional[bool] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class HTTPGetAction(K8sSpec):
     """HTTPGetAction describes an action based on HTTP Get requests.
 
@@ -1619,7 +1619,7 @@ class HTTPGetAction(K8sSpec):
     scheme: Optional[str] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class HTTPHeader(K8sSpec):
     """HTTPHeader describes a custom header to be used in HTTP probes
     Attributes:
@@ -1633,7 +1633,7 @@ class HTTPHeader(K8sSpec):
     value: str
 
 
-@dataclass
+@dataclass(slots=True)
 class HostAlias(K8sSpec):
     """HostAlias holds the mapping between IP and hostnames that will be injected as an entry in the pod's
     hosts file.
@@ -1648,7 +1648,7 @@ class HostAlias(K8sSpec):
     hostnames: Optional[List[str]] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class ISCSIVolumeSource(K8sSpec):
     """Represents an ISCSI disk. ISCSI volumes can only be mounted as read/write once. ISCSI volumes support
     ownership management and SELinux relabeling.
@@ -1688,7 +1688,7 @@ class ISCSIVolumeSource(K8sSpec):
     secretRef: Optional[LocalObjectReference] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class ImageVolumeSource(K8sSpec):
     """ImageVolumeSource represents a image volume resource.
 
@@ -1709,7 +1709,7 @@ class ImageVolumeSource(K8sSpec):
     reference: Optional[str] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class KeyToPath(K8sSpec):
     """Maps a string key to a path within a volume.
 
@@ -1730,7 +1730,7 @@ class KeyToPath(K8sSpec):
     mode: Optional[int] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class Lifecycle(K8sSpec):
     """Lifecycle describes actions that the management system should take in response to container lifecycle
     events. For the PostStart and PreStop lifecycle handlers, management of the container blocks until the
@@ -1754,7 +1754,7 @@ class Lifecycle(K8sSpec):
     preStop: Optional[LifecycleHandler] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class LifecycleHandler(K8sSpec):
     """LifecycleHandler defines a specific action that should be taken in a lifecycle hook. One and only one
     of the fields, except TCPSocket must be specified.
@@ -1775,7 +1775,7 @@ class LifecycleHandler(K8sSpec):
     tcpSocket: Optional[TCPSocketAction] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class LocalObjectReference(K8sSpec):
     """LocalObjectReference contains enough information to let you locate the referenced object inside the
     same namespace.
@@ -1789,7 +1789,7 @@ class LocalObjectReference(K8sSpec):
     name: Optional[str] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class ModifyVolumeStatus(K8sSpec):
     """ModifyVolumeStatus represents the status object of ControllerModifyVolume operation
     Attributes:
@@ -1809,7 +1809,7 @@ class ModifyVolumeStatus(K8sSpec):
     targetVolumeAttributesClassName: Optional[str] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class NodeAffinity(K8sSpec):
     """Node affinity is a group of node affinity scheduling rules.
 
@@ -1832,7 +1832,7 @@ class NodeAffinity(K8sSpec):
     requiredDuringSchedulingIgnoredDuringExecution: Optional[NodeSelector] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class ObjectFieldSelector(K8sSpec):
     """ObjectFieldSelector selects an APIVersioned field of an object.
 
@@ -1846,7 +1846,7 @@ class ObjectFieldSelector(K8sSpec):
     apiVersion: Optional[str] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class PersistentVolumeClaim(K8sResource):
     """PersistentVolumeClaim is a user's request for and claim to a persistent volume
     Attributes:
@@ -1868,7 +1868,7 @@ class PersistentVolumeClaim(K8sResource):
     status: Optional[PersistentVolumeClaimStatus] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class PersistentVolumeClaimCondition(K8sSpec):
     """PersistentVolumeClaimCondition contains details about state of pvc
     Attributes:
@@ -1892,7 +1892,7 @@ class PersistentVolumeClaimCondition(K8sSpec):
     reason: Optional[str] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class PersistentVolumeClaimSpec(K8sSpec):
     """PersistentVolumeClaimSpec describes the common attributes of storage devices and allows a Source for
     provider-specific attributes
@@ -1954,7 +1954,7 @@ class PersistentVolumeClaimSpec(K8sSpec):
     volumeName: Optional[str] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class PersistentVolumeClaimStatus(K8sSpec):
     """PersistentVolumeClaimStatus is the current status of a persistent volume claim.
 
@@ -2023,7 +2023,7 @@ class PersistentVolumeClaimStatus(K8sSpec):
     phase: Optional[str] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class PersistentVolumeClaimTemplate(K8sSpec):
     """PersistentVolumeClaimTemplate is used to produce PersistentVolumeClaim objects as part of an
     EphemeralVolumeSource.
@@ -2041,7 +2041,7 @@ class PersistentVolumeClaimTemplate(K8sSpec):
     metadata: Optional[gybe.k8s.v1_31.meta.v1.ObjectMeta] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class PersistentVolumeClaimVolumeSource(K8sSpec):
     """PersistentVolumeClaimVolumeSource references the user's PVC in the same namespace. This volume finds
     the bound PV and mounts that volume for the pod. A PersistentVolumeClaimVolumeSource is, essentially,
@@ -2058,7 +2058,7 @@ class PersistentVolumeClaimVolumeSource(K8sSpec):
     readOnly: Optional[bool] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class PodAffinity(K8sSpec):
     """Pod affinity is a group of inter pod affinity scheduling rules.
 
@@ -2084,7 +2084,7 @@ class PodAffinity(K8sSpec):
     requiredDuringSchedulingIgnoredDuringExecution: Optional[List[PodAffinityTerm]] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class PodAffinityTerm(K8sSpec):
     """Defines a set of pods (namely those matching the labelSelector relative to the given namespace(s))
     that this pod should be co-located (affinity) or not co-located (anti-affinity) with, where co-located
@@ -2132,7 +2132,7 @@ class PodAffinityTerm(K8sSpec):
     namespaces: Optional[List[str]] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class PodAntiAffinity(K8sSpec):
     """Pod anti affinity is a group of inter pod anti affinity scheduling rules.
 
@@ -2158,7 +2158,7 @@ class PodAntiAffinity(K8sSpec):
     requiredDuringSchedulingIgnoredDuringExecution: Optional[List[PodAffinityTerm]] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class PodDNSConfig(K8sSpec):
     """PodDNSConfig defines the DNS parameters of a pod in addition to those generated from DNSPolicy.
 
@@ -2178,7 +2178,7 @@ class PodDNSConfig(K8sSpec):
     searches: Optional[List[str]] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class PodDNSConfigOption(K8sSpec):
     """PodDNSConfigOption defines DNS resolver options of a pod.
 
@@ -2192,7 +2192,7 @@ class PodDNSConfigOption(K8sSpec):
     value: Optional[str] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class PodOS(K8sSpec):
     """PodOS defines the OS parameters of a pod.
 
@@ -2208,7 +2208,7 @@ class PodOS(K8sSpec):
     name: str
 
 
-@dataclass
+@dataclass(slots=True)
 class PodReadinessGate(K8sSpec):
     """PodReadinessGate contains the reference to a pod condition
     Attributes:
@@ -2219,7 +2219,7 @@ class PodReadinessGate(K8sSpec):
     conditionType: str
 
 
-@dataclass
+@dataclass(slots=True)
 class PodResourceClaim(K8sSpec):
     """PodResourceClaim references exactly one ResourceClaim, either directly or by naming a
     ResourceClaimTemplate which is then turned into a ResourceClaim for the pod.  It adds a name to it
@@ -2246,7 +2246,7 @@ class PodResourceClaim(K8sSpec):
     resourceClaimTemplateName: Optional[str] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class PodSchedulingGate(K8sSpec):
     """PodSchedulingGate is associated to a Pod to guard its scheduling.
 
@@ -2258,7 +2258,7 @@ class PodSchedulingGate(K8sSpec):
     name: str
 
 
-@dataclass
+@dataclass(slots=True)
 class PodSecurityContext(K8sSpec):
     """PodSecurityContext holds pod-level security attributes and common container settings. Some fields are
     also present in container.securityContext.  Field values of container.securityContext take precedence
@@ -2334,7 +2334,7 @@ class PodSecurityContext(K8sSpec):
     windowsOptions: Optional[WindowsSecurityContextOptions] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class PodSpec(K8sSpec):
     """PodSpec is a description of a pod.
 
@@ -2519,7 +2519,7 @@ class PodSpec(K8sSpec):
     volumes: Optional[List[Volume]] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class PodTemplateSpec(K8sSpec):
     """PodTemplateSpec describes the data a pod should have when created from a template
     Attributes:
@@ -2532,7 +2532,7 @@ class PodTemplateSpec(K8sSpec):
     spec: Optional[PodSpec] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class PreferredSchedulingTerm(K8sSpec):
     """An empty preferred scheduling term matches all objects with implicit weight 0 (i.e. it's a no-op). A
     null preferred scheduling term matches no objects (i.e. is also a no-op).
@@ -2547,7 +2547,7 @@ class PreferredSchedulingTerm(K8sSpec):
     preference: NodeSelectorTerm
 
 
-@dataclass
+@dataclass(slots=True)
 class Probe(K8sSpec):
     """Probe describes a health check to be performed against a container to determine whether it is alive or
     ready to receive traffic.
@@ -2590,7 +2590,7 @@ class Probe(K8sSpec):
     timeoutSeconds: Optional[int] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class ProjectedVolumeSource(K8sSpec):
     """Represents a projected volume source
     Attributes:
@@ -2607,7 +2607,7 @@ class ProjectedVolumeSource(K8sSpec):
     sources: Optional[List[VolumeProjection]] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class RBDVolumeSource(K8sSpec):
     """Represents a Rados Block Device mount that lasts the lifetime of a pod. RBD volumes support ownership
     management and SELinux relabeling.
@@ -2637,7 +2637,7 @@ class RBDVolumeSource(K8sSpec):
     user: Optional[str] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class ResourceClaim(K8sSpec):
     """ResourceClaim references one entry in PodSpec.ResourceClaims.
 
@@ -2653,7 +2653,7 @@ class ResourceClaim(K8sSpec):
     request: Optional[str] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class ResourceFieldSelector(K8sSpec):
     """ResourceFieldSelector represents container resources (cpu, memory) and their output format
     Attributes:
@@ -2668,7 +2668,7 @@ class ResourceFieldSelector(K8sSpec):
     divisor: Optional[gybe.k8s.v1_31.api.resource.Quantity] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class ResourceRequirements(K8sSpec):
     """ResourceRequirements describes the compute resource requirements.
 
@@ -2688,7 +2688,7 @@ class ResourceRequirements(K8sSpec):
     requests: Optional[JSONDict] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class SELinuxOptions(K8sSpec):
     """SELinuxOptions are the labels to be applied to the container
     Attributes:
@@ -2705,7 +2705,7 @@ class SELinuxOptions(K8sSpec):
     user: Optional[str] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class ScaleIOVolumeSource(K8sSpec):
     """ScaleIOVolumeSource represents a persistent ScaleIO volume
     Attributes:
@@ -2740,7 +2740,7 @@ class ScaleIOVolumeSource(K8sSpec):
     volumeName: Optional[str] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class SeccompProfile(K8sSpec):
     """SeccompProfile defines a pod/container's seccomp profile settings. Only one profile source may be set.
 
@@ -2759,7 +2759,7 @@ class SeccompProfile(K8sSpec):
     localhostProfile: Optional[str] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class SecretEnvSource(K8sSpec):
     """SecretEnvSource selects a Secret to populate the environment variables with.  The contents of the
     target Secret's Data field will represent the key-value pairs as environment variables.
@@ -2775,7 +2775,7 @@ class SecretEnvSource(K8sSpec):
     optional: Optional[bool] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class SecretKeySelector(K8sSpec):
     """SecretKeySelector selects a key of a Secret.
 
@@ -2792,7 +2792,7 @@ class SecretKeySelector(K8sSpec):
     optional: Optional[bool] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class SecretProjection(K8sSpec):
     """Adapts a secret into a projected volume.  The contents of the target Secret's Data field will be
     presented in a projected volume as files using the keys in the Data field as the file names. Note that
@@ -2815,7 +2815,7 @@ class SecretProjection(K8sSpec):
     optional: Optional[bool] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class SecretVolumeSource(K8sSpec):
     """Adapts a Secret into a volume.  The contents of the target Secret's Data field will be presented in a
     volume as files using the keys in the Data field as the file names. Secret volumes support ownership
@@ -2843,7 +2843,7 @@ class SecretVolumeSource(K8sSpec):
     secretName: Optional[str] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class SecurityContext(K8sSpec):
     """SecurityContext holds security configuration that will be applied to a container. Some fields are
     present in both SecurityContext and PodSecurityContext.  When both are set, the values in
@@ -2910,7 +2910,7 @@ class SecurityContext(K8sSpec):
     windowsOptions: Optional[WindowsSecurityContextOptions] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class ServiceAccountTokenProjection(K8sSpec):
     """ServiceAccountTokenProjection represents a projected service account token volume. This projection can
     be used to insert a service account token into the pods runtime filesystem for use against APIs
@@ -2934,7 +2934,7 @@ class ServiceAccountTokenProjection(K8sSpec):
     expirationSeconds: Optional[int] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class SleepAction(K8sSpec):
     """SleepAction describes a 'sleep' action.
 
@@ -2946,7 +2946,7 @@ class SleepAction(K8sSpec):
     seconds: int
 
 
-@dataclass
+@dataclass(slots=True)
 class StorageOSVolumeSource(K8sSpec):
     """Represents a StorageOS persistent volume resource.
 
@@ -2974,7 +2974,7 @@ class StorageOSVolumeSource(K8sSpec):
     volumeNamespace: Optional[str] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class Sysctl(K8sSpec):
     """Sysctl defines a kernel parameter to be set
     Attributes:
@@ -2987,7 +2987,7 @@ class Sysctl(K8sSpec):
     value: str
 
 
-@dataclass
+@dataclass(slots=True)
 class TCPSocketAction(K8sSpec):
     """TCPSocketAction describes an action based on opening a socket
     Attributes:
@@ -3001,7 +3001,7 @@ class TCPSocketAction(K8sSpec):
     host: Optional[str] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class TopologySpreadConstraint(K8sSpec):
     """TopologySpreadConstraint specifies how to spread matching pods among the given topology.
 
@@ -3083,7 +3083,7 @@ class TopologySpreadConstraint(K8sSpec):
     nodeTaintsPolicy: Optional[str] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class TypedLocalObjectReference(K8sSpec):
     """TypedLocalObjectReference contains enough information to let you locate the typed referenced object
     inside the same namespace.
@@ -3102,7 +3102,7 @@ class TypedLocalObjectReference(K8sSpec):
     apiGroup: Optional[str] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class TypedObjectReference(K8sSpec):
     """Schema model io.k8s.api.core.v1.TypedObjectReference.
 
@@ -3126,7 +3126,7 @@ class TypedObjectReference(K8sSpec):
     namespace: Optional[str] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class Volume(K8sSpec):
     """Volume represents a named volume in a pod that may be accessed by any container in the pod.
 
@@ -3239,7 +3239,7 @@ class Volume(K8sSpec):
     vsphereVolume: Optional[VsphereVirtualDiskVolumeSource] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class VolumeDevice(K8sSpec):
     """volumeDevice describes a mapping of a raw block device within a container.
 
@@ -3253,7 +3253,7 @@ class VolumeDevice(K8sSpec):
     devicePath: str
 
 
-@dataclass
+@dataclass(slots=True)
 class VolumeMount(K8sSpec):
     """VolumeMount describes a mounting of a Volume within a container.
 
@@ -3292,7 +3292,7 @@ class VolumeMount(K8sSpec):
     subPathExpr: Optional[str] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class VolumeProjection(K8sSpec):
     """Projection that may be projected along with other supported volume types. Exactly one of these fields
     must be set.
@@ -3319,7 +3319,7 @@ class VolumeProjection(K8sSpec):
     serviceAccountToken: Optional[ServiceAccountTokenProjection] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class VolumeResourceRequirements(K8sSpec):
     """VolumeResourceRequirements describes the storage resource requirements for a volume.
 
@@ -3335,7 +3335,7 @@ class VolumeResourceRequirements(K8sSpec):
     requests: Optional[JSONDict] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class WeightedPodAffinityTerm(K8sSpec):
     """The weights of all of the matched WeightedPodAffinityTerm fields are added per-node to find the most
     preferred node(s)
@@ -3350,7 +3350,7 @@ class WeightedPodAffinityTerm(K8sSpec):
     podAffinityTerm: PodAffinityTerm
 
 
-@dataclass
+@dataclass(slots=True)
 class WindowsSecurityContextOptions(K8sSpec):
     """WindowsSecurityContextOptions contain Windows-specific options and credentials.
 
@@ -3376,7 +3376,7 @@ class WindowsSecurityContextOptions(K8sSpec):
     runAsUserName: Optional[str] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class AttachedVolume(K8sSpec):
     """AttachedVolume describes a volume attached to a node
     Attributes:
@@ -3389,7 +3389,7 @@ class AttachedVolume(K8sSpec):
     devicePath: str
 
 
-@dataclass
+@dataclass(slots=True)
 class Binding(K8sResource):
     """Binding ties one object to another; for example, a pod is bound to a node by a scheduler. Deprecated
     in 1.7, please use the bindings subresource of pods instead.
@@ -3411,7 +3411,7 @@ class Binding(K8sResource):
     metadata: Optional[gybe.k8s.v1_31.meta.v1.ObjectMeta] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class ClientIPConfig(K8sSpec):
     """ClientIPConfig represents the configurations of Client IP based session affinity.
 
@@ -3425,7 +3425,7 @@ class ClientIPConfig(K8sSpec):
     timeoutSeconds: Optional[int] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class ComponentCondition(K8sSpec):
     """Information about the condition of a component.
 
@@ -3444,7 +3444,7 @@ class ComponentCondition(K8sSpec):
     message: Optional[str] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class ComponentStatus(K8sResource):
     """ComponentStatus (and ComponentStatusList) holds the cluster validation info. Deprecated: This API is
     deprecated in v1.19+
@@ -3465,7 +3465,7 @@ class ComponentStatus(K8sResource):
     metadata: Optional[gybe.k8s.v1_31.meta.v1.ObjectMeta] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class ConfigMap(K8sResource):
     """ConfigMap holds configuration data for pods to consume.
 
@@ -3498,7 +3498,7 @@ class ConfigMap(K8sResource):
     metadata: Optional[gybe.k8s.v1_31.meta.v1.ObjectMeta] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class ConfigMapNodeConfigSource(K8sSpec):
     """ConfigMapNodeConfigSource contains the information to reference a ConfigMap as a config source for the
     Node. This API is deprecated since 1.22: https://git.k8s.io/enhancements/keps/sig-node/281-dynamic-
@@ -3523,7 +3523,7 @@ class ConfigMapNodeConfigSource(K8sSpec):
     uid: Optional[str] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class ContainerImage(K8sSpec):
     """Describe a container image
     Attributes:
@@ -3537,7 +3537,7 @@ class ContainerImage(K8sSpec):
     sizeBytes: Optional[int] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class ContainerState(K8sSpec):
     """ContainerState holds a possible state of container. Only one of its members may be specified. If none
     of them is specified, the default one is ContainerStateWaiting.
@@ -3554,7 +3554,7 @@ class ContainerState(K8sSpec):
     waiting: Optional[ContainerStateWaiting] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class ContainerStateRunning(K8sSpec):
     """ContainerStateRunning is a running state of a container.
 
@@ -3566,7 +3566,7 @@ class ContainerStateRunning(K8sSpec):
     startedAt: Optional[str] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class ContainerStateTerminated(K8sSpec):
     """ContainerStateTerminated is a terminated state of a container.
 
@@ -3590,7 +3590,7 @@ class ContainerStateTerminated(K8sSpec):
     startedAt: Optional[str] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class ContainerStateWaiting(K8sSpec):
     """ContainerStateWaiting is a waiting state of a container.
 
@@ -3604,7 +3604,7 @@ class ContainerStateWaiting(K8sSpec):
     reason: Optional[str] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class ContainerStatus(K8sSpec):
     """ContainerStatus contains details for the current status of this container.
 
@@ -3664,7 +3664,7 @@ class ContainerStatus(K8sSpec):
     volumeMounts: Optional[List[VolumeMountStatus]] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class ContainerUser(K8sSpec):
     """ContainerUser represents user identity information
     Attributes:
@@ -3677,7 +3677,7 @@ class ContainerUser(K8sSpec):
     linux: Optional[LinuxContainerUser] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class DaemonEndpoint(K8sSpec):
     """DaemonEndpoint contains information about a single Daemon endpoint.
 
@@ -3689,7 +3689,7 @@ class DaemonEndpoint(K8sSpec):
     Port: int
 
 
-@dataclass
+@dataclass(slots=True)
 class EndpointAddress(K8sSpec):
     """EndpointAddress is a tuple that describes single IP address.
 
@@ -3709,7 +3709,7 @@ class EndpointAddress(K8sSpec):
     targetRef: Optional[ObjectReference] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class EndpointPort(K8sSpec):
     """EndpointPort is a tuple that describes a single port.
 
@@ -3737,7 +3737,7 @@ class EndpointPort(K8sSpec):
     protocol: Optional[str] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class EndpointSubset(K8sSpec):
     """EndpointSubset is a group of addresses with a common set of ports. The expanded set of endpoints is
     the Cartesian product of Addresses x Ports. For example, given:          {           Addresses:
@@ -3760,7 +3760,7 @@ class EndpointSubset(K8sSpec):
     ports: Optional[List[EndpointPort]] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class Endpoints(K8sResource):
     """Endpoints is a collection of endpoints that implement the actual service. Example:           Name:
     'mysvc',          Subsets: [            {              Addresses: [{'ip': '10.10.1.1'}, {'ip':
@@ -3790,7 +3790,7 @@ class Endpoints(K8sResource):
     subsets: Optional[List[EndpointSubset]] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class Event(K8sResource):
     """Event is a report of an event somewhere in the cluster.  Events have a limited retention time and
     triggers and messages may evolve with time.  Event consumers should not rely on the timing of an event
@@ -3842,7 +3842,7 @@ class Event(K8sResource):
     type: Optional[str] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class EventSeries(K8sSpec):
     """EventSeries contain information on series of events, i.e. thing that was/is happening continuously for
     some time.
@@ -3857,7 +3857,7 @@ class EventSeries(K8sSpec):
     lastObservedTime: Optional[str] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class HostIP(K8sSpec):
     """HostIP represents a single IP address allocated to the host.
 
@@ -3869,7 +3869,7 @@ class HostIP(K8sSpec):
     ip: str
 
 
-@dataclass
+@dataclass(slots=True)
 class LimitRange(K8sResource):
     """LimitRange sets resource usage limits for each kind of resource in a Namespace.
 
@@ -3890,7 +3890,7 @@ class LimitRange(K8sResource):
     spec: Optional[LimitRangeSpec] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class LimitRangeItem(K8sSpec):
     """LimitRangeItem defines a min/max usage limit for any resource that matches on kind.
 
@@ -3915,7 +3915,7 @@ class LimitRangeItem(K8sSpec):
     min: Optional[JSONDict] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class LimitRangeSpec(K8sSpec):
     """LimitRangeSpec defines a min/max usage limit for resources that match on kind.
 
@@ -3927,7 +3927,7 @@ class LimitRangeSpec(K8sSpec):
     limits: List[LimitRangeItem]
 
 
-@dataclass
+@dataclass(slots=True)
 class LinuxContainerUser(K8sSpec):
     """LinuxContainerUser represents user identity information in Linux containers
     Attributes:
@@ -3943,7 +3943,7 @@ class LinuxContainerUser(K8sSpec):
     supplementalGroups: Optional[List[int]] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class LoadBalancerIngress(K8sSpec):
     """LoadBalancerIngress represents the status of a load-balancer ingress point: traffic intended for the
     service should be sent to an ingress point.
@@ -3969,7 +3969,7 @@ class LoadBalancerIngress(K8sSpec):
     ports: Optional[List[PortStatus]] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class LoadBalancerStatus(K8sSpec):
     """LoadBalancerStatus represents the status of a load-balancer.
 
@@ -3982,7 +3982,7 @@ class LoadBalancerStatus(K8sSpec):
     ingress: Optional[List[LoadBalancerIngress]] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class Namespace(K8sResource):
     """Namespace provides a scope for Names. Use of multiple namespaces is optional.
 
@@ -4005,7 +4005,7 @@ class Namespace(K8sResource):
     status: Optional[NamespaceStatus] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class NamespaceCondition(K8sSpec):
     """NamespaceCondition contains details about state of namespace.
 
@@ -4025,7 +4025,7 @@ class NamespaceCondition(K8sSpec):
     reason: Optional[str] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class NamespaceSpec(K8sSpec):
     """NamespaceSpec describes the attributes on a Namespace.
 
@@ -4038,7 +4038,7 @@ class NamespaceSpec(K8sSpec):
     finalizers: Optional[List[str]] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class NamespaceStatus(K8sSpec):
     """NamespaceStatus is information about the current status of a Namespace.
 
@@ -4052,7 +4052,7 @@ class NamespaceStatus(K8sSpec):
     phase: Optional[str] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class Node(K8sResource):
     """Node is a worker node in Kubernetes. Each node will have a unique identifier in the cache (i.e. in
     etcd).
@@ -4077,7 +4077,7 @@ class Node(K8sResource):
     status: Optional[NodeStatus] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class NodeAddress(K8sSpec):
     """NodeAddress contains information for the node's address.
 
@@ -4091,7 +4091,7 @@ class NodeAddress(K8sSpec):
     address: str
 
 
-@dataclass
+@dataclass(slots=True)
 class NodeCondition(K8sSpec):
     """NodeCondition contains condition information for a node.
 
@@ -4113,7 +4113,7 @@ class NodeCondition(K8sSpec):
     reason: Optional[str] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class NodeConfigSource(K8sSpec):
     """NodeConfigSource specifies a source of node configuration. Exactly one subfield (excluding metadata)
     must be non-nil. This API is deprecated since 1.22
@@ -4125,7 +4125,7 @@ class NodeConfigSource(K8sSpec):
     configMap: Optional[ConfigMapNodeConfigSource] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class NodeConfigStatus(K8sSpec):
     """NodeConfigStatus describes the status of the config assigned by Node.Spec.ConfigSource.
 
@@ -4169,7 +4169,7 @@ class NodeConfigStatus(K8sSpec):
     lastKnownGood: Optional[NodeConfigSource] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class NodeDaemonEndpoints(K8sSpec):
     """NodeDaemonEndpoints lists ports opened by daemons running on the Node.
 
@@ -4181,7 +4181,7 @@ class NodeDaemonEndpoints(K8sSpec):
     kubeletEndpoint: Optional[DaemonEndpoint] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class NodeFeatures(K8sSpec):
     """NodeFeatures describes the set of features implemented by the CRI implementation. The features
     contained in the NodeFeatures should depend only on the cri implementation independent of runtime
@@ -4196,7 +4196,7 @@ class NodeFeatures(K8sSpec):
     supplementalGroupsPolicy: Optional[bool] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class NodeRuntimeHandler(K8sSpec):
     """NodeRuntimeHandler is a set of runtime handler information.
 
@@ -4210,7 +4210,7 @@ class NodeRuntimeHandler(K8sSpec):
     name: Optional[str] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class NodeRuntimeHandlerFeatures(K8sSpec):
     """NodeRuntimeHandlerFeatures is a set of features implemented by the runtime handler.
 
@@ -4226,7 +4226,7 @@ class NodeRuntimeHandlerFeatures(K8sSpec):
     userNamespaces: Optional[bool] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class NodeSpec(K8sSpec):
     """NodeSpec describes the attributes that a node is created with.
 
@@ -4256,7 +4256,7 @@ class NodeSpec(K8sSpec):
     unschedulable: Optional[bool] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class NodeStatus(K8sSpec):
     """NodeStatus is information about the current status of a node.
 
@@ -4293,7 +4293,7 @@ class NodeStatus(K8sSpec):
     volumesInUse: Optional[List[str]] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class NodeSystemInfo(K8sSpec):
     """NodeSystemInfo is a set of ids/uuids to uniquely identify the node.
 
@@ -4328,7 +4328,7 @@ class NodeSystemInfo(K8sSpec):
     architecture: str
 
 
-@dataclass
+@dataclass(slots=True)
 class PersistentVolume(K8sResource):
     """PersistentVolume (PV) is a storage resource provisioned by an administrator. It is analogous to a
     node. More info: https://kubernetes.io/docs/concepts/storage/persistent-volumes
@@ -4353,7 +4353,7 @@ class PersistentVolume(K8sResource):
     status: Optional[PersistentVolumeStatus] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class PersistentVolumeStatus(K8sSpec):
     """PersistentVolumeStatus is the current status of a persistent volume.
 
@@ -4373,7 +4373,7 @@ class PersistentVolumeStatus(K8sSpec):
     reason: Optional[str] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class Pod(K8sResource):
     """Pod is a collection of containers that can run on a host. This resource is created by clients and
     scheduled onto hosts.
@@ -4398,7 +4398,7 @@ class Pod(K8sResource):
     status: Optional[PodStatus] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class PodCondition(K8sSpec):
     """PodCondition contains details for the current condition of this pod.
 
@@ -4420,7 +4420,7 @@ class PodCondition(K8sSpec):
     reason: Optional[str] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class PodIP(K8sSpec):
     """PodIP represents a single IP address allocated to the pod.
 
@@ -4432,7 +4432,7 @@ class PodIP(K8sSpec):
     ip: str
 
 
-@dataclass
+@dataclass(slots=True)
 class PodResourceClaimStatus(K8sSpec):
     """PodResourceClaimStatus is stored in the PodStatus for each PodResourceClaim which references a
     ResourceClaimTemplate. It stores the generated name for the corresponding ResourceClaim.
@@ -4450,7 +4450,7 @@ class PodResourceClaimStatus(K8sSpec):
     resourceClaimName: Optional[str] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class PodStatus(K8sSpec):
     """PodStatus represents information about the status of a pod. Status may trail the actual state of a
     system, especially if the node that hosts the pod cannot contact the control plane.
@@ -4523,7 +4523,7 @@ class PodStatus(K8sSpec):
     startTime: Optional[str] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class PodTemplate(K8sResource):
     """PodTemplate describes a template for creating copies of a predefined pod.
 
@@ -4546,7 +4546,7 @@ class PodTemplate(K8sResource):
     template: Optional[PodTemplateSpec] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class PortStatus(K8sSpec):
     """Schema model io.k8s.api.core.v1.PortStatus.
 
@@ -4566,7 +4566,7 @@ class PortStatus(K8sSpec):
     error: Optional[str] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class ReplicationController(K8sResource):
     """ReplicationController represents the configuration of a replication controller.
 
@@ -4591,7 +4591,7 @@ class ReplicationController(K8sResource):
     status: Optional[ReplicationControllerStatus] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class ReplicationControllerCondition(K8sSpec):
     """ReplicationControllerCondition describes the state of a replication controller at a certain point.
 
@@ -4611,7 +4611,7 @@ class ReplicationControllerCondition(K8sSpec):
     reason: Optional[str] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class ReplicationControllerSpec(K8sSpec):
     """ReplicationControllerSpec is the specification of a replication controller.
 
@@ -4637,7 +4637,7 @@ class ReplicationControllerSpec(K8sSpec):
     template: Optional[PodTemplateSpec] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class ReplicationControllerStatus(K8sSpec):
     """ReplicationControllerStatus represents the current status of a replication controller.
 
@@ -4662,7 +4662,7 @@ class ReplicationControllerStatus(K8sSpec):
     readyReplicas: Optional[int] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class ResourceHealth(K8sSpec):
     """ResourceHealth represents the health of a resource. It has the latest device health information. This
     is a part of KEP https://kep.k8s.io/4680 and historical health changes are planned to be added in
@@ -4683,7 +4683,7 @@ class ResourceHealth(K8sSpec):
     health: Optional[str] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class ResourceQuota(K8sResource):
     """ResourceQuota sets aggregate quota restrictions enforced per namespace
     Attributes:
@@ -4708,7 +4708,7 @@ class ResourceQuota(K8sResource):
     status: Optional[ResourceQuotaStatus] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class ResourceQuotaSpec(K8sSpec):
     """ResourceQuotaSpec defines the desired hard limits to enforce for Quota.
 
@@ -4727,7 +4727,7 @@ class ResourceQuotaSpec(K8sSpec):
     scopes: Optional[List[str]] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class ResourceQuotaStatus(K8sSpec):
     """ResourceQuotaStatus defines the enforced hard limits and observed use.
 
@@ -4741,7 +4741,7 @@ class ResourceQuotaStatus(K8sSpec):
     used: Optional[JSONDict] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class ResourceStatus(K8sSpec):
     """Schema model io.k8s.api.core.v1.ResourceStatus.
 
@@ -4758,7 +4758,7 @@ class ResourceStatus(K8sSpec):
     resources: Optional[List[ResourceHealth]] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class ScopeSelector(K8sSpec):
     """A scope selector represents the AND of the selectors represented by the scoped-resource selector
     requirements.
@@ -4771,7 +4771,7 @@ class ScopeSelector(K8sSpec):
     matchExpressions: Optional[List[ScopedResourceSelectorRequirement]] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class ScopedResourceSelectorRequirement(K8sSpec):
     """A scoped-resource selector requirement is a selector that contains values, a scope name, and an
     operator that relates the scope name and values.
@@ -4791,7 +4791,7 @@ class ScopedResourceSelectorRequirement(K8sSpec):
     values: Optional[List[str]] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class Secret(K8sResource):
     """Secret holds secret data of a certain type. The total bytes of the values in the Data field must be
     less than MaxSecretSize bytes.
@@ -4826,7 +4826,7 @@ class Secret(K8sResource):
     type: Optional[str] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class Service(K8sResource):
     """Service is a named abstraction of software service (for example, mysql) consisting of local port (for
     example 3306) that the proxy listens on, and the selector that determines which pods will answer
@@ -4852,7 +4852,7 @@ class Service(K8sResource):
     status: Optional[ServiceStatus] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class ServiceAccount(K8sResource):
     """ServiceAccount binds together: * a name, understood by users, and perhaps by peripheral systems, for
     an identity * a principal that can be authenticated and authorized * a set of secrets
@@ -4887,7 +4887,7 @@ class ServiceAccount(K8sResource):
     secrets: Optional[List[ObjectReference]] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class ServicePort(K8sSpec):
     """ServicePort contains information on service's port.
 
@@ -4929,7 +4929,7 @@ class ServicePort(K8sSpec):
     targetPort: Optional[int | str] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class ServiceSpec(K8sSpec):
     """ServiceSpec describes the attributes that a user creates on a service.
 
@@ -5088,7 +5088,7 @@ class ServiceSpec(K8sSpec):
     type: Optional[str] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class ServiceStatus(K8sSpec):
     """ServiceStatus represents the current status of a service.
 
@@ -5102,7 +5102,7 @@ class ServiceStatus(K8sSpec):
     loadBalancer: Optional[LoadBalancerStatus] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class SessionAffinityConfig(K8sSpec):
     """SessionAffinityConfig represents the configurations of session affinity.
 
@@ -5114,7 +5114,7 @@ class SessionAffinityConfig(K8sSpec):
     clientIP: Optional[ClientIPConfig] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class Taint(K8sSpec):
     """The node this Taint is attached to has the 'effect' on any pod that does not tolerate the Taint.
 
@@ -5134,7 +5134,7 @@ class Taint(K8sSpec):
     value: Optional[str] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class VolumeMountStatus(K8sSpec):
     """VolumeMountStatus shows status of volume mounts.
 
@@ -10,7 +10,7 @@ import gybe.k8s.v1_31.meta.v1
 from gybe.k8s.types import JSONDict, K8sResource, K8sSpec
 
 
-@dataclass
+@dataclass(slots=True)
 class Endpoint(K8sSpec):
     """Endpoint represents a single logical 'backend' implementing a service.
 
@@ -48,7 +48,7 @@ class Endpoint(K8sSpec):
     zone: Optional[str] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class EndpointConditions(K8sSpec):
     """EndpointConditions represents the current condition of an endpoint.
 
@@ -71,7 +71,7 @@ class EndpointConditions(K8sSpec):
     terminating: Optional[bool] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class EndpointHints(K8sSpec):
     """EndpointHints provides hints describing how an endpoint should be consumed.
 
@@ -84,7 +84,7 @@ class EndpointHints(K8sSpec):
     forZones: Optional[List[ForZone]] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class EndpointPort(K8sSpec):
     """EndpointPort represents a Port used by an EndpointSlice
     Attributes:
@@ -116,7 +116,7 @@ class EndpointPort(K8sSpec):
     protocol: Optional[str] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class EndpointSlice(K8sResource):
     """EndpointSlice represents a subset of the endpoints that implement a service. For a given service there
     may be multiple EndpointSlice objects, selected by labels, which must be joined to produce the full
@@ -150,7 +150,7 @@ class EndpointSlice(K8sResource):
     ports: Optional[List[EndpointPort]] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class ForZone(K8sSpec):
     """ForZone provides information about which zones should consume this endpoint.
 
@@ -10,7 +10,7 @@ import gybe.k8s.v1_31.meta.v1
 from gybe.k8s.types import K8sResource, K8sSpec
 
 
-@dataclass
+@dataclass(slots=True)
 class Event(K8sResource):
     """Event is a report of an event somewhere in the cluster. It generally denotes some state change in the
     system. Events have a limited retention time and triggers and messages may evolve with time.  Event
@@ -74,7 +74,7 @@ class Event(K8sResource):
     type: Optional[str] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class EventSeries(K8sSpec):
     """EventSeries contain information on series of events, i.e. thing that was/is happening continuously for
     some time. How often to update the EventSeries is up to the event reporters. The default event
@@ -9,7 +9,7 @@ import gybe.k8s.v1_31.meta.v1
 from gybe.k8s.types import K8sResource, K8sSpec
 
 
-@dataclass
+@dataclass(slots=True)
 class ExemptPriorityLevelConfiguration(K8sSpec):
     """ExemptPriorityLevelConfiguration describes the configurable aspects of the handling of exempt
     requests. In the mandatory exempt configuration object the values in the fields here can be modified
@@ -36,7 +36,7 @@ class ExemptPriorityLevelConfiguration(K8sSpec):
     nominalConcurrencyShares: Optional[int] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class FlowDistinguisherMethod(K8sSpec):
     """FlowDistinguisherMethod specifies the method of a flow distinguisher.
 
@@ -49,7 +49,7 @@ class FlowDistinguisherMethod(K8sSpec):
     type: str
 
 
-@dataclass
+@dataclass(slots=True)
 class FlowSchema(K8sResource):
     """FlowSchema defines the schema of a group of flows. Note that a flow is made up of a set of inbound API
     requests with similar attributes and is identified by a pair of strings: the name of the FlowSchema
@@ -74,7 +74,7 @@ class FlowSchema(K8sResource):
     status: Optional[FlowSchemaStatus] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class FlowSchemaCondition(K8sSpec):
     """FlowSchemaCondition describes conditions for a FlowSchema.
 
@@ -95,7 +95,7 @@ class FlowSchemaCondition(K8sSpec):
     type: Optional[str] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class FlowSchemaSpec(K8sSpec):
     """FlowSchemaSpec describes how the FlowSchema's specification looks like.
 
@@ -122,7 +122,7 @@ class FlowSchemaSpec(K8sSpec):
     rules: Optional[List[PolicyRulesWithSubjects]] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class FlowSchemaStatus(K8sSpec):
     """FlowSchemaStatus represents the current state of a FlowSchema.
 
@@ -134,7 +134,7 @@ class FlowSchemaStatus(K8sSpec):
     conditions: Optional[List[FlowSchemaCondition]] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class GroupSubject(K8sSpec):
     """GroupSubject holds detailed information for group-kind subject.
 
@@ -148,7 +148,7 @@ class GroupSubject(K8sSpec):
     name: str
 
 
-@dataclass
+@dataclass(slots=True)
 class LimitResponse(K8sSpec):
     """LimitResponse defines how to handle requests that can not be executed right now.
 
@@ -165,7 +165,7 @@ class LimitResponse(K8sSpec):
     queuing: Optional[QueuingConfiguration] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class LimitedPriorityLevelConfiguration(K8sSpec):
     """LimitedPriorityLevelConfiguration specifies how to handle requests that are subject to limits. It
     addresses two issues:   - How are requests for this priority level limited?   - What should be done
@@ -203,7 +203,7 @@ class LimitedPriorityLevelConfiguration(K8sSpec):
     nominalConcurrencyShares: Optional[int] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class NonResourcePolicyRule(K8sSpec):
     """NonResourcePolicyRule is a predicate that matches non-resource requests according to their verb and
     the target non-resource URL. A NonResourcePolicyRule matches a request if and only if both (a) at
@@ -225,7 +225,7 @@ class NonResourcePolicyRule(K8sSpec):
     nonResourceURLs: List[str]
 
 
-@dataclass
+@dataclass(slots=True)
 class PolicyRulesWithSubjects(K8sSpec):
     """PolicyRulesWithSubjects prescribes a test that applies to a request to an apiserver. The test
     considers the subject making the request, the verb being requested, and the resource to be acted upon.
@@ -250,7 +250,7 @@ class PolicyRulesWithSubjects(K8sSpec):
     resourceRules: Optional[List[ResourcePolicyRule]] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class PriorityLevelConfiguration(K8sResource):
     """PriorityLevelConfiguration represents the configuration of a priority level.
 
@@ -273,7 +273,7 @@ class PriorityLevelConfiguration(K8sResource):
     status: Optional[PriorityLevelConfigurationStatus] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class PriorityLevelConfigurationCondition(K8sSpec):
     """PriorityLevelConfigurationCondition defines the condition of priority level.
 
@@ -294,7 +294,7 @@ class PriorityLevelConfigurationCondition(K8sSpec):
     type: Optional[str] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class PriorityLevelConfigurationReference(K8sSpec):
     """PriorityLevelConfigurationReference contains information that points to the 'request-priority' being
     used.
@@ -307,7 +307,7 @@ class PriorityLevelConfigurationReference(K8sSpec):
     name: str
 
 
-@dataclass
+@dataclass(slots=True)
 class PriorityLevelConfigurationSpec(K8sSpec):
     """PriorityLevelConfigurationSpec specifies the configuration of a priority level.
 
@@ -331,7 +331,7 @@ class PriorityLevelConfigurationSpec(K8sSpec):
     limited: Optional[LimitedPriorityLevelConfiguration] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class PriorityLevelConfigurationStatus(K8sSpec):
     """PriorityLevelConfigurationStatus represents the current state of a 'request-priority'.
 
@@ -343,7 +343,7 @@ class PriorityLevelConfigurationStatus(K8sSpec):
     conditions: Optional[List[PriorityLevelConfigurationCondition]] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class QueuingConfiguration(K8sSpec):
     """QueuingConfiguration holds the configuration parameters for queuing
     Attributes:
@@ -369,7 +369,7 @@ class QueuingConfiguration(K8sSpec):
     queues: Optional[int] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class ResourcePolicyRule(K8sSpec):
     """ResourcePolicyRule is a predicate that matches some resource requests, testing the request's verb and
     the target resource. A ResourcePolicyRule matches a resource request if and only if: (a) at least one
@@ -405,7 +405,7 @@ class ResourcePolicyRule(K8sSpec):
     namespaces: Optional[List[str]] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class ServiceAccountSubject(K8sSpec):
     """ServiceAccountSubject holds detailed information for service-account-kind subject.
 
@@ -420,7 +420,7 @@ class ServiceAccountSubject(K8sSpec):
     name: str
 
 
-@dataclass
+@dataclass(slots=True)
 class Subject(K8sSpec):
     """Subject matches the originator of a request, as identified by the request authentication system. There
     are three ways of matching an originator; by user, group, or service account.
@@ -439,7 +439,7 @@ class Subject(K8sSpec):
     user: Optional[UserSubject] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class UserSubject(K8sSpec):
     """UserSubject holds detailed information for user-kind subject.
 
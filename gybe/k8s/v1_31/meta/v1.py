@@ -8,7 +8,7 @@ from typing import List, Literal, Optional
 from gybe.k8s.types import JSONDict, JSONObj, K8sResource, K8sSpec
 
 
-@dataclass
+@dataclass(slots=True)
 class APIGroup(K8sResource):
     """APIGroup contains the name, the supported versions, and the preferred version of a group.
 
@@ -40,7 +40,7 @@ class APIGroup(K8sResource):
     serverAddressByClientCIDRs: Optional[List[ServerAddressByClientCIDR]] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class GroupVersionForDiscovery(K8sSpec):
     """GroupVersion contains the 'group/version' and 'version' string of a version. It is made a struct to
     keep extensibility.
@@ -56,7 +56,7 @@ class GroupVersionForDiscovery(K8sSpec):
     version: str
 
 
-@dataclass
+@dataclass(slots=True)
 class ServerAddressByClientCIDR(K8sSpec):
     """ServerAddressByClientCIDR helps the client to determine the server address that they should use,
     depending on the clientCIDR that they match.
@@ -73,7 +73,7 @@ class ServerAddressByClientCIDR(K8sSpec):
     serverAddress: str
 
 
-@dataclass
+@dataclass(slots=True)
 class APIResource(K8sSpec):
     """APIResource specifies the name of a resource and whether it is namespaced.
 
@@ -113,7 +113,7 @@ class APIResource(K8sSpec):
     version: Optional[str] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class DeleteOptions(K8sResource):
     """DeleteOptions may be provided when deleting an API object.
 
@@ -154,7 +154,7 @@ class DeleteOptions(K8sResource):
     propagationPolicy: Optional[str] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class ManagedFieldsEntry(K8sSpec):
     """ManagedFieldsEntry is a workflow-id, a FieldSet and the group version of the resource that the
     fieldset applies to.
@@ -190,7 +190,7 @@ class ManagedFieldsEntry(K8sSpec):
     time: Optional[str] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class ObjectMeta(K8sSpec):
     """ObjectMeta is metadata that all persisted resources must have, which includes all objects users must
     create.
@@ -286,7 +286,7 @@ class ObjectMeta(K8sSpec):
     uid: Optional[str] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class OwnerReference(K8sSpec):
     """OwnerReference contains enough information to let you identify an owning object. An owning object must
     be in the same namespace as the dependent, or be cluster-scoped, so there is no namespace field.
@@ -314,7 +314,7 @@ class OwnerReference(K8sSpec):
     controller: Optional[bool] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class Preconditions(K8sSpec):
     """Preconditions must be fulfilled before an operation (update, delete, etc.) is carried out.
 
@@ -328,7 +328,7 @@ class Preconditions(K8sSpec):
     uid: Optional[str] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class Status(K8sResource):
     """Status is a return value for calls that don't return other objects.
 
@@ -361,7 +361,7 @@ class Status(K8sResource):
     status: Optional[str] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class StatusCause(K8sSpec):
     """StatusCause provides more information about an api.Status failure, including cases when multiple
     errors are encountered.
@@ -384,7 +384,7 @@ class StatusCause(K8sSpec):
     reason: Optional[str] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class StatusDetails(K8sSpec):
     """StatusDetails is a set of additional properties that MAY be set by the server to provide additional
     information about a response. The Reason field of a Status object defines what attributes will be set.
@@ -414,7 +414,7 @@ class StatusDetails(K8sSpec):
     uid: Optional[str] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class WatchEvent(K8sResource):
     """Event represents a single event to a watched resource.
 
@@ -430,7 +430,7 @@ class WatchEvent(K8sResource):
     object: JSONObj
 
 
-@dataclass
+@dataclass(slots=True)
 class LabelSelector(K8sSpec):
     """A label selector is a label query over a set of resources. The result of matchLabels and
     matchExpressions are ANDed. An empty label selector matches all objects. A null label selector matches
@@ -449,7 +449,7 @@ class LabelSelector(K8sSpec):
     matchLabels: Optional[JSONDict] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class LabelSelectorRequirement(K8sSpec):
     """A label selector requirement is a selector that contains values, a key, and an operator that relates
     the key and values.
@@ -469,7 +469,7 @@ class LabelSelectorRequirement(K8sSpec):
     values: Optional[List[str]] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class Condition(K8sSpec):
     """Condition contains details for one aspect of the current state of this API Resource.
 
@@ -500,7 +500,7 @@ class Condition(K8sSpec):
     observedGeneration: Optional[int] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class FieldSelectorRequirement(K8sSpec):
     """FieldSelectorRequirement is a selector that contains values, a key, and an operator that relates the
     key and values.
@@ -519,7 +519,7 @@ class FieldSelectorRequirement(K8sSpec):
     values: Optional[List[str]] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class APIVersions(K8sResource):
     """APIVersions lists the versions that are available, to allow clients to discover the API at /api, which
     is the root path of the legacy v1 API.
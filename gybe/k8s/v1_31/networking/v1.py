@@ -10,7 +10,7 @@ import gybe.k8s.v1_31.meta.v1
 from gybe.k8s.types import JSONObj, K8sResource, K8sSpec
 
 
-@dataclass
+@dataclass(slots=True)
 class HTTPIngressPath(K8sSpec):
     """HTTPIngressPath associates a path with a backend. Incoming urls matching the path are forwarded to the
     backend.
@@ -38,7 +38,7 @@ class HTTPIngressPath(K8sSpec):
     path: Optional[str] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class HTTPIngressRuleValue(K8sSpec):
     """HTTPIngressRuleValue is a list of http selectors pointing to backends. In the example:
     http://<host>/<path>?<searchpart> -> backend where where parts of the url correspond to RFC 3986, this
@@ -52,7 +52,7 @@ class HTTPIngressRuleValue(K8sSpec):
     paths: List[HTTPIngressPath]
 
 
-@dataclass
+@dataclass(slots=True)
 class Ingress(K8sResource):
     """Ingress is a collection of rules that allow inbound connections to reach the endpoints defined by a
     backend. An Ingress can be configured to give services externally-reachable urls, load balance
@@ -77,7 +77,7 @@ class Ingress(K8sResource):
     status: Optional[IngressStatus] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class IngressBackend(K8sSpec):
     """IngressBackend describes all endpoints for a given service and port.
 
@@ -94,7 +94,7 @@ class IngressBackend(K8sSpec):
     service: Optional[IngressServiceBackend] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class IngressClass(K8sResource):
     """IngressClass represents the class of the Ingress, referenced by the Ingress Spec. The
     `ingressclass.kubernetes.io/is-default-class` annotation can be used to indicate that an IngressClass
@@ -118,7 +118,7 @@ class IngressClass(K8sResource):
     spec: Optional[IngressClassSpec] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class IngressClassParametersReference(K8sSpec):
     """IngressClassParametersReference identifies an API object. This can be used to specify a cluster or
     namespace-scoped resource.
@@ -143,7 +143,7 @@ class IngressClassParametersReference(K8sSpec):
     scope: Optional[str] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class IngressClassSpec(K8sSpec):
     """IngressClassSpec provides information about the class of an Ingress.
 
@@ -162,7 +162,7 @@ class IngressClassSpec(K8sSpec):
     parameters: Optional[IngressClassParametersReference] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class IngressLoadBalancerIngress(K8sSpec):
     """IngressLoadBalancerIngress represents the status of a load-balancer ingress point.
 
@@ -178,7 +178,7 @@ class IngressLoadBalancerIngress(K8sSpec):
     ports: Optional[List[IngressPortStatus]] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class IngressLoadBalancerStatus(K8sSpec):
     """IngressLoadBalancerStatus represents the status of a load-balancer.
 
@@ -190,7 +190,7 @@ class IngressLoadBalancerStatus(K8sSpec):
     ingress: Optional[List[IngressLoadBalancerIngress]] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class IngressPortStatus(K8sSpec):
     """IngressPortStatus represents the error condition of a service port
     Attributes:
@@ -208,7 +208,7 @@ class IngressPortStatus(K8sSpec):
     error: Optional[str] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class IngressRule(K8sSpec):
     """IngressRule represents the rules mapping the paths under a specified host to the related backend
     services. Incoming requests are first evaluated for a host match, then routed to the backend
@@ -238,7 +238,7 @@ class IngressRule(K8sSpec):
     http: Optional[HTTPIngressRuleValue] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class IngressServiceBackend(K8sSpec):
     """IngressServiceBackend references a Kubernetes Service as a Backend.
 
@@ -254,7 +254,7 @@ class IngressServiceBackend(K8sSpec):
     port: Optional[ServiceBackendPort] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class IngressSpec(K8sSpec):
     """IngressSpec describes the Ingress the user wishes to exist.
 
@@ -285,7 +285,7 @@ class IngressSpec(K8sSpec):
     tls: Optional[List[IngressTLS]] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class IngressStatus(K8sSpec):
     """IngressStatus describe the current state of the Ingress.
 
@@ -297,7 +297,7 @@ class IngressStatus(K8sSpec):
     loadBalancer: Optional[IngressLoadBalancerStatus] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class IngressTLS(K8sSpec):
     """IngressTLS describes the transport layer security associated with an ingress.
 
@@ -316,7 +316,7 @@ class IngressTLS(K8sSpec):
     secretName: Optional[str] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class NetworkPolicy(K8sResource):
     """NetworkPolicy describes what network traffic is allowed for a set of Pods
     Attributes:
@@ -336,7 +336,7 @@ class NetworkPolicy(K8sResource):
     spec: Optional[NetworkPolicySpec] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class NetworkPolicyEgressRule(K8sSpec):
     """NetworkPolicyEgressRule describes a particular set of traffic that is allowed out of pods matched by a
     NetworkPolicySpec's podSelector. The traffic must match both ports and to. This type is beta-level in
@@ -358,7 +358,7 @@ class NetworkPolicyEgressRule(K8sSpec):
     to: Optional[List[NetworkPolicyPeer]] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class NetworkPolicyPeer(K8sSpec):
     """NetworkPolicyPeer describes a peer to allow traffic to/from. Only certain combinations of fields are
     allowed
@@ -383,7 +383,7 @@ class NetworkPolicyPeer(K8sSpec):
     podSelector: Optional[gybe.k8s.v1_31.meta.v1.LabelSelector] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class NetworkPolicyPort(K8sSpec):
     """NetworkPolicyPort describes a port to allow traffic on
     Attributes:
@@ -403,7 +403,7 @@ class NetworkPolicyPort(K8sSpec):
     protocol: Optional[str] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class NetworkPolicySpec(K8sSpec):
     """NetworkPolicySpec provides the specification of a NetworkPolicy
     Attributes:
@@ -442,7 +442,7 @@ class NetworkPolicySpec(K8sSpec):
     policyTypes: Optional[List[str]] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class ServiceBackendPort(K8sSpec):
     """ServiceBackendPort is the service port being referenced.
 
@@ -9,7 +9,7 @@ import gybe.k8s.v1_31.meta.v1
 from gybe.k8s.types import K8sResource, K8sSpec
 
 
-@dataclass
+@dataclass(slots=True)
 class IPAddress(K8sResource):
     """IPAddress represents a single IP of a single IP Family. The object is designed to be used by APIs that
     operate on IP addresses. The object is used by the Service core API for allocation of IP addresses. An
@@ -34,7 +34,7 @@ class IPAddress(K8sResource):
     spec: Optional[IPAddressSpec] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class IPAddressSpec(K8sSpec):
     """IPAddressSpec describe the attributes in an IP Address.
 
@@ -47,7 +47,7 @@ class IPAddressSpec(K8sSpec):
     parentRef: ParentReference
 
 
-@dataclass
+@dataclass(slots=True)
 class ParentReference(K8sSpec):
     """ParentReference describes a reference to a parent object.
 
@@ -65,7 +65,7 @@ class ParentReference(K8sSpec):
     namespace: Optional[str] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class ServiceCIDR(K8sResource):
     """ServiceCIDR defines a range of IP addresses using CIDR format (e.g. 192.168.0.0/24 or 2001:db2::/64).
     This range is used to allocate ClusterIPs to Service objects.
@@ -89,7 +89,7 @@ class ServiceCIDR(K8sResource):
     status: Optional[ServiceCIDRStatus] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class ServiceCIDRSpec(K8sSpec):
     """ServiceCIDRSpec define the CIDRs the user wants to use for allocating ClusterIPs for Services.
 
@@ -103,7 +103,7 @@ class ServiceCIDRSpec(K8sSpec):
     cidrs: Optional[List[str]] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class ServiceCIDRStatus(K8sSpec):
     """ServiceCIDRStatus describes the current state of the ServiceCIDR.
 
@@ -10,7 +10,7 @@ import gybe.k8s.v1_31.meta.v1
 from gybe.k8s.types import JSONDict, K8sResource, K8sSpec
 
 
-@dataclass
+@dataclass(slots=True)
 class Overhead(K8sSpec):
     """Overhead structure represents the resource overhead associated with running a pod.
 
@@ -22,7 +22,7 @@ class Overhead(K8sSpec):
     podFixed: Optional[JSONDict] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class RuntimeClass(K8sResource):
     """RuntimeClass defines a class of container runtime supported in the cluster. The RuntimeClass is used
     to determine which container runtime is used to run all containers in a pod. RuntimeClasses are
@@ -60,7 +60,7 @@ class RuntimeClass(K8sResource):
     scheduling: Optional[Scheduling] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class Scheduling(K8sSpec):
     """Scheduling specifies the scheduling constraints for nodes supporting a RuntimeClass.
 
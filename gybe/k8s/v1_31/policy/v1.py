@@ -9,7 +9,7 @@ import gybe.k8s.v1_31.meta.v1
 from gybe.k8s.types import JSONDict, K8sResource, K8sSpec
 
 
-@dataclass
+@dataclass(slots=True)
 class Eviction(K8sResource):
     """Eviction evicts a pod from its node subject to certain policies and safety constraints. This is a
     subresource of Pod.  A request to cause such an eviction is created by POSTing to .../pods/<pod
@@ -32,7 +32,7 @@ class Eviction(K8sResource):
     metadata: Optional[gybe.k8s.v1_31.meta.v1.ObjectMeta] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class PodDisruptionBudget(K8sResource):
     """PodDisruptionBudget is an object to define the max disruption that can be caused to a collection of
     pods
@@ -55,7 +55,7 @@ class PodDisruptionBudget(K8sResource):
     status: Optional[PodDisruptionBudgetStatus] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class PodDisruptionBudgetSpec(K8sSpec):
     """PodDisruptionBudgetSpec is a description of a PodDisruptionBudget.
 
@@ -93,7 +93,7 @@ class PodDisruptionBudgetSpec(K8sSpec):
     unhealthyPodEvictionPolicy: Optional[str] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class PodDisruptionBudgetStatus(K8sSpec):
     """PodDisruptionBudgetStatus represents information about the status of a PodDisruptionBudget. Status may
     trail the actual state of a system.
@@ -9,7 +9,7 @@ import gybe.k8s.v1_31.meta.v1
 from gybe.k8s.types import K8sResource, K8sSpec
 
 
-@dataclass
+@dataclass(slots=True)
 class AggregationRule(K8sSpec):
     """AggregationRule describes how to locate ClusterRoles to aggregate into the ClusterRole
     Attributes:
@@ -22,7 +22,7 @@ class AggregationRule(K8sSpec):
     clusterRoleSelectors: Optional[List[gybe.k8s.v1_31.meta.v1.LabelSelector]] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class ClusterRole(K8sResource):
     """ClusterRole is a cluster level, logical grouping of PolicyRules that can be referenced as a unit by a
     RoleBinding or ClusterRoleBinding.
@@ -48,7 +48,7 @@ class ClusterRole(K8sResource):
     rules: Optional[List[PolicyRule]] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class ClusterRoleBinding(K8sResource):
     """ClusterRoleBinding references a ClusterRole, but not contain it.  It can reference a ClusterRole in
     the global namespace, and adds who information via Subject.
@@ -73,7 +73,7 @@ class ClusterRoleBinding(K8sResource):
     subjects: Optional[List[Subject]] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class PolicyRule(K8sSpec):
     """PolicyRule holds information that describes a policy rule, but does not contain information about who
     the rule applies to or which namespace the rule applies to.
@@ -102,7 +102,7 @@ class PolicyRule(K8sSpec):
     resources: Optional[List[str]] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class Role(K8sResource):
     """Role is a namespaced, logical grouping of PolicyRules that can be referenced as a unit by a
     RoleBinding.
@@ -124,7 +124,7 @@ class Role(K8sResource):
     rules: Optional[List[PolicyRule]] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class RoleBinding(K8sResource):
     """RoleBinding references a role, but does not contain it.  It can reference a Role in the same namespace
     or a ClusterRole in the global namespace. It adds who information via Subjects and namespace
@@ -152,7 +152,7 @@ class RoleBinding(K8sResource):
     subjects: Optional[List[Subject]] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class RoleRef(K8sSpec):
     """RoleRef contains information that points to the role being used
     Attributes:
@@ -167,7 +167,7 @@ class RoleRef(K8sSpec):
     name: str
 
 
-@dataclass
+@dataclass(slots=True)
 class Subject(K8sSpec):
     """Subject contains a reference to the object or user identities a role binding applies to.  This can
     either hold a direct API object reference, or a value for non-objects such as user and group names.
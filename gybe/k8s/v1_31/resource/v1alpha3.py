@@ -10,7 +10,7 @@ import gybe.k8s.v1_31.meta.v1
 from gybe.k8s.types import JSONDict, JSONObj, K8sResource, K8sSpec
 
 
-@dataclass
+@dataclass(slots=True)
 class AllocationResult(K8sSpec):
     """AllocationResult contains attributes of an allocated resource.
 
@@ -31,7 +31,7 @@ class AllocationResult(K8sSpec):
     nodeSelector: Optional[gybe.k8s.v1_31.core.v1.NodeSelector] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class BasicDevice(K8sSpec):
     """BasicDevice defines one device instance.
 
@@ -47,7 +47,7 @@ class BasicDevice(K8sSpec):
     capacity: Optional[JSONDict] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class CELDeviceSelector(K8sSpec):
     """CELDeviceSelector contains a CEL expression for selecting a device.
 
@@ -81,7 +81,7 @@ class CELDeviceSelector(K8sSpec):
     expression: str
 
 
-@dataclass
+@dataclass(slots=True)
 class Device(K8sSpec):
     """Device represents one individual hardware instance that can be selected based on its attributes.
     Besides the name, exactly one field must be set.
@@ -97,7 +97,7 @@ class Device(K8sSpec):
     basic: Optional[BasicDevice] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class DeviceAllocationConfiguration(K8sSpec):
     """DeviceAllocationConfiguration gets embedded in an AllocationResult.
 
@@ -115,7 +115,7 @@ class DeviceAllocationConfiguration(K8sSpec):
     requests: Optional[List[str]] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class DeviceAllocationResult(K8sSpec):
     """DeviceAllocationResult is the result of allocating devices.
 
@@ -132,7 +132,7 @@ class DeviceAllocationResult(K8sSpec):
     results: Optional[List[DeviceRequestAllocationResult]] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class DeviceAttribute(K8sSpec):
     """DeviceAttribute must have exactly one field set.
 
@@ -151,7 +151,7 @@ class DeviceAttribute(K8sSpec):
     version: Optional[str] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class DeviceClaim(K8sSpec):
     """DeviceClaim defines how to request devices with a ResourceClaim.
 
@@ -170,7 +170,7 @@ class DeviceClaim(K8sSpec):
     requests: Optional[List[DeviceRequest]] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class DeviceClaimConfiguration(K8sSpec):
     """DeviceClaimConfiguration is used for configuration parameters in DeviceClaim.
 
@@ -185,7 +185,7 @@ class DeviceClaimConfiguration(K8sSpec):
     requests: Optional[List[str]] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class DeviceClass(K8sResource):
     """DeviceClass is a vendor- or admin-provided resource that contains device configuration and selectors.
     It can be referenced in the device requests of a claim to apply these presets. Cluster scoped.  This
@@ -211,7 +211,7 @@ class DeviceClass(K8sResource):
     metadata: Optional[gybe.k8s.v1_31.meta.v1.ObjectMeta] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class DeviceClassConfiguration(K8sSpec):
     """DeviceClassConfiguration is used in DeviceClass.
 
@@ -223,7 +223,7 @@ class DeviceClassConfiguration(K8sSpec):
     opaque: Optional[OpaqueDeviceConfiguration] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class DeviceClassSpec(K8sSpec):
     """DeviceClassSpec is used in a [DeviceClass] to define what can be allocated and how to configure it.
 
@@ -247,7 +247,7 @@ class DeviceClassSpec(K8sSpec):
     suitableNodes: Optional[gybe.k8s.v1_31.core.v1.NodeSelector] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class DeviceConstraint(K8sSpec):
     """DeviceConstraint must have exactly one field set besides Requests.
 
@@ -268,7 +268,7 @@ class DeviceConstraint(K8sSpec):
     requests: Optional[List[str]] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class DeviceRequest(K8sSpec):
     """DeviceRequest is a request for devices required for a claim. This is typically a request for a single
     resource like a device, but can also ask for several identical devices.  A DeviceClassName is
@@ -313,7 +313,7 @@ class DeviceRequest(K8sSpec):
     selectors: Optional[List[DeviceSelector]] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class DeviceRequestAllocationResult(K8sSpec):
     """DeviceRequestAllocationResult contains the allocation result for one request.
 
@@ -337,7 +337,7 @@ class DeviceRequestAllocationResult(K8sSpec):
     device: str
 
 
-@dataclass
+@dataclass(slots=True)
 class DeviceSelector(K8sSpec):
     """DeviceSelector must have exactly one field set.
 
@@ -349,7 +349,7 @@ class DeviceSelector(K8sSpec):
     cel: Optional[CELDeviceSelector] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class OpaqueDeviceConfiguration(K8sSpec):
     """OpaqueDeviceConfiguration contains configuration parameters for a driver in a format defined by the
     driver vendor.
@@ -369,7 +369,7 @@ class OpaqueDeviceConfiguration(K8sSpec):
     parameters: JSONObj
 
 
-@dataclass
+@dataclass(slots=True)
 class PodSchedulingContext(K8sResource):
     """PodSchedulingContext objects hold information that is needed to schedule a Pod with ResourceClaims
     that use 'WaitForFirstConsumer' allocation mode.  This is an alpha type and requires enabling the
@@ -394,7 +394,7 @@ class PodSchedulingContext(K8sResource):
     status: Optional[PodSchedulingContextStatus] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class PodSchedulingContextSpec(K8sSpec):
     """PodSchedulingContextSpec describes where resources for the Pod are needed.
 
@@ -412,7 +412,7 @@ class PodSchedulingContextSpec(K8sSpec):
     selectedNode: Optional[str] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class PodSchedulingContextStatus(K8sSpec):
     """PodSchedulingContextStatus describes where resources for the Pod can be allocated.
 
@@ -425,7 +425,7 @@ class PodSchedulingContextStatus(K8sSpec):
     resourceClaims: Optional[List[ResourceClaimSchedulingStatus]] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class ResourceClaim(K8sResource):
     """ResourceClaim describes a request for access to resources in the cluster, for use by workloads. For
     example, if a workload needs an accelerator device with specific properties, this is how that request
@@ -452,7 +452,7 @@ class ResourceClaim(K8sResource):
     status: Optional[ResourceClaimStatus] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class ResourceClaimConsumerReference(K8sSpec):
     """ResourceClaimConsumerReference contains enough information to let you locate the consumer of a
     ResourceClaim. The user must be a resource in the same namespace as the ResourceClaim.
@@ -472,7 +472,7 @@ class ResourceClaimConsumerReference(K8sSpec):
     apiGroup: Optional[str] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class ResourceClaimSchedulingStatus(K8sSpec):
     """ResourceClaimSchedulingStatus contains information about one particular ResourceClaim with
     'WaitForFirstConsumer' allocation mode.
@@ -489,7 +489,7 @@ class ResourceClaimSchedulingStatus(K8sSpec):
     unsuitableNodes: Optional[List[str]] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class ResourceClaimSpec(K8sSpec):
     """ResourceClaimSpec defines what is being requested in a ResourceClaim and how to configure it.
 
@@ -506,7 +506,7 @@ class ResourceClaimSpec(K8sSpec):
     devices: Optional[DeviceClaim] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class ResourceClaimStatus(K8sSpec):
     """ResourceClaimStatus tracks whether the resource has been allocated and what the result of that was.
 
@@ -535,7 +535,7 @@ class ResourceClaimStatus(K8sSpec):
     reservedFor: Optional[List[ResourceClaimConsumerReference]] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class ResourceClaimTemplate(K8sResource):
     """ResourceClaimTemplate is used to produce ResourceClaim objects.  This is an alpha type and requires
     enabling the DynamicResourceAllocation feature gate.
@@ -558,7 +558,7 @@ class ResourceClaimTemplate(K8sResource):
     metadata: Optional[gybe.k8s.v1_31.meta.v1.ObjectMeta] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class ResourceClaimTemplateSpec(K8sSpec):
     """ResourceClaimTemplateSpec contains the metadata and fields for a ResourceClaim.
 
@@ -574,7 +574,7 @@ class ResourceClaimTemplateSpec(K8sSpec):
     metadata: Optional[gybe.k8s.v1_31.meta.v1.ObjectMeta] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class ResourcePool(K8sSpec):
     """ResourcePool describes the pool that ResourceSlices belong to.
 
@@ -600,7 +600,7 @@ class ResourcePool(K8sSpec):
     resourceSliceCount: int
 
 
-@dataclass
+@dataclass(slots=True)
 class ResourceSlice(K8sResource):
     """ResourceSlice represents one or more resources in a pool of similar resources, managed by a common
     driver. A pool may span more than one ResourceSlice, and exactly how many ResourceSlices comprise a
@@ -636,7 +636,7 @@ class ResourceSlice(K8sResource):
     metadata: Optional[gybe.k8s.v1_31.meta.v1.ObjectMeta] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class ResourceSliceSpec(K8sSpec):
     """ResourceSliceSpec contains the information published by the driver in one ResourceSlice.
 
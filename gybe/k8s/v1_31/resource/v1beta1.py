@@ -11,7 +11,7 @@ import gybe.k8s.v1_31.meta.v1
 from gybe.k8s.types import JSONDict, JSONObj, K8sResource, K8sSpec
 
 
-@dataclass
+@dataclass(slots=True)
 class AllocatedDeviceStatus(K8sSpec):
     """AllocatedDeviceStatus contains the status of an allocated device, if the driver chooses to report it.
     This may include driver-specific information.
@@ -42,7 +42,7 @@ class AllocatedDeviceStatus(K8sSpec):
     networkData: Optional[NetworkDeviceData] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class AllocationResult(K8sSpec):
     """AllocationResult contains attributes of an allocated resource.
 
@@ -57,7 +57,7 @@ class AllocationResult(K8sSpec):
     nodeSelector: Optional[gybe.k8s.v1_31.core.v1.NodeSelector] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class BasicDevice(K8sSpec):
     """BasicDevice defines one device instance.
 
@@ -73,7 +73,7 @@ class BasicDevice(K8sSpec):
     capacity: Optional[JSONDict] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class CELDeviceSelector(K8sSpec):
     """CELDeviceSelector contains a CEL expression for selecting a device.
 
@@ -109,7 +109,7 @@ class CELDeviceSelector(K8sSpec):
     expression: str
 
 
-@dataclass
+@dataclass(slots=True)
 class Device(K8sSpec):
     """Device represents one individual hardware instance that can be selected based on its attributes.
     Besides the name, exactly one field must be set.
@@ -125,7 +125,7 @@ class Device(K8sSpec):
     basic: Optional[BasicDevice] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class DeviceAllocationConfiguration(K8sSpec):
     """DeviceAllocationConfiguration gets embedded in an AllocationResult.
 
@@ -143,7 +143,7 @@ class DeviceAllocationConfiguration(K8sSpec):
     requests: Optional[List[str]] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class DeviceAllocationResult(K8sSpec):
     """DeviceAllocationResult is the result of allocating devices.
 
@@ -160,7 +160,7 @@ class DeviceAllocationResult(K8sSpec):
     results: Optional[List[DeviceRequestAllocationResult]] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class DeviceAttribute(K8sSpec):
     """DeviceAttribute must have exactly one field set.
 
@@ -179,7 +179,7 @@ class DeviceAttribute(K8sSpec):
     version: Optional[str] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class DeviceCapacity(K8sSpec):
     """DeviceCapacity describes a quantity associated with a device.
 
@@ -191,7 +191,7 @@ class DeviceCapacity(K8sSpec):
     value: gybe.k8s.v1_31.api.resource.Quantity
 
 
-@dataclass
+@dataclass(slots=True)
 class DeviceClaim(K8sSpec):
     """DeviceClaim defines how to request devices with a ResourceClaim.
 
@@ -210,7 +210,7 @@ class DeviceClaim(K8sSpec):
     requests: Optional[List[DeviceRequest]] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class DeviceClaimConfiguration(K8sSpec):
     """DeviceClaimConfiguration is used for configuration parameters in DeviceClaim.
 
@@ -225,7 +225,7 @@ class DeviceClaimConfiguration(K8sSpec):
     requests: Optional[List[str]] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class DeviceClass(K8sSpec):
     """DeviceClass is a vendor- or admin-provided resource that contains device configuration and selectors.
     It can be referenced in the device requests of a claim to apply these presets. Cluster scoped.  This
@@ -251,7 +251,7 @@ class DeviceClass(K8sSpec):
     metadata: Optional[gybe.k8s.v1_31.meta.v1.ObjectMeta] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class DeviceClassConfiguration(K8sSpec):
     """DeviceClassConfiguration is used in DeviceClass.
 
@@ -263,7 +263,7 @@ class DeviceClassConfiguration(K8sSpec):
     opaque: Optional[OpaqueDeviceConfiguration] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class DeviceClassList(K8sSpec):
     """DeviceClassList is a collection of classes.
 
@@ -284,7 +284,7 @@ class DeviceClassList(K8sSpec):
     metadata: Optional[JSONObj] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class DeviceClassSpec(K8sSpec):
     """DeviceClassSpec is used in a [DeviceClass] to define what can be allocated and how to configure it.
 
@@ -301,7 +301,7 @@ class DeviceClassSpec(K8sSpec):
     selectors: Optional[List[DeviceSelector]] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class DeviceConstraint(K8sSpec):
     """DeviceConstraint must have exactly one field set besides Requests.
 
@@ -322,7 +322,7 @@ class DeviceConstraint(K8sSpec):
     requests: Optional[List[str]] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class DeviceRequest(K8sSpec):
     """DeviceRequest is a request for devices required for a claim. This is typically a request for a single
     resource like a device, but can also ask for several identical devices.  A DeviceClassName is
@@ -368,7 +368,7 @@ class DeviceRequest(K8sSpec):
     selectors: Optional[List[DeviceSelector]] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class DeviceRequestAllocationResult(K8sSpec):
     """DeviceRequestAllocationResult contains the allocation result for one request.
 
@@ -397,7 +397,7 @@ class DeviceRequestAllocationResult(K8sSpec):
     adminAccess: Optional[bool] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class DeviceSelector(K8sSpec):
     """DeviceSelector must have exactly one field set.
 
@@ -409,7 +409,7 @@ class DeviceSelector(K8sSpec):
     cel: Optional[CELDeviceSelector] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class NetworkDeviceData(K8sSpec):
     """NetworkDeviceData provides network-related details for the allocated device. This information may be
     filled by drivers or other components to configure or identify the device within a network context.
@@ -431,7 +431,7 @@ class NetworkDeviceData(K8sSpec):
     ips: Optional[List[str]] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class OpaqueDeviceConfiguration(K8sSpec):
     """OpaqueDeviceConfiguration contains configuration parameters for a driver in a format defined by the
     driver vendor.
@@ -452,7 +452,7 @@ class OpaqueDeviceConfiguration(K8sSpec):
     parameters: JSONObj
 
 
-@dataclass
+@dataclass(slots=True)
 class ResourceClaim(K8sResource):
     """ResourceClaim describes a request for access to resources in the cluster, for use by workloads. For
     example, if a workload needs an accelerator device with specific properties, this is how that request
@@ -479,7 +479,7 @@ class ResourceClaim(K8sResource):
     status: Optional[ResourceClaimStatus] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class ResourceClaimConsumerReference(K8sSpec):
     """ResourceClaimConsumerReference contains enough information to let you locate the consumer of a
     ResourceClaim. The user must be a resource in the same namespace as the ResourceClaim.
@@ -499,7 +499,7 @@ class ResourceClaimConsumerReference(K8sSpec):
     apiGroup: Optional[str] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class ResourceClaimList(K8sSpec):
     """ResourceClaimList is a collection of claims.
 
@@ -520,7 +520,7 @@ class ResourceClaimList(K8sSpec):
     metadata: Optional[JSONObj] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class ResourceClaimSpec(K8sSpec):
     """ResourceClaimSpec defines what is being requested in a ResourceClaim and how to configure it.
 
@@ -532,7 +532,7 @@ class ResourceClaimSpec(K8sSpec):
     devices: Optional[DeviceClaim] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class ResourceClaimStatus(K8sSpec):
     """ResourceClaimStatus tracks whether the resource has been allocated and what the result of that was.
 
@@ -559,7 +559,7 @@ class ResourceClaimStatus(K8sSpec):
     reservedFor: Optional[List[ResourceClaimConsumerReference]] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class ResourceClaimTemplate(K8sSpec):
     """ResourceClaimTemplate is used to produce ResourceClaim objects.  This is an alpha type and requires
     enabling the DynamicResourceAllocation feature gate.
@@ -582,7 +582,7 @@ class ResourceClaimTemplate(K8sSpec):
     metadata: Optional[gybe.k8s.v1_31.meta.v1.ObjectMeta] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class ResourceClaimTemplateList(K8sSpec):
     """ResourceClaimTemplateList is a collection of claim templates.
 
@@ -603,7 +603,7 @@ class ResourceClaimTemplateList(K8sSpec):
     metadata: Optional[JSONObj] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class ResourceClaimTemplateSpec(K8sSpec):
     """ResourceClaimTemplateSpec contains the metadata and fields for a ResourceClaim.
 
@@ -619,7 +619,7 @@ class ResourceClaimTemplateSpec(K8sSpec):
     metadata: Optional[gybe.k8s.v1_31.meta.v1.ObjectMeta] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class ResourcePool(K8sSpec):
     """ResourcePool describes the pool that ResourceSlices belong to.
 
@@ -645,7 +645,7 @@ class ResourcePool(K8sSpec):
     resourceSliceCount: int
 
 
-@dataclass
+@dataclass(slots=True)
 class ResourceSlice(K8sSpec):
     """ResourceSlice represents one or more resources in a pool of similar resources, managed by a common
     driver. A pool may span more than one ResourceSlice, and exactly how many ResourceSlices comprise a
@@ -681,7 +681,7 @@ class ResourceSlice(K8sSpec):
     metadata: Optional[gybe.k8s.v1_31.meta.v1.ObjectMeta] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class ResourceSliceList(K8sSpec):
     """ResourceSliceList is a collection of ResourceSlices.
 
@@ -702,7 +702,7 @@ class ResourceSliceList(K8sSpec):
     metadata: Optional[JSONObj] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class ResourceSliceSpec(K8sSpec):
     """ResourceSliceSpec contains the information published by the driver in one ResourceSlice.
 
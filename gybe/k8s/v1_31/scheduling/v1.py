@@ -9,7 +9,7 @@ import gybe.k8s.v1_31.meta.v1
 from gybe.k8s.types import K8sResource
 
 
-@dataclass
+@dataclass(slots=True)
 class PriorityClass(K8sResource):
     """PriorityClass defines mapping from a priority class name to the priority integer value. The value can
     be any valid integer.
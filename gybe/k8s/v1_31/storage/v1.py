@@ -11,7 +11,7 @@ import gybe.k8s.v1_31.meta.v1
 from gybe.k8s.types import JSONDict, K8sResource, K8sSpec
 
 
-@dataclass
+@dataclass(slots=True)
 class CSIDriver(K8sResource):
     """CSIDriver captures information about a Container Storage Interface (CSI) volume driver deployed on the
     cluster. Kubernetes attach detach controller uses this object to determine whether attach is required.
@@ -38,7 +38,7 @@ class CSIDriver(K8sResource):
     metadata: Optional[gybe.k8s.v1_31.meta.v1.ObjectMeta] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class CSIDriverSpec(K8sSpec):
     """CSIDriverSpec is the specification of a CSIDriver.
 
@@ -126,7 +126,7 @@ class CSIDriverSpec(K8sSpec):
     volumeLifecycleModes: Optional[List[str]] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class CSINode(K8sResource):
     """CSINode holds information about all CSI drivers installed on a node. CSI drivers do not need to create
     the CSINode object directly. As long as they use the node-driver-registrar sidecar container, the
@@ -152,7 +152,7 @@ class CSINode(K8sResource):
     metadata: Optional[gybe.k8s.v1_31.meta.v1.ObjectMeta] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class CSINodeDriver(K8sSpec):
     """CSINodeDriver holds information about the specification of one CSI driver installed on a node
     Attributes:
@@ -182,7 +182,7 @@ class CSINodeDriver(K8sSpec):
     topologyKeys: Optional[List[str]] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class CSINodeSpec(K8sSpec):
     """CSINodeSpec holds information about the specification of all CSI drivers installed on a node
     Attributes:
@@ -194,7 +194,7 @@ class CSINodeSpec(K8sSpec):
     drivers: List[CSINodeDriver]
 
 
-@dataclass
+@dataclass(slots=True)
 class CSIStorageCapacity(K8sResource):
     """CSIStorageCapacity stores the result of one CSI GetCapacity call. For a given StorageClass, this
     describes the available capacity in a particular topology segment.  This can be used when considering
@@ -249,7 +249,7 @@ class CSIStorageCapacity(K8sResource):
     nodeTopology: Optional[gybe.k8s.v1_31.meta.v1.LabelSelector] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class StorageClass(K8sResource):
     """StorageClass describes the parameters for a class of storage for which PersistentVolumes can be
     dynamically provisioned.  StorageClasses are non-namespaced; the name of the storage class according
@@ -293,7 +293,7 @@ class StorageClass(K8sResource):
     volumeBindingMode: Optional[str] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class TokenRequest(K8sSpec):
     """TokenRequest contains parameters of a service account token.
 
@@ -309,7 +309,7 @@ class TokenRequest(K8sSpec):
     expirationSeconds: Optional[int] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class VolumeAttachment(K8sResource):
     """VolumeAttachment captures the intent to attach or detach the specified volume to/from the specified
     node.  VolumeAttachment objects are non-namespaced.
@@ -335,7 +335,7 @@ class VolumeAttachment(K8sResource):
     status: Optional[VolumeAttachmentStatus] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class VolumeAttachmentSource(K8sSpec):
     """VolumeAttachmentSource represents a volume that should be attached. Right now only PersistenVolumes
     can be attached via external attacher, in future we may allow also inline volumes in pods. Exactly one
@@ -354,7 +354,7 @@ class VolumeAttachmentSource(K8sSpec):
     persistentVolumeName: Optional[str] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class VolumeAttachmentSpec(K8sSpec):
     """VolumeAttachmentSpec is the specification of a VolumeAttachment request.
 
@@ -371,7 +371,7 @@ class VolumeAttachmentSpec(K8sSpec):
     nodeName: str
 
 
-@dataclass
+@dataclass(slots=True)
 class VolumeAttachmentStatus(K8sSpec):
     """VolumeAttachmentStatus is the status of a VolumeAttachment request.
 
@@ -395,7 +395,7 @@ class VolumeAttachmentStatus(K8sSpec):
     detachError: Optional[VolumeError] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class VolumeError(K8sSpec):
     """VolumeError captures an error encountered during a volume operation.
 
@@ -410,7 +410,7 @@ class VolumeError(K8sSpec):
     time: Optional[str] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class VolumeNodeResources(K8sSpec):
     """VolumeNodeResources is a set of resource limits for scheduling of volumes.
 
@@ -9,7 +9,7 @@ import gybe.k8s.v1_31.meta.v1
 from gybe.k8s.types import JSONDict, K8sResource
 
 
-@dataclass
+@dataclass(slots=True)
 class VolumeAttributesClass(K8sResource):
     """VolumeAttributesClass represents a specification of mutable volume attributes defined by the CSI
     driver. The class can be specified during dynamic provisioning of PersistentVolumeClaims, and changed
@@ -9,7 +9,7 @@ import gybe.k8s.v1_31.meta.v1
 from gybe.k8s.types import K8sResource, K8sSpec
 
 
-@dataclass
+@dataclass(slots=True)
 class GroupVersionResource(K8sSpec):
     """The names of the group, the version, and the resource.
 
@@ -25,7 +25,7 @@ class GroupVersionResource(K8sSpec):
     version: Optional[str] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class MigrationCondition(K8sSpec):
     """Describes the state of a migration at a certain point.
 
@@ -45,7 +45,7 @@ class MigrationCondition(K8sSpec):
     reason: Optional[str] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class StorageVersionMigration(K8sResource):
     """StorageVersionMigration represents a migration of stored data to the latest storage version.
 
@@ -68,7 +68,7 @@ class StorageVersionMigration(K8sResource):
     status: Optional[StorageVersionMigrationStatus] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class StorageVersionMigrationSpec(K8sSpec):
     """Spec of the storage version migration.
 
@@ -85,7 +85,7 @@ class StorageVersionMigrationSpec(K8sSpec):
     continueToken: Optional[str] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class StorageVersionMigrationStatus(K8sSpec):
     """Status of the storage version migration.
 
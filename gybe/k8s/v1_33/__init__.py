@@ -1 +1,92 @@
 """k8s dataclass models generated by gybe"""
+
+from gybe.lazy import lazy_attributes
+
+__all__ = [
+    'admissionregistration',
+    'api',
+    'apiextensions',
+    'apiregistration',
+    'apiserverinternal',
+    'apps',
+    'authentication',
+    'authorization',
+    'autoscaling',
+    'batch',
+    'certificates',
+    'coordination',
+    'core',
+    'discovery',
+    'events',
+    'flowcontrol',
+    'meta',
+    'networking',
+    'node',
+    'pkg',
+    'policy',
+    'rbac',
+    'resource',
+    'scheduling',
+    'storage',
+    'storagemigration',
+    'util',
+]
+
+__getattr__, __dir__ = lazy_attributes(
+    __name__,
+    {
+        'admissionregistration': (
+            'gybe.k8s.v1_33.admissionregistration.v1',
+            'gybe.k8s.v1_33.admissionregistration.v1alpha1',
+            'gybe.k8s.v1_33.admissionregistration.v1beta1',
+        ),
+        'api': ('gybe.k8s.v1_33.api.resource',),
+        'apiextensions': ('gybe.k8s.v1_33.apiextensions.v1',),
+        'apiregistration': ('gybe.k8s.v1_33.apiregistration.v1',),
+        'apiserverinternal': ('gybe.k8s.v1_33.apiserverinternal.v1alpha1',),
+        'apps': ('gybe.k8s.v1_33.apps.v1',),
+        'authentication': ('gybe.k8s.v1_33.authentication.v1',),
+        'authorization': ('gybe.k8s.v1_33.authorization.v1',),
+        'autoscaling': (
+            'gybe.k8s.v1_33.autoscaling.v1',
+            'gybe.k8s.v1_33.autoscaling.v2',
+        ),
+        'batch': ('gybe.k8s.v1_33.batch.v1',),
+        'certificates': (
+            'gybe.k8s.v1_33.certificates.v1',
+            'gybe.k8s.v1_33.certificates.v1alpha1',
+            'gybe.k8s.v1_33.certificates.v1beta1',
+        ),
+        'coordination': (
+            'gybe.k8s.v1_33.coordination.v1',
+            'gybe.k8s.v1_33.coordination.v1alpha2',
+            'gybe.k8s.v1_33.coordination.v1beta1',
+        ),
+        'core': ('gybe.k8s.v1_33.core.v1',),
+        'discovery': ('gybe.k8s.v1_33.discovery.v1',),
+        'events': ('gybe.k8s.v1_33.events.v1',),
+        'flowcontrol': ('gybe.k8s.v1_33.flowcontrol.v1',),
+        'meta': ('gybe.k8s.v1_33.meta.v1',),
+        'networking': (
+            'gybe.k8s.v1_33.networking.v1',
+            'gybe.k8s.v1_33.networking.v1beta1',
+        ),
+        'node': ('gybe.k8s.v1_33.node.v1',),
+        'pkg': ('gybe.k8s.v1_33.pkg.version',),
+        'policy': ('gybe.k8s.v1_33.policy.v1',),
+        'rbac': ('gybe.k8s.v1_33.rbac.v1',),
+        'resource': (
+            'gybe.k8s.v1_33.resource.v1alpha3',
+            'gybe.k8s.v1_33.resource.v1beta1',
+            'gybe.k8s.v1_33.resource.v1beta2',
+        ),
+        'scheduling': ('gybe.k8s.v1_33.scheduling.v1',),
+        'storage': (
+            'gybe.k8s.v1_33.storage.v1',
+            'gybe.k8s.v1_33.storage.v1alpha1',
+            'gybe.k8s.v1_33.storage.v1beta1',
+        ),
+        'storagemigration': ('gybe.k8s.v1_33.storagemigration.v1alpha1',),
+        'util': ('gybe.k8s.v1_33.util.intstr',),
+    },
+)
@@ -9,7 +9,7 @@ import gybe.k8s.v1_33.meta.v1
 from gybe.k8s.types import K8sResource, K8sSpec
 
 
-@dataclass
+@dataclass(slots=True)
 class LeaseCandidate(K8sResource):
     """LeaseCandidate defines a candidate for a Lease object. Candidates are created such that coordinated
     leader election will pick the best leader from the list of candidates.
@@ -31,7 +31,7 @@ class LeaseCandidate(K8sResource):
     spec: Optional[LeaseCandidateSpec] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class LeaseCandidateSpec(K8sSpec):
     """LeaseCandidateSpec is a specification of a Lease.
 
@@ -6,11 +6,13 @@ from dataclasses import dataclass
 from typing import List, Literal, Optional
 
 import gybe.k8s.v1_33.core.v1
+import gybe.k8s.v1_33.discovery.v1
 import gybe.k8s.v1_33.meta.v1
 from gybe.k8s.types import JSONDict, K8sResource, K8sSpec
+from gybe.lazy import lazy_attributes
 
 
-@dataclass
+@dataclass(slots=True)
 class Endpoint(K8sSpec):
     """Endpoint represents a single logical 'backend' implementing a service.
 
@@ -39,7 +41,7 @@ class Endpoint(K8sSpec):
     """
 
     addresses: List[str]
-    conditions: Optional[EndpointConditions] = None
+    conditions: Optional[gybe.k8s.v1_33.discovery.v1.EndpointConditions] = None
     deprecatedTopology: Optional[JSONDict] = None
     hints: Optional[EndpointHints] = None
     hostname: Optional[str] = None
@@ -48,30 +50,7 @@ class Endpoint(K8sSpec):
     zone: Optional[str] = None
 
 
-@dataclass
-class EndpointConditions(K8sSpec):
-    """EndpointConditions represents the current condition of an endpoint.
-
-    Attributes:
-        ready: ready indicates that this endpoint is ready to receive traffic, according to whatever system is
-            managing the endpoint. A nil value should be interpreted as 'true'. In general, an endpoint should
-            be marked ready if it is serving and not terminating, though this can be overridden in some cases,
-            such as when the associated Service has set the publishNotReadyAddresses flag.
-        serving: serving indicates that this endpoint is able to receive traffic, according to whatever system
-            is managing the endpoint. For endpoints backed by pods, the EndpointSlice controller will mark the
-            endpoint as serving if the pod's Ready condition is True. A nil value should be interpreted as
-            'true'.
-        terminating: terminating indicates that this endpoint is terminating. A nil value should be
-            interpreted as 'false'.
-
-    """
-
-    ready: Optional[bool] = None
-    serving: Optional[bool] = None
-    terminating: Optional[bool] = None
-
-
-@dataclass
+@dataclass(slots=True)
 class EndpointHints(K8sSpec):
     """EndpointHints provides hints describing how an endpoint should be consumed.
 
@@ -85,43 +64,10 @@ class EndpointHints(K8sSpec):
     """
 
     forNodes: Optional[List[ForNode]] = None
-    forZones: Optional[List[ForZone]] = None
+    forZones: Optional[List[gybe.k8s.v1_33.discovery.v1.ForZone]] = None
 
 
-@dataclass
-class EndpointPort(K8sSpec):
-    """EndpointPort represents a Port used by an EndpointSlice
-    Attributes:
-        appProtocol: The application protocol for this port. This is used as a hint for implementations to
-            offer richer behavior for protocols that they understand. This field follows standard Kubernetes
-            label syntax. Valid values are either:  * Un-prefixed protocol names - reserved for IANA standard
-            service names (as per RFC-6335 and https://www.iana.org/assignments/service-names).  * Kubernetes-
-            defined prefixed names:   * 'kubernetes.io/h2c' - HTTP/2 prior knowledge over cleartext as
-            described in https://www.rfc-editor.org/rfc/rfc9113.html#name-starting-http-2-with-prior-   *
-            'kubernetes.io/ws'  - WebSocket over cleartext as described in https://www.rfc-
-            editor.org/rfc/rfc6455   * 'kubernetes.io/wss' - WebSocket over TLS as described in
-            https://www.rfc-editor.org/rfc/rfc6455  * Other protocols should use implementation-defined
-            prefixed names such as mycompany.com/my-custom-protocol.
-        name: name represents the name of this port. All ports in an EndpointSlice must have a unique name. If
-            the EndpointSlice is derived from a Kubernetes service, this corresponds to the
-            Service.ports[].name. Name must either be an empty string or pass DNS_LABEL validation: * must be
-            no more than 63 characters long. * must consist of lower case alphanumeric characters or '-'. *
-            must start and end with an alphanumeric character. Default is empty string.
-        port: port represents the port number of the endpoint. If the EndpointSlice is derived from a
-            Kubernetes service, this must be set to the service's target port. EndpointSlices used for other
-            purposes may have a nil port.
-        protocol: protocol represents the IP protocol for this port. Must be UDP, TCP, or SCTP. Default is
-            TCP.
-
-    """
-
-    appProtocol: Optional[str] = None
-    name: Optional[str] = None
-    port: Optional[int] = None
-    protocol: Optional[str] = None
-
-
-@dataclass
+@dataclass(slots=True)
 class EndpointSlice(K8sResource):
     """EndpointSlice represents a set of service endpoints. Most EndpointSlices are created by the
     EndpointSlice controller to represent the Pods selected by Service objects. For a given service there
@@ -156,10 +102,10 @@ class EndpointSlice(K8sResource):
     apiVersion: Literal['discovery.k8s.io/v1'] = 'discovery.k8s.io/v1'
     kind: Literal['EndpointSlice'] = 'EndpointSlice'
     metadata: Optional[gybe.k8s.v1_33.meta.v1.ObjectMeta] = None
-    ports: Optional[List[EndpointPort]] = None
+    ports: Optional[List[gybe.k8s.v1_33.discovery.v1.EndpointPort]] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class ForNode(K8sSpec):
     """ForNode provides information about which nodes should consume this endpoint.
 
@@ -171,13 +117,11 @@ class ForNode(K8sSpec):
     name: str
 
 
-@dataclass
-class ForZone(K8sSpec):
-    """ForZone provides information about which zones should consume this endpoint.
-
-    Attributes:
-        name: name represents the name of the zone.
-
-    """
-
-    name: str
+__getattr__, __dir__ = lazy_attributes(
+    __name__,
+    {
+        'EndpointConditions': 'gybe.k8s.v1_31.discovery.v1',
+        'EndpointPort': 'gybe.k8s.v1_31.discovery.v1',
+        'ForZone': 'gybe.k8s.v1_31.discovery.v1',
+    },
+)
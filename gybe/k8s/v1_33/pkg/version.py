@@ -8,7 +8,7 @@ from typing import Optional
 from gybe.k8s.types import K8sSpec
 
 
-@dataclass
+@dataclass(slots=True)
 class Info(K8sSpec):
     """Info contains versioning information. how we'll want to distribute that information.
 
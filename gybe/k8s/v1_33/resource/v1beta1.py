@@ -8,41 +8,12 @@ from typing import List, Literal, Optional
 import gybe.k8s.v1_33.api.resource
 import gybe.k8s.v1_33.core.v1
 import gybe.k8s.v1_33.meta.v1
-from gybe.k8s.types import JSONDict, JSONObj, K8sResource, K8sSpec
+import gybe.k8s.v1_33.resource.v1beta1
+from gybe.k8s.types import JSONDict, K8sResource, K8sSpec
+from gybe.lazy import lazy_attributes
 
 
-@dataclass
-class AllocatedDeviceStatus(K8sSpec):
-    """AllocatedDeviceStatus contains the status of an allocated device, if the driver chooses to report it.
-    This may include driver-specific information.
-
-    Attributes:
-        conditions: Conditions contains the latest observation of the device's state. If the device has been
-            configured according to the class and claim config references, the `Ready` condition should be
-            True.  Must not contain more than 8 entries.
-        data: Data contains arbitrary driver-specific data.  The length of the raw data must be smaller or
-            equal to 10 Ki.
-        device: Device references one device instance via its name in the driver's resource pool. It must be a
-            DNS label.
-        driver: Driver specifies the name of the DRA driver whose kubelet plugin should be invoked to process
-            the allocation once the claim is needed on a node.  Must be a DNS subdomain and should end with a
-            DNS domain owned by the vendor of the driver.
-        networkData: NetworkData contains network-related information specific to the device.
-        pool: This name together with the driver name and the device name field identify which device was
-            allocated (`<driver name>/<pool name>/<device name>`).  Must not be longer than 253 characters and
-            may contain one or more DNS sub-domains separated by slashes.
-
-    """
-
-    driver: str
-    pool: str
-    device: str
-    conditions: Optional[List[gybe.k8s.v1_33.meta.v1.Condition]] = None
-    data: Optional[JSONObj] = None
-    networkData: Optional[NetworkDeviceData] = None
-
-
-@dataclass
+@dataclass(slots=True)
 class AllocationResult(K8sSpec):
     """AllocationResult contains attributes of an allocated resource.
 
@@ -57,7 +28,7 @@ class AllocationResult(K8sSpec):
     nodeSelector: Optional[gybe.k8s.v1_33.core.v1.NodeSelector] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class BasicDevice(K8sSpec):
     """BasicDevice defines one device instance.
 
@@ -94,43 +65,7 @@ class BasicDevice(K8sSpec):
     taints: Optional[List[DeviceTaint]] = None
 
 
-@dataclass
-class CELDeviceSelector(K8sSpec):
-    """CELDeviceSelector contains a CEL expression for selecting a device.
-
-    Attributes:
-        expression: Expression is a CEL expression which evaluates a single device. It must evaluate to true
-            when the device under consideration satisfies the desired criteria, and false when it does not.
-            Any other result is an error and causes allocation of devices to abort.  The expression's input is
-            an object named 'device', which carries the following properties:  - driver (string): the name of
-            the driver which defines this device.  - attributes (map[string]object): the device's attributes,
-            grouped by prefix    (e.g. device.attributes['dra.example.com'] evaluates to an object with all
-            of the attributes which were prefixed by 'dra.example.com'.  - capacity (map[string]object): the
-            device's capacities, grouped by prefix.  Example: Consider a device with driver='dra.example.com',
-            which exposes two attributes named 'model' and 'ext.example.com/family' and which exposes one
-            capacity named 'modules'. This input to this expression would have the following fields:
-            device.driver     device.attributes['dra.example.com'].model
-            device.attributes['ext.example.com'].family     device.capacity['dra.example.com'].modules  The
-            device.driver field can be used to check for a specific driver, either as a high-level
-            precondition (i.e. you only want to consider devices from this driver) or as part of a multi-
-            clause expression that is meant to consider devices from different drivers.  The value type of
-            each attribute is defined by the device definition, and users who write these expressions must
-            consult the documentation for their specific drivers. The value type of each capacity is Quantity.
-            If an unknown prefix is used as a lookup in either device.attributes or device.capacity, an empty
-            map will be returned. Any reference to an unknown field will cause an evaluation error and
-            allocation to abort.  A robust expression should check for the existence of attributes before
-            referencing them.  For ease of use, the cel.bind() function is enabled, and can be used to
-            simplify expressions that access multiple attributes with the same domain. For example:
-            cel.bind(dra, device.attributes['dra.example.com'], dra.someBool && dra.anotherBool)  The length
-            of the expression must be smaller or equal to 10 Ki. The cost of evaluating it is also limited
-            based on the estimated number of logical steps.
-
-    """
-
-    expression: str
-
-
-@dataclass
+@dataclass(slots=True)
 class Counter(K8sSpec):
     """Counter describes a quantity associated with a device.
 
@@ -142,7 +77,7 @@ class Counter(K8sSpec):
     value: gybe.k8s.v1_33.api.resource.Quantity
 
 
-@dataclass
+@dataclass(slots=True)
 class CounterSet(K8sSpec):
     """CounterSet defines a named set of counters that are available to be used by devices defined in the
     ResourceSlice.  The counters are not allocatable by themselves, but can be referenced by devices. When
@@ -160,7 +95,7 @@ class CounterSet(K8sSpec):
     counters: JSONDict
 
 
-@dataclass
+@dataclass(slots=True)
 class Device(K8sSpec):
     """Device represents one individual hardware instance that can be selected based on its attributes.
     Besides the name, exactly one field must be set.
@@ -176,27 +111,7 @@ class Device(K8sSpec):
     basic: Optional[BasicDevice] = None
 
 
-@dataclass
-class DeviceAllocationConfiguration(K8sSpec):
-    """DeviceAllocationConfiguration gets embedded in an AllocationResult.
-
-    Attributes:
-        opaque: Opaque provides driver-specific configuration parameters.
-        requests: Requests lists the names of requests where the configuration applies. If empty, its applies
-            to all requests.  References to subrequests must include the name of the main request and may
-            include the subrequest using the format <main request>[/<subrequest>]. If just the main request is
-            given, the configuration applies to all subrequests.
-        source: Source records whether the configuration comes from a class and thus is not something that a
-            normal user would have been able to set or from a claim.
-
-    """
-
-    source: str
-    opaque: Optional[OpaqueDeviceConfiguration] = None
-    requests: Optional[List[str]] = None
-
-
-@dataclass
+@dataclass(slots=True)
 class DeviceAllocationResult(K8sSpec):
     """DeviceAllocationResult is the result of allocating devices.
 
@@ -209,42 +124,11 @@ class DeviceAllocationResult(K8sSpec):
 
     """
 
-    config: Optional[List[DeviceAllocationConfiguration]] = None
+    config: Optional[List[gybe.k8s.v1_33.resource.v1beta1.DeviceAllocationConfiguration]] = None
     results: Optional[List[DeviceRequestAllocationResult]] = None
 
 
-@dataclass
-class DeviceAttribute(K8sSpec):
-    """DeviceAttribute must have exactly one field set.
-
-    Attributes:
-        bool: BoolValue is a true/false value.
-        int: IntValue is a number.
-        string: StringValue is a string. Must not be longer than 64 characters.
-        version: VersionValue is a semantic version according to semver.org spec 2.0.0. Must not be longer
-            than 64 characters.
-
-    """
-
-    bool: Optional[bool] = None
-    int: Optional[int] = None
-    string: Optional[str] = None
-    version: Optional[str] = None
-
-
-@dataclass
-class DeviceCapacity(K8sSpec):
-    """DeviceCapacity describes a quantity associated with a device.
-
-    Attributes:
-        value: Value defines how much of a certain device capacity is available.
-
-    """
-
-    value: gybe.k8s.v1_33.api.resource.Quantity
-
-
-@dataclass
+@dataclass(slots=True)
 class DeviceClaim(K8sSpec):
     """DeviceClaim defines how to request devices with a ResourceClaim.
 
@@ -258,108 +142,12 @@ class DeviceClaim(K8sSpec):
 
     """
 
-    config: Optional[List[DeviceClaimConfiguration]] = None
-    constraints: Optional[List[DeviceConstraint]] = None
+    config: Optional[List[gybe.k8s.v1_33.resource.v1beta1.DeviceClaimConfiguration]] = None
+    constraints: Optional[List[gybe.k8s.v1_33.resource.v1beta1.DeviceConstraint]] = None
     requests: Optional[List[DeviceRequest]] = None
 
 
-@dataclass
-class DeviceClaimConfiguration(K8sSpec):
-    """DeviceClaimConfiguration is used for configuration parameters in DeviceClaim.
-
-    Attributes:
-        opaque: Opaque provides driver-specific configuration parameters.
-        requests: Requests lists the names of requests where the configuration applies. If empty, it applies
-            to all requests.  References to subrequests must include the name of the main request and may
-            include the subrequest using the format <main request>[/<subrequest>]. If just the main request is
-            given, the configuration applies to all subrequests.
-
-    """
-
-    opaque: Optional[OpaqueDeviceConfiguration] = None
-    requests: Optional[List[str]] = None
-
-
-@dataclass
-class DeviceClass(K8sResource):
-    """DeviceClass is a vendor- or admin-provided resource that contains device configuration and selectors.
-    It can be referenced in the device requests of a claim to apply these presets. Cluster scoped.  This
-    is an alpha type and requires enabling the DynamicResourceAllocation feature gate.
-
-    Attributes:
-        apiVersion: APIVersion defines the versioned schema of this representation of an object. Servers
-            should convert recognized schemas to the latest internal value, and may reject unrecognized
-            values.
-        kind: Kind is a string value representing the REST resource this object represents. Servers may infer
-            this from the endpoint the client submits requests to. Cannot be updated. In CamelCase.
-        metadata: Standard object metadata
-        spec: Spec defines what can be allocated and how to configure it.  This is mutable. Consumers have to
-            be prepared for classes changing at any time, either because they get updated or replaced. Claim
-            allocations are done once based on whatever was set in classes at the time of allocation.
-            Changing the spec automatically increments the metadata.generation number.
-
-    """
-
-    spec: DeviceClassSpec
-    apiVersion: Literal['resource.k8s.io/v1beta1'] = 'resource.k8s.io/v1beta1'
-    kind: Literal['DeviceClass'] = 'DeviceClass'
-    metadata: Optional[gybe.k8s.v1_33.meta.v1.ObjectMeta] = None
-
-
-@dataclass
-class DeviceClassConfiguration(K8sSpec):
-    """DeviceClassConfiguration is used in DeviceClass.
-
-    Attributes:
-        opaque: Opaque provides driver-specific configuration parameters.
-
-    """
-
-    opaque: Optional[OpaqueDeviceConfiguration] = None
-
-
-@dataclass
-class DeviceClassSpec(K8sSpec):
-    """DeviceClassSpec is used in a [DeviceClass] to define what can be allocated and how to configure it.
-
-    Attributes:
-        config: Config defines configuration parameters that apply to each device that is claimed via this
-            class. Some classses may potentially be satisfied by multiple drivers, so each instance of a
-            vendor configuration applies to exactly one driver.  They are passed to the driver, but are not
-            considered while allocating the claim.
-        selectors: Each selector must be satisfied by a device which is claimed via this class.
-
-    """
-
-    config: Optional[List[DeviceClassConfiguration]] = None
-    selectors: Optional[List[DeviceSelector]] = None
-
-
-@dataclass
-class DeviceConstraint(K8sSpec):
-    """DeviceConstraint must have exactly one field set besides Requests.
-
-    Attributes:
-        matchAttribute: MatchAttribute requires that all devices in question have this attribute and that its
-            type and value are the same across those devices.  For example, if you specified
-            'dra.example.com/numa' (a hypothetical example!), then only devices in the same NUMA node will be
-            chosen. A device which does not have that attribute will not be chosen. All devices should use a
-            value of the same type for this attribute because that is part of its specification, but if one
-            device doesn't, then it also will not be chosen.  Must include the domain qualifier.
-        requests: Requests is a list of the one or more requests in this claim which must co-satisfy this
-            constraint. If a request is fulfilled by multiple devices, then all of the devices must satisfy
-            the constraint. If this is not specified, this constraint applies to all requests in this claim.
-            References to subrequests must include the name of the main request and may include the subrequest
-            using the format <main request>[/<subrequest>]. If just the main request is given, the constraint
-            applies to all subrequests.
-
-    """
-
-    matchAttribute: Optional[str] = None
-    requests: Optional[List[str]] = None
-
-
-@dataclass
+@dataclass(slots=True)
 class DeviceCounterConsumption(K8sSpec):
     """DeviceCounterConsumption defines a set of counters that a device will consume from a CounterSet.
 
@@ -375,7 +163,7 @@ class DeviceCounterConsumption(K8sSpec):
     counters: JSONDict
 
 
-@dataclass
+@dataclass(slots=True)
 class DeviceRequest(K8sSpec):
     """DeviceRequest is a request for devices required for a claim. This is typically a request for a single
     resource like a device, but can also ask for several identical devices.
@@ -442,11 +230,11 @@ class DeviceRequest(K8sSpec):
     count: Optional[int] = None
     deviceClassName: Optional[str] = None
     firstAvailable: Optional[List[DeviceSubRequest]] = None
-    selectors: Optional[List[DeviceSelector]] = None
+    selectors: Optional[List[gybe.k8s.v1_33.resource.v1beta1.DeviceSelector]] = None
     tolerations: Optional[List[DeviceToleration]] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class DeviceRequestAllocationResult(K8sSpec):
     """DeviceRequestAllocationResult contains the allocation result for one request.
 
@@ -481,19 +269,7 @@ class DeviceRequestAllocationResult(K8sSpec):
     tolerations: Optional[List[DeviceToleration]] = None
 
 
-@dataclass
-class DeviceSelector(K8sSpec):
-    """DeviceSelector must have exactly one field set.
-
-    Attributes:
-        cel: CEL contains a CEL expression for selecting a device.
-
-    """
-
-    cel: Optional[CELDeviceSelector] = None
-
-
-@dataclass
+@dataclass(slots=True)
 class DeviceSubRequest(K8sSpec):
     """DeviceSubRequest describes a request for device provided in the
     claim.spec.devices.requests[].firstAvailable array. Each is typically a request for a single resource
@@ -539,11 +315,11 @@ class DeviceSubRequest(K8sSpec):
     deviceClassName: str
     allocationMode: Optional[str] = None
     count: Optional[int] = None
-    selectors: Optional[List[DeviceSelector]] = None
+    selectors: Optional[List[gybe.k8s.v1_33.resource.v1beta1.DeviceSelector]] = None
     tolerations: Optional[List[DeviceToleration]] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class DeviceTaint(K8sSpec):
     """The device this taint is attached to has the 'effect' on any claim which does not tolerate the taint
     and, through the claim, to pods using the claim.
@@ -565,7 +341,7 @@ class DeviceTaint(K8sSpec):
     value: Optional[str] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class DeviceToleration(K8sSpec):
     """The ResourceClaim this DeviceToleration is attached to tolerates any taint that matches the triple
     <key,value,effect> using the matching operator <operator>.
@@ -596,51 +372,7 @@ class DeviceToleration(K8sSpec):
     value: Optional[str] = None
 
 
-@dataclass
-class NetworkDeviceData(K8sSpec):
-    """NetworkDeviceData provides network-related details for the allocated device. This information may be
-    filled by drivers or other components to configure or identify the device within a network context.
-
-    Attributes:
-        hardwareAddress: HardwareAddress represents the hardware address (e.g. MAC Address) of the device's
-            network interface.  Must not be longer than 128 characters.
-        interfaceName: InterfaceName specifies the name of the network interface associated with the allocated
-            device. This might be the name of a physical or virtual network interface being configured in the
-            pod.  Must not be longer than 256 characters.
-        ips: IPs lists the network addresses assigned to the device's network interface. This can include both
-            IPv4 and IPv6 addresses. The IPs are in the CIDR notation, which includes both the address and the
-            associated subnet mask. e.g.: '192.0.2.5/24' for IPv4 and '2001:db8::5/64' for IPv6.  Must not
-            contain more than 16 entries.
-
-    """
-
-    hardwareAddress: Optional[str] = None
-    interfaceName: Optional[str] = None
-    ips: Optional[List[str]] = None
-
-
-@dataclass
-class OpaqueDeviceConfiguration(K8sSpec):
-    """OpaqueDeviceConfiguration contains configuration parameters for a driver in a format defined by the
-    driver vendor.
-
-    Attributes:
-        driver: Driver is used to determine which kubelet plugin needs to be passed these configuration
-            parameters.  An admission policy provided by the driver developer could use this to decide whether
-            it needs to validate them.  Must be a DNS subdomain and should end with a DNS domain owned by the
-            vendor of the driver.
-        parameters: Parameters can contain arbitrary data. It is the responsibility of the driver developer to
-            handle validation and versioning. Typically this includes self-identification and a version
-            ('kind' + 'apiVersion' for Kubernetes types), with conversion between different versions.  The
-            length of the raw data must be smaller or equal to 10 Ki.
-
-    """
-
-    driver: str
-    parameters: JSONObj
-
-
-@dataclass
+@dataclass(slots=True)
 class ResourceClaim(K8sResource):
     """ResourceClaim describes a request for access to resources in the cluster, for use by workloads. For
     example, if a workload needs an accelerator device with specific properties, this is how that request
@@ -667,27 +399,7 @@ class ResourceClaim(K8sResource):
     status: Optional[ResourceClaimStatus] = None
 
 
-@dataclass
-class ResourceClaimConsumerReference(K8sSpec):
-    """ResourceClaimConsumerReference contains enough information to let you locate the consumer of a
-    ResourceClaim. The user must be a resource in the same namespace as the ResourceClaim.
-
-    Attributes:
-        apiGroup: APIGroup is the group for the resource being referenced. It is empty for the core API. This
-            matches the group in the APIVersion that is used when creating the resources.
-        name: Name is the name of resource being referenced.
-        resource: Resource is the type of resource being referenced, for example 'pods'.
-        uid: UID identifies exactly one incarnation of the resource.
-
-    """
-
-    resource: str
-    name: str
-    uid: str
-    apiGroup: Optional[str] = None
-
-
-@dataclass
+@dataclass(slots=True)
 class ResourceClaimSpec(K8sSpec):
     """ResourceClaimSpec defines what is being requested in a ResourceClaim and how to configure it.
 
@@ -699,7 +411,7 @@ class ResourceClaimSpec(K8sSpec):
     devices: Optional[DeviceClaim] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class ResourceClaimStatus(K8sSpec):
     """ResourceClaimStatus tracks whether the resource has been allocated and what the result of that was.
 
@@ -722,11 +434,11 @@ class ResourceClaimStatus(K8sSpec):
     """
 
     allocation: Optional[AllocationResult] = None
-    devices: Optional[List[AllocatedDeviceStatus]] = None
-    reservedFor: Optional[List[ResourceClaimConsumerReference]] = None
+    devices: Optional[List[gybe.k8s.v1_33.resource.v1beta1.AllocatedDeviceStatus]] = None
+    reservedFor: Optional[List[gybe.k8s.v1_33.resource.v1beta1.ResourceClaimConsumerReference]] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class ResourceClaimTemplate(K8sResource):
     """ResourceClaimTemplate is used to produce ResourceClaim objects.  This is an alpha type and requires
     enabling the DynamicResourceAllocation feature gate.
@@ -749,7 +461,7 @@ class ResourceClaimTemplate(K8sResource):
     metadata: Optional[gybe.k8s.v1_33.meta.v1.ObjectMeta] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class ResourceClaimTemplateSpec(K8sSpec):
     """ResourceClaimTemplateSpec contains the metadata and fields for a ResourceClaim.
 
@@ -765,33 +477,7 @@ class ResourceClaimTemplateSpec(K8sSpec):
     metadata: Optional[gybe.k8s.v1_33.meta.v1.ObjectMeta] = None
 
 
-@dataclass
-class ResourcePool(K8sSpec):
-    """ResourcePool describes the pool that ResourceSlices belong to.
-
-    Attributes:
-        generation: Generation tracks the change in a pool over time. Whenever a driver changes something
-            about one or more of the resources in a pool, it must change the generation in all ResourceSlices
-            which are part of that pool. Consumers of ResourceSlices should only consider resources from the
-            pool with the highest generation number. The generation may be reset by drivers, which should be
-            fine for consumers, assuming that all ResourceSlices in a pool are updated to match or deleted.
-            Combined with ResourceSliceCount, this mechanism enables consumers to detect pools which are
-            comprised of multiple ResourceSlices and are in an incomplete state.
-        name: Name is used to identify the pool. For node-local devices, this is often the node name, but this
-            is not required.  It must not be longer than 253 characters and must consist of one or more DNS
-            sub-domains separated by slashes. This field is immutable.
-        resourceSliceCount: ResourceSliceCount is the total number of ResourceSlices in the pool at this
-            generation number. Must be greater than zero.  Consumers can use this to check whether they have
-            seen all ResourceSlices belonging to the same pool.
-
-    """
-
-    name: str
-    generation: int
-    resourceSliceCount: int
-
-
-@dataclass
+@dataclass(slots=True)
 class ResourceSlice(K8sResource):
     """ResourceSlice represents one or more resources in a pool of similar resources, managed by a common
     driver. A pool may span more than one ResourceSlice, and exactly how many ResourceSlices comprise a
@@ -827,7 +513,7 @@ class ResourceSlice(K8sResource):
     metadata: Optional[gybe.k8s.v1_33.meta.v1.ObjectMeta] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class ResourceSliceSpec(K8sSpec):
     """ResourceSliceSpec contains the information published by the driver in one ResourceSlice.
 
@@ -859,10 +545,32 @@ class ResourceSliceSpec(K8sSpec):
     """
 
     driver: str
-    pool: ResourcePool
+    pool: gybe.k8s.v1_33.resource.v1beta1.ResourcePool
     allNodes: Optional[bool] = None
     devices: Optional[List[Device]] = None
     nodeName: Optional[str] = None
     nodeSelector: Optional[gybe.k8s.v1_33.core.v1.NodeSelector] = None
     perDeviceNodeSelection: Optional[bool] = None
     sharedCounters: Optional[List[CounterSet]] = None
+
+
+__getattr__, __dir__ = lazy_attributes(
+    __name__,
+    {
+        'AllocatedDeviceStatus': 'gybe.k8s.v1_31.resource.v1beta1',
+        'CELDeviceSelector': 'gybe.k8s.v1_31.resource.v1beta1',
+        'DeviceAllocationConfiguration': 'gybe.k8s.v1_31.resource.v1beta1',
+        'DeviceAttribute': 'gybe.k8s.v1_31.resource.v1beta1',
+        'DeviceCapacity': 'gybe.k8s.v1_31.resource.v1beta1',
+        'DeviceClaimConfiguration': 'gybe.k8s.v1_31.resource.v1beta1',
+        'DeviceClass': 'gybe.k8s.v1_32.resource.v1beta1',
+        'DeviceClassConfiguration': 'gybe.k8s.v1_31.resource.v1beta1',
+        'DeviceClassSpec': 'gybe.k8s.v1_31.resource.v1beta1',
+        'DeviceConstraint': 'gybe.k8s.v1_31.resource.v1beta1',
+        'DeviceSelector': 'gybe.k8s.v1_31.resource.v1beta1',
+        'NetworkDeviceData': 'gybe.k8s.v1_31.resource.v1beta1',
+        'OpaqueDeviceConfiguration': 'gybe.k8s.v1_31.resource.v1beta1',
+        'ResourceClaimConsumerReference': 'gybe.k8s.v1_31.resource.v1beta1',
+        'ResourcePool': 'gybe.k8s.v1_31.resource.v1beta1',
+    },
+)
@@ -11,7 +11,7 @@ import gybe.k8s.v1_33.meta.v1
 from gybe.k8s.types import JSONDict, JSONObj, K8sResource, K8sSpec
 
 
-@dataclass
+@dataclass(slots=True)
 class AllocatedDeviceStatus(K8sSpec):
     """AllocatedDeviceStatus contains the status of an allocated device, if the driver chooses to report it.
     This may include driver-specific information.
@@ -42,7 +42,7 @@ class AllocatedDeviceStatus(K8sSpec):
     networkData: Optional[NetworkDeviceData] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class AllocationResult(K8sSpec):
     """AllocationResult contains attributes of an allocated resource.
 
@@ -57,7 +57,7 @@ class AllocationResult(K8sSpec):
     nodeSelector: Optional[gybe.k8s.v1_33.core.v1.NodeSelector] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class CELDeviceSelector(K8sSpec):
     """CELDeviceSelector contains a CEL expression for selecting a device.
 
@@ -93,7 +93,7 @@ class CELDeviceSelector(K8sSpec):
     expression: str
 
 
-@dataclass
+@dataclass(slots=True)
 class Counter(K8sSpec):
     """Counter describes a quantity associated with a device.
 
@@ -105,7 +105,7 @@ class Counter(K8sSpec):
     value: gybe.k8s.v1_33.api.resource.Quantity
 
 
-@dataclass
+@dataclass(slots=True)
 class CounterSet(K8sSpec):
     """CounterSet defines a named set of counters that are available to be used by devices defined in the
     ResourceSlice.  The counters are not allocatable by themselves, but can be referenced by devices. When
@@ -123,7 +123,7 @@ class CounterSet(K8sSpec):
     counters: JSONDict
 
 
-@dataclass
+@dataclass(slots=True)
 class Device(K8sSpec):
     """Device represents one individual hardware instance that can be selected based on its attributes.
     Besides the name, exactly one field must be set.
@@ -164,7 +164,7 @@ class Device(K8sSpec):
     taints: Optional[List[DeviceTaint]] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class DeviceAllocationConfiguration(K8sSpec):
     """DeviceAllocationConfiguration gets embedded in an AllocationResult.
 
@@ -184,7 +184,7 @@ class DeviceAllocationConfiguration(K8sSpec):
     requests: Optional[List[str]] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class DeviceAllocationResult(K8sSpec):
     """DeviceAllocationResult is the result of allocating devices.
 
@@ -201,7 +201,7 @@ class DeviceAllocationResult(K8sSpec):
     results: Optional[List[DeviceRequestAllocationResult]] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class DeviceAttribute(K8sSpec):
     """DeviceAttribute must have exactly one field set.
 
@@ -220,7 +220,7 @@ class DeviceAttribute(K8sSpec):
     version: Optional[str] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class DeviceCapacity(K8sSpec):
     """DeviceCapacity describes a quantity associated with a device.
 
@@ -232,7 +232,7 @@ class DeviceCapacity(K8sSpec):
     value: gybe.k8s.v1_33.api.resource.Quantity
 
 
-@dataclass
+@dataclass(slots=True)
 class DeviceClaim(K8sSpec):
     """DeviceClaim defines how to request devices with a ResourceClaim.
 
@@ -251,7 +251,7 @@ class DeviceClaim(K8sSpec):
     requests: Optional[List[DeviceRequest]] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class DeviceClaimConfiguration(K8sSpec):
     """DeviceClaimConfiguration is used for configuration parameters in DeviceClaim.
 
@@ -268,7 +268,7 @@ class DeviceClaimConfiguration(K8sSpec):
     requests: Optional[List[str]] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class DeviceClass(K8sResource):
     """DeviceClass is a vendor- or admin-provided resource that contains device configuration and selectors.
     It can be referenced in the device requests of a claim to apply these presets. Cluster scoped.  This
@@ -294,7 +294,7 @@ class DeviceClass(K8sResource):
     metadata: Optional[gybe.k8s.v1_33.meta.v1.ObjectMeta] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class DeviceClassConfiguration(K8sSpec):
     """DeviceClassConfiguration is used in DeviceClass.
 
@@ -306,7 +306,7 @@ class DeviceClassConfiguration(K8sSpec):
     opaque: Optional[OpaqueDeviceConfiguration] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class DeviceClassSpec(K8sSpec):
     """DeviceClassSpec is used in a [DeviceClass] to define what can be allocated and how to configure it.
 
@@ -323,7 +323,7 @@ class DeviceClassSpec(K8sSpec):
     selectors: Optional[List[DeviceSelector]] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class DeviceConstraint(K8sSpec):
     """DeviceConstraint must have exactly one field set besides Requests.
 
@@ -347,7 +347,7 @@ class DeviceConstraint(K8sSpec):
     requests: Optional[List[str]] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class DeviceCounterConsumption(K8sSpec):
     """DeviceCounterConsumption defines a set of counters that a device will consume from a CounterSet.
 
@@ -363,7 +363,7 @@ class DeviceCounterConsumption(K8sSpec):
     counters: JSONDict
 
 
-@dataclass
+@dataclass(slots=True)
 class DeviceRequest(K8sSpec):
     """DeviceRequest is a request for devices required for a claim. This is typically a request for a single
     resource like a device, but can also ask for several identical devices. With FirstAvailable it is also
@@ -393,7 +393,7 @@ class DeviceRequest(K8sSpec):
     firstAvailable: Optional[List[DeviceSubRequest]] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class DeviceRequestAllocationResult(K8sSpec):
     """DeviceRequestAllocationResult contains the allocation result for one request.
 
@@ -428,7 +428,7 @@ class DeviceRequestAllocationResult(K8sSpec):
     tolerations: Optional[List[DeviceToleration]] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class DeviceSelector(K8sSpec):
     """DeviceSelector must have exactly one field set.
 
@@ -440,7 +440,7 @@ class DeviceSelector(K8sSpec):
     cel: Optional[CELDeviceSelector] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class DeviceSubRequest(K8sSpec):
     """DeviceSubRequest describes a request for device provided in the
     claim.spec.devices.requests[].firstAvailable array. Each is typically a request for a single resource
@@ -489,7 +489,7 @@ class DeviceSubRequest(K8sSpec):
     tolerations: Optional[List[DeviceToleration]] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class DeviceTaint(K8sSpec):
     """The device this taint is attached to has the 'effect' on any claim which does not tolerate the taint
     and, through the claim, to pods using the claim.
@@ -511,7 +511,7 @@ class DeviceTaint(K8sSpec):
     value: Optional[str] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class DeviceToleration(K8sSpec):
     """The ResourceClaim this DeviceToleration is attached to tolerates any taint that matches the triple
     <key,value,effect> using the matching operator <operator>.
@@ -542,7 +542,7 @@ class DeviceToleration(K8sSpec):
     value: Optional[str] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class ExactDeviceRequest(K8sSpec):
     """ExactDeviceRequest is a request for one or more identical devices.
 
@@ -589,7 +589,7 @@ class ExactDeviceRequest(K8sSpec):
     tolerations: Optional[List[DeviceToleration]] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class NetworkDeviceData(K8sSpec):
     """NetworkDeviceData provides network-related details for the allocated device. This information may be
     filled by drivers or other components to configure or identify the device within a network context.
@@ -611,7 +611,7 @@ class NetworkDeviceData(K8sSpec):
     ips: Optional[List[str]] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class OpaqueDeviceConfiguration(K8sSpec):
     """OpaqueDeviceConfiguration contains configuration parameters for a driver in a format defined by the
     driver vendor.
@@ -632,7 +632,7 @@ class OpaqueDeviceConfiguration(K8sSpec):
     parameters: JSONObj
 
 
-@dataclass
+@dataclass(slots=True)
 class ResourceClaim(K8sResource):
     """ResourceClaim describes a request for access to resources in the cluster, for use by workloads. For
     example, if a workload needs an accelerator device with specific properties, this is how that request
@@ -659,7 +659,7 @@ class ResourceClaim(K8sResource):
     status: Optional[ResourceClaimStatus] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class ResourceClaimConsumerReference(K8sSpec):
     """ResourceClaimConsumerReference contains enough information to let you locate the consumer of a
     ResourceClaim. The user must be a resource in the same namespace as the ResourceClaim.
@@ -679,7 +679,7 @@ class ResourceClaimConsumerReference(K8sSpec):
     apiGroup: Optional[str] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class ResourceClaimSpec(K8sSpec):
     """ResourceClaimSpec defines what is being requested in a ResourceClaim and how to configure it.
 
@@ -691,7 +691,7 @@ class ResourceClaimSpec(K8sSpec):
     devices: Optional[DeviceClaim] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class ResourceClaimStatus(K8sSpec):
     """ResourceClaimStatus tracks whether the resource has been allocated and what the result of that was.
 
@@ -718,7 +718,7 @@ class ResourceClaimStatus(K8sSpec):
     reservedFor: Optional[List[ResourceClaimConsumerReference]] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class ResourceClaimTemplate(K8sResource):
     """ResourceClaimTemplate is used to produce ResourceClaim objects.  This is an alpha type and requires
     enabling the DynamicResourceAllocation feature gate.
@@ -741,7 +741,7 @@ class ResourceClaimTemplate(K8sResource):
     metadata: Optional[gybe.k8s.v1_33.meta.v1.ObjectMeta] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class ResourceClaimTemplateSpec(K8sSpec):
     """ResourceClaimTemplateSpec contains the metadata and fields for a ResourceClaim.
 
@@ -757,7 +757,7 @@ class ResourceClaimTemplateSpec(K8sSpec):
     metadata: Optional[gybe.k8s.v1_33.meta.v1.ObjectMeta] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class ResourcePool(K8sSpec):
     """ResourcePool describes the pool that ResourceSlices belong to.
 
@@ -783,7 +783,7 @@ class ResourcePool(K8sSpec):
     resourceSliceCount: int
 
 
-@dataclass
+@dataclass(slots=True)
 class ResourceSlice(K8sResource):
     """ResourceSlice represents one or more resources in a pool of similar resources, managed by a common
     driver. A pool may span more than one ResourceSlice, and exactly how many ResourceSlices comprise a
@@ -819,7 +819,7 @@ class ResourceSlice(K8sResource):
     metadata: Optional[gybe.k8s.v1_33.meta.v1.ObjectMeta] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class ResourceSliceSpec(K8sSpec):
     """ResourceSliceSpec contains the information published by the driver in one ResourceSlice.
 
@@ -11,7 +11,7 @@ import gybe.k8s.v1_34.meta.v1
 from gybe.k8s.types import JSONDict, JSONObj, K8sResource, K8sSpec
 
 
-@dataclass
+@dataclass(slots=True)
 class AllocatedDeviceStatus(K8sSpec):
     """AllocatedDeviceStatus contains the status of an allocated device, if the driver chooses to report it.
     This may include driver-specific information.  The combination of Driver, Pool, Device, and ShareID
@@ -45,7 +45,7 @@ class AllocatedDeviceStatus(K8sSpec):
     shareID: Optional[str] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class AllocationResult(K8sSpec):
     """AllocationResult contains attributes of an allocated resource.
 
@@ -64,7 +64,7 @@ class AllocationResult(K8sSpec):
     nodeSelector: Optional[gybe.k8s.v1_34.core.v1.NodeSelector] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class CELDeviceSelector(K8sSpec):
     """CELDeviceSelector contains a CEL expression for selecting a device.
 
@@ -101,7 +101,7 @@ class CELDeviceSelector(K8sSpec):
     expression: str
 
 
-@dataclass
+@dataclass(slots=True)
 class CapacityRequestPolicy(K8sSpec):
     """CapacityRequestPolicy defines how requests consume device capacity.  Must not set more than one
     ValidRequestValues.
@@ -129,7 +129,7 @@ class CapacityRequestPolicy(K8sSpec):
     validValues: Optional[List[gybe.k8s.v1_34.api.resource.Quantity]] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class CapacityRequestPolicyRange(K8sSpec):
     """CapacityRequestPolicyRange defines a valid range for consumable capacity values.    - If the requested
     amount is less than Min, it is rounded up to the Min value.   - If Step is set and the requested
@@ -155,7 +155,7 @@ class CapacityRequestPolicyRange(K8sSpec):
     step: Optional[gybe.k8s.v1_34.api.resource.Quantity] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class CapacityRequirements(K8sSpec):
     """CapacityRequirements defines the capacity requirements for a specific device request.
 
@@ -180,7 +180,7 @@ class CapacityRequirements(K8sSpec):
     requests: Optional[JSONDict] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class Counter(K8sSpec):
     """Counter describes a quantity associated with a device.
 
@@ -192,7 +192,7 @@ class Counter(K8sSpec):
     value: gybe.k8s.v1_34.api.resource.Quantity
 
 
-@dataclass
+@dataclass(slots=True)
 class CounterSet(K8sSpec):
     """CounterSet defines a named set of counters that are available to be used by devices defined in the
     ResourceSlice.  The counters are not allocatable by themselves, but can be referenced by devices. When
@@ -210,7 +210,7 @@ class CounterSet(K8sSpec):
     counters: JSONDict
 
 
-@dataclass
+@dataclass(slots=True)
 class Device(K8sSpec):
     """Device represents one individual hardware instance that can be selected based on its attributes.
     Besides the name, exactly one field must be set.
@@ -274,7 +274,7 @@ class Device(K8sSpec):
     taints: Optional[List[DeviceTaint]] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class DeviceAllocationConfiguration(K8sSpec):
     """DeviceAllocationConfiguration gets embedded in an AllocationResult.
 
@@ -294,7 +294,7 @@ class DeviceAllocationConfiguration(K8sSpec):
     requests: Optional[List[str]] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class DeviceAllocationResult(K8sSpec):
     """DeviceAllocationResult is the result of allocating devices.
 
@@ -311,7 +311,7 @@ class DeviceAllocationResult(K8sSpec):
     results: Optional[List[DeviceRequestAllocationResult]] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class DeviceAttribute(K8sSpec):
     """DeviceAttribute must have exactly one field set.
 
@@ -330,7 +330,7 @@ class DeviceAttribute(K8sSpec):
     version: Optional[str] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class DeviceCapacity(K8sSpec):
     """DeviceCapacity describes a quantity associated with a device.
 
@@ -351,7 +351,7 @@ class DeviceCapacity(K8sSpec):
     requestPolicy: Optional[CapacityRequestPolicy] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class DeviceClaim(K8sSpec):
     """DeviceClaim defines how to request devices with a ResourceClaim.
 
@@ -370,7 +370,7 @@ class DeviceClaim(K8sSpec):
     requests: Optional[List[DeviceRequest]] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class DeviceClaimConfiguration(K8sSpec):
     """DeviceClaimConfiguration is used for configuration parameters in DeviceClaim.
 
@@ -387,7 +387,7 @@ class DeviceClaimConfiguration(K8sSpec):
     requests: Optional[List[str]] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class DeviceClass(K8sResource):
     """DeviceClass is a vendor- or admin-provided resource that contains device configuration and selectors.
     It can be referenced in the device requests of a claim to apply these presets. Cluster scoped.  This
@@ -413,7 +413,7 @@ class DeviceClass(K8sResource):
     metadata: Optional[gybe.k8s.v1_34.meta.v1.ObjectMeta] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class DeviceClassConfiguration(K8sSpec):
     """DeviceClassConfiguration is used in DeviceClass.
 
@@ -425,7 +425,7 @@ class DeviceClassConfiguration(K8sSpec):
     opaque: Optional[OpaqueDeviceConfiguration] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class DeviceClassSpec(K8sSpec):
     """DeviceClassSpec is used in a [DeviceClass] to define what can be allocated and how to configure it.
 
@@ -449,7 +449,7 @@ class DeviceClassSpec(K8sSpec):
     selectors: Optional[List[DeviceSelector]] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class DeviceConstraint(K8sSpec):
     """DeviceConstraint must have exactly one field set besides Requests.
 
@@ -480,7 +480,7 @@ class DeviceConstraint(K8sSpec):
     requests: Optional[List[str]] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class DeviceCounterConsumption(K8sSpec):
     """DeviceCounterConsumption defines a set of counters that a device will consume from a CounterSet.
 
@@ -496,7 +496,7 @@ class DeviceCounterConsumption(K8sSpec):
     counters: JSONDict
 
 
-@dataclass
+@dataclass(slots=True)
 class DeviceRequest(K8sSpec):
     """DeviceRequest is a request for devices required for a claim. This is typically a request for a single
     resource like a device, but can also ask for several identical devices. With FirstAvailable it is also
@@ -526,7 +526,7 @@ class DeviceRequest(K8sSpec):
     firstAvailable: Optional[List[DeviceSubRequest]] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class DeviceRequestAllocationResult(K8sSpec):
     """DeviceRequestAllocationResult contains the allocation result for one request.
 
@@ -580,7 +580,7 @@ class DeviceRequestAllocationResult(K8sSpec):
     tolerations: Optional[List[DeviceToleration]] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class DeviceSelector(K8sSpec):
     """DeviceSelector must have exactly one field set.
 
@@ -592,7 +592,7 @@ class DeviceSelector(K8sSpec):
     cel: Optional[CELDeviceSelector] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class DeviceSubRequest(K8sSpec):
     """DeviceSubRequest describes a request for device provided in the
     claim.spec.devices.requests[].firstAvailable array. Each is typically a request for a single resource
@@ -649,7 +649,7 @@ class DeviceSubRequest(K8sSpec):
     tolerations: Optional[List[DeviceToleration]] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class DeviceTaint(K8sSpec):
     """The device this taint is attached to has the 'effect' on any claim which does not tolerate the taint
     and, through the claim, to pods using the claim.
@@ -671,7 +671,7 @@ class DeviceTaint(K8sSpec):
     value: Optional[str] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class DeviceToleration(K8sSpec):
     """The ResourceClaim this DeviceToleration is attached to tolerates any taint that matches the triple
     <key,value,effect> using the matching operator <operator>.
@@ -702,7 +702,7 @@ class DeviceToleration(K8sSpec):
     value: Optional[str] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class ExactDeviceRequest(K8sSpec):
     """ExactDeviceRequest is a request for one or more identical devices.
 
@@ -757,7 +757,7 @@ class ExactDeviceRequest(K8sSpec):
     tolerations: Optional[List[DeviceToleration]] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class NetworkDeviceData(K8sSpec):
     """NetworkDeviceData provides network-related details for the allocated device. This information may be
     filled by drivers or other components to configure or identify the device within a network context.
@@ -779,7 +779,7 @@ class NetworkDeviceData(K8sSpec):
     ips: Optional[List[str]] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class OpaqueDeviceConfiguration(K8sSpec):
     """OpaqueDeviceConfiguration contains configuration parameters for a driver in a format defined by the
     driver vendor.
@@ -800,7 +800,7 @@ class OpaqueDeviceConfiguration(K8sSpec):
     parameters: JSONObj
 
 
-@dataclass
+@dataclass(slots=True)
 class ResourceClaim(K8sResource):
     """ResourceClaim describes a request for access to resources in the cluster, for use by workloads. For
     example, if a workload needs an accelerator device with specific properties, this is how that request
@@ -827,7 +827,7 @@ class ResourceClaim(K8sResource):
     status: Optional[ResourceClaimStatus] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class ResourceClaimConsumerReference(K8sSpec):
     """ResourceClaimConsumerReference contains enough information to let you locate the consumer of a
     ResourceClaim. The user must be a resource in the same namespace as the ResourceClaim.
@@ -847,7 +847,7 @@ class ResourceClaimConsumerReference(K8sSpec):
     apiGroup: Optional[str] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class ResourceClaimSpec(K8sSpec):
     """ResourceClaimSpec defines what is being requested in a ResourceClaim and how to configure it.
 
@@ -859,7 +859,7 @@ class ResourceClaimSpec(K8sSpec):
     devices: Optional[DeviceClaim] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class ResourceClaimStatus(K8sSpec):
     """ResourceClaimStatus tracks whether the resource has been allocated and what the result of that was.
 
@@ -886,7 +886,7 @@ class ResourceClaimStatus(K8sSpec):
     reservedFor: Optional[List[ResourceClaimConsumerReference]] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class ResourceClaimTemplate(K8sResource):
     """ResourceClaimTemplate is used to produce ResourceClaim objects.  This is an alpha type and requires
     enabling the DynamicResourceAllocation feature gate.
@@ -909,7 +909,7 @@ class ResourceClaimTemplate(K8sResource):
     metadata: Optional[gybe.k8s.v1_34.meta.v1.ObjectMeta] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class ResourceClaimTemplateSpec(K8sSpec):
     """ResourceClaimTemplateSpec contains the metadata and fields for a ResourceClaim.
 
@@ -925,7 +925,7 @@ class ResourceClaimTemplateSpec(K8sSpec):
     metadata: Optional[gybe.k8s.v1_34.meta.v1.ObjectMeta] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class ResourcePool(K8sSpec):
     """ResourcePool describes the pool that ResourceSlices belong to.
 
@@ -951,7 +951,7 @@ class ResourcePool(K8sSpec):
     resourceSliceCount: int
 
 
-@dataclass
+@dataclass(slots=True)
 class ResourceSlice(K8sResource):
     """ResourceSlice represents one or more resources in a pool of similar resources, managed by a common
     driver. A pool may span more than one ResourceSlice, and exactly how many ResourceSlices comprise a
@@ -987,7 +987,7 @@ class ResourceSlice(K8sResource):
     metadata: Optional[gybe.k8s.v1_34.meta.v1.ObjectMeta] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class ResourceSliceSpec(K8sSpec):
     """ResourceSliceSpec contains the information published by the driver in one ResourceSlice.
 
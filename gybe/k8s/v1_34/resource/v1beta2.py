@@ -8,10 +8,12 @@ from typing import List, Literal, Optional
 import gybe.k8s.v1_34.api.resource
 import gybe.k8s.v1_34.core.v1
 import gybe.k8s.v1_34.meta.v1
+import gybe.k8s.v1_34.resource.v1beta2
 from gybe.k8s.types import JSONDict, JSONObj, K8sResource, K8sSpec
+from gybe.lazy import lazy_attributes
 
 
-@dataclass
+@dataclass(slots=True)
 class AllocatedDeviceStatus(K8sSpec):
     """AllocatedDeviceStatus contains the status of an allocated device, if the driver chooses to report it.
     This may include driver-specific information.  The combination of Driver, Pool, Device, and ShareID
@@ -41,11 +43,11 @@ class AllocatedDeviceStatus(K8sSpec):
     device: str
     conditions: Optional[List[gybe.k8s.v1_34.meta.v1.Condition]] = None
     data: Optional[JSONObj] = None
-    networkData: Optional[NetworkDeviceData] = None
+    networkData: Optional[gybe.k8s.v1_34.resource.v1beta2.NetworkDeviceData] = None
     shareID: Optional[str] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class AllocationResult(K8sSpec):
     """AllocationResult contains attributes of an allocated resource.
 
@@ -64,44 +66,7 @@ class AllocationResult(K8sSpec):
     nodeSelector: Optional[gybe.k8s.v1_34.core.v1.NodeSelector] = None
 
 
-@dataclass
-class CELDeviceSelector(K8sSpec):
-    """CELDeviceSelector contains a CEL expression for selecting a device.
-
-    Attributes:
-        expression: Expression is a CEL expression which evaluates a single device. It must evaluate to true
-            when the device under consideration satisfies the desired criteria, and false when it does not.
-            Any other result is an error and causes allocation of devices to abort.  The expression's input is
-            an object named 'device', which carries the following properties:  - driver (string): the name of
-            the driver which defines this device.  - attributes (map[string]object): the device's attributes,
-            grouped by prefix    (e.g. device.attributes['dra.example.com'] evaluates to an object with all
-            of the attributes which were prefixed by 'dra.example.com'.  - capacity (map[string]object): the
-            device's capacities, grouped by prefix.  - allowMultipleAllocations (bool): the
-            allowMultipleAllocations property of the device    (v1.34+ with the DRAConsumableCapacity feature
-            enabled).  Example: Consider a device with driver='dra.example.com', which exposes two attributes
-            named 'model' and 'ext.example.com/family' and which exposes one capacity named 'modules'. This
-            input to this expression would have the following fields:      device.driver
-            device.attributes['dra.example.com'].model     device.attributes['ext.example.com'].family
-            device.capacity['dra.example.com'].modules  The device.driver field can be used to check for a
-            specific driver, either as a high-level precondition (i.e. you only want to consider devices from
-            this driver) or as part of a multi-clause expression that is meant to consider devices from
-            different drivers.  The value type of each attribute is defined by the device definition, and
-            users who write these expressions must consult the documentation for their specific drivers. The
-            value type of each capacity is Quantity.  If an unknown prefix is used as a lookup in either
-            device.attributes or device.capacity, an empty map will be returned. Any reference to an unknown
-            field will cause an evaluation error and allocation to abort.  A robust expression should check
-            for the existence of attributes before referencing them.  For ease of use, the cel.bind() function
-            is enabled, and can be used to simplify expressions that access multiple attributes with the same
-            domain. For example:      cel.bind(dra, device.attributes['dra.example.com'], dra.someBool &&
-            dra.anotherBool)  The length of the expression must be smaller or equal to 10 Ki. The cost of
-            evaluating it is also limited based on the estimated number of logical steps.
-
-    """
-
-    expression: str
-
-
-@dataclass
+@dataclass(slots=True)
 class CapacityRequestPolicy(K8sSpec):
     """CapacityRequestPolicy defines how requests consume device capacity.  Must not set more than one
     ValidRequestValues.
@@ -129,7 +94,7 @@ class CapacityRequestPolicy(K8sSpec):
     validValues: Optional[List[gybe.k8s.v1_34.api.resource.Quantity]] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class CapacityRequestPolicyRange(K8sSpec):
     """CapacityRequestPolicyRange defines a valid range for consumable capacity values.    - If the requested
     amount is less than Min, it is rounded up to the Min value.   - If Step is set and the requested
@@ -155,7 +120,7 @@ class CapacityRequestPolicyRange(K8sSpec):
     step: Optional[gybe.k8s.v1_34.api.resource.Quantity] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class CapacityRequirements(K8sSpec):
     """CapacityRequirements defines the capacity requirements for a specific device request.
 
@@ -180,37 +145,7 @@ class CapacityRequirements(K8sSpec):
     requests: Optional[JSONDict] = None
 
 
-@dataclass
-class Counter(K8sSpec):
-    """Counter describes a quantity associated with a device.
-
-    Attributes:
-        value: Value defines how much of a certain device counter is available.
-
-    """
-
-    value: gybe.k8s.v1_34.api.resource.Quantity
-
-
-@dataclass
-class CounterSet(K8sSpec):
-    """CounterSet defines a named set of counters that are available to be used by devices defined in the
-    ResourceSlice.  The counters are not allocatable by themselves, but can be referenced by devices. When
-    a device is allocated, the portion of counters it uses will no longer be available for use by other
-    devices.
-
-    Attributes:
-        counters: Counters defines the set of counters for this CounterSet The name of each counter must be
-            unique in that set and must be a DNS label.  The maximum number of counters in all sets is 32.
-        name: Name defines the name of the counter set. It must be a DNS label.
-
-    """
-
-    name: str
-    counters: JSONDict
-
-
-@dataclass
+@dataclass(slots=True)
 class Device(K8sSpec):
     """Device represents one individual hardware instance that can be selected based on its attributes.
     Besides the name, exactly one field must be set.
@@ -268,33 +203,13 @@ class Device(K8sSpec):
     bindingFailureConditions: Optional[List[str]] = None
     bindsToNode: Optional[bool] = None
     capacity: Optional[JSONDict] = None
-    consumesCounters: Optional[List[DeviceCounterConsumption]] = None
+    consumesCounters: Optional[List[gybe.k8s.v1_34.resource.v1beta2.DeviceCounterConsumption]] = None
     nodeName: Optional[str] = None
     nodeSelector: Optional[gybe.k8s.v1_34.core.v1.NodeSelector] = None
-    taints: Optional[List[DeviceTaint]] = None
-
-
-@dataclass
-class DeviceAllocationConfiguration(K8sSpec):
-    """DeviceAllocationConfiguration gets embedded in an AllocationResult.
-
-    Attributes:
-        opaque: Opaque provides driver-specific configuration parameters.
-        requests: Requests lists the names of requests where the configuration applies. If empty, its applies
-            to all requests.  References to subrequests must include the name of the main request and may
-            include the subrequest using the format <main request>[/<subrequest>]. If just the main request is
-            given, the configuration applies to all subrequests.
-        source: Source records whether the configuration comes from a class and thus is not something that a
-            normal user would have been able to set or from a claim.
-
-    """
-
-    source: str
-    opaque: Optional[OpaqueDeviceConfiguration] = None
-    requests: Optional[List[str]] = None
+    taints: Optional[List[gybe.k8s.v1_34.resource.v1beta2.DeviceTaint]] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class DeviceAllocationResult(K8sSpec):
     """DeviceAllocationResult is the result of allocating devices.
 
@@ -307,30 +222,11 @@ class DeviceAllocationResult(K8sSpec):
 
     """
 
-    config: Optional[List[DeviceAllocationConfiguration]] = None
+    config: Optional[List[gybe.k8s.v1_34.resource.v1beta2.DeviceAllocationConfiguration]] = None
     results: Optional[List[DeviceRequestAllocationResult]] = None
 
 
-@dataclass
-class DeviceAttribute(K8sSpec):
-    """DeviceAttribute must have exactly one field set.
-
-    Attributes:
-        bool: BoolValue is a true/false value.
-        int: IntValue is a number.
-        string: StringValue is a string. Must not be longer than 64 characters.
-        version: VersionValue is a semantic version according to semver.org spec 2.0.0. Must not be longer
-            than 64 characters.
-
-    """
-
-    bool: Optional[bool] = None
-    int: Optional[int] = None
-    string: Optional[str] = None
-    version: Optional[str] = None
-
-
-@dataclass
+@dataclass(slots=True)
 class DeviceCapacity(K8sSpec):
     """DeviceCapacity describes a quantity associated with a device.
 
@@ -351,7 +247,7 @@ class DeviceCapacity(K8sSpec):
     requestPolicy: Optional[CapacityRequestPolicy] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class DeviceClaim(K8sSpec):
     """DeviceClaim defines how to request devices with a ResourceClaim.
 
@@ -365,29 +261,12 @@ class DeviceClaim(K8sSpec):
 
     """
 
-    config: Optional[List[DeviceClaimConfiguration]] = None
+    config: Optional[List[gybe.k8s.v1_34.resource.v1beta2.DeviceClaimConfiguration]] = None
     constraints: Optional[List[DeviceConstraint]] = None
     requests: Optional[List[DeviceRequest]] = None
 
 
-@dataclass
-class DeviceClaimConfiguration(K8sSpec):
-    """DeviceClaimConfiguration is used for configuration parameters in DeviceClaim.
-
-    Attributes:
-        opaque: Opaque provides driver-specific configuration parameters.
-        requests: Requests lists the names of requests where the configuration applies. If empty, it applies
-            to all requests.  References to subrequests must include the name of the main request and may
-            include the subrequest using the format <main request>[/<subrequest>]. If just the main request is
-            given, the configuration applies to all subrequests.
-
-    """
-
-    opaque: Optional[OpaqueDeviceConfiguration] = None
-    requests: Optional[List[str]] = None
-
-
-@dataclass
+@dataclass(slots=True)
 class DeviceClass(K8sResource):
     """DeviceClass is a vendor- or admin-provided resource that contains device configuration and selectors.
     It can be referenced in the device requests of a claim to apply these presets. Cluster scoped.  This
@@ -413,19 +292,7 @@ class DeviceClass(K8sResource):
     metadata: Optional[gybe.k8s.v1_34.meta.v1.ObjectMeta] = None
 
 
-@dataclass
-class DeviceClassConfiguration(K8sSpec):
-    """DeviceClassConfiguration is used in DeviceClass.
-
-    Attributes:
-        opaque: Opaque provides driver-specific configuration parameters.
-
-    """
-
-    opaque: Optional[OpaqueDeviceConfiguration] = None
-
-
-@dataclass
+@dataclass(slots=True)
 class DeviceClassSpec(K8sSpec):
     """DeviceClassSpec is used in a [DeviceClass] to define what can be allocated and how to configure it.
 
@@ -444,12 +311,12 @@ class DeviceClassSpec(K8sSpec):
 
     """
 
-    config: Optional[List[DeviceClassConfiguration]] = None
+    config: Optional[List[gybe.k8s.v1_34.resource.v1beta2.DeviceClassConfiguration]] = None
     extendedResourceName: Optional[str] = None
-    selectors: Optional[List[DeviceSelector]] = None
+    selectors: Optional[List[gybe.k8s.v1_34.resource.v1beta2.DeviceSelector]] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class DeviceConstraint(K8sSpec):
     """DeviceConstraint must have exactly one field set besides Requests.
 
@@ -480,23 +347,7 @@ class DeviceConstraint(K8sSpec):
     requests: Optional[List[str]] = None
 
 
-@dataclass
-class DeviceCounterConsumption(K8sSpec):
-    """DeviceCounterConsumption defines a set of counters that a device will consume from a CounterSet.
-
-    Attributes:
-        counterSet: CounterSet is the name of the set from which the counters defined will be consumed.
-        counters: Counters defines the counters that will be consumed by the device.  The maximum number
-            counters in a device is 32. In addition, the maximum number of all counters in all devices is 1024
-            (for example, 64 devices with 16 counters each).
-
-    """
-
-    counterSet: str
-    counters: JSONDict
-
-
-@dataclass
+@dataclass(slots=True)
 class DeviceRequest(K8sSpec):
     """DeviceRequest is a request for devices required for a claim. This is typically a request for a single
     resource like a device, but can also ask for several identical devices. With FirstAvailable it is also
@@ -526,7 +377,7 @@ class DeviceRequest(K8sSpec):
     firstAvailable: Optional[List[DeviceSubRequest]] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class DeviceRequestAllocationResult(K8sSpec):
     """DeviceRequestAllocationResult contains the allocation result for one request.
 
@@ -577,22 +428,10 @@ class DeviceRequestAllocationResult(K8sSpec):
     bindingFailureConditions: Optional[List[str]] = None
     consumedCapacity: Optional[JSONDict] = None
     shareID: Optional[str] = None
-    tolerations: Optional[List[DeviceToleration]] = None
-
-
-@dataclass
-class DeviceSelector(K8sSpec):
-    """DeviceSelector must have exactly one field set.
-
-    Attributes:
-        cel: CEL contains a CEL expression for selecting a device.
-
-    """
-
-    cel: Optional[CELDeviceSelector] = None
+    tolerations: Optional[List[gybe.k8s.v1_34.resource.v1beta2.DeviceToleration]] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class DeviceSubRequest(K8sSpec):
     """DeviceSubRequest describes a request for device provided in the
     claim.spec.devices.requests[].firstAvailable array. Each is typically a request for a single resource
@@ -645,64 +484,11 @@ class DeviceSubRequest(K8sSpec):
     allocationMode: Optional[str] = None
     capacity: Optional[CapacityRequirements] = None
     count: Optional[int] = None
-    selectors: Optional[List[DeviceSelector]] = None
-    tolerations: Optional[List[DeviceToleration]] = None
-
-
-@dataclass
-class DeviceTaint(K8sSpec):
-    """The device this taint is attached to has the 'effect' on any claim which does not tolerate the taint
-    and, through the claim, to pods using the claim.
-
-    Attributes:
-        effect: The effect of the taint on claims that do not tolerate the taint and through such claims on
-            the pods using them. Valid effects are NoSchedule and NoExecute. PreferNoSchedule as used for
-            nodes is not valid here.
-        key: The taint key to be applied to a device. Must be a label name.
-        timeAdded: TimeAdded represents the time at which the taint was added. Added automatically during
-            create or update if not set.
-        value: The taint value corresponding to the taint key. Must be a label value.
-
-    """
-
-    key: str
-    effect: str
-    timeAdded: Optional[str] = None
-    value: Optional[str] = None
-
-
-@dataclass
-class DeviceToleration(K8sSpec):
-    """The ResourceClaim this DeviceToleration is attached to tolerates any taint that matches the triple
-    <key,value,effect> using the matching operator <operator>.
-
-    Attributes:
-        effect: Effect indicates the taint effect to match. Empty means match all taint effects. When
-            specified, allowed values are NoSchedule and NoExecute.
-        key: Key is the taint key that the toleration applies to. Empty means match all taint keys. If the key
-            is empty, operator must be Exists; this combination means to match all values and all keys. Must
-            be a label name.
-        operator: Operator represents a key's relationship to the value. Valid operators are Exists and Equal.
-            Defaults to Equal. Exists is equivalent to wildcard for value, so that a ResourceClaim can
-            tolerate all taints of a particular category.
-        tolerationSeconds: TolerationSeconds represents the period of time the toleration (which must be of
-            effect NoExecute, otherwise this field is ignored) tolerates the taint. By default, it is not set,
-            which means tolerate the taint forever (do not evict). Zero and negative values will be treated as
-            0 (evict immediately) by the system. If larger than zero, the time when the pod needs to be
-            evicted is calculated as <time when taint was adedd> + <toleration seconds>.
-        value: Value is the taint value the toleration matches to. If the operator is Exists, the value must
-            be empty, otherwise just a regular string. Must be a label value.
-
-    """
-
-    effect: Optional[str] = None
-    key: Optional[str] = None
-    operator: Optional[str] = None
-    tolerationSeconds: Optional[int] = None
-    value: Optional[str] = None
+    selectors: Optional[List[gybe.k8s.v1_34.resource.v1beta2.DeviceSelector]] = None
+    tolerations: Optional[List[gybe.k8s.v1_34.resource.v1beta2.DeviceToleration]] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class ExactDeviceRequest(K8sSpec):
     """ExactDeviceRequest is a request for one or more identical devices.
 
@@ -753,54 +539,11 @@ class ExactDeviceRequest(K8sSpec):
     allocationMode: Optional[str] = None
     capacity: Optional[CapacityRequirements] = None
     count: Optional[int] = None
-    selectors: Optional[List[DeviceSelector]] = None
-    tolerations: Optional[List[DeviceToleration]] = None
-
-
-@dataclass
-class NetworkDeviceData(K8sSpec):
-    """NetworkDeviceData provides network-related details for the allocated device. This information may be
-    filled by drivers or other components to configure or identify the device within a network context.
-
-    Attributes:
-        hardwareAddress: HardwareAddress represents the hardware address (e.g. MAC Address) of the device's
-            network interface.  Must not be longer than 128 characters.
-        interfaceName: InterfaceName specifies the name of the network interface associated with the allocated
-            device. This might be the name of a physical or virtual network interface being configured in the
-            pod.  Must not be longer than 256 characters.
-        ips: IPs lists the network addresses assigned to the device's network interface. This can include both
-            IPv4 and IPv6 addresses. The IPs are in the CIDR notation, which includes both the address and the
-            associated subnet mask. e.g.: '192.0.2.5/24' for IPv4 and '2001:db8::5/64' for IPv6.
-
-    """
-
-    hardwareAddress: Optional[str] = None
-    interfaceName: Optional[str] = None
-    ips: Optional[List[str]] = None
-
-
-@dataclass
-class OpaqueDeviceConfiguration(K8sSpec):
-    """OpaqueDeviceConfiguration contains configuration parameters for a driver in a format defined by the
-    driver vendor.
-
-    Attributes:
-        driver: Driver is used to determine which kubelet plugin needs to be passed these configuration
-            parameters.  An admission policy provided by the driver developer could use this to decide whether
-            it needs to validate them.  Must be a DNS subdomain and should end with a DNS domain owned by the
-            vendor of the driver.
-        parameters: Parameters can contain arbitrary data. It is the responsibility of the driver developer to
-            handle validation and versioning. Typically this includes self-identification and a version
-            ('kind' + 'apiVersion' for Kubernetes types), with conversion between different versions.  The
-            length of the raw data must be smaller or equal to 10 Ki.
-
-    """
+    selectors: Optional[List[gybe.k8s.v1_34.resource.v1beta2.DeviceSelector]] = None
+    tolerations: Optional[List[gybe.k8s.v1_34.resource.v1beta2.DeviceToleration]] = None
 
-    driver: str
-    parameters: JSONObj
 
-
-@dataclass
+@dataclass(slots=True)
 class ResourceClaim(K8sResource):
     """ResourceClaim describes a request for access to resources in the cluster, for use by workloads. For
     example, if a workload needs an accelerator device with specific properties, this is how that request
@@ -827,27 +570,7 @@ class ResourceClaim(K8sResource):
     status: Optional[ResourceClaimStatus] = None
 
 
-@dataclass
-class ResourceClaimConsumerReference(K8sSpec):
-    """ResourceClaimConsumerReference contains enough information to let you locate the consumer of a
-    ResourceClaim. The user must be a resource in the same namespace as the ResourceClaim.
-
-    Attributes:
-        apiGroup: APIGroup is the group for the resource being referenced. It is empty for the core API. This
-            matches the group in the APIVersion that is used when creating the resources.
-        name: Name is the name of resource being referenced.
-        resource: Resource is the type of resource being referenced, for example 'pods'.
-        uid: UID identifies exactly one incarnation of the resource.
-
-    """
-
-    resource: str
-    name: str
-    uid: str
-    apiGroup: Optional[str] = None
-
-
-@dataclass
+@dataclass(slots=True)
 class ResourceClaimSpec(K8sSpec):
     """ResourceClaimSpec defines what is being requested in a ResourceClaim and how to configure it.
 
@@ -859,7 +582,7 @@ class ResourceClaimSpec(K8sSpec):
     devices: Optional[DeviceClaim] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class ResourceClaimStatus(K8sSpec):
     """ResourceClaimStatus tracks whether the resource has been allocated and what the result of that was.
 
@@ -883,10 +606,10 @@ class ResourceClaimStatus(K8sSpec):
 
     allocation: Optional[AllocationResult] = None
     devices: Optional[List[AllocatedDeviceStatus]] = None
-    reservedFor: Optional[List[ResourceClaimConsumerReference]] = None
+    reservedFor: Optional[List[gybe.k8s.v1_34.resource.v1beta2.ResourceClaimConsumerReference]] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class ResourceClaimTemplate(K8sResource):
     """ResourceClaimTemplate is used to produce ResourceClaim objects.  This is an alpha type and requires
     enabling the DynamicResourceAllocation feature gate.
@@ -909,7 +632,7 @@ class ResourceClaimTemplate(K8sResource):
     metadata: Optional[gybe.k8s.v1_34.meta.v1.ObjectMeta] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class ResourceClaimTemplateSpec(K8sSpec):
     """ResourceClaimTemplateSpec contains the metadata and fields for a ResourceClaim.
 
@@ -925,33 +648,7 @@ class ResourceClaimTemplateSpec(K8sSpec):
     metadata: Optional[gybe.k8s.v1_34.meta.v1.ObjectMeta] = None
 
 
-@dataclass
-class ResourcePool(K8sSpec):
-    """ResourcePool describes the pool that ResourceSlices belong to.
-
-    Attributes:
-        generation: Generation tracks the change in a pool over time. Whenever a driver changes something
-            about one or more of the resources in a pool, it must change the generation in all ResourceSlices
-            which are part of that pool. Consumers of ResourceSlices should only consider resources from the
-            pool with the highest generation number. The generation may be reset by drivers, which should be
-            fine for consumers, assuming that all ResourceSlices in a pool are updated to match or deleted.
-            Combined with ResourceSliceCount, this mechanism enables consumers to detect pools which are
-            comprised of multiple ResourceSlices and are in an incomplete state.
-        name: Name is used to identify the pool. For node-local devices, this is often the node name, but this
-            is not required.  It must not be longer than 253 characters and must consist of one or more DNS
-            sub-domains separated by slashes. This field is immutable.
-        resourceSliceCount: ResourceSliceCount is the total number of ResourceSlices in the pool at this
-            generation number. Must be greater than zero.  Consumers can use this to check whether they have
-            seen all ResourceSlices belonging to the same pool.
-
-    """
-
-    name: str
-    generation: int
-    resourceSliceCount: int
-
-
-@dataclass
+@dataclass(slots=True)
 class ResourceSlice(K8sResource):
     """ResourceSlice represents one or more resources in a pool of similar resources, managed by a common
     driver. A pool may span more than one ResourceSlice, and exactly how many ResourceSlices comprise a
@@ -987,7 +684,7 @@ class ResourceSlice(K8sResource):
     metadata: Optional[gybe.k8s.v1_34.meta.v1.ObjectMeta] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class ResourceSliceSpec(K8sSpec):
     """ResourceSliceSpec contains the information published by the driver in one ResourceSlice.
 
@@ -1019,10 +716,32 @@ class ResourceSliceSpec(K8sSpec):
     """
 
     driver: str
-    pool: ResourcePool
+    pool: gybe.k8s.v1_34.resource.v1beta2.ResourcePool
     allNodes: Optional[bool] = None
     devices: Optional[List[Device]] = None
     nodeName: Optional[str] = None
     nodeSelector: Optional[gybe.k8s.v1_34.core.v1.NodeSelector] = None
     perDeviceNodeSelection: Optional[bool] = None
-    sharedCounters: Optional[List[CounterSet]] = None
+    sharedCounters: Optional[List[gybe.k8s.v1_34.resource.v1beta2.CounterSet]] = None
+
+
+__getattr__, __dir__ = lazy_attributes(
+    __name__,
+    {
+        'CELDeviceSelector': 'gybe.k8s.v1_33.resource.v1beta2',
+        'Counter': 'gybe.k8s.v1_33.resource.v1beta2',
+        'CounterSet': 'gybe.k8s.v1_33.resource.v1beta2',
+        'DeviceAllocationConfiguration': 'gybe.k8s.v1_33.resource.v1beta2',
+        'DeviceAttribute': 'gybe.k8s.v1_33.resource.v1beta2',
+        'DeviceClaimConfiguration': 'gybe.k8s.v1_33.resource.v1beta2',
+        'DeviceClassConfiguration': 'gybe.k8s.v1_33.resource.v1beta2',
+        'DeviceCounterConsumption': 'gybe.k8s.v1_33.resource.v1beta2',
+        'DeviceSelector': 'gybe.k8s.v1_33.resource.v1beta2',
+        'DeviceTaint': 'gybe.k8s.v1_33.resource.v1beta2',
+        'DeviceToleration': 'gybe.k8s.v1_33.resource.v1beta2',
+        'NetworkDeviceData': 'gybe.k8s.v1_33.resource.v1beta2',
+        'OpaqueDeviceConfiguration': 'gybe.k8s.v1_33.resource.v1beta2',
+        'ResourceClaimConsumerReference': 'gybe.k8s.v1_33.resource.v1beta2',
+        'ResourcePool': 'gybe.k8s.v1_33.resource.v1beta2',
+    },
+)
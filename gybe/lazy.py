@@ -0,0 +1,42 @@
+"""Lazily import the attributes of a package on first access."""
+
+import importlib
+import importlib.util
+import sys
+from typing import Any, Callable, Mapping
+
+
+def lazy_attributes(
+    module_name: str, attributes: Mapping[str, str | tuple[str, ...]], submodules: bool = False
+) -> tuple[Callable[[str], Any], Callable[[], list[str]]]:
+    """Make module level `__getattr__` and `__dir__` functions that import attributes on first use.
+
+    `attributes` maps each name to the module it's imported from, or to the submodule of the same
+    name for subpackages. A tuple of modules stands for a namespace subpackage, all of them are
+    imported so they can be used as attributes of the subpackage. Imported values are cached in
+    the module's globals, so `__getattr__` is only called once per name. With `submodules`, other
+    names are imported as submodules of the package when it has one of that name.
+    """
+    module_globals = sys.modules[module_name].__dict__
+
+    def getattr_(name: str) -> Any:
+        try:
+            paths = attributes[name]
+        except KeyError:
+            paths = f'{module_name}.{name}'
+            if not submodules or importlib.util.find_spec(paths) is None:
+                raise AttributeError(f'module {module_name!r} has no attribute {name!r}') from None
+        if isinstance(paths, str):
+            module = importlib.import_module(paths)
+            value = module if paths == f'{module_name}.{name}' else getattr(module, name)
+        else:
+            for path in paths:
+                importlib.import_module(path)
+            value = importlib.import_module(f'{module_name}.{name}')
+        module_globals[name] = value
+        return value
+
+    def dir_() -> list[str]:
+        return sorted(set(module_globals) | set(attributes))
+
+    return getattr_, dir_
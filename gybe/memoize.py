@@ -0,0 +1,208 @@
+"""Memoize chart helpers that build models, like a function making the same container for many pods.
+
+Models are dataclasses without a hash, so `functools.lru_cache` can't take them as arguments.
+`cached` hashes its arguments by their structure instead: models and other dataclasses by their
+type and fields, lists, tuples, dicts and sets by their items, so equal arguments share a cache
+entry. Dicts are only equal with their keys in the same order. The models it returns are shared
+between calls, and serialized once per render when the same instance appears in several resources.
+"""
+
+import threading
+from collections import OrderedDict
+from dataclasses import FrozenInstanceError, fields, is_dataclass
+from functools import update_wrapper
+from typing import Any, Callable, Hashable, NamedTuple, TypeVar, overload
+
+from gybe.k8s.types import K8sSpec
+
+F = TypeVar('F', bound=Callable[..., Any])
+
+# dataclass field names by class, looked up once per class
+_field_names: dict[type, tuple[str, ...]] = {}
+# subclasses of models that refuse attribute assignment, by model class, and the other way around
+_frozen_classes: dict[type, type] = {}
+_model_classes: dict[type, type] = {}
+
+
+class CacheInfo(NamedTuple):
+    """Statistics of a cached function, like `functools.lru_cache` has."""
+
+    hits: int
+    misses: int
+    maxsize: int | None
+    currsize: int
+
+
+def structural_key(value: Any) -> Hashable:
+    """Hashable key of a value by its structure, equal for equal values of the same types.
+
+    Raises TypeError for values that are neither hashable nor a dataclass, list, tuple, dict or set.
+    """
+    cls = value.__class__
+    if cls is list or cls is tuple:
+        return cls, tuple(map(structural_key, value))
+    if cls is dict:
+        # in insertion order, helpers can build lists from dicts, like env vars where order matters
+        return dict, tuple((structural_key(k), structural_key(v)) for k, v in value.items())
+    if cls is set or cls is frozenset:
+        return frozenset, frozenset(map(structural_key, value))
+    names = _field_names.get(cls)
+    if names is None and is_dataclass(value) and not isinstance(value, type):
+        names = _fields(value)
+    if names is not None:
+        # frozen models have the same key as the equal models they were made from
+        cls = _model_classes.get(cls, cls)
+        return cls, tuple(structural_key(getattr(value, name)) for name in names)
+    try:
+        hash(value)
+    except TypeError:
+        raise TypeError(
+            f'cached functions take hashable arguments or dataclasses, not {cls.__name__}'
+        ) from None
+    # the type keeps 1, 1.0 and True apart
+    return cls, value
+
+
+def _fields(value: Any) -> tuple[str, ...]:
+    names = _field_names.get(value.__class__)
+    if names is None:
+        names = _field_names[value.__class__] = tuple(f.name for f in fields(value))
+    return names
+
+
+def _thaw(cls: type, values: dict[str, Any]) -> Any:
+    return cls(**values)
+
+
+def _frozen_class(cls: type) -> type:
+    frozen = _frozen_classes.get(cls)
+    if frozen is not None:
+        return frozen
+
+    def __new__(_frozen_cls: type, *args: Any, **kwargs: Any) -> Any:  # noqa: N807
+        # `dataclasses.replace()` and `copy.copy()` make models of the class that can be changed
+        return cls(*args, **kwargs) if args or kwargs else object.__new__(cls)
+
+    def __setattr__(_self: Any, name: str, _value: Any) -> None:  # noqa: N807
+        raise FrozenInstanceError(f'cannot assign to field {name!r} of a cached {cls.__name__}')
+
+    def __delattr__(_self: Any, name: str) -> None:  # noqa: N807
+        raise FrozenInstanceError(f'cannot delete field {name!r} of a cached {cls.__name__}')
+
+    def __eq__(self: Any, other: Any) -> Any:  # noqa: N807
+        # equal to models of the class they were frozen from, like dataclasses compare
+        if _model_classes.get(other.__class__, other.__class__) is not cls:
+            return NotImplemented
+        names = _fields(self)
+        return tuple(getattr(self, n) for n in names) == tuple(getattr(other, n) for n in names)
+
+    def __reduce__(self: Any) -> Any:  # noqa: N807
+        # pickled, and copied, as models of the class they were frozen from
+        return _thaw, (cls, {name: getattr(self, name) for name in _fields(self)})
+
+    namespace = {
+        '__slots__': (),
+        '__new__': __new__,
+        '__setattr__': __setattr__,
+        '__delattr__': __delattr__,
+        '__eq__': __eq__,
+        '__hash__': cls.__hash__,
+        '__reduce__': __reduce__,
+    }
+    frozen = _frozen_classes[cls] = type(cls.__name__, (cls,), namespace)
+    _model_classes[frozen] = cls
+    frozen.__qualname__ = cls.__qualname__
+    frozen.__module__ = cls.__module__
+    # unstructured like the model class, with its generated `to_dict()` when it has one
+    from gybe.converter import _unstructure_fns, get_unstructure_fn
+
+    _unstructure_fns[frozen] = get_unstructure_fn(cls)
+    return frozen
+
+
+def freeze(value: Any) -> Any:
+    """Make the models in a value, and every model in their fields, refuse attribute assignment.
+
+    Lists and dicts holding them can still be changed, the models are frozen in place.
+    """
+    if isinstance(value, K8sSpec):
+        if value.__class__ in _model_classes:
+            return value
+        for name in _fields(value):
+            freeze(getattr(value, name))
+        value.__class__ = _frozen_class(value.__class__)
+    elif value.__class__ in (list, tuple, set, frozenset):
+        for item in value:
+            freeze(item)
+    elif value.__class__ is dict:
+        for item in value.values():
+            freeze(item)
+    return value
+
+
+class _CachedFunction:
+    """Function wrapper keeping the results of its last `maxsize` calls."""
+
+    def __init__(self, func: Callable[..., Any], maxsize: int | None, frozen: bool):
+        """Cache the results of `func`, frozen if `frozen`, without a limit if `maxsize` is None."""
+        self.__wrapped__ = func
+        self.maxsize = maxsize
+        self.frozen = frozen
+        self._results: OrderedDict[Hashable, Any] = OrderedDict()
+        self._lock = threading.Lock()
+        self._hits = self._misses = 0
+        update_wrapper(self, func)
+
+    def __call__(self, *args: Any, **kwargs: Any) -> Any:
+        """Return the result of an earlier call with equal arguments, or call the function."""
+        key = (structural_key(args), structural_key(kwargs)) if kwargs else structural_key(args)
+        with self._lock:
+            try:
+                result = self._results[key]
+            except KeyError:
+                self._misses += 1
+            else:
+                self._hits += 1
+                self._results.move_to_end(key)
+                return result
+
+        result = self.__wrapped__(*args, **kwargs)
+        if self.frozen:
+            freeze(result)
+        with self._lock:
+            self._results[key] = result
+            if self.maxsize is not None and len(self._results) > self.maxsize:
+                self._results.popitem(last=False)
+        return result
+
+    def cache_info(self) -> CacheInfo:
+        """Hits, misses, maximum and current size of the cache."""
+        return CacheInfo(self._hits, self._misses, self.maxsize, len(self._results))
+
+    def cache_clear(self) -> None:
+        """Drop every cached result and reset the statistics."""
+        with self._lock:
+            self._results.clear()
+            self._hits = self._misses = 0
+
+
+@overload
+def cached(func: F) -> F: ...
+
+
+@overload
+def cached(*, maxsize: int | None = 128, frozen: bool = False) -> Callable[[F], F]: ...
+
+
+def cached(func: Any = None, *, maxsize: int | None = 128, frozen: bool = False) -> Any:
+    """Memoize a chart helper, keeping the results of its last `maxsize` calls with equal arguments.
+
+    Use it as `@gybe.cached` or `@gybe.cached(maxsize=1024, frozen=True)`. The same result is
+    returned for every call with equal arguments, so don't change it, or pass `frozen=True` to make
+    the models in it refuse attribute assignment. `dataclasses.replace()` makes a changed copy of a
+    frozen model. The wrapped function has `cache_info()` and `cache_clear()` like
+    `functools.lru_cache`.
+    """
+    if func is None:
+        return lambda f: _CachedFunction(f, maxsize, frozen)
+    return _CachedFunction(func, maxsize, frozen)
@@ -2,13 +2,52 @@
 
 import inspect
 from dataclasses import make_dataclass
-from typing import Any, Callable, Union
+from typing import Any, Awaitable, Callable, TypeVar, Union
+from weakref import WeakKeyDictionary
 
-from gybe.k8s.types import Manifest
+from gybe.k8s.types import AsyncManifestIterator, Manifest, ManifestIterator
 
+T = TypeVar('T')
 
-def create_input_model(func: Callable[..., Manifest]) -> type:
-    """Create dataclass input model from a decorated function."""
+# input models by function, weakly keyed so a model is freed with its function
+_input_models: WeakKeyDictionary[Callable[..., Any], type] = WeakKeyDictionary()
+
+
+def cached_per_function(
+    cache: WeakKeyDictionary[Callable[..., Any], T], func: Callable[..., Any], make: Callable[[], T]
+) -> T:
+    """Look up the value of `func` in a weakly keyed cache, or make it and keep it there.
+
+    Callables that can't be weakly referenced, like instances of classes with `__slots__`, get a
+    new value each time.
+    """
+    try:
+        return cache[func]
+    except (KeyError, TypeError):
+        # TypeError for callables that can't be weakly referenced
+        pass
+    value = make()
+    try:
+        cache[func] = value
+    except TypeError:
+        pass
+    return value
+
+
+def create_input_model(
+    func: Callable[..., Manifest | ManifestIterator | Awaitable[Manifest] | AsyncManifestIterator],
+) -> type:
+    """Create dataclass input model from a decorated function.
+
+    The model is created once per function that can be weakly referenced, and reused until the
+    function is freed.
+    """
+    return cached_per_function(_input_models, func, lambda: _make_input_model(func))
+
+
+def _make_input_model(
+    func: Callable[..., Manifest | ManifestIterator | Awaitable[Manifest] | AsyncManifestIterator],
+) -> type:
     argspec = inspect.getfullargspec(func)
     if argspec.defaults:
         positional_count = len(argspec.args) - len(argspec.defaults)
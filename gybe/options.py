@@ -0,0 +1,40 @@
+"""Options and error output shared by transpiler commands and the `gybe` command.
+
+Only click and the exception types are imported here, so commands that don't end up rendering,
+like cached renders, don't pay for importing the rendering machinery.
+"""
+
+import sys
+from contextlib import contextmanager
+from typing import Iterable, Iterator
+
+import click
+
+from gybe.exceptions import InputValidationError, InvalidOverrideError
+
+VALUES_FILE = click.Path(exists=True, dir_okay=False, allow_dash=True)
+VALUES_HELP = 'Values file merged over FILE and earlier values files, can be given more than once.'
+
+
+@contextmanager
+def exit_on_render_error() -> Iterator[None]:
+    """Print input validation and override errors and exit, like a transpiler command does."""
+    try:
+        yield
+    except InputValidationError as exc:
+        print('validation errors:')
+        for m in exc.errors:
+            print('-', m)
+        sys.exit(-1)
+    except InvalidOverrideError as exc:
+        for _, message in exc.errors:
+            print(f'\nERROR: {message}')
+        sys.exit(-1)
+
+
+def values_paths(file: str | None, values_files: Iterable[str]) -> list[str]:
+    """Values files given as the FILE argument and `-f` options, in the order they're merged."""
+    paths = ([file] if file is not None else []) + list(values_files)
+    if not paths:
+        raise click.UsageError('Missing argument FILE or option -f/--values.')
+    return paths
@@ -0,0 +1,242 @@
+"""Set `path.to.arg=value` overrides on input values.
+
+Overrides are compiled into a trie of their paths once, then set in a single walk of the values,
+so containers shared by many overrides are looked up and copied once. A `-` in a path appends to
+a list, `containers.-.name=proxy` adds a container named proxy.
+"""
+
+import types
+from dataclasses import MISSING, Field, fields, is_dataclass
+from typing import Any, Iterable, Mapping, Union, get_args, get_origin
+from weakref import WeakKeyDictionary
+
+from gybe.converter import converter as _c
+from gybe.exceptions import InvalidOverrideError
+from gybe.k8s.types import JSONObj
+from gybe.yaml import yaml_loads
+
+APPEND = '-'
+
+_UNSET = object()
+
+OverrideErrors = list[tuple[str, str]]
+
+# fields of dataclasses by name, like input models, weakly keyed so they're freed with the transpiler
+_field_maps: WeakKeyDictionary[type, dict[str, Field]] = WeakKeyDictionary()
+
+
+def set_nested_arg(path: str, value: str, data: JSONObj) -> None:
+    """Set value in nested JSON object using a basic "." path."""
+    keys = path.split('.')
+    for key in keys[:-1]:
+        if isinstance(data, dict):
+            data = data[key]
+        elif isinstance(data, list):
+            try:
+                data = data[int(key)]
+            except ValueError:
+                raise KeyError(f'Expected integer but recieved "{key}"')
+
+    last_key: str | int
+    if isinstance(data, dict):
+        last_key = keys[-1]
+    elif isinstance(data, list):
+        last_key = int(keys[-1])
+    else:
+        raise KeyError('Path leads to unindexable location')
+
+    if isinstance(data, list) and isinstance(last_key, int):
+        data[last_key] = value
+    elif isinstance(data, dict) and isinstance(last_key, str):
+        data[last_key] = value
+    else:
+        raise ValueError('Path leads to unexpected data type')
+
+
+class _Node:
+    """A key in the paths of the overrides, with the value set there and the keys below it."""
+
+    __slots__ = ('key', 'index', 'value', 'override', 'children')
+
+    def __init__(self, key: str):
+        """Make an empty node for `key`, parsing it as a list index once."""
+        self.key = key
+        digits = key[1:] if key[:1] == '-' else key
+        self.index = int(key) if digits.isdecimal() else None
+        self.value: Any = _UNSET
+        self.override: tuple[str, str] | None = None
+        # in the order their paths were first given, appends have a key of their own
+        self.children: dict[object, _Node] = {}
+
+    def set(self, value: Any, override: str, path: str) -> None:
+        """Set the value of this node, replacing what earlier overrides set below it."""
+        self.value = value
+        self.override = (override, path)
+        self.children.clear()
+
+    def errors(self) -> OverrideErrors:
+        """Errors for every override that sets this node or a node below it."""
+        errors = []
+        if self.override is not None:
+            override, path = self.override
+            errors.append((override, f'path "{path}" does not exist in the input data'))
+        for child in self.children.values():
+            errors.extend(child.errors())
+        return errors
+
+
+def _shape(t: Any) -> tuple[dict[str, Field] | None, Any]:
+    """Fields of `t` when it's a dataclass, or the type of its items when it's a list or a dict."""
+    if get_origin(t) in (Union, types.UnionType):
+        members = [a for a in get_args(t) if a is not type(None)]
+        t = members[0] if len(members) == 1 else None
+    if isinstance(t, type) and is_dataclass(t):
+        field_map = _field_maps.get(t)
+        if field_map is None:
+            field_map = _field_maps[t] = {f.name: f for f in fields(t)}
+        return field_map, None
+    args = get_args(t)
+    if get_origin(t) is list and args:
+        return None, args[0]
+    if get_origin(t) is dict and len(args) == 2:
+        return None, args[1]
+    return None, None
+
+
+def _child_type(t: Any, key: str) -> Any:
+    """Type of the value at `key` in a value of type `t`, None when it isn't known."""
+    field_map, item_type = _shape(t)
+    if field_map is None:
+        return item_type
+    field = field_map.get(key)
+    return field.type if field is not None else None
+
+
+def _default(field: Field) -> Any:
+    """Unstructured default of a dataclass field, MISSING when it has none."""
+    if field.default is not MISSING:
+        return _c.unstructure(field.default)
+    if field.default_factory is not MISSING:
+        return _c.unstructure(field.default_factory())
+    return MISSING
+
+
+def _empty(node: _Node) -> Any:
+    """Make an empty list for nodes that only append to it, or an empty dict."""
+    return [] if all(child.key == APPEND for child in node.children.values()) and node.children else {}
+
+
+def _slot(container: Any, node: _Node, t: Any) -> str | int | None:
+    """Where `node` goes in `container`, adding missing keys below it. None when it can't go there."""
+    if isinstance(container, list):
+        if node.index is None or not -len(container) <= node.index < len(container):
+            return None
+        return node.index
+    key = node.key
+    if key in container or node.value is not _UNSET:
+        return key
+    # a key the overrides go through, fill it in with its default like the structured input has it
+    value: Any = MISSING
+    field_map = _shape(t)[0]
+    if field_map is not None:
+        if key not in field_map:
+            return None
+        value = _default(field_map[key])
+    if value is MISSING or value is None:
+        value = _empty(node)
+    container[key] = value
+    return key
+
+
+def _set(container: Any, slot: str | int, node: _Node, t: Any, errors: OverrideErrors) -> None:
+    if node.value is not _UNSET:
+        container[slot] = node.value
+    if node.children:
+        child = container[slot]
+        if not isinstance(child, (dict, list)):
+            for child_node in node.children.values():
+                errors.extend(child_node.errors())
+            return
+        # copied before it's changed, so the caller's values are left as they are
+        child = container[slot] = child.copy()
+        _set_children(child, node, t, errors)
+
+
+def _set_children(container: Any, node: _Node, t: Any, errors: OverrideErrors) -> None:
+    for child in node.children.values():
+        slot: str | int | None
+        if child.key == APPEND:
+            slot = None
+            if isinstance(container, list):
+                container.append(_empty(child))
+                slot = len(container) - 1
+        else:
+            slot = _slot(container, child, t)
+        if slot is None:
+            errors.extend(child.errors())
+        else:
+            _set(container, slot, child, _child_type(t, child.key), errors)
+
+
+class CompiledOverrides:
+    """Overrides parsed into a trie of their paths, ready to be set on values."""
+
+    def __init__(self) -> None:
+        """Start without any overrides."""
+        self._root = _Node('')
+        self._errors: OverrideErrors = []
+
+    def __bool__(self) -> bool:
+        """Whether there are any overrides or errors to report."""
+        return bool(self._root.children or self._errors)
+
+    def add(self, override: str, typed: bool = False) -> None:
+        """Add a `path.to.arg=value` override, with a YAML value like `3`, `true` or `null` if `typed`.
+
+        Later overrides replace what earlier ones set on the same path or below it.
+        """
+        path, sep, text = override.partition('=')
+        if not sep or not path:
+            self._errors.append((override, '--set expects this format: path.to.arg=value'))
+            return
+        value: Any = text
+        if typed:
+            try:
+                value = yaml_loads(text)
+            except Exception:
+                self._errors.append((override, f'"{text}" is not a valid YAML value'))
+                return
+
+        node = self._root
+        for key in path.split('.'):
+            child = None if key == APPEND else node.children.get(key)
+            if child is None:
+                child = node.children[object() if key == APPEND else key] = _Node(key)
+            node = child
+        node.set(value, override, path)
+
+    def apply(self, values: Mapping[str, Any], input_model: type | None = None) -> dict[str, Any]:
+        """Set the overrides on a copy of `values`, the input values of `input_model`.
+
+        Only the containers the overrides go through are copied. Missing keys along the way are
+        filled in with their defaults from `input_model`, or added as empty dicts or lists.
+        Raises InvalidOverrideError with every override that failed.
+        """
+        errors = list(self._errors)
+        patched = dict(values)
+        _set_children(patched, self._root, input_model, errors)
+        if errors:
+            raise InvalidOverrideError(errors[0][0], errors[0][1], errors)
+        return patched
+
+
+def compile_overrides(
+    overrides: Iterable[str] = (), typed_overrides: Iterable[str] = ()
+) -> CompiledOverrides:
+    """Compile `--set` and then `--set-typed` overrides."""
+    compiled = CompiledOverrides()
+    for override in overrides:
+        compiled.add(override)
+    for override in typed_overrides:
+        compiled.add(override, typed=True)
+    return compiled
@@ -0,0 +1,149 @@
+"""Render transpilers in-process, as a library instead of a command line tool."""
+
+import io
+from dataclasses import fields
+from typing import Any, AsyncIterator, Awaitable, Callable, Coroutine, Iterable, Iterator, Mapping
+from weakref import WeakKeyDictionary
+
+from cattrs import transform_error
+
+from gybe.charts import transpiler_function
+from gybe.converter import converter as _c
+from gybe.converter import unstructure_model
+from gybe.exceptions import InputValidationError, InvalidOutputError
+from gybe.k8s.types import AsyncManifestIterator, JSONDict, K8sResource, Manifest, ManifestIterator
+from gybe.modeling import cached_per_function, create_input_model
+from gybe.overrides import compile_overrides
+from gybe.yaml import yaml_dump_manifest
+
+Transpiler = Callable[..., Manifest | ManifestIterator | Awaitable[Manifest] | AsyncManifestIterator]
+
+# structure hooks by transpiler function, compiled outside the converter's dispatch cache so the
+# hook and its input model are freed with the function, for example when the daemon reloads a chart
+_input_hooks: WeakKeyDictionary[Callable[..., Any], Callable[[Any, type], Any]] = WeakKeyDictionary()
+
+
+def _validate_resources(resources: Iterator[Any]) -> ManifestIterator:
+    for resource in resources:
+        if not isinstance(resource, K8sResource):
+            raise InvalidOutputError()
+        yield resource
+
+
+async def _collect(resources: AsyncIterator[Any]) -> list[Any]:
+    return [resource async for resource in resources]
+
+
+def _run(coroutine: Coroutine[Any, Any, Any]) -> Any:
+    # imported on first use, most charts aren't async
+    import asyncio
+
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return asyncio.run(coroutine)
+    # rendered from async code, like a service rendering in-process, which can't run a second
+    # event loop in the same thread
+    from concurrent.futures import ThreadPoolExecutor
+
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        return executor.submit(asyncio.run, coroutine).result()
+
+
+def _structure_hook(func: Transpiler, input_model: type) -> Callable[[Any, type], Any]:
+    return cached_per_function(_input_hooks, func, lambda: _c.gen_structure_attrs_fromdict(input_model))
+
+
+def _structure(values: Mapping[str, Any], func: Transpiler, input_model: type) -> Any:
+    try:
+        return _structure_hook(func, input_model)(values, input_model)
+    except Exception as exc:
+        raise InputValidationError(transform_error(exc)) from exc
+
+
+def prepare(func: Transpiler) -> None:
+    """Create the input model of a transpiler and compile its structure hook ahead of rendering.
+
+    Both are cached per function, so only the first render of a transpiler pays for them.
+    """
+    f = transpiler_function(func)
+    _structure_hook(f, create_input_model(f))
+
+
+def transpile(
+    func: Transpiler,
+    values: Mapping[str, Any] | None = None,
+    overrides: Iterable[str] = (),
+    typed_overrides: Iterable[str] = (),
+) -> Manifest | ManifestIterator:
+    """Call a transpiler with input values, like its command does with an input YAML file.
+
+    `overrides` are `path.to.arg=value` strings, like the `--set` option, and `typed_overrides`
+    have YAML values like `--set-typed`. Generators are returned as they are, checking each
+    resource as it's yielded. Async transpilers are run to completion on an event loop, async
+    generators are collected into a list.
+    """
+    f = transpiler_function(func)
+    input_model = create_input_model(f)
+    values = values or {}
+
+    compiled = compile_overrides(overrides, typed_overrides)
+    if compiled:
+        # overrides are set on the values before they're structured, so they're only validated once
+        values = compiled.apply(values, input_model)
+
+    input_obj = _structure(values, f, input_model)
+
+    manifest = f(**{field.name: getattr(input_obj, field.name) for field in fields(input_model)})
+
+    if isinstance(manifest, Coroutine):
+        manifest = _run(manifest)
+    elif isinstance(manifest, AsyncIterator):
+        manifest = _run(_collect(manifest))
+
+    # Validate outputs, generators are validated one resource at a time while streaming
+    if isinstance(manifest, Iterator):
+        return _validate_resources(manifest)
+    elif not isinstance(manifest, list):
+        raise InvalidOutputError()
+    for resource in manifest:
+        if not isinstance(resource, K8sResource):
+            raise InvalidOutputError()
+    return manifest
+
+
+def render(
+    func: Transpiler,
+    values: Mapping[str, Any] | None = None,
+    overrides: Iterable[str] = (),
+    typed_overrides: Iterable[str] = (),
+) -> Manifest:
+    """Render a transpiler, or the command made by `gybe.transpiler`, to a list of resources.
+
+    Raises InputValidationError, InvalidOverrideError or InvalidOutputError instead of printing
+    errors and exiting, so it can be called any number of times in one process.
+    """
+    return list(transpile(func, values, overrides, typed_overrides))
+
+
+def render_dicts(
+    func: Transpiler,
+    values: Mapping[str, Any] | None = None,
+    overrides: Iterable[str] = (),
+    typed_overrides: Iterable[str] = (),
+) -> list[JSONDict]:
+    """Render a transpiler to a list of JSON dicts, see `render`."""
+    # dicts aren't shared between resources, so each can be changed on its own
+    return [unstructure_model(resource) for resource in transpile(func, values, overrides, typed_overrides)]
+
+
+def render_yaml(
+    func: Transpiler,
+    values: Mapping[str, Any] | None = None,
+    overrides: Iterable[str] = (),
+    typed_overrides: Iterable[str] = (),
+) -> str:
+    """Render a transpiler to the same multi-document YAML its command writes, see `render`."""
+    stream = io.StringIO()
+    yaml_dump_manifest(transpile(func, values, overrides, typed_overrides), stream)
+    return stream.getvalue()
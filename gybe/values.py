@@ -0,0 +1,78 @@
+"""Read values files and merge them in layers, like a base, region and tenant values file.
+
+Later layers win. Dicts are merged key by key, any other value, like a list, replaces the value of
+earlier layers, and `null` removes the value of earlier layers so the input model's default
+applies again.
+"""
+
+import os
+import sys
+from functools import lru_cache
+from typing import Any, Iterable, Mapping
+
+from gybe.exceptions import InputValidationError
+from gybe.yaml import yaml_loads
+
+
+def parse_values(text: str, name: str = '<stdin>') -> Mapping[str, Any]:
+    """Parse values YAML, an empty document has no values."""
+    values = yaml_loads(text)
+    if values is None:
+        return {}
+    if not isinstance(values, Mapping):
+        raise InputValidationError([f'expected a mapping of input values @ {name}'])
+    return values
+
+
+@lru_cache(maxsize=128)
+def _read_file(path: str, mtime_ns: int, size: int) -> Mapping[str, Any]:  # noqa: ARG001
+    with open(path) as f:
+        return parse_values(f.read(), path)
+
+
+def _copy(value: Any) -> Any:
+    # YAML documents are trees of dicts, lists and immutable scalars, so this is a deep copy
+    if isinstance(value, dict):
+        return {k: _copy(v) for k, v in value.items()}
+    if isinstance(value, list):
+        return [_copy(v) for v in value]
+    return value
+
+
+def read_values(path: str) -> Mapping[str, Any]:
+    """Read a values file, `-` for stdin.
+
+    Files are parsed once for as long as they're unchanged, each read returns a new copy of the
+    values, so transpilers can change their input without changing later renders.
+    """
+    if path == '-':
+        return parse_values(sys.stdin.read())
+    path = os.path.abspath(path)
+    stat = os.stat(path)
+    return _copy(_read_file(path, stat.st_mtime_ns, stat.st_size))
+
+
+def merge_values(layers: Iterable[Mapping[str, Any]]) -> dict[str, Any]:
+    """Deep merge layers of values in one pass, without changing any of them.
+
+    Dicts only found in one layer aren't copied, so the merged values share them with the layers.
+    """
+    # the values of each key from every layer since the last one that replaced it
+    values: dict[str, list[Any]] = {}
+    for layer in layers:
+        for key, value in layer.items():
+            stack = values.get(key)
+            if stack is None:
+                values[key] = [value]
+            elif value is None:
+                del values[key]
+            elif isinstance(value, dict) and isinstance(stack[-1], dict):
+                stack.append(value)
+            else:
+                values[key] = [value]
+    return {key: merge_values(stack) if len(stack) > 1 else stack[0] for key, stack in values.items()}
+
+
+def load_values(paths: Iterable[str]) -> dict[str, Any]:
+    """Read values files and merge them, later files win."""
+    return merge_values([read_values(path) for path in paths])
@@ -0,0 +1,165 @@
+"""Render a transpiler again whenever its chart or values files change, for the `--watch` option.
+
+The process stays warm between renders, so only the chart module is imported again when it
+changes and the cached input model is reused when only values change. Files are polled with
+`os.stat`, which works the same on every platform without extra dependencies.
+"""
+
+import os
+import sys
+import time
+import traceback
+from typing import IO, Any, Iterable, Sequence
+
+import click
+
+from gybe.charts import chart_ref, find_transpiler
+from gybe.exceptions import ChartError, RenderError
+from gybe.rendering import Transpiler, transpile
+from gybe.values import load_values
+from gybe.yaml import yaml_dumps_documents
+
+POLL_INTERVAL = 0.2
+
+FileState = tuple[int, int] | None
+DocumentKey = tuple[Any, ...]
+
+
+def _file_state(path: str) -> FileState:
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return None
+    return stat.st_mtime_ns, stat.st_size
+
+
+def _document_key(resource: Any, seen: dict[DocumentKey, int]) -> DocumentKey:
+    """Identify a resource by its kind, namespace and name, numbering resources that share them."""
+    metadata = getattr(resource, 'metadata', None)
+    key = (
+        getattr(resource, 'apiVersion', None),
+        getattr(resource, 'kind', type(resource).__name__),
+        getattr(metadata, 'namespace', None),
+        getattr(metadata, 'name', None),
+    )
+    seen[key] = n = seen.get(key, -1) + 1
+    return (*key, n)
+
+
+def _describe(key: DocumentKey) -> str:
+    _, kind, namespace, name, _ = key
+    return f'{kind} {namespace}/{name}' if namespace else f'{kind} {name}'
+
+
+class Watcher:
+    """Render a transpiler, then render it again and write what changed each time its files change."""
+
+    def __init__(
+        self,
+        func: Transpiler,
+        paths: Sequence[str],
+        overrides: Sequence[str] = (),
+        typed_overrides: Sequence[str] = (),
+        output: IO[str] | None = None,
+    ):
+        """Watch the values files in `paths` and the chart `func` is defined in, if it can be imported again.
+
+        Only the changed documents are written to streams like a terminal or a pipe, files like
+        `-o manifest.yaml` are written again with the whole manifest. `output` is stdout by default.
+        """
+        self.func = func
+        self.paths = list(paths)
+        self.overrides = overrides
+        self.typed_overrides = typed_overrides
+        self.output = output if output is not None else sys.stdout
+        self.chart: str | None = None
+        self.chart_path: str | None = None
+        try:
+            self.chart = chart_ref(func)
+            self.chart_path = self.chart.rpartition(':')[0]
+        except ChartError:
+            # transpilers that can't be imported again only re-render when their values change
+            pass
+        self._documents: dict[DocumentKey, str] = {}
+        self._streamed = False
+        self._files = self._poll()
+
+    def _watched(self) -> Iterable[str]:
+        yield from self.paths
+        if self.chart_path is not None:
+            yield self.chart_path
+
+    def _poll(self) -> dict[str, FileState]:
+        return {path: _file_state(path) for path in self._watched()}
+
+    def changed(self) -> list[str]:
+        """Files that changed since the last call, or since watching started."""
+        files = self._poll()
+        changed = [path for path, state in files.items() if state != self._files.get(path)]
+        self._files = files
+        return changed
+
+    def _render(self) -> dict[DocumentKey, str]:
+        resources = transpile(self.func, load_values(self.paths), self.overrides, self.typed_overrides)
+        seen: dict[DocumentKey, int] = {}
+        return {
+            _document_key(resource, seen): document for resource, document in yaml_dumps_documents(resources)
+        }
+
+    def render(self) -> bool:
+        """Render again and write the documents that changed, returns whether rendering succeeded.
+
+        Errors are printed instead of raised, and the documents of the last successful render are
+        kept to compare the next one against.
+        """
+        try:
+            documents = self._render()
+        except RenderError as exc:
+            click.echo(f'\nERROR: {exc}', err=True)
+            return False
+        except Exception:
+            click.echo(traceback.format_exc(), err=True, nl=False)
+            return False
+
+        changed = [doc for key, doc in documents.items() if self._documents.get(key) != doc]
+        deleted = [key for key in self._documents if key not in documents]
+        self._documents = documents
+        if self.output.seekable():
+            if changed or deleted:
+                self.output.seek(0)
+                self.output.truncate()
+                self.output.write('---\n'.join(documents.values()) + '\n')
+        else:
+            if changed:
+                # documents of later renders continue the same multi-document stream
+                self.output.write('---\n' * self._streamed + '---\n'.join(changed) + '\n')
+                self._streamed = True
+            for key in deleted:
+                click.echo(f'Deleted {_describe(key)}', err=True)
+        self.output.flush()
+        click.echo(
+            f'Rendered {len(documents)} documents, {len(changed)} changed, {len(deleted)} deleted', err=True
+        )
+        return True
+
+    def reload(self) -> bool:
+        """Import the chart again, returns False and keeps the transpiler from before when that fails."""
+        try:
+            self.func = find_transpiler(self.chart)  # type: ignore[arg-type]
+        except Exception:
+            click.echo(traceback.format_exc(), err=True, nl=False)
+            return False
+        return True
+
+    def run(self, interval: float = POLL_INTERVAL) -> None:
+        """Render, then poll the watched files every `interval` seconds and render what changed."""
+        self.render()
+        click.echo(f'Watching {", ".join(self._watched())} for changes', err=True)
+        while True:
+            time.sleep(interval)
+            changed = self.changed()
+            if not changed:
+                continue
+            if self.chart_path in changed and not self.reload():
+                continue
+            self.render()
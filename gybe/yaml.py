@@ -1,15 +1,298 @@
 """Read and write YAML."""
 
-from typing import Any
+import io
+import os
+from dataclasses import fields
+from functools import lru_cache
+from operator import itemgetter
+from typing import IO, Any, Iterable, Iterator, Mapping, TypeAlias
 
 import yaml
+from yaml.emitter import Emitter
+from yaml.nodes import ScalarNode
+from yaml.resolver import Resolver
 
+from gybe.converter import Memo, unstructure_model
+from gybe.exceptions import YAMLBackendMismatchError
+from gybe.k8s.sparse import SparseK8sSpec, sparse_items
+from gybe.k8s.types import K8sSpec
 
-def yaml_dumps(d: dict[str, Any]) -> str:
-    """Write dict to YAML str"""
-    return yaml.dump(d, default_flow_style=False)
+# PyYAML folds scalars with spaces past this column and writes empty keys or keys this long as
+# complex keys, its limit of 128 includes the length of the `!!str` tag
+_WIDTH = 80
+_MAX_SIMPLE_KEY = 123
+_STR_TAG = 'tag:yaml.org,2002:str'
+
+_analyzer = Emitter(io.StringIO())
+_resolver = Resolver()
+_model_fields: dict[type, tuple[str, ...]] = {}
+_first = itemgetter(0)
+_scalar_types = frozenset({str, int, float, bool})
+
+# YAML written for models by id, indent and whether they follow a key, shared by the documents of
+# a manifest like `Memo` shares unstructured dicts
+Fragments: TypeAlias = dict[tuple[int, int, bool], tuple[K8sSpec, str]]
+
+
+# render with every backend and compare the results against pure-Python PyYAML
+cross_check = os.environ.get('GYBE_YAML_CROSS_CHECK', '') not in ('', '0')
+
+
+class _Dumper(yaml.Dumper):
+    # unstructured manifests reuse the dicts of shared models, write them out in full instead
+    # of as YAML anchors and aliases
+    def ignore_aliases(self, data: Any) -> bool:  # noqa: ARG002
+        return True
+
+
+_CDumper: type[Any] | None = None
+_CSafeLoader: type[Any] | None = None
+if yaml.__with_libyaml__:
+
+    class _LibYAMLDumper(yaml.CDumper):
+        def ignore_aliases(self, data: Any) -> bool:  # noqa: ARG002
+            return True
+
+    _CDumper = _LibYAMLDumper
+    _CSafeLoader = yaml.CSafeLoader
+
+
+@lru_cache(maxsize=1024)
+def _single_quoted_multiline(s: str) -> bool:
+    return s.replace('\n', '').isprintable() and _analyzer.analyze_scalar(s).allow_single_quoted
+
+
+def _libyaml_matches(o: Any) -> bool:
+    """Check that libyaml writes `o` exactly like the pure-Python emitter.
+
+    The emitters only differ on empty keys, keys of 123 characters or more and how long double
+    quoted strings are folded, so anything with a key like that, a string that would be double
+    quoted or a value that isn't JSON-like is left to the pure-Python emitter.
+    """
+    cls = o.__class__
+    if cls is str:
+        return o.isascii() and (o.isprintable() or _single_quoted_multiline(o))
+    if cls is dict:
+        for k, v in o.items():
+            if k.__class__ is str and (
+                not k or len(k) >= _MAX_SIMPLE_KEY or not (k.isascii() and k.isprintable())
+            ):
+                return False
+            if not _libyaml_matches(v):
+                return False
+    elif cls is list or cls is tuple:
+        for v in o:
+            if not _libyaml_matches(v):
+                return False
+    elif o is not None and cls not in _scalar_types:
+        return False
+    return True
+
+
+def _cross_check(backend: str, result: Any, expected: Any) -> None:
+    if result != expected:
+        raise YAMLBackendMismatchError(backend)
+
+
+def _pure_python_dumps(d: Any) -> str:
+    return yaml.dump(d, Dumper=_Dumper, default_flow_style=False)
+
+
+def yaml_dumps(d: Mapping[str, Any]) -> str:
+    """Write dict to YAML str, with libyaml when PyYAML was built with it"""
+    if _CDumper is None or not _libyaml_matches(d):
+        return _pure_python_dumps(d)
+    s = yaml.dump(d, Dumper=_CDumper, default_flow_style=False)
+    if cross_check:
+        _cross_check('libyaml', s, _pure_python_dumps(d))
+    return s
 
 
 def yaml_loads(s: str) -> dict[str, Any]:
-    """Read dict from YAML str"""
-    return yaml.safe_load(s)
+    """Read dict from YAML str, with libyaml when PyYAML was built with it"""
+    if _CSafeLoader is None:
+        return yaml.safe_load(s)
+    d = yaml.load(s, Loader=_CSafeLoader)  # noqa: S506
+    if cross_check:
+        _cross_check('libyaml', d, yaml.safe_load(s))
+    return d
+
+
+class _FallbackError(Exception):
+    """Raised for values the model emitter can't write exactly like `yaml_dumps`."""
+
+
+@lru_cache(maxsize=8192)
+def _str_scalar(s: str) -> str | None:
+    """Write a single line string plain or single quoted like PyYAML does, None for other styles."""
+    analysis = _analyzer.analyze_scalar(s)
+    if analysis.multiline:
+        return None
+    if analysis.allow_block_plain and _resolver.resolve(ScalarNode, s, (True, False)) == _STR_TAG:
+        return s
+    if analysis.allow_single_quoted:
+        return "'" + s.replace("'", "''") + "'"
+    return None
+
+
+def _key(k: Any) -> str:
+    if k.__class__ is not str or not k or len(k) >= _MAX_SIMPLE_KEY:
+        raise _FallbackError()
+    s = _str_scalar(k)
+    if s is None:
+        raise _FallbackError()
+    return s
+
+
+def _items(v: Any) -> list[tuple[Any, Any]]:
+    """Sorted keys and values of a dict or the fields of a model that are not None."""
+    if v.__class__ is dict:
+        try:
+            return sorted(v.items(), key=_first)
+        except TypeError:
+            raise _FallbackError()
+    if isinstance(v, SparseK8sSpec):
+        return sorted(sparse_items(v), key=_first)
+    if not isinstance(v, K8sSpec):
+        raise _FallbackError()
+    names = _model_fields.get(v.__class__)
+    if names is None:
+        names = _model_fields[v.__class__] = tuple(sorted(f.name for f in fields(v)))
+    return [(name, value) for name in names if (value := getattr(v, name)) is not None]
+
+
+def _write_node(
+    v: Any, indent: int, column: int, out: list[str], after_key: bool, fragments: Fragments | None
+) -> None:
+    """Write a value following either `key:` or `- ` and ending with a line break."""
+    cls = v.__class__
+    if cls is str:
+        s = _str_scalar(v)
+        if s is None or (' ' in v and column + len(s) > _WIDTH):
+            raise _FallbackError()
+    elif cls is int:
+        s = str(v)
+    elif cls is bool:
+        s = 'true' if v else 'false'
+    elif v is None:
+        s = 'null'
+    elif cls is list:
+        if not v:
+            s = '[]'
+        elif after_key:
+            # block sequences in a mapping aren't indented
+            out.append('\n')
+            _write_sequence(v, indent, out, False, fragments)
+            return
+        else:
+            _write_sequence(v, indent + 2, out, True, fragments)
+            return
+    elif fragments is not None and isinstance(v, K8sSpec):
+        key = (id(v), indent, after_key)
+        hit = fragments.get(key)
+        if hit is None:
+            start = len(out)
+            _write_collection(v, indent, out, after_key, fragments)
+            # keep a reference to the model so its id can't be reused while writing the manifest
+            hit = fragments[key] = (v, ''.join(out[start:]))
+            del out[start:]
+        out.append(hit[1])
+        return
+    else:
+        _write_collection(v, indent, out, after_key, fragments)
+        return
+    out.append(f' {s}\n' if after_key else f'{s}\n')
+
+
+def _write_collection(
+    v: Any, indent: int, out: list[str], after_key: bool, fragments: Fragments | None
+) -> None:
+    items = _items(v)
+    if not items:
+        out.append(' {}\n' if after_key else '{}\n')
+    elif after_key:
+        out.append('\n')
+        _write_mapping(items, indent + 2, out, False, fragments)
+    else:
+        _write_mapping(items, indent + 2, out, True, fragments)
+
+
+def _write_mapping(
+    items: list[tuple[Any, Any]], indent: int, out: list[str], inline: bool, fragments: Fragments | None
+) -> None:
+    pad = ' ' * indent
+    for k, v in items:
+        key = _key(k)
+        if inline:
+            # the first key goes on the line of the sequence item
+            out.append(f'{key}:')
+            inline = False
+        else:
+            out.append(f'{pad}{key}:')
+        _write_node(v, indent, indent + len(key) + 2, out, True, fragments)
+
+
+def _write_sequence(
+    items: list[Any], indent: int, out: list[str], inline: bool, fragments: Fragments | None
+) -> None:
+    pad = ' ' * indent + '- '
+    for v in items:
+        if inline:
+            out.append('- ')
+            inline = False
+        else:
+            out.append(pad)
+        _write_node(v, indent, indent + 2, out, False, fragments)
+
+
+def yaml_dumps_model(obj: K8sSpec, memo: Memo | None = None, fragments: Fragments | None = None) -> str:
+    """Write a model to YAML str, same as `yaml_dumps(unstructure_model(obj))`.
+
+    Block style YAML is written straight from the model fields without building dicts first, with
+    `fragments` a model that appears several times is written once and its YAML reused. Models
+    with values that need other scalar styles, like floats or multiline strings, are unstructured
+    with `memo` and written by PyYAML instead.
+    """
+    out: list[str] = []
+    try:
+        items = _items(obj)
+        if not items:
+            return '{}\n'
+        _write_mapping(items, 0, out, False, fragments)
+    except _FallbackError:
+        return yaml_dumps(unstructure_model(obj, memo))
+    s = ''.join(out)
+    if cross_check:
+        _cross_check('model emitter', s, _pure_python_dumps(unstructure_model(obj)))
+    return s
+
+
+def yaml_dumps_documents(resources: Iterable[K8sSpec]) -> Iterator[tuple[K8sSpec, str]]:
+    """Write each model to the YAML document of a manifest, yielding the model with its document.
+
+    Models shared between the resources of a list are unstructured and written once, resources
+    from any other iterable only share within their own document so they can be freed after
+    they're written.
+    """
+    shared = isinstance(resources, list)
+    memo: Memo = {}
+    fragments: Fragments = {}
+    for resource in resources:
+        if not shared:
+            memo = {}
+            fragments = {}
+        yield resource, yaml_dumps_model(resource, memo, fragments)
+
+
+def yaml_dump_manifest(resources: Iterable[K8sSpec], stream: IO[str]) -> None:
+    """Write models to a stream as a multi-document YAML manifest.
+
+    Each document is written as soon as it is serialized, so the whole manifest is never held in
+    memory as a single string, see `yaml_dumps_documents`.
+    """
+    separator = ''
+    for _, document in yaml_dumps_documents(resources):
+        stream.write(separator)
+        stream.write(document)
+        separator = '---\n'
+    stream.write('\n')
@@ -1,7 +1,11 @@
+import threading
+
 import pytest
 from click import Command
 from click.testing import CliRunner, Result
 
+from gybe.daemon import make_server
+
 
 def _run_cli(cli_fn: Command, yaml: str, *args: str) -> Result:
     runner = CliRunner()
@@ -16,3 +20,39 @@ def _run_cli(cli_fn: Command, yaml: str, *args: str) -> Result:
 def run_cli():
     """Invoke test CLI"""
     return _run_cli
+
+
+@pytest.fixture(autouse=True)
+def yaml_cross_check(monkeypatch):
+    """Compare every YAML backend against pure-Python PyYAML while testing"""
+    monkeypatch.setattr('gybe.yaml.cross_check', True)
+
+
+@pytest.fixture
+def chart_files(request):
+    """Contents of the chart directory by path, override per module or parametrize indirectly"""
+    return getattr(request, 'param', {})
+
+
+@pytest.fixture
+def chart(tmp_path, monkeypatch, chart_files):
+    """Write `chart_files` to the test's temp directory and run the test in it"""
+    monkeypatch.chdir(tmp_path)
+    for name, text in chart_files.items():
+        path = tmp_path / name
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(text)
+    return tmp_path
+
+
+@pytest.fixture
+def daemon(tmp_path):
+    """Run a render daemon on a socket in the test's temp directory"""
+    socket_path = str(tmp_path / 'gybe.sock')
+    server = make_server(socket_path)
+    thread = threading.Thread(target=server.serve_forever)
+    thread.start()
+    yield socket_path
+    server.shutdown()
+    server.server_close()
+    thread.join()
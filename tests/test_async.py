@@ -0,0 +1,83 @@
+import asyncio
+import os
+
+import pytest
+from click.testing import CliRunner
+
+import gybe
+from gybe.exceptions import InputValidationError, InvalidOutputError
+
+
+@gybe.transpiler
+async def config(paths: list[str], name: str = 'config') -> gybe.Manifest:
+    files = await gybe.files.read_many_text(paths)
+    return [
+        gybe.k8s.Secret(
+            metadata=gybe.k8s.ObjectMeta(name=name),
+            stringData={os.path.basename(path): text for path, text in files.items()},
+        )
+    ]
+
+
+async def secrets(paths: list[str]) -> gybe.AsyncManifestIterator:
+    for path in paths:
+        content = await gybe.files.read_bytes(path)
+        yield gybe.k8s.Secret(metadata=gybe.k8s.ObjectMeta(name=path), stringData={'key': content.decode()})
+
+
+@pytest.fixture
+def files(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    for name in 'abc':
+        (tmp_path / f'{name}.conf').write_text(f'{name} = 1\n')
+    (tmp_path / 'values.yaml').write_text('paths: [a.conf, b.conf, c.conf]')
+    return tmp_path
+
+
+def test_async_transpiler(files):
+    (secret,) = gybe.render(config, {'paths': ['c.conf', 'a.conf']})
+    assert secret.stringData == {'c.conf': 'c = 1\n', 'a.conf': 'a = 1\n'}
+
+    result = CliRunner().invoke(config, ['values.yaml', '--set', 'name=app'])
+    assert result.exit_code == 0
+    assert result.stdout == gybe.render_yaml(config, {'paths': ['a.conf', 'b.conf', 'c.conf'], 'name': 'app'})
+    assert 'name: app' in result.stdout
+
+    with pytest.raises(InputValidationError):
+        gybe.render(config, {})
+    with pytest.raises(FileNotFoundError):
+        gybe.render(config, {'paths': ['a.conf', 'missing.conf']})
+
+
+def test_async_generator_transpiler(files):
+    resources = gybe.render(secrets, {'paths': ['a.conf', 'b.conf']})
+    assert [r.metadata.name for r in resources] == ['a.conf', 'b.conf']
+    assert resources[1].stringData == {'key': 'b = 1\n'}
+
+
+def test_async_transpiler_output_is_validated():
+    async def not_a_list() -> gybe.Manifest:
+        return {'kind': 'Pod'}  # type: ignore[return-value]
+
+    async def not_resources() -> gybe.AsyncManifestIterator:
+        yield gybe.k8s.ObjectMeta(name='pod')  # type: ignore[misc]
+
+    with pytest.raises(InvalidOutputError):
+        gybe.render(not_a_list)
+    with pytest.raises(InvalidOutputError):
+        gybe.render(not_resources)
+
+
+def test_async_transpiler_rendered_from_event_loop(files):
+    async def service() -> str:
+        return gybe.render_yaml(config, {'paths': ['b.conf']})
+
+    assert asyncio.run(service()) == gybe.render_yaml(config, {'paths': ['b.conf']})
+
+
+def test_read_many(files):
+    assert asyncio.run(gybe.files.read_many_bytes([files / 'b.conf', 'a.conf'])) == {
+        str(files / 'b.conf'): b'b = 1\n',
+        'a.conf': b'a = 1\n',
+    }
+    assert asyncio.run(gybe.files.read_text('c.conf')) == 'c = 1\n'
@@ -0,0 +1,106 @@
+import pytest
+from click.testing import CliRunner
+
+import gybe
+from gybe.batch import _init_worker, _render_file, render_many
+from gybe.charts import chart_ref, find_transpiler
+from gybe.exceptions import ChartError
+
+CHART = """
+import gybe
+
+
+@gybe.transpiler
+def pods(tenant: str, count: int = 1) -> gybe.ManifestIterator:
+    for i in range(count):
+        yield gybe.k8s.Pod(metadata=gybe.k8s.ObjectMeta(name=f'{tenant}-{i}'))
+        if tenant == 'broken':
+            raise ValueError('the broken tenant fails halfway')
+"""
+
+
+@pytest.fixture
+def chart_files():
+    tenants = {f'tenants/{tenant}.yaml': f'tenant: {tenant}' for tenant in ('a', 'b', 'c')}
+    return {'chart.py': CHART, 'base.yaml': 'count: 2', **tenants}
+
+
+@pytest.mark.parametrize('jobs', ['1', '2'])
+def test_render_many(chart, jobs):
+    pods = find_transpiler('chart.py')
+    args = [
+        'base.yaml',
+        '--render-many',
+        'tenants/*.yaml',
+        '--output-dir',
+        'out',
+        '-j',
+        jobs,
+        '--set',
+        'count=3',
+    ]
+    result = CliRunner().invoke(pods, args)
+    assert result.exit_code == 0
+    assert result.stderr == 'Rendered 3 of 3 values files to out\n'
+    assert sorted(p.name for p in (chart / 'out').iterdir()) == ['a.yaml', 'b.yaml', 'c.yaml']
+    assert 'name: c-2' in (chart / 'out' / 'c.yaml').read_text()
+
+
+@pytest.mark.parametrize('jobs', [1, 2])
+def test_render_many_collects_errors(chart, jobs):
+    (chart / 'tenants' / 'broken.yaml').write_text('tenant: broken')
+    (chart / 'tenants' / 'invalid.yaml').write_text('count: 1')
+    paths = ['tenants/a.yaml', 'tenants/broken.yaml', 'tenants/invalid.yaml', 'tenants/missing.yaml']
+    errors = render_many(find_transpiler('chart.py'), paths, 'out', jobs=jobs)
+    assert list(errors) == paths[1:]
+    assert errors['tenants/broken.yaml'] == 'ValueError: the broken tenant fails halfway'
+    assert errors['tenants/invalid.yaml'].startswith(
+        'validation errors:\n- required field missing @ $.tenant'
+    )
+    assert 'No such file or directory' in errors['tenants/missing.yaml']
+    assert [p.name for p in (chart / 'out').iterdir()] == ['a.yaml']
+
+
+def test_render_many_command_errors(chart):
+    pods = find_transpiler('chart.py')
+    (chart / 'tenants' / 'invalid.yaml').write_text('count: 1')
+    result = CliRunner().invoke(pods, ['--render-many', 'tenants/*.yaml', '--render-many', 'tenants/a.yaml'])
+    assert result.exit_code == 2
+    assert 'Option --render-many needs --output-dir.' in result.stderr
+
+    result = CliRunner().invoke(pods, ['--render-many', 'tenants/*.yaml', '--output-dir', 'out', '-j', '1'])
+    assert result.exit_code == -1
+    assert result.stdout.startswith('\nERROR: tenants/invalid.yaml\nvalidation errors:\n')
+    assert result.stderr == 'Rendered 3 of 4 values files to out\n'
+
+    (chart / 'a.yaml').write_text('tenant: a')
+    result = CliRunner().invoke(
+        pods, ['--render-many', '*.yaml', '--render-many', 'tenants/*', '--output-dir', 'out']
+    )
+    assert result.exit_code == 2
+    assert 'a.yaml and tenants/a.yaml would both be rendered to out/a.yaml' in result.stderr
+
+    for args in (['-', '--render-many', 'tenants/*'], ['base.yaml', '--render-many', '-']):
+        result = CliRunner().invoke(pods, [*args, '--output-dir', 'out'], input='count: 2')
+        assert result.exit_code == 2
+        assert "Option --render-many can't read values from stdin." in result.stderr
+
+
+def test_render_many_needs_top_level_transpilers(chart):
+    @gybe.transpiler
+    def pods(tenant: str) -> gybe.Manifest:
+        return []
+
+    with pytest.raises(ChartError, match='pods should be defined at the top level'):
+        chart_ref(pods)
+    assert chart_ref(find_transpiler('chart.py')) == f'{chart / "chart.py"}:pods'
+
+    result = CliRunner().invoke(pods, ['--render-many', 'tenants/*.yaml', '--output-dir', 'out', '-j', '2'])
+    assert result.exit_code == 2
+    assert 'should be defined at the top level of a chart file' in result.stderr
+
+
+def test_worker_renders_imported_chart(chart):
+    _init_worker(chart_ref(find_transpiler('chart.py')))
+    assert _render_file(None, ['base.yaml'], [], [], 'tenants/b.yaml', 'b.yaml') is None
+    assert 'name: b-1' in (chart / 'b.yaml').read_text()
@@ -0,0 +1,160 @@
+import os
+import sys
+from types import ModuleType
+
+import pytest
+from click.testing import CliRunner
+
+import gybe
+from gybe.cache import RenderCache, default_cache_dir, local_modules
+from gybe.charts import find_transpiler
+from gybe.cli import main
+
+CHART = """
+import gybe
+from labels import LABELS
+
+
+@gybe.transpiler
+def pods(count: int = 1) -> gybe.Manifest:
+    return [gybe.k8s.Pod(metadata=gybe.k8s.ObjectMeta(name=f'pod-{i}', labels=LABELS)) for i in range(count)]
+"""
+
+
+def fail(*args, **kwargs):
+    raise AssertionError('rendered instead of reading the cache')
+
+
+@pytest.fixture
+def chart_files():
+    return {'chart.py': CHART, 'labels.py': "LABELS = {'team': 'a'}\n", 'values.yaml': 'count: 2'}
+
+
+@pytest.fixture
+def chart(chart, monkeypatch):
+    monkeypatch.setenv('GYBE_CACHE_DIR', str(chart / 'cache'))
+    return chart
+
+
+def test_transpiler_command_cache(chart, monkeypatch):
+    pods = find_transpiler('chart.py')
+    result = CliRunner().invoke(pods, ['values.yaml', '--cache', '--set', 'count=3'])
+    assert result.exit_code == 0
+    assert result.stdout == gybe.render_yaml(pods, {'count': 3})
+    assert len(os.listdir(chart / 'cache')) == 1
+
+    with monkeypatch.context() as m:
+        m.setattr('gybe.decorators.render_yaml', fail)
+        assert (
+            CliRunner().invoke(pods, ['values.yaml', '--cache', '--set', 'count=3']).stdout == result.stdout
+        )
+
+    result = CliRunner().invoke(pods, ['values.yaml', '--cache'])
+    assert result.stdout.count('name: pod-') == 2
+    (chart / 'values.yaml').write_text('count: 1')
+    result = CliRunner().invoke(pods, ['values.yaml', '--cache'])
+    assert result.stdout.count('name: pod-') == 1
+    assert len(os.listdir(chart / 'cache')) == 3
+
+    result = CliRunner().invoke(pods, ['values.yaml', '--cache', '--set', 'count=x'])
+    assert result.exit_code == -1
+    assert result.stdout.startswith('validation errors:')
+
+
+def test_render_command_cache(chart, daemon, monkeypatch):
+    args = ['render', 'chart.py', 'values.yaml', '--cache']
+    result = CliRunner().invoke(main, args)
+    assert result.exit_code == 0
+    assert 'team: a' in result.stdout
+
+    # cached renders don't import the chart
+    with monkeypatch.context() as m:
+        m.setattr('gybe.charts.find_transpiler', fail)
+        assert CliRunner().invoke(main, args).stdout == result.stdout
+
+    # nor are they used once a local module the chart imported changed
+    key = RenderCache().key('chart.py', ['values.yaml'])
+    assert RenderCache().get(key) == result.stdout
+    (chart / 'labels.py').write_text("LABELS = {'team': 'b'}\n")
+    assert RenderCache().get(key) is None
+    result = CliRunner().invoke(main, [*args, '--daemon', '--socket', daemon])
+    assert result.exit_code == 0
+    # renders from the daemon aren't cached, since the modules the chart imported there aren't known
+    assert len(os.listdir(chart / 'cache')) == 1
+
+    result = CliRunner().invoke(main, ['render', 'missing.py', '--cache'])
+    assert result.exit_code == 1
+    assert "Can't read chart missing.py" in result.output
+
+
+def test_render_command_cache_keeps_charts_in_different_directories_apart(chart):
+    chart_source = CHART.replace('from labels import LABELS', 'from helper import LABELS')
+    for team in ('a', 'b'):
+        (chart / team).mkdir()
+        (chart / team / 'chart.py').write_text(chart_source)
+        (chart / team / 'helper.py').write_text(f"LABELS = {{'team': '{team}'}}\n")
+    for team in ('a', 'b', 'a', 'b'):
+        result = CliRunner().invoke(main, ['render', f'{team}/chart.py', '--cache'])
+        assert result.exit_code == 0
+        assert f'team: {team}' in result.stdout
+    assert len(os.listdir(chart / 'cache')) == 2
+
+
+def test_cache_needs_values_files_and_chart_files(chart):
+    @gybe.transpiler
+    def pods() -> gybe.Manifest:
+        return []
+
+    result = CliRunner().invoke(pods, ['-f', '-', '--cache'])
+    assert result.exit_code == 2
+    assert "Option --cache can't cache values read from stdin." in result.stderr
+    result = CliRunner().invoke(main, ['render', 'chart.py', '-f', '-', '--cache'])
+    assert result.exit_code == 2
+    assert "Option --cache can't cache values read from stdin." in result.stderr
+
+    result = CliRunner().invoke(pods, ['values.yaml', '--cache'])
+    assert result.exit_code == 2
+    assert 'should be defined at the top level of a chart file' in result.stderr
+
+
+def test_cache_evicts_least_recently_used(chart):
+    cache = RenderCache(str(chart / 'lru'))
+    for i, key in enumerate('abc'):
+        cache.put(key, 'x' * 80, 'chart.py')
+        os.utime(chart / 'lru' / f'{key}.yaml', ns=(i * 10**9, i * 10**9))
+    # room for three entries
+    cache.max_bytes = 3 * os.path.getsize(chart / 'lru' / 'a.yaml')
+    (chart / 'lru' / 'interrupted.tmp').write_text('x' * 1000)
+    assert cache.get('a') == 'x' * 80
+    cache.put('d', 'x' * 80, 'chart.py')
+    assert sorted(os.listdir(chart / 'lru')) == ['a.yaml', 'c.yaml', 'd.yaml', 'interrupted.tmp']
+
+    (chart / 'lru' / 'a.yaml').write_text('corrupt')
+    assert cache.get('a') is None
+    assert cache.get('missing') is None
+
+
+def test_local_modules(chart, monkeypatch):
+    modules = {
+        'chart': chart / 'chart.py',
+        'labels': chart / 'labels.py',
+        'installed': chart / '.venv' / 'lib' / 'site-packages' / 'installed.py',
+        'compiled': chart / 'compiled.so',
+        'elsewhere': chart.parent / 'elsewhere.py',
+    }
+    for name, path in modules.items():
+        module = ModuleType(name)
+        module.__file__ = str(path)
+        monkeypatch.setitem(sys.modules, name, module)
+    monkeypatch.setitem(sys.modules, 'builtin', ModuleType('builtin'))
+    assert local_modules('chart.py') == [str(chart / 'labels.py')]
+
+
+def test_default_cache_dir(monkeypatch):
+    monkeypatch.setenv('GYBE_CACHE_DIR', '/var/cache/gybe')
+    assert default_cache_dir() == '/var/cache/gybe'
+    monkeypatch.delenv('GYBE_CACHE_DIR')
+    monkeypatch.setenv('XDG_CACHE_HOME', '/home/ci/.cache')
+    assert default_cache_dir() == '/home/ci/.cache/gybe'
+    monkeypatch.delenv('XDG_CACHE_HOME')
+    assert default_cache_dir() == os.path.expanduser('~/.cache/gybe')
@@ -0,0 +1,248 @@
+import os
+import signal
+import socket
+import socketserver
+
+import pytest
+from click.testing import CliRunner
+
+from gybe.charts import find_transpiler, split_chart_ref
+from gybe.cli import main
+from gybe.daemon import default_socket_path, handle_request, make_server, request_render
+from gybe.exceptions import ChartError, DaemonError, InvalidOutputError
+from tests.test_example import EXPECTED_TWO_POD_MANIFEST, VALID_TWO_POD_YAML
+
+CHART = """
+import gybe
+from tests.test_example import two_pods
+
+if __name__ == '__main__':
+    raise SystemExit('charts are not run as scripts')
+"""
+
+PODS_CHART = """
+import gybe
+
+
+@gybe.transpiler
+def pods(name: str = 'pod', count: int = 1) -> gybe.Manifest:
+    return [gybe.k8s.Pod(metadata=gybe.k8s.ObjectMeta(name=f'{name}-{i}')) for i in range(count)]
+
+
+@gybe.transpiler
+def invalid() -> gybe.Manifest:
+    return 'pod'
+
+
+@gybe.transpiler
+def broken() -> gybe.Manifest:
+    return 1 / 0
+"""
+
+
+@pytest.fixture
+def chart_files():
+    return {'chart.py': CHART, 'pods.py': PODS_CHART, 'values.yaml': VALID_TWO_POD_YAML}
+
+
+def _render(*args: str):
+    return CliRunner().invoke(main, ['render', *args])
+
+
+@pytest.mark.parametrize('use_daemon', [False, True])
+def test_render_chart(chart, daemon, use_daemon):
+    args = ['chart.py', 'values.yaml', '--socket', daemon] + (['--daemon'] if use_daemon else [])
+    result = _render(*args)
+    assert result.exit_code == 0
+    assert result.stdout == EXPECTED_TWO_POD_MANIFEST.lstrip() + '\n'
+
+    result = _render(*args, '--set', 'image=python:3.14', '-o', 'manifest.yaml')
+    assert result.exit_code == 0
+    assert (chart / 'manifest.yaml').read_text().startswith(EXPECTED_TWO_POD_MANIFEST.lstrip()[:60])
+    assert 'python:3.14' in (chart / 'manifest.yaml').read_text()
+
+
+def test_render_daemon_falls_back_in_process(chart):
+    result = _render('pods.py:pods', '--daemon', '--socket', str(chart / 'missing.sock'))
+    assert result.exit_code == 0
+    assert 'name: pod-0' in result.stdout
+
+
+@pytest.mark.parametrize('use_daemon', [False, True])
+def test_render_errors(chart, daemon, use_daemon):
+    daemon_args = ['--socket', daemon] + (['--daemon'] if use_daemon else [])
+
+    result = _render('chart.py', *daemon_args)
+    assert result.exit_code == -1
+    assert result.stdout.startswith('validation errors:\n- required field missing @ $.image\n')
+
+    result = _render('pods.py:pods', *daemon_args, '--set', 'count', '--set-typed', 'name.x=1')
+    assert result.exit_code == -1
+    assert result.stdout == (
+        '\nERROR: --set expects this format: path.to.arg=value\n'
+        '\nERROR: path "name.x" does not exist in the input data\n'
+    )
+
+    result = _render('pods.py:pods', *daemon_args, '--set-typed', 'count=2')
+    assert result.exit_code == 0
+    assert 'name: pod-1' in result.stdout
+
+    result = _render('pods.py:invalid', *daemon_args)
+    assert result.exit_code == 1
+    assert 'Must be a list or generator of gybe.types.K8sResource' in result.output
+
+    result = _render('pods.py', *daemon_args)
+    assert result.exit_code == 1
+    assert 'should define one transpiler' in result.output
+    assert 'found pods, invalid, broken' in result.output
+
+
+def test_daemon_sends_back_chart_errors(chart, daemon):
+    with pytest.raises(DaemonError, match='ZeroDivisionError'):
+        request_render(daemon, 'pods.py:broken')
+    with pytest.raises(InvalidOutputError):
+        request_render(daemon, 'pods.py:invalid')
+    with pytest.raises(ChartError, match='has no transpiler named missing'):
+        request_render(daemon, 'pods.py:missing')
+    (chart / 'count.yaml').write_text('count: 3')
+    assert 'pod-2' in request_render(daemon, 'pods.py:pods', ['count.yaml'])
+
+    with socket.socket(socket.AF_UNIX) as sock, sock.makefile('rwb') as stream:
+        sock.connect(daemon)
+        stream.write(b'not json\n')
+        stream.flush()
+        assert b'Invalid request' in stream.readline()
+
+
+def test_daemon_reloads_changed_charts(chart, daemon):
+    assert 'name: pod-0' in request_render(daemon, 'pods.py:pods')
+    (chart / 'pods.py').write_text(PODS_CHART.replace("name: str = 'pod'", "name: str = 'changed'"))
+    stat = os.stat(chart / 'pods.py')
+    os.utime(chart / 'pods.py', ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+    assert 'name: changed-0' in request_render(daemon, 'pods.py:pods')
+
+
+HELPER_CHART = """
+import gybe
+from helper import NAME
+
+
+@gybe.transpiler
+def pods() -> gybe.Manifest:
+    return [gybe.k8s.Pod(metadata=gybe.k8s.ObjectMeta(name=NAME))]
+"""
+
+
+def test_daemon_keeps_local_modules_of_charts_apart(chart, daemon):
+    for name in ('a', 'b'):
+        (chart / name).mkdir()
+        (chart / name / 'chart.py').write_text(HELPER_CHART)
+        (chart / name / 'helper.py').write_text(f"NAME = 'from-{name}'\n")
+    assert 'name: from-a' in request_render(daemon, 'a/chart.py')
+    assert 'name: from-b' in request_render(daemon, 'b/chart.py')
+    assert 'name: from-a' in request_render(daemon, 'a/chart.py')
+
+    # charts are imported again when a module they imported from their directory changes
+    (chart / 'a' / 'helper.py').write_text("NAME = 'changed'\n")
+    stat = os.stat(chart / 'a' / 'helper.py')
+    os.utime(chart / 'a' / 'helper.py', ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+    assert 'name: changed' in request_render(daemon, 'a/chart.py')
+    assert 'name: from-b' in request_render(daemon, 'b/chart.py')
+    (chart / 'a' / 'helper.py').unlink()
+    with pytest.raises(DaemonError, match='ModuleNotFoundError'):
+        request_render(daemon, 'a/chart.py')
+
+
+def test_find_transpiler_errors(chart):
+    with pytest.raises(ChartError, match="Can't read chart"):
+        find_transpiler('missing.py')
+    with pytest.raises(ChartError, match='should be a Python file'):
+        find_transpiler('values.yaml')
+    (chart / 'failing.py').write_text('1 / 0\n')
+    with pytest.raises(ZeroDivisionError):
+        find_transpiler('failing.py')
+    (chart / 'empty.py').write_text('')
+    with pytest.raises(ChartError, match='found none'):
+        find_transpiler('empty.py')
+    assert handle_request({'chart': str(chart / 'empty.py')})['error']['type'] == 'ChartError'
+
+
+def test_split_chart_ref():
+    assert split_chart_ref('chart.py') == ('chart.py', None)
+    assert split_chart_ref('charts/chart.py:two_pods') == ('charts/chart.py', 'two_pods')
+    assert split_chart_ref('C:\\charts\\chart.py') == ('C:\\charts\\chart.py', None)
+
+
+def test_serve(chart, monkeypatch):
+    socket_path = str(chart / 'gybe.sock')
+    # a stale socket left behind by a daemon that didn't stop cleanly
+    socketserver.UnixStreamServer(socket_path, socketserver.StreamRequestHandler).server_close()
+
+    def serve_forever(self):
+        assert handle_request({'chart': str(chart / 'pods.py:pods')})['yaml'].startswith('apiVersion: v1')
+        assert os.path.exists(socket_path)
+        raise KeyboardInterrupt()
+
+    monkeypatch.setattr(socketserver.UnixStreamServer, 'serve_forever', serve_forever)
+    sigterm = signal.getsignal(signal.SIGTERM)
+    try:
+        result = CliRunner().invoke(main, ['serve', '--socket', socket_path, '--preload', 'chart.py'])
+    finally:
+        signal.signal(signal.SIGTERM, sigterm)
+    assert result.exit_code == 0
+    assert not os.path.exists(socket_path)
+
+
+def test_serve_fails_when_already_running(daemon):
+    result = CliRunner().invoke(main, ['serve', '--socket', daemon])
+    assert result.exit_code == 1
+    assert 'A daemon is already listening' in result.output
+
+
+def test_daemon_renders_in_client_working_directory(chart, daemon, monkeypatch):
+    (chart / 'data').mkdir()
+    (chart / 'data' / 'name.txt').write_text('from-data')
+    (chart / 'reads.py').write_text(
+        PODS_CHART.replace("name: str = 'pod'", "name: str = open('name.txt').read()")
+    )
+    request = {'chart': str(chart / 'reads.py:pods'), 'cwd': str(chart / 'data')}
+    assert 'name: from-data-0' in handle_request(request)['yaml']
+    assert os.getcwd() == str(chart)
+    assert handle_request({**request, 'cwd': str(chart / 'missing')})['error']['type'] == 'Exception'
+    assert os.getcwd() == str(chart)
+
+    monkeypatch.chdir(chart / 'data')
+    assert 'name: from-data-0' in request_render(daemon, str(chart / 'reads.py:pods'))
+
+
+def test_daemon_sockets_of_other_users(chart, daemon, monkeypatch):
+    assert request_render(daemon, 'pods.py:pods') is not None
+    # a path below a file can't be connected to
+    assert request_render(str(chart / 'values.yaml' / 'gybe.sock'), 'pods.py:pods') is None
+    (chart / 'shared').mkdir()
+    os.chmod(chart / 'shared', 0o777)  # noqa: S103
+    with pytest.raises(OSError, match='Other users can write to'):
+        make_server(str(chart / 'shared' / 'gybe.sock'))
+    os.chmod(chart / 'shared', 0o1777)  # noqa: S103
+    make_server(str(chart / 'shared' / 'gybe.sock')).server_close()
+    make_server(str(chart / 'private' / 'gybe.sock')).server_close()
+    assert (chart / 'private').stat().st_mode & 0o777 == 0o700
+
+    uid = os.getuid() + 1
+    monkeypatch.setattr('gybe.daemon.os.getuid', lambda: uid)
+    assert request_render(daemon, 'pods.py:pods') is None
+    result = _render('pods.py:pods', '--daemon', '--socket', daemon)
+    assert result.exit_code == 0
+    assert 'name: pod-0' in result.stdout
+
+
+def test_default_socket_path(tmp_path, monkeypatch):
+    monkeypatch.setenv('GYBE_SOCKET', '/run/gybe.sock')
+    assert '$GYBE_SOCKET' in CliRunner().invoke(main, ['render', '--help']).output
+    assert default_socket_path() == '/run/gybe.sock'
+    monkeypatch.delenv('GYBE_SOCKET')
+    monkeypatch.setenv('XDG_RUNTIME_DIR', '/run/user/1000')
+    assert default_socket_path() == f'/run/user/1000/gybe-{os.getuid()}.sock'
+    monkeypatch.delenv('XDG_RUNTIME_DIR')
+    monkeypatch.setattr('tempfile.tempdir', str(tmp_path))
+    assert default_socket_path() == str(tmp_path / f'gybe-{os.getuid()}' / 'gybe.sock')
@@ -1,9 +1,19 @@
+import ast
+import enum
+import importlib
+import inspect
+import pydoc
+import sys
+from contextlib import contextmanager
 from pathlib import Path
 from tempfile import TemporaryDirectory
 
 import pytest
 
-from gybe.codegen.k8s_modules import write_module
+import gybe.k8s
+from gybe.codegen.k8s_modules import CodegenOptions, _split_models, write_module, write_modules
+from gybe.converter import converter, get_unstructure_fn, make_unstructure_fn, unstructure_model
+from gybe.k8s.sparse import SparseK8sSpec
 
 base_test_spec_dir = Path(__file__).parent / 'data/k8s-api-specs'
 base_codegen_out_dir = Path(__file__).parent / 'data/codegen-outputs'
@@ -41,3 +51,232 @@ def test_cli_importable():
     from gybe.codegen import __main__, cli
 
     _ = cli, __main__
+
+
+def test_cli_options(monkeypatch):
+    from gybe.codegen import cli
+
+    calls = []
+    monkeypatch.setattr(cli, 'write_modules', lambda dirs, options: calls.append((dirs, options)))
+    monkeypatch.setattr(sys, 'argv', ['gybe.codegen', 'v1_31=specs/v1_31', 'v1_32', '--slots', '--split'])
+    cli.main()
+    assert calls == [
+        (
+            {'v1_31': Path('specs/v1_31'), 'v1_32': Path('kubernetes/api/openapi-spec/v3')},
+            CodegenOptions(slots=True, split=True),
+        )
+    ]
+
+
+@contextmanager
+def generated_k8s_versions(versions: dict[str, str], **kwargs):
+    """Generate k8s modules into a temporary directory and make them importable under `gybe.k8s`."""
+    with TemporaryDirectory() as tdir:
+        temp_k8s_module_dir = Path(tdir) / 'gybe/k8s'
+        temp_k8s_module_dir.mkdir(parents=True)
+        write_modules(
+            {m: base_test_spec_dir / v / 'api/openapi-spec/v3' for m, v in versions.items()},
+            k8s_module_dir=temp_k8s_module_dir,
+            **kwargs,
+        )
+        gybe.k8s.__path__.append(str(temp_k8s_module_dir))
+        try:
+            yield [importlib.import_module(f'gybe.k8s.{m}') for m in versions]
+        finally:
+            gybe.k8s.__path__.remove(str(temp_k8s_module_dir))
+            for name in [m for m in sys.modules if m.startswith(tuple(f'gybe.k8s.{v}' for v in versions))]:
+                del sys.modules[name]
+
+
+@contextmanager
+def generated_k8s(version_module: str, version: str = 'v1.32.1', **kwargs):
+    """Generate k8s modules of one version, see `generated_k8s_versions`."""
+    with generated_k8s_versions({version_module: version}, **kwargs) as (module,):
+        yield module
+
+
+def test_codegen_to_dict_matches_unstructure():
+    with generated_k8s('v1_90', options=CodegenOptions(to_dict=True)):
+        v1 = importlib.import_module('gybe.k8s.v1_90.core.v1')
+        meta_v1 = importlib.import_module('gybe.k8s.v1_90.meta.v1')
+
+        pod = v1.Pod(
+            metadata=meta_v1.ObjectMeta(name='pod-1', labels={'app': 'web'}),
+            spec=v1.PodSpec(
+                containers=[
+                    v1.Container(
+                        name='app',
+                        command=['python'],
+                        resources=v1.ResourceRequirements(limits={'cpu': '1'}),
+                        ports=[v1.ContainerPort(containerPort=8080)],
+                    )
+                ],
+            ),
+        )
+        assert 'to_dict' in v1.Pod.__dict__
+        assert pod.to_dict() == make_unstructure_fn(v1.Pod)(pod)
+        assert unstructure_model(pod) == pod.to_dict()
+
+        # values that don't match the type hints exactly are unstructured by cattrs in both functions
+        class Policy(str, enum.Enum):
+            ALWAYS = 'Always'
+
+        pod.metadata = {'name': 'raw-dict'}
+        pod.spec.restartPolicy = Policy.ALWAYS
+        pod.spec.containers = (pod.spec.containers[0],)
+        pod.spec.containers[0].command = ('python', Policy.ALWAYS)
+        assert pod.to_dict() == make_unstructure_fn(v1.Pod)(pod)
+        assert unstructure_model(pod)['metadata'] == {'name': 'raw-dict'}
+        assert unstructure_model(pod)['spec']['containers'][0]['command'] == ['python', 'Always']
+
+
+def test_codegen_version_package_imports_groups_lazily():
+    with generated_k8s('v1_93') as version:
+        assert {'apps', 'core', 'meta'} <= set(version.__all__)
+        assert 'gybe.k8s.v1_93.autoscaling.v2' not in sys.modules
+        assert version.autoscaling.v2.HorizontalPodAutoscaler.__module__ == 'gybe.k8s.v1_93.autoscaling.v2'
+        assert version.autoscaling.v1.Scale.__module__ == 'gybe.k8s.v1_93.autoscaling.v1'
+
+
+def test_codegen_slots_option():
+    with generated_k8s('v1_91', options=CodegenOptions(slots=True, kw_only=True)):
+        v1 = importlib.import_module('gybe.k8s.v1_91.core.v1')
+        container = v1.Container(name='app', image='python:3')
+        assert not hasattr(container, '__dict__')
+        assert container.to_dict() == {'name': 'app', 'image': 'python:3'}
+        with pytest.raises(TypeError):
+            v1.Container('app')
+
+
+def test_shipped_models_use_slots():
+    container = gybe.k8s.Container(name='app', ports=[gybe.k8s.ContainerPort(containerPort=80)])
+    assert not hasattr(container, '__dict__')
+    assert container.to_dict() == make_unstructure_fn(gybe.k8s.Container)(container)
+    with pytest.raises(AttributeError):
+        container.undefined_field = 'value'  # type: ignore[attr-defined]
+
+
+def test_shipped_versions_share_identical_models():
+    from gybe.k8s import v1_31, v1_32, v1_34
+
+    assert v1_34.meta.v1.ObjectMeta is v1_32.meta.v1.ObjectMeta is v1_31.meta.v1.ObjectMeta
+    assert v1_34.core.v1.Secret is v1_31.core.v1.Secret
+    assert v1_34.core.v1.Secret.__module__ == 'gybe.k8s.v1_31.core.v1'
+    # models with different fields, or that reference models with different fields, are defined again
+    assert v1_34.core.v1.PodSpec is not v1_31.core.v1.PodSpec
+    assert v1_32.apps.v1.Deployment is not v1_31.apps.v1.Deployment
+
+
+def test_codegen_sparse_option():
+    with generated_k8s('v1_92', options=CodegenOptions(sparse=True)):
+        v1 = importlib.import_module('gybe.k8s.v1_92.core.v1')
+        container = v1.Container(name='app', image='python:3', ports=[v1.ContainerPort(containerPort=80)])
+        assert isinstance(container, SparseK8sSpec)
+        assert not hasattr(container, '__dict__')
+        assert 'to_dict' not in v1.Container.__dict__
+        assert container.to_dict() == {'name': 'app', 'image': 'python:3', 'ports': [{'containerPort': 80}]}
+
+
+def test_codegen_slim_docs_option():
+    with generated_k8s('v1_94', options=CodegenOptions(slim_docs=True, slots=True)) as version:
+        v1 = importlib.import_module('gybe.k8s.v1_94.core.v1')
+        assert 'Pod is a collection of containers' not in Path(v1.__file__).read_text()
+        assert (Path(version.__file__).parent / 'docs.json').exists()
+
+        doc = inspect.getdoc(v1.Pod)
+        assert doc is not None
+        assert doc.startswith('Pod is a collection of containers')
+        assert 'spec: Specification of the desired behavior of the pod.' in doc
+        assert v1.Pod(spec=None).__doc__ == v1.Pod.__doc__
+        assert 'Pod is a collection of containers' in pydoc.render_doc(v1.Pod)
+        assert v1.Container(name='app').to_dict() == {'name': 'app'}
+
+
+def test_codegen_split_option():
+    with generated_k8s('v1_95', options=CodegenOptions(slots=True, split=True, slim_docs=True)) as version:
+        v1 = importlib.import_module('gybe.k8s.v1_95.core.v1')
+        assert Path(v1.__file__).name == '__init__.py'
+        assert not (Path(version.__file__).parent / 'core/v1.py').exists()
+        assert 'Pod' in dir(v1) and 'PodSpec' in v1.__all__
+        assert not [m for m in sys.modules if m.startswith('gybe.k8s.v1_95.core.v1.')]
+
+        # a kind's private types share its submodule, types used by several kinds get their own
+        assert v1.Pod.__module__ == v1.PodStatus.__module__ == 'gybe.k8s.v1_95.core.v1._pod'
+        assert 'gybe.k8s.v1_95.core.v1._pod_spec' not in sys.modules
+        assert v1.PodSpec.__module__ == v1.Container.__module__ == 'gybe.k8s.v1_95.core.v1._pod_spec'
+        assert 'gybe.k8s.v1_95.core.v1._service' not in sys.modules
+
+        pod = converter.structure(
+            {
+                'metadata': {'name': 'pod-1'},
+                'spec': {'containers': [{'name': 'app', 'ports': [{'containerPort': 80}]}]},
+            },
+            v1.Pod,
+        )
+        assert isinstance(pod.spec.containers[0], v1.Container)
+        assert pod.to_dict() == make_unstructure_fn(v1.Pod)(pod) == unstructure_model(pod)
+        assert inspect.getdoc(v1.Pod).startswith('Pod is a collection of containers')
+
+
+SPLIT_SOURCE = """
+class Pod(K8sResource):
+    spec: Optional[PodSpec] = None
+    status: Optional[PodStatus] = None
+class PodSpec(K8sSpec):
+    containers: List[Container]
+class Container(K8sSpec):
+    name: str
+class PodStatus(K8sSpec):
+    phase: Optional[str] = None
+class PodTemplate(K8sResource):
+    template: Optional[PodSpec] = None
+class Ref(K8sSpec):
+    back: Optional[Back] = None
+class Back(K8sSpec):
+    ref: Optional[Ref] = None
+"""
+
+
+def test_split_models_groups_by_dependency_closure():
+    class_defs = [c for c in ast.parse(SPLIT_SOURCE).body if isinstance(c, ast.ClassDef)]
+    submodules = {name: [c.name for c in cdefs] for name, cdefs in _split_models(class_defs).items()}
+    assert submodules == {
+        '_pod': ['Pod', 'PodStatus'],
+        '_pod_spec': ['PodSpec', 'Container'],
+        '_pod_template': ['PodTemplate'],
+        '_back': ['Ref', 'Back'],
+    }
+
+
+def test_codegen_write_modules_shares_identical_models(monkeypatch):
+    # also split the few models that core/v1 redefines
+    monkeypatch.setattr('gybe.codegen.k8s_modules.SPLIT_MIN_MODELS', 5)
+    versions = {'v1_88': 'v1.31.5', 'v1_89': 'v1.32.1'}
+    with generated_k8s_versions(versions, options=CodegenOptions(slots=True, split=True)) as (old, new):
+        old_v1 = importlib.import_module('gybe.k8s.v1_88.core.v1')
+        new_v1 = importlib.import_module('gybe.k8s.v1_89.core.v1')
+        sources = [p.read_text() for p in Path(new_v1.__file__).parent.glob('*.py')]
+        assert not any('class ObjectReference(' in source for source in sources)
+        assert 'class ObjectMeta(' not in Path(new.meta.v1.__file__).read_text()
+        assert new_v1.ObjectReference is old_v1.ObjectReference
+        assert old.meta.v1.ObjectMeta is new.meta.v1.ObjectMeta
+        assert get_unstructure_fn(new_v1.ObjectReference) is get_unstructure_fn(old_v1.ObjectReference)
+        assert 'ObjectReference' in dir(new_v1)
+
+        # models that changed between the versions, or reference one that did, are redefined
+        assert new_v1.PodSpec is not old_v1.PodSpec
+        assert new_v1.Pod is not old_v1.Pod
+        assert new_v1.Pod.__module__ == 'gybe.k8s.v1_89.core.v1._pod'
+
+        pod = converter.structure(
+            {'metadata': {'name': 'pod-1'}, 'spec': {'containers': [{'name': 'app'}]}}, new_v1.Pod
+        )
+        assert isinstance(pod.metadata, old.meta.v1.ObjectMeta)
+        assert pod.to_dict() == make_unstructure_fn(new_v1.Pod)(pod) == unstructure_model(pod)
+
+
+def test_codegen_sparse_option_rejects_slots():
+    with pytest.raises(ValueError):
+        CodegenOptions(sparse=True, slots=True)
+    with pytest.raises(ValueError):
+        CodegenOptions(sparse=True, to_dict=True)
@@ -0,0 +1,114 @@
+from dataclasses import dataclass
+from typing import List, Optional
+
+import gybe
+from gybe.converter import Memo, converter, get_unstructure_fn, unstructure_model
+from gybe.k8s.types import JSONDict, K8sSpec
+from gybe.yaml import yaml_dumps
+
+
+def test_unstructure_model_omits_none_values():
+    container = gybe.k8s.Container(name='app', image='python:3')
+    assert unstructure_model(container) == {'name': 'app', 'image': 'python:3'}
+
+
+def test_unstructure_model_nested_models_and_lists():
+    pod = gybe.k8s.Pod(
+        metadata=gybe.k8s.ObjectMeta(name='pod-1', labels={'app': 'web'}),
+        spec=gybe.k8s.PodSpec(
+            containers=[
+                gybe.k8s.Container(
+                    name='app',
+                    command=['python', '-m', 'http.server'],
+                    ports=[gybe.k8s.ContainerPort(containerPort=8080)],
+                )
+            ]
+        ),
+    )
+    assert converter.unstructure(pod) == {
+        'apiVersion': 'v1',
+        'kind': 'Pod',
+        'metadata': {'labels': {'app': 'web'}, 'name': 'pod-1'},
+        'spec': {
+            'containers': [
+                {
+                    'name': 'app',
+                    'command': ['python', '-m', 'http.server'],
+                    'ports': [{'containerPort': 8080}],
+                }
+            ]
+        },
+    }
+
+
+def test_model_to_dict():
+    assert gybe.k8s.EnvVar(name='A', value='1').to_dict() == {'name': 'A', 'value': '1'}
+
+
+def test_unstructure_fn_is_cached_per_class():
+    assert get_unstructure_fn(gybe.k8s.Probe) is get_unstructure_fn(gybe.k8s.Probe)
+
+
+@dataclass
+class CustomSpec(K8sSpec):
+    name: str
+    config: Optional[JSONDict] = None
+    values: Optional[List[int | str]] = None
+    pods: Optional[List['gybe.k8s.PodSpec']] = None
+
+
+def test_unstructure_model_custom_spec():
+    spec = CustomSpec(name='a', config={'k': ['v']}, values=[1, 'b'], pods=[gybe.k8s.PodSpec(containers=[])])
+    assert unstructure_model(spec) == {
+        'name': 'a',
+        'config': {'k': ['v']},
+        'values': [1, 'b'],
+        'pods': [{'containers': []}],
+    }
+
+
+def test_unstructure_model_values_not_matching_type_hints():
+    meta = {'name': 'raw-dict'}
+    pod = gybe.k8s.Pod(metadata=meta, spec=gybe.k8s.PodSpec(containers=('a',)))  # type: ignore[arg-type]
+    assert unstructure_model(pod)['metadata'] == meta
+    assert unstructure_model(pod)['spec'] == {'containers': ['a']}
+
+
+@dataclass
+class UnresolvableSpec(K8sSpec):
+    ref: 'UndefinedModel'  # type: ignore[name-defined]  # noqa: F821
+
+
+def test_unstructure_model_unresolvable_type_hints():
+    assert unstructure_model(UnresolvableSpec(ref=gybe.k8s.EnvVar(name='a'))) == {'ref': {'name': 'a'}}
+
+
+def test_unstructure_model_memo_reuses_shared_subtrees():
+    pod_spec = gybe.k8s.PodSpec(containers=[gybe.k8s.Container(name='app')])
+    pods = [gybe.k8s.Pod(metadata=gybe.k8s.ObjectMeta(name=f'pod-{i}'), spec=pod_spec) for i in range(3)]
+    memo: Memo = {}
+    dicts = [unstructure_model(p, memo) for p in pods]
+    assert dicts == [unstructure_model(p) for p in pods]
+    assert dicts[0]['spec'] is dicts[1]['spec'] is dicts[2]['spec']
+    assert dicts[0]['metadata'] is not dicts[1]['metadata']
+    assert unstructure_model(pods[0], memo) is dicts[0]
+
+
+def test_unstructure_model_memo_with_to_dict_models():
+    @dataclass
+    class Wrapper(K8sSpec):
+        spec: Optional['gybe.k8s.PodSpec'] = None
+
+        def to_dict(self) -> JSONDict:
+            raise AssertionError('to_dict() skips the memo')
+
+    pod_spec = gybe.k8s.PodSpec(containers=[])
+    memo: Memo = {}
+    first, second = unstructure_model(Wrapper(pod_spec), memo), unstructure_model(Wrapper(pod_spec), memo)
+    assert first == {'spec': {'containers': []}}
+    assert first['spec'] is second['spec']
+
+
+def test_yaml_dumps_writes_shared_dicts_without_aliases():
+    shared = {'name': 'app'}
+    assert yaml_dumps({'a': shared, 'b': shared}) == 'a:\n  name: app\nb:\n  name: app\n'
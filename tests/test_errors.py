@@ -10,3 +10,15 @@ def invalid_output_not_list():
 def test_invalid_output_not_list_raises_error(run_cli):
     result = run_cli(invalid_output_not_list, '')
     assert isinstance(result.exception, InvalidOutputError)
+
+
+@gybe.transpiler
+def invalid_output_generator() -> gybe.ManifestIterator:
+    yield gybe.k8s.Pod(metadata=gybe.k8s.ObjectMeta(name='valid'))
+    yield 'foo'  # type: ignore[misc]
+
+
+def test_invalid_output_generator_raises_error_after_valid_resources(run_cli):
+    result = run_cli(invalid_output_generator, '')
+    assert isinstance(result.exception, InvalidOutputError)
+    assert result.stdout == 'apiVersion: v1\nkind: Pod\nmetadata:\n  name: valid\n'
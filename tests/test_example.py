@@ -69,6 +69,34 @@ def test_two_pods_chart_transpiles_with_valid_yaml(run_cli):
     assert result.stdout.strip() == EXPECTED_TWO_POD_MANIFEST.strip()
 
 
+@gybe.transpiler
+def two_pods_generator(image: str, command: list[str]) -> gybe.ManifestIterator:
+    pod_spec = gybe.k8s.PodSpec(
+        containers=[create_standard_container(image=image, command=command)],
+    )
+    for name in ('pod-1', 'pod-2'):
+        yield gybe.k8s.Pod(
+            kind='Pod',
+            apiVersion='v1',
+            metadata=gybe.k8s.ObjectMeta(name=name),
+            spec=pod_spec,
+        )
+
+
+def test_two_pods_generator_chart_transpiles_with_valid_yaml(run_cli):
+    result = run_cli(two_pods_generator, VALID_TWO_POD_YAML)
+    assert result.exit_code == 0
+    assert result.stdout == EXPECTED_TWO_POD_MANIFEST.lstrip() + '\n'
+
+
+def test_two_pods_chart_writes_output_file(run_cli, tmp_path):
+    output = tmp_path / 'manifest.yaml'
+    result = run_cli(two_pods, VALID_TWO_POD_YAML, '--output', str(output))
+    assert result.exit_code == 0
+    assert result.stdout == ''
+    assert output.read_text() == EXPECTED_TWO_POD_MANIFEST.lstrip() + '\n'
+
+
 def test_two_pods_chart_transpiles_with_valid_yaml_and_set_arg(run_cli):
     result = run_cli(two_pods, VALID_TWO_POD_YAML, '--set', 'image=python:3.14')
     assert result.exit_code == 0
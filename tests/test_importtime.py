@@ -0,0 +1,74 @@
+import os
+
+import pytest
+
+from benchmarks.importtime import (
+    FACADE_MODULES,
+    budget_for,
+    imported_modules,
+    k8s_modules,
+    measure,
+    parse_importtime,
+    peak_memory,
+    startup_modules,
+)
+
+IMPORTTIME_OUTPUT = """\
+import time: self [us] | cumulative | imported package
+import time:       906 |       2110 | encodings
+import time:      1536 |       4710 | site
+import time:       563 |      16958 |   attr
+import time:      2425 |     336134 | gybe
+import time:      1030 |      10000 | gybe.k8s
+"""
+
+
+def test_parse_importtime_sums_top_level_imports():
+    assert parse_importtime(IMPORTTIME_OUTPUT, ignore={'encodings', 'site'}) == pytest.approx(0.346134)
+
+
+def test_every_module_has_a_budget():
+    modules = k8s_modules()
+    assert 'gybe.k8s.v1_34' in modules
+    assert 'gybe.k8s.v1_34.core.v1' in modules
+    for module in FACADE_MODULES + modules:
+        assert budget_for(module)
+
+
+def test_budget_for_unknown_module():
+    with pytest.raises(KeyError):
+        budget_for('kubernetes')
+
+
+def test_measure_writes_bytecode_outside_the_source_tree(tmp_path, monkeypatch):
+    monkeypatch.setattr('benchmarks.importtime.PYCACHE_PREFIX', str(tmp_path))
+    result = measure('gybe.exceptions', repeat=1)
+    assert result.seconds > 0
+    assert result.peak_bytes > 0
+    assert [p.name for p in tmp_path.rglob('exceptions.*.pyc')]
+
+
+BUDGETED_MODULES = [*FACADE_MODULES, 'gybe.k8s.v1_34', 'gybe.k8s.v1_34.core.v1']
+
+
+@pytest.mark.parametrize('module', BUDGETED_MODULES)
+def test_import_within_memory_budget(module):
+    mib = budget_for(module)[1]
+    assert peak_memory(module) / 2**20 <= mib
+
+
+def test_imports_stay_lazy():
+    assert not {m for m in imported_modules('gybe') if m.startswith('gybe.k8s.v1_')}
+    assert not {'click', 'cattrs', 'yaml'} & imported_modules('gybe.k8s')
+    assert not {m for m in imported_modules('gybe.k8s.v1_34') if m.startswith('gybe.k8s.v1_34.')}
+    # an API group imports the models it references, not every group of its version
+    groups = {m.split('.')[3] for m in imported_modules('gybe.k8s.v1_34.core.v1') if m.count('.') >= 4}
+    assert groups == {'api', 'core', 'meta'}
+
+
+# wall-clock budgets depend on the machine, `python -m benchmarks.importtime` checks them all
+@pytest.mark.skipif(not os.environ.get('GYBE_IMPORT_BUDGETS'), reason='set GYBE_IMPORT_BUDGETS=1 to run')
+@pytest.mark.parametrize('module', BUDGETED_MODULES)
+def test_import_within_budget(module):
+    result = measure(module, ignore=startup_modules())
+    assert not result.over_budget(), result
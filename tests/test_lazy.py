@@ -0,0 +1,43 @@
+import importlib
+import subprocess
+import sys
+
+import pytest
+
+import gybe
+import gybe.k8s
+
+
+def test_import_gybe_defers_models_and_cli():
+    script = 'import sys, gybe, gybe.k8s; print(" ".join(sorted(sys.modules)))'
+    result = subprocess.run([sys.executable, '-c', script], capture_output=True, text=True, check=True)  # noqa: S603
+    modules = result.stdout.split()
+    for name in ('click', 'cattrs', 'gybe.decorators', 'gybe.k8s.v1_32.core.v1'):
+        assert name not in modules
+
+
+def test_version_packages_resolve_through_gybe_k8s():
+    script = 'import gybe; print(gybe.k8s.v1_31.core.v1.ConfigMap.__module__, gybe.k8s.v1_34.__name__)'
+    result = subprocess.run([sys.executable, '-c', script], capture_output=True, text=True, check=True)  # noqa: S603
+    assert result.stdout.split() == ['gybe.k8s.v1_31.core.v1', 'gybe.k8s.v1_34']
+
+
+@pytest.mark.parametrize('module', [gybe, gybe.k8s])
+def test_lazy_all_names_resolve(module):
+    for name in module.__all__:
+        assert getattr(module, name) is not None
+    assert set(module.__all__) <= set(dir(module))
+
+
+def test_lazy_unknown_attribute_raises_attribute_error():
+    with pytest.raises(AttributeError, match='IngressServiceBackendPort'):
+        _ = gybe.k8s.IngressServiceBackendPort  # type: ignore[attr-defined]
+    with pytest.raises(AttributeError, match='v1_1'):
+        _ = gybe.k8s.v1_1  # type: ignore[attr-defined]
+
+
+@pytest.mark.parametrize('version_module', ['v1_31', 'v1_32', 'v1_33', 'v1_34'])
+def test_version_packages_load_groups_lazily(version_module):
+    version = importlib.import_module(f'gybe.k8s.{version_module}')
+    assert {'apps', 'core', 'meta'} <= set(version.__all__) <= set(dir(version))
+    assert version.core.v1.Pod.__module__ == f'gybe.k8s.{version_module}.core.v1'
@@ -0,0 +1,146 @@
+import copy
+import dataclasses
+import io
+import pickle
+from dataclasses import dataclass
+
+import pytest
+
+import gybe
+from gybe.memoize import CacheInfo, freeze, structural_key
+from gybe.yaml import yaml_dump_manifest
+from tests.test_sparse import SparseContainer, SparsePod
+
+
+@dataclass
+class Resources:
+    cpu: float
+    labels: dict[str, str]
+
+
+def test_structural_key():
+    assert structural_key(Resources(1.0, {'a': 'b', 'c': 'd'})) == structural_key(
+        Resources(1.0, {'a': 'b', 'c': 'd'})
+    )
+    assert structural_key(Resources(1.0, {'a': 'b', 'c': 'd'})) != structural_key(
+        Resources(1.0, {'c': 'd', 'a': 'b'})
+    )
+    assert structural_key(Resources(1.0, {})) != structural_key(Resources(2.0, {}))
+    assert len({structural_key(v) for v in (1, 1.0, True, '1', [1], (1,), {1}, frozenset([1]))}) == 7
+    assert structural_key({1}) == structural_key(frozenset([1]))
+    assert structural_key([gybe.k8s.EnvVar(name='a')]) == structural_key([gybe.k8s.EnvVar(name='a')])
+    assert structural_key(SparseContainer(name='a')) != structural_key(SparseContainer(name='a', image='b'))
+    with pytest.raises(TypeError, match='not bytearray'):
+        structural_key([bytearray()])
+
+
+def test_cached_returns_shared_results():
+    calls = []
+
+    @gybe.cached
+    def container(name: str, resources: Resources, command: list[str]) -> gybe.k8s.Container:
+        """Build a container."""
+        calls.append(name)
+        return gybe.k8s.Container(name=name, command=command, env=[gybe.k8s.EnvVar(name='CPU', value='1')])
+
+    first = container('app', Resources(1, {'a': 'b'}), ['serve'])
+    assert container('app', Resources(1, {'a': 'b'}), ['serve']) is first
+    assert container('app', Resources(1, {'a': 'c'}), ['serve']) is not first
+    assert container('app', Resources(1, {'a': 'b'}), command=['serve']) is not first
+    assert calls == ['app'] * 3
+    assert container.__doc__ == 'Build a container.'
+    assert container.cache_info() == CacheInfo(hits=1, misses=3, maxsize=128, currsize=3)
+    container.cache_clear()
+    assert container.cache_info() == CacheInfo(hits=0, misses=0, maxsize=128, currsize=0)
+
+    @gybe.cached
+    def env(variables: dict[str, str]) -> list[gybe.k8s.EnvVar]:
+        return [gybe.k8s.EnvVar(name=k, value=v) for k, v in variables.items()]
+
+    assert [e.name for e in env({'A': '1', 'B': '$(A)'})] == ['A', 'B']
+    assert [e.name for e in env({'B': '$(A)', 'A': '1'})] == ['B', 'A']
+
+    # a result shared by several resources is written for each of them
+    pods = [gybe.k8s.Pod(spec=gybe.k8s.PodSpec(containers=[first])) for _ in range(2)]
+    out = io.StringIO()
+    yaml_dump_manifest(pods, out)
+    assert out.getvalue().count('name: CPU') == 2
+
+
+def test_cached_evicts_least_recently_used():
+    @gybe.cached(maxsize=2)
+    def double(n: int) -> list[int]:
+        return [n, n]
+
+    a, b = double(1), double(2)
+    assert double(1) is a
+    double(3)
+    assert double(1) is a
+    assert double(2) is not b
+    assert double.cache_info() == CacheInfo(hits=2, misses=4, maxsize=2, currsize=2)
+
+    unbounded = gybe.cached(maxsize=None)(double.__wrapped__)
+    for n in range(200):
+        unbounded(n)
+    assert unbounded.cache_info().currsize == 200
+
+
+def test_cached_frozen_results():
+    @gybe.cached(frozen=True)
+    def pods(name: str) -> list[gybe.k8s.Pod]:
+        container = gybe.k8s.Container(name=name, image='app:1')
+        return [gybe.k8s.Pod(metadata=gybe.k8s.ObjectMeta(name=name), spec=gybe.k8s.PodSpec([container]))]
+
+    (pod,) = pods('app')
+    expected = {
+        'apiVersion': 'v1',
+        'kind': 'Pod',
+        'metadata': {'name': 'app'},
+        'spec': {'containers': [{'name': 'app', 'image': 'app:1'}]},
+    }
+    assert pod.to_dict() == expected
+    assert isinstance(pod, gybe.k8s.Pod)
+    with pytest.raises(dataclasses.FrozenInstanceError, match="'name' of a cached ObjectMeta"):
+        pod.metadata.name = 'other'
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        del pod.spec.containers[0].image
+    assert freeze(pod) is pod
+    assert type(pods('other')[0]) is type(pod)
+    assert structural_key(pod) == structural_key(pods.__wrapped__('app')[0])
+
+    # copies can be changed
+    changed = dataclasses.replace(pod, metadata=gybe.k8s.ObjectMeta(name='other'))
+    changed.kind = 'Pod'
+    copied = copy.deepcopy(pod)
+    copied.spec.containers[0].image = 'app:2'
+    copy.copy(pod.metadata).name = 'other'
+    assert pod.to_dict() == expected
+
+    # frozen models are equal to the models they were made from, and pickled as them
+    assert pod == pods.__wrapped__('app')[0]
+    assert pods.__wrapped__('app')[0] == pod
+    assert pod != pods('other')[0]
+    assert pod.metadata != pod
+    unpickled = pickle.loads(pickle.dumps(pod))  # noqa: S301
+    assert unpickled == pod
+    assert type(unpickled) is gybe.k8s.Pod
+    assert type(unpickled.spec.containers[0]) is gybe.k8s.Container
+    unpickled.metadata.name = 'other'
+
+
+def test_freeze_sparse_models():
+    values = {'pods': [SparsePod(containers=[SparseContainer(name='app', command=['serve'])])]}
+    assert freeze(values) is values
+    pod = values['pods'][0]
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        pod.containers[0].image = 'app:1'
+    assert pod.to_dict() == {
+        'apiVersion': 'v1',
+        'kind': 'Pod',
+        'containers': [{'name': 'app', 'command': ['serve']}],
+    }
+    copied = copy.copy(pod.containers[0])
+    copied.image = 'app:1'
+    assert copied.image == 'app:1'
+    assert pod == SparsePod(containers=[SparseContainer(name='app', command=['serve'])])
+    assert pickle.loads(pickle.dumps(pod)) == pod  # noqa: S301
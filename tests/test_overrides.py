@@ -0,0 +1,108 @@
+from typing import Any
+
+import pytest
+
+import gybe
+from gybe.exceptions import InvalidOverrideError
+from gybe.overrides import compile_overrides
+from tests.test_nested_set import PodConfig
+
+
+def apply(values: dict[str, Any], *overrides: str, typed: tuple[str, ...] = (), input_model: Any = None):
+    return compile_overrides(overrides, typed).apply(values, input_model)
+
+
+def test_overrides_share_paths():
+    values = {'tenants': {'a': {'image': 'app:1', 'replicas': 1}, 'b': {'image': 'app:1'}}, 'other': {}}
+    patched = apply(values, 'tenants.a.image=app:2', 'tenants.a.replicas=3', 'tenants.b.image=app:3')
+    assert patched == {
+        'tenants': {'a': {'image': 'app:2', 'replicas': '3'}, 'b': {'image': 'app:3'}},
+        'other': {},
+    }
+    assert values['tenants']['a'] == {'image': 'app:1', 'replicas': 1}
+    assert patched['other'] is values['other']
+
+
+def test_typed_overrides():
+    patched = apply({}, 'tag=3', typed=('replicas=3', 'debug=true', 'limits=null', 'args=[a, b]', 'name=x=y'))
+    assert patched == {
+        'tag': '3',
+        'replicas': 3,
+        'debug': True,
+        'limits': None,
+        'args': ['a', 'b'],
+        'name': 'x=y',
+    }
+
+
+def test_overrides_add_missing_keys_and_append():
+    values = {'containers': [{'name': 'app', 'args': ['serve']}]}
+    patched = apply(
+        values,
+        'labels.team.name=platform',
+        'containers.-.name=proxy',
+        'containers.0.args.-=--debug',
+        'containers.-1.ports.-.containerPort=80',
+        'volumes.-.-=data',
+    )
+    assert patched == {
+        'labels': {'team': {'name': 'platform'}},
+        'containers': [
+            {'name': 'app', 'args': ['serve', '--debug']},
+            {'name': 'proxy', 'ports': [{'containerPort': '80'}]},
+        ],
+        'volumes': [['data']],
+    }
+    assert values == {'containers': [{'name': 'app', 'args': ['serve']}]}
+
+
+def test_later_overrides_win():
+    assert apply({}, 'a.b=1', 'a=2') == {'a': '2'}
+    assert apply({}, typed=('a={b: 1}', 'a.c=2')) == {'a': {'b': 1, 'c': 2}}
+
+
+def test_override_errors_are_batched():
+    overrides = ['image', '=x', 'count.x=1', 'items.3=x', 'items.x=1', '-.name=x', 'count.-=1']
+    with pytest.raises(InvalidOverrideError) as exc_info:
+        apply({'count': 1, 'items': []}, *overrides, typed=('bad=[',))
+    assert exc_info.value.override == 'image'
+    assert exc_info.value.errors == [
+        ('image', '--set expects this format: path.to.arg=value'),
+        ('=x', '--set expects this format: path.to.arg=value'),
+        ('bad=[', '"[" is not a valid YAML value'),
+        ('count.x=1', 'path "count.x" does not exist in the input data'),
+        ('count.-=1', 'path "count.-" does not exist in the input data'),
+        ('items.3=x', 'path "items.3" does not exist in the input data'),
+        ('items.x=1', 'path "items.x" does not exist in the input data'),
+        ('-.name=x', 'path "-.name" does not exist in the input data'),
+    ]
+
+
+def test_overrides_use_input_model_defaults():
+    @gybe.transpiler
+    def pods(pod: PodConfig, sidecar: PodConfig | None = None) -> gybe.Manifest:
+        return []
+
+    input_model = gybe.rendering.create_input_model(pods.callback.__wrapped__)
+    patched = apply({}, 'pod.command.-=x.py', 'sidecar.name=proxy', input_model=input_model)
+    assert patched == {'pod': {'command': ['python', 'server.py', 'x.py']}, 'sidecar': {'name': 'proxy'}}
+    with pytest.raises(InvalidOverrideError, match='path "pod.missing.x"'):
+        apply({}, 'pod.missing.x=1', input_model=input_model)
+
+
+def test_cli_overrides(run_cli):
+    @gybe.transpiler
+    def pods(image: str, count: int = 1, debug: bool = False) -> gybe.Manifest:
+        name = 'debug' if debug else 'pod'
+        return [gybe.k8s.Pod(metadata=gybe.k8s.ObjectMeta(name=f'{name}-{i}')) for i in range(count)]
+
+    result = run_cli(pods, '', '--set', 'image=app:1', '--set-typed', 'debug=false', '--set', 'count=2')
+    assert result.exit_code == 0
+    assert 'name: pod-1' in result.stdout
+
+    result = run_cli(pods, 'image: app:1', '--set', 'image.tag=2', '--set', 'count')
+    assert result.exit_code == -1
+    assert result.stdout == (
+        '\nERROR: --set expects this format: path.to.arg=value\n'
+        '\nERROR: path "image.tag" does not exist in the input data\n'
+    )
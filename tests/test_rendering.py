@@ -0,0 +1,181 @@
+import gc
+import weakref
+
+import pytest
+
+import gybe
+from gybe.exceptions import InputValidationError, InvalidOutputError, InvalidOverrideError, RenderError
+from gybe.modeling import _input_models, create_input_model
+from gybe.rendering import _input_hooks, prepare, transpile
+from tests.test_example import EXPECTED_TWO_POD_MANIFEST, VALID_TWO_POD_YAML, two_pods, two_pods_generator
+from tests.test_nested_set import PodConfig
+
+VALUES = {'image': 'python:3', 'command': ['python', '-m', 'http.server']}
+
+
+def pods(image: str, count: int = 2) -> gybe.Manifest:
+    return [gybe.k8s.Pod(metadata=gybe.k8s.ObjectMeta(name=f'pod-{i}'), spec=None) for i in range(count)]
+
+
+def test_render_yaml_matches_command_output(run_cli):
+    assert gybe.render_yaml(two_pods, VALUES) == run_cli(two_pods, VALID_TWO_POD_YAML).stdout
+    assert gybe.render_yaml(two_pods, VALUES).strip() == EXPECTED_TWO_POD_MANIFEST.strip()
+
+
+def test_render_resources_and_dicts():
+    resources = gybe.render(two_pods_generator, VALUES)
+    assert [r.metadata.name for r in resources] == ['pod-1', 'pod-2']
+    dicts = gybe.render_dicts(two_pods, VALUES)
+    assert [d['metadata']['name'] for d in dicts] == ['pod-1', 'pod-2']
+    assert dicts[0]['spec'] == dicts[1]['spec']
+    assert dicts[0]['spec'] is not dicts[1]['spec']
+
+
+def test_render_plain_function_repeatedly():
+    values = {'image': 'python:3'}
+    assert len(gybe.render(pods, values)) == 2
+    assert len(gybe.render(pods, values, overrides=['count=3'])) == 3
+    assert len(gybe.render(pods, values)) == 2
+    assert values == {'image': 'python:3'}
+
+
+def test_transpile_keeps_generators_lazy():
+    manifest = transpile(two_pods_generator, VALUES)
+    assert not isinstance(manifest, list)
+    assert next(iter(manifest)).metadata.name == 'pod-1'
+
+
+def test_render_input_validation_error():
+    with pytest.raises(InputValidationError) as exc_info:
+        gybe.render(pods, {'count': 'many'})
+    assert exc_info.value.errors == [
+        'required field missing @ $.image',
+        'invalid value for type, expected int @ $.count',
+    ]
+    assert isinstance(exc_info.value, RenderError)
+
+
+@pytest.mark.parametrize(
+    'override,message',
+    [
+        ('image', '--set expects this format: path.to.arg=value'),
+        ('missing.path=1', 'path "missing.path" does not exist in the input data'),
+        ('command.first=1', 'path "command.first" does not exist in the input data'),
+        ('command.5=1', 'path "command.5" does not exist in the input data'),
+        ('image.tag=1', 'path "image.tag" does not exist in the input data'),
+    ],
+)
+def test_render_invalid_override_error(override: str, message: str):
+    with pytest.raises(InvalidOverrideError, match=message) as exc_info:
+        gybe.render(two_pods, VALUES, overrides=[override])
+    assert exc_info.value.override == override
+
+
+def not_a_manifest() -> gybe.Manifest:
+    return 'foo'  # type: ignore[return-value]
+
+
+def test_render_invalid_output_error():
+    with pytest.raises(InvalidOutputError):
+        gybe.render(not_a_manifest)
+
+
+class SlottedTranspiler:
+    __slots__ = ()
+    __name__ = 'slotted'
+
+    def __call__(self, image: str) -> gybe.Manifest:
+        return pods(image)
+
+
+def test_input_model_and_hooks_are_cached_per_function():
+    prepare(two_pods)
+    input_model = create_input_model(two_pods.callback.__wrapped__)
+    assert two_pods.callback.__wrapped__ in _input_hooks
+    gybe.render(two_pods, VALUES, overrides=['image=python:3.14'])
+    assert create_input_model(two_pods.callback.__wrapped__) is input_model
+    assert create_input_model(pods) is not input_model
+
+    # callables that can't be weakly referenced get a new model each time
+    slotted = SlottedTranspiler()
+    assert create_input_model(slotted) is not create_input_model(slotted)
+    assert len(gybe.render(slotted, {'image': 'python:3'})) == 2
+
+    def temporary(config: PodConfig | None = None) -> gybe.Manifest:
+        return []
+
+    gybe.render(
+        temporary, {'config': {'name': 'app', 'image': 'python:3'}}, overrides=['config.image=python:3.14']
+    )
+    count = len(_input_models)
+    input_model = weakref.ref(create_input_model(temporary))
+    del temporary
+    gc.collect()
+    assert len(_input_models) == count - 1
+    # neither the converter nor the overrides keep the model of a freed function
+    assert input_model() is None
+
+
+def configured_pods(
+    configs: dict[str, PodConfig],
+    extra: PodConfig | None = None,
+    sidecars: list[PodConfig] | None = None,
+    tag: int = 1,
+) -> gybe.Manifest:
+    return [
+        gybe.k8s.Pod(
+            metadata=gybe.k8s.ObjectMeta(name=name),
+            spec=gybe.k8s.PodSpec(
+                containers=[gybe.k8s.Container(name=name, image=c.image, command=c.command)]
+            ),
+        )
+        for name, c in configs.items()
+    ]
+
+
+def test_overrides_are_set_on_values_before_structuring():
+    values = {'configs': {'a': {'name': 'a'}, 'b': {'name': 'b', 'command': ['python', 'b.py']}}}
+    pods_ = gybe.render(
+        configured_pods,
+        values,
+        overrides=['configs.a.command.1=a.py', 'configs.b.command.1=main.py', 'configs.b.image=python:3.14'],
+    )
+    assert [(p.spec.containers[0].image, p.spec.containers[0].command) for p in pods_] == [
+        ('python:3', ['python', 'a.py']),
+        ('python:3.14', ['python', 'main.py']),
+    ]
+    assert values == {'configs': {'a': {'name': 'a'}, 'b': {'name': 'b', 'command': ['python', 'b.py']}}}
+
+    # overrides can set required values and are validated with the rest of the values
+    assert len(gybe.render(pods, {}, overrides=['image=python:3'])) == 2
+    with pytest.raises(InputValidationError) as exc_info:
+        gybe.render(configured_pods, {'configs': {'a': {}}}, overrides=['tag=many'])
+    assert exc_info.value.errors == [
+        "required field missing @ $.configs['a'].name",
+        'invalid value for type, expected int @ $.tag',
+    ]
+
+    assert (
+        gybe.render(
+            configured_pods,
+            {'configs': {}, 'sidecars': [{'name': 'proxy'}]},
+            overrides=['sidecars.0.image=envoy'],
+        )
+        == []
+    )
+
+    invalid_overrides = [
+        'configs.a.missing.x=1',
+        'configs.a.name.x=1',
+        'sidecars.0.image=envoy',
+        'sidecars.x.image=envoy',
+        'tag.x.y=1',
+    ]
+    with pytest.raises(InvalidOverrideError) as exc_info:
+        gybe.render(
+            configured_pods, {'configs': {'a': {'name': 'a'}}, 'sidecars': []}, overrides=invalid_overrides
+        )
+    assert exc_info.value.errors == [
+        (override, f'path "{override.split("=")[0]}" does not exist in the input data')
+        for override in invalid_overrides
+    ]
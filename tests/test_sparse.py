@@ -0,0 +1,91 @@
+import copy
+import dataclasses
+import pickle
+from dataclasses import dataclass, field
+from typing import ClassVar, List, Optional
+
+import pytest
+
+import gybe
+from gybe.converter import unstructure_model
+from gybe.k8s.sparse import SparseK8sResource, SparseK8sSpec, sparse_items
+
+
+@dataclass
+class SparseContainer(SparseK8sSpec):
+    __slots__ = ()
+    kind_name: ClassVar[str] = 'container'
+
+    name: str
+    image: Optional[str] = None
+    command: Optional[List[str]] = None
+    env: Optional[List['gybe.k8s.EnvVar']] = None
+
+
+@dataclass
+class SparsePod(SparseK8sResource):
+    __slots__ = ()
+
+    containers: List[SparseContainer]
+    apiVersion: str = 'v1'
+    kind: str = 'Pod'
+
+
+def test_sparse_model_only_stores_set_fields():
+    c = SparseContainer(name='app', command=['python'])
+    assert list(sparse_items(c)) == [('name', 'app'), ('command', ['python'])]
+    assert c.image is None
+    assert not hasattr(c, '__dict__')
+
+
+def test_sparse_model_set_and_unset_fields():
+    c = SparseContainer(name='app', command=['python'])
+    c.image = 'python:3'
+    c.command = None
+    c.env = None
+    c.name = 'web'
+    assert list(sparse_items(c)) == [('name', 'web'), ('image', 'python:3')]
+    assert c == SparseContainer(name='web', image='python:3')
+
+
+def test_sparse_model_dataclass_behaviour():
+    c = SparseContainer(name='app', env=[gybe.k8s.EnvVar(name='A')])
+    assert [f.name for f in dataclasses.fields(c)] == ['name', 'image', 'command', 'env']
+    assert repr(c).startswith("SparseContainer(name='app', image=None")
+    assert pickle.loads(pickle.dumps(c)) == c  # noqa: S301
+    assert copy.deepcopy(c) == c
+    assert dataclasses.replace(c, image='python:3').image == 'python:3'
+    with pytest.raises(TypeError):
+        SparseContainer()  # type: ignore[call-arg]
+
+
+def test_sparse_model_unstructure():
+    pod = SparsePod(containers=[SparseContainer(name='app', env=[gybe.k8s.EnvVar(name='A', value='1')])])
+    assert isinstance(pod, gybe.k8s.K8sResource)
+    assert unstructure_model(pod) == {
+        'containers': [{'name': 'app', 'env': [{'name': 'A', 'value': '1'}]}],
+        'apiVersion': 'v1',
+        'kind': 'Pod',
+    }
+    assert pod.to_dict() == unstructure_model(pod)
+
+
+def test_sparse_model_subclass_redefines_field():
+    @dataclass
+    class NamedContainer(SparseContainer):
+        __slots__ = ()
+
+        image: Optional[str] = 'busybox'
+        tty: Optional[bool] = None
+
+    c = NamedContainer(name='app', tty=True)
+    assert [f.name for f in dataclasses.fields(c)] == ['name', 'image', 'command', 'env', 'tty']
+    assert list(sparse_items(c)) == [('name', 'app'), ('image', 'busybox'), ('tty', True)]
+
+
+def test_sparse_model_rejects_field_defaults():
+    with pytest.raises(TypeError):
+
+        @dataclass
+        class InvalidContainer(SparseK8sSpec):
+            command: List[str] = field(default_factory=list)
@@ -0,0 +1,111 @@
+from typing import Any
+
+import pytest
+from click.testing import CliRunner
+
+import gybe
+from gybe.cli import main
+from gybe.daemon import handle_request
+from gybe.exceptions import InputValidationError
+from gybe.values import load_values, merge_values, read_values
+
+BASE = {
+    'image': 'app:1',
+    'labels': {'team': 'platform', 'tier': 'web'},
+    'args': ['serve'],
+    'limits': {'cpu': 1},
+    'debug': True,
+}
+
+
+def test_merge_values():
+    region = {'labels': {'tier': 'api', 'region': 'eu'}, 'args': ['serve', '--eu'], 'limits': None}
+    tenant = {'image': 'app:2', 'labels': {'tenant': 'a', 'region': None}, 'debug': None, 'extra': None}
+    assert merge_values([BASE, region, tenant]) == {
+        'image': 'app:2',
+        'labels': {'team': 'platform', 'tier': 'api', 'tenant': 'a'},
+        'args': ['serve', '--eu'],
+        'extra': None,
+    }
+    assert BASE['labels'] == {'team': 'platform', 'tier': 'web'}
+    assert merge_values([BASE, {'limits': {'cpu': 2}}, {'limits': 3}, {'limits': {'memory': 1}}]) == {
+        **BASE,
+        'limits': {'memory': 1},
+    }
+    assert merge_values([BASE, {}])['labels'] is BASE['labels']
+    assert merge_values([]) == {}
+
+
+def test_values_files_are_parsed_once(tmp_path, monkeypatch):
+    parsed = []
+    monkeypatch.setattr('gybe.values.yaml_loads', lambda s: parsed.append(s) or {'image': s.strip()})
+    base = tmp_path / 'base.yaml'
+    base.write_text('app:1')
+    overlay = tmp_path / 'overlay.yaml'
+    overlay.write_text('app:2')
+    assert load_values([str(base)]) == {'image': 'app:1'}
+    assert load_values([str(base), str(overlay)]) == {'image': 'app:2'}
+    assert read_values(str(base)) is not read_values(str(base))
+    assert parsed == ['app:1', 'app:2']
+
+    base.write_text('app:10')
+    assert load_values([str(base)]) == {'image': 'app:10'}
+
+
+def test_transpilers_can_change_values_read_before(tmp_path):
+    @gybe.transpiler
+    def counter(config: dict[str, Any]) -> gybe.Manifest:
+        config['nested']['count'] += 1
+        config['nested']['items'].append('x')
+        return [gybe.k8s.Pod(metadata=gybe.k8s.ObjectMeta(name=f'pod-{config["nested"]["count"]}'))]
+
+    (tmp_path / 'values.yaml').write_text('config: {nested: {count: 1, items: []}}')
+    paths = [str(tmp_path / 'values.yaml')]
+    for _ in range(3):
+        assert 'name: pod-2' in gybe.render_yaml(counter, load_values(paths))
+    assert read_values(paths[0]) == {'config': {'nested': {'count': 1, 'items': []}}}
+
+
+def test_values_must_be_a_mapping(tmp_path, monkeypatch):
+    (tmp_path / 'list.yaml').write_text('- a\n')
+    (tmp_path / 'empty.yaml').write_text('')
+    monkeypatch.chdir(tmp_path)
+    assert read_values('empty.yaml') == {}
+    with pytest.raises(InputValidationError) as exc_info:
+        read_values('list.yaml')
+    assert exc_info.value.errors == [f'expected a mapping of input values @ {tmp_path / "list.yaml"}']
+
+
+@gybe.transpiler
+def pods(image: str, count: int = 1, labels: dict[str, str] | None = None) -> gybe.Manifest:
+    return [gybe.k8s.Pod(metadata=gybe.k8s.ObjectMeta(name=f'pod-{i}', labels=labels)) for i in range(count)]
+
+
+def test_transpiler_command_layers_values_files(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    (tmp_path / 'base.yaml').write_text('image: app:1\nlabels: {team: a}')
+    result = CliRunner().invoke(pods, ['base.yaml', '-f', '-'], input='count: 2\nlabels: {tier: web}')
+    assert result.exit_code == 0
+    assert 'name: pod-1' in result.stdout
+    assert 'team: a\n    tier: web' in result.stdout
+
+    result = CliRunner().invoke(pods, [])
+    assert result.exit_code == 2
+    assert 'Missing argument FILE or option -f/--values.' in result.output
+
+
+def test_render_command_layers_values_files(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    (tmp_path / 'chart.py').write_text('from tests.test_values import pods\n')
+    (tmp_path / 'base.yaml').write_text('image: app:1\ncount: 2\n')
+    (tmp_path / 'tenant.yaml').write_text('count: 3\n')
+    for args in ([], ['--daemon', '--socket', str(tmp_path / 'missing.sock')]):
+        result = CliRunner().invoke(main, ['render', 'chart.py', 'base.yaml', '-f', 'tenant.yaml', *args])
+        assert result.exit_code == 0
+        assert 'name: pod-2' in result.stdout
+
+    request = {
+        'chart': str(tmp_path / 'chart.py'),
+        'values': [str(tmp_path / 'base.yaml'), {'yaml': 'count: 1'}],
+    }
+    assert handle_request(request)['yaml'].count('name: pod') == 1
@@ -0,0 +1,171 @@
+import io
+import os
+
+import pytest
+from click.testing import CliRunner
+
+import gybe
+from gybe.charts import find_transpiler
+from gybe.watch import Watcher
+
+CHART = """
+import gybe
+
+
+@gybe.transpiler
+def pods(name: str = 'pod', count: int = 1, image: str = 'app:1') -> gybe.Manifest:
+    return [
+        gybe.k8s.Pod(
+            metadata=gybe.k8s.ObjectMeta(name=f'{name}-{i}'),
+            spec=gybe.k8s.PodSpec(containers=[gybe.k8s.Container(name='app', image=image)]),
+        )
+        for i in range(count)
+    ]
+"""
+
+
+class Terminal(io.StringIO):
+    def seekable(self):
+        return False
+
+
+def edit(path, text):
+    # bump the modification time, so quick edits aren't missed on filesystems with coarse timestamps
+    mtime_ns = os.stat(path).st_mtime_ns if path.exists() else 0
+    path.write_text(text)
+    os.utime(path, ns=(mtime_ns + 10**9, mtime_ns + 10**9))
+
+
+@pytest.fixture
+def chart_files():
+    return {'chart.py': CHART, 'values.yaml': 'count: 2'}
+
+
+def test_watcher_writes_changed_documents(chart, capsys):
+    output = Terminal()
+    watcher = Watcher(find_transpiler('chart.py'), ['values.yaml'], ['image=app:2'], output=output)
+    assert watcher.changed() == []
+    assert watcher.render()
+    assert output.getvalue().count('name: pod-') == 2
+
+    output.seek(0)
+    output.truncate()
+    edit(chart / 'values.yaml', 'count: 3')
+    assert watcher.changed() == ['values.yaml']
+    assert watcher.render()
+    assert output.getvalue().count('name: pod-') == 1
+    assert 'name: pod-2' in output.getvalue()
+    assert watcher.render()
+    assert capsys.readouterr().err.splitlines()[-1] == 'Rendered 3 documents, 0 changed, 0 deleted'
+
+    edit(chart / 'values.yaml', 'count: 1')
+    edit(chart / 'chart.py', CHART.replace("name='app'", "name='server'"))
+    assert watcher.changed() == ['values.yaml', str(chart / 'chart.py')]
+    assert watcher.reload()
+    assert watcher.render()
+    assert 'name: app\n\n---\napiVersion: v1\nkind: Pod\nmetadata:\n  name: pod-0\n' in output.getvalue()
+    assert output.getvalue().endswith('name: server\n\n')
+    assert capsys.readouterr().err.splitlines() == [
+        'Deleted Pod pod-1',
+        'Deleted Pod pod-2',
+        'Rendered 1 documents, 1 changed, 2 deleted',
+    ]
+
+
+def test_watcher_keeps_watching_after_errors(chart, capsys):
+    output = Terminal()
+    watcher = Watcher(find_transpiler('chart.py'), ['values.yaml'], output=output)
+    assert watcher.render()
+
+    edit(chart / 'values.yaml', 'count: many')
+    assert not watcher.render()
+    assert 'ERROR: validation errors:' in capsys.readouterr().err
+    edit(chart / 'values.yaml', 'count: [')
+    assert not watcher.render()
+    assert 'yaml.parser.ParserError' in capsys.readouterr().err
+
+    edit(chart / 'chart.py', 'def pods(:\n')
+    assert not watcher.reload()
+    assert 'SyntaxError' in capsys.readouterr().err
+    edit(chart / 'values.yaml', 'count: 2')
+    assert watcher.render()
+    assert output.getvalue().count('name: pod-1') == 1
+
+    (chart / 'values.yaml').unlink()
+    assert watcher.changed() == ['values.yaml', str(chart / 'chart.py')]
+    assert not watcher.render()
+    assert 'FileNotFoundError' in capsys.readouterr().err
+
+
+def test_watcher_writes_shared_models_once(monkeypatch):
+    spec = gybe.k8s.PodSpec(containers=[gybe.k8s.Container(name='app', image='app:1')])
+
+    @gybe.transpiler
+    def pods(count: int) -> gybe.Manifest:
+        return [gybe.k8s.Pod(metadata=gybe.k8s.ObjectMeta(name=f'pod-{i}'), spec=spec) for i in range(count)]
+
+    visited = []
+    items = gybe.yaml._items
+    monkeypatch.setattr('gybe.yaml._items', lambda v: visited.append(v) or items(v))
+    output = io.StringIO()
+    watcher = Watcher(pods, [], ['count=3'], output=output)
+    assert watcher.render()
+    assert sum(v is spec for v in visited) == 1
+    assert output.getvalue() == gybe.render_yaml(pods, {'count': 3})
+
+
+def test_watch_command(chart, monkeypatch):
+    sleeps = []
+
+    def sleep(interval):
+        sleeps.append(interval)
+        if len(sleeps) in (2, 3):
+            edit(chart / 'values.yaml', 'count: 3')
+        elif len(sleeps) == 4:
+            edit(chart / 'chart.py', 'def pods(:\n')
+        elif len(sleeps) == 5:
+            raise KeyboardInterrupt()
+
+    monkeypatch.setattr('gybe.watch.time.sleep', sleep)
+    pods = find_transpiler('chart.py')
+    result = CliRunner().invoke(pods, ['values.yaml', '--watch', '-o', 'manifest.yaml'])
+    assert result.exit_code == 0
+    assert result.stderr.startswith(
+        'Rendered 2 documents, 2 changed, 0 deleted\n'
+        f'Watching values.yaml, {chart / "chart.py"} for changes\n'
+        'Rendered 3 documents, 1 changed, 0 deleted\n'
+        'Rendered 3 documents, 0 changed, 0 deleted\n'
+        'Traceback'
+    )
+    manifest = (chart / 'manifest.yaml').read_text()
+    assert manifest.count('name: pod-') == 3
+    assert manifest == gybe.render_yaml(pods, {'count': 3})
+
+
+def test_watch_command_errors(chart, monkeypatch):
+    @gybe.transpiler
+    def pods(count: int) -> gybe.ManifestIterator:
+        for i in range(count):
+            yield gybe.k8s.Pod(metadata=gybe.k8s.ObjectMeta(name=f'pod-{i}'))
+
+    result = CliRunner().invoke(pods, ['values.yaml', '-f', '-', '--watch'])
+    assert result.exit_code == 2
+    assert "Option --watch can't watch values read from stdin." in result.stderr
+
+    sleeps = []
+
+    def sleep(interval):
+        sleeps.append(interval)
+        if len(sleeps) == 1:
+            edit(chart / 'values.yaml', 'count: 3')
+        elif len(sleeps) == 3:
+            raise KeyboardInterrupt()
+
+    monkeypatch.setattr('gybe.watch.time.sleep', sleep)
+    output = Terminal()
+    watcher = Watcher(pods, ['values.yaml'], output=output)
+    assert watcher.chart is None
+    with pytest.raises(KeyboardInterrupt):
+        watcher.run(interval=0.01)
+    assert sleeps == [0.01] * 3
+    assert output.getvalue().count('name: pod-') == 3
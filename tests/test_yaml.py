@@ -0,0 +1,193 @@
+import io
+from dataclasses import dataclass
+from typing import Any, List, Optional
+
+import pytest
+import yaml
+
+import gybe
+from gybe.converter import Memo, unstructure_model
+from gybe.exceptions import YAMLBackendMismatchError
+from gybe.k8s.sparse import SparseK8sSpec
+from gybe.k8s.types import K8sSpec
+from gybe.yaml import yaml_dump_manifest, yaml_dumps, yaml_dumps_documents, yaml_dumps_model, yaml_loads
+
+
+@dataclass
+class AnySpec(K8sSpec):
+    value: Optional[Any] = None
+
+
+@dataclass
+class SparseSpec(SparseK8sSpec):
+    __slots__ = ()
+
+    name: Optional[str] = None
+    items: Optional[List[Any]] = None
+
+
+def _deployment() -> gybe.k8s.Deployment:
+    return gybe.k8s.Deployment(
+        metadata=gybe.k8s.ObjectMeta(name='web', labels={'app': 'web', 'app.kubernetes.io/part-of': 'site'}),
+        spec=gybe.k8s.DeploymentSpec(
+            replicas=3,
+            selector=gybe.k8s.LabelSelector(matchLabels={'app': 'web'}),
+            template=gybe.k8s.PodTemplateSpec(
+                spec=gybe.k8s.PodSpec(
+                    containers=[
+                        gybe.k8s.Container(
+                            name='app',
+                            image='python:3',
+                            command=['python', '-m', 'http.server', "it's", '', 'yes', '1'],
+                            env=[gybe.k8s.EnvVar(name='DEBUG', value='true'), gybe.k8s.EnvVar(name='EMPTY')],
+                            ports=[gybe.k8s.ContainerPort(containerPort=8080)],
+                        )
+                    ],
+                    volumes=[],
+                    nodeSelector={},
+                    hostNetwork=False,
+                )
+            ),
+        ),
+    )
+
+
+def test_yaml_dumps_model_matches_yaml_dumps():
+    deployment = _deployment()
+    assert yaml_dumps_model(deployment) == yaml_dumps(unstructure_model(deployment))
+
+
+@pytest.mark.parametrize(
+    'value',
+    [
+        None,
+        {},
+        [],
+        [[1, [2, []]], {'a': {'b': [None, True]}}, [{'c': 'd', 'e': [{}]}]],
+        {'a b': ['x: y', '- z', '#', '@', '~', 'null', '0x10', '2024-01-01']},
+        ['word ' * 10, 'word ' * 20, 'x' * 200],
+        {'nested': {'spec': gybe.k8s.EnvVar(name='A')}},
+        SparseSpec(items=[SparseSpec(name='a'), SparseSpec()]),
+    ],
+)
+def test_yaml_dumps_model_scalars_and_collections(value: Any):
+    spec = AnySpec(value)
+    assert yaml_dumps_model(spec) == yaml_dumps(unstructure_model(spec))
+
+
+@pytest.mark.parametrize(
+    'value',
+    [
+        1.5,
+        'multi\nline',
+        'tab\tcharacter',
+        'ünïcode',
+        ('tuple',),
+        {'': 'empty key'},
+        {'k' * 123: 'long key'},
+        {1: 'int key', 'a': 'str key'},
+        {'ünïcode': 'key'},
+    ],
+)
+def test_yaml_dumps_model_falls_back_to_pyyaml(value: Any):
+    spec = AnySpec(value)
+    memo: Memo = {}
+    assert yaml_dumps_model(spec, memo) == yaml_dumps(unstructure_model(spec))
+    assert id(spec) in memo
+
+
+def test_yaml_dumps_model_without_values():
+    assert yaml_dumps_model(AnySpec()) == yaml_dumps({}) == '{}\n'
+
+
+class RecordingStream(io.StringIO):
+    def __init__(self):
+        super().__init__()
+        self.writes: list[str] = []
+
+    def write(self, s: str) -> int:
+        self.writes.append(s)
+        return super().write(s)
+
+
+def test_yaml_dump_manifest_writes_documents_one_at_a_time():
+    pods = [gybe.k8s.Pod(metadata=gybe.k8s.ObjectMeta(name=f'pod-{i}')) for i in range(3)]
+    stream = RecordingStream()
+    yaml_dump_manifest(iter(pods), stream)
+    documents = [yaml_dumps(unstructure_model(p)) for p in pods]
+    assert stream.getvalue() == '---\n'.join(documents) + '\n'
+    assert [w for w in stream.writes if w.startswith('apiVersion')] == documents
+
+
+def test_yaml_dump_manifest_writes_shared_models_once(monkeypatch):
+    spec = gybe.k8s.PodSpec(containers=[gybe.k8s.Container(name='app', image='app:1', command=['serve'])])
+    pods = [gybe.k8s.Pod(metadata=gybe.k8s.ObjectMeta(name=f'pod-{i}'), spec=spec) for i in range(3)]
+    visited = []
+    items = gybe.yaml._items
+    monkeypatch.setattr('gybe.yaml._items', lambda v: visited.append(v) or items(v))
+
+    stream = io.StringIO()
+    yaml_dump_manifest(pods, stream)
+    assert sum(v is spec for v in visited) == 1
+    assert sum(v is spec.containers[0] for v in visited) == 1
+    assert stream.getvalue() == '---\n'.join(yaml_dumps(unstructure_model(pod)) for pod in pods) + '\n'
+
+    # resources from generators only share models within their own document
+    visited.clear()
+    yaml_dump_manifest(iter(pods), io.StringIO())
+    assert sum(v is spec for v in visited) == 3
+
+
+def test_yaml_dumps_documents():
+    pods = [gybe.k8s.Pod(metadata=gybe.k8s.ObjectMeta(name=f'pod-{i}')) for i in range(3)]
+    documents = list(yaml_dumps_documents(iter(pods)))
+    assert documents == [(pod, yaml_dumps(unstructure_model(pod))) for pod in pods]
+
+
+def test_yaml_dump_manifest_without_resources():
+    stream = io.StringIO()
+    yaml_dump_manifest([], stream)
+    assert stream.getvalue() == '\n'
+
+
+class IndentedDumper(yaml.CDumper):
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **{**kwargs, 'indent': 4})
+
+
+LIBYAML_DOCUMENTS = [
+    {'': 'empty key'},
+    {'k' * 123: 'long key'},
+    {'multi\nline key': 1},
+    {'folded': 'trailing space \n' + 'x ' * 60},
+    {'unicode': ['ascii', 'ünïcode']},
+    {'object': yaml.YAMLObject()},
+]
+
+
+@pytest.mark.skipif(not yaml.__with_libyaml__, reason='PyYAML built without libyaml')
+@pytest.mark.parametrize('document', LIBYAML_DOCUMENTS)
+def test_yaml_dumps_uses_pure_python_where_libyaml_differs(document, monkeypatch):
+    monkeypatch.setattr('gybe.yaml._CDumper', IndentedDumper)
+    assert yaml_dumps(document) == yaml.dump(document, default_flow_style=False)
+
+
+@pytest.mark.skipif(not yaml.__with_libyaml__, reason='PyYAML built without libyaml')
+def test_yaml_cross_check_detects_differences(monkeypatch):
+    monkeypatch.setattr('gybe.yaml._CDumper', IndentedDumper)
+    monkeypatch.setattr('gybe.yaml._CSafeLoader', yaml.CBaseLoader)
+    assert yaml_dumps({'flat': 'value'}) == 'flat: value\n'
+    with pytest.raises(YAMLBackendMismatchError):
+        yaml_dumps({'nested': {'key': 'value'}})
+    with pytest.raises(YAMLBackendMismatchError):
+        yaml_loads('replicas: 1')
+
+    monkeypatch.setattr('gybe.yaml.cross_check', False)
+    assert yaml_dumps({'nested': {'key': 'value'}}) == 'nested:\n    key: value\n'
+
+
+def test_yaml_pure_python_backend(monkeypatch):
+    monkeypatch.setattr('gybe.yaml._CDumper', None)
+    monkeypatch.setattr('gybe.yaml._CSafeLoader', None)
+    document = {'spec': {'replicas': 1, 'args': ['--port', '8080']}}
+    assert yaml_loads(yaml_dumps(document)) == document